@@ -25,12 +25,24 @@ import platform
 import signal
 import subprocess  # nosec
 import sys
+import time
 from asyncio import AbstractEventLoop, AbstractServer, CancelledError, Task
-from io import BytesIO
+from collections import deque
 from logging import Logger
 from pathlib import Path
 from threading import Event, Thread
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import grpc
 from aea.configurations.base import PublicId
@@ -101,7 +113,29 @@ DEFAULT_P2P_LISTEN_ADDRESS = f"{_TCP}{DEFAULT_LISTEN_ADDRESS}:{DEFAULT_P2P_PORT}
 DEFAULT_RPC_LISTEN_ADDRESS = f"{_TCP}{LOCALHOST}:{DEFAULT_RPC_PORT}"
 MAX_READ_IN_BYTES = 2**20  # Max we'll consume on a read stream (1 MiB)
 MAX_VARINT_BYTES = 10  # Max size of varint we support
+READ_CHUNK_SIZE = 2**16  # Size of the chunks read from the stream (64 KiB)
+DEFAULT_MAX_WRITE_BUFFER_SIZE = (
+    2**16
+)  # Max size of the responses buffered per peer (64 KiB)
+# the requests waiting for the skill, beyond which the channels stop reading from Tendermint
+DEFAULT_REQUEST_QUEUE_SIZE = 1024
+# the time a request may wait for the skill before the skill is reported as the bottleneck, in seconds
+DEFAULT_REQUEST_QUEUE_ALARM_WAIT = 1.0
+REQUEST_QUEUE_ALARM_INTERVAL = 10.0
 DEFAULT_TENDERMINT_LOG_FILE = "tendermint.log"
+# the gRPC methods which do not change the state of the app, named after the fields of the `Request`
+GRPC_READ_ONLY_METHODS = frozenset({"echo", "info", "query"})
+# `info` is not cached by default, since the app's height also changes on hard resets, without an ABCI request
+DEFAULT_GRPC_FAST_PATH_METHODS = ("echo", "query")
+MAX_GRPC_FAST_PATH_CACHE_SIZE = 1024
+# the responses after which the cached responses to the read-only gRPC methods are stale
+STATE_CHANGING_PERFORMATIVES = frozenset(
+    {
+        AbciMessage.Performative.RESPONSE_COMMIT,
+        AbciMessage.Performative.RESPONSE_INIT_CHAIN,
+        AbciMessage.Performative.RESPONSE_APPLY_SNAPSHOT_CHUNK,
+    }
+)
 
 
 class DecodeVarintError(Exception):
@@ -158,16 +192,42 @@ class _TendermintABCISerializer:
             raise EncodeVarintError(f"{log_msg}: {number}")
 
         number <<= 1  # Shift to int64
-        buf = b""
-        while True:
-            towrite = number & 0x7F
+        buf = bytearray()
+        while number > 0x7F:
+            buf.append((number & 0x7F) | 0x80)
             number >>= 7
-            if number:
-                buf += bytes((towrite | 0x80,))
-            else:
-                buf += bytes((towrite,))
-                break
-        return buf
+        buf.append(number)
+        return bytes(buf)
+
+    @classmethod
+    def parse_varint(
+        cls,
+        data: Union[bytes, bytearray],
+        offset: int = 0,
+        max_length: int = MAX_VARINT_BYTES,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Parse a number from its varint coding, in a buffer.
+
+        :param data: the buffer to parse from.
+        :param offset: the position of the varint in the buffer.
+        :param max_length: the max number of bytes that can be read.
+        :return: the decoded int and the position following the varint, or None if the buffer ends before the varint.
+
+        :raise: DecodeVarintError if the varint could not be decoded.
+        """
+        result = 0
+        shift = 0
+        end = min(len(data), offset + max_length + 1)
+        for position in range(offset, end):
+            byte = data[position]
+            result |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return result >> 1, position + 1
+        if end - offset > max_length:
+            raise DecodeVarintError("could not decode varint")
+        return None
 
     @classmethod
     async def decode_varint(
@@ -220,49 +280,259 @@ class _TendermintABCISerializer:
     @classmethod
     def write_message(cls, message: Response) -> bytes:
         """Write a message in a buffer."""
-        buffer = BytesIO(b"")
         protobuf_bytes = message.SerializeToString()
-        encoded = cls.encode_varint(len(protobuf_bytes))
-        buffer.write(encoded)
-        buffer.write(protobuf_bytes)
-        return buffer.getvalue()
+        return cls.encode_varint(len(protobuf_bytes)) + protobuf_bytes
 
 
 class VarintMessageReader:  # pylint: disable=too-few-public-methods
-    """Varint message reader."""
+    """
+    Varint message reader.
 
-    def __init__(self, reader: asyncio.StreamReader) -> None:
+    The stream is read in chunks of up to `read_size` bytes, which are buffered,
+    so that all the length-prefixed messages of a chunk are parsed without waiting on the stream again,
+    and a message which is split across chunks is completed by the following reads.
+    The rest of a message which is larger than `read_size`, e.g., a state-sync snapshot chunk,
+    is read from the stream at once, instead of being assembled from many chunks.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, read_size: int = READ_CHUNK_SIZE
+    ) -> None:
         """Initialize the reader."""
         self._reader = reader
+        self._read_size = read_size
+        self._buffer = bytearray()
+        self._offset = 0
+        # the start of the next message in the buffer, and the number of its bytes which are missing from the buffer
+        self._frame_start = 0
+        self._missing = 0
 
-    async def read_next_message(self) -> bytes:
-        """Read next message."""
-        varint = await _TendermintABCISerializer.decode_varint(self._reader)
+    def _next_frame(self) -> Optional[bytes]:
+        """
+        Parse the next message from the buffer.
+
+        :return: the message, or None if the buffer does not contain a whole message yet.
+        """
+        self._missing = 0
+        parsed = _TendermintABCISerializer.parse_varint(self._buffer, self._offset)
+        if parsed is None:
+            return None
+        varint, start = parsed
         if varint > MAX_READ_IN_BYTES:
             raise TooLargeVarint(received_size=varint, max_size=MAX_READ_IN_BYTES)
-        message_bytes = await self.read_until(varint)
-        if len(message_bytes) < varint:
-            raise ShortBufferLengthError(varint, message_bytes)
+        end = start + varint
+        if end > len(self._buffer):
+            self._frame_start = start
+            self._missing = end - len(self._buffer)
+            return None
+        with memoryview(self._buffer) as view:
+            message_bytes = view[start:end].tobytes()
+        self._offset = end
         return message_bytes
 
-    async def read_until(self, n: int) -> bytes:
-        """Wait until n bytes are read from the stream."""
-        result = BytesIO(b"")
-        read_bytes = 0
-        while read_bytes < n:
-            data = await self._reader.read(n - read_bytes)
-            result.write(data)
-            read_bytes += len(data)
-        return result.getvalue()
+    async def _fill(self) -> bool:
+        """
+        Read the next chunk of the stream into the buffer, dropping the messages which have been consumed.
+
+        :return: whether any data was read, i.e., whether the stream is not at EOF.
+        """
+        if self._offset:
+            del self._buffer[: self._offset]
+            self._offset = 0
+        data = await self._reader.read(self._read_size)
+        self._buffer += data
+        return len(data) > 0
+
+    async def read_next_message(self) -> bytes:
+        """Read next message."""
+        while True:
+            # an invalid varint is raised as is, since the stream cannot be realigned with the following messages
+            message_bytes = self._next_frame()
+            if message_bytes is not None:
+                return message_bytes
+            if self._missing > self._read_size:
+                return await self._read_large_frame()
+            if not await self._fill():
+                self._raise_eof()
+
+    async def _read_large_frame(self) -> bytes:
+        """Complete the next message, which is larger than the chunks, by reading the rest of it as it arrives."""
+        # the stream is read as the data arrive, instead of waiting for all of them with `readexactly`,
+        # which would pause the transport once the data exceed the limit of the stream's buffer
+        chunks = []
+        missing = self._missing
+        while missing > 0:
+            data = await self._reader.read(missing)
+            if not data:
+                self._buffer += b"".join(chunks)
+                self._raise_eof()
+            chunks.append(data)
+            missing -= len(data)
+        # the buffer does not contain anything after the start of the message
+        with memoryview(self._buffer) as view:
+            message_bytes = b"".join((view[self._frame_start :], *chunks))
+        self._buffer.clear()
+        self._offset = 0
+        return message_bytes
+
+    def _raise_eof(self) -> NoReturn:
+        """Raise the error corresponding to the EOF of the stream, while the buffer does not contain a whole message."""
+        remaining = self._buffer[self._offset :]
+        self._offset = len(self._buffer)
+        if len(remaining) == 0:
+            raise EOFError()
+        parsed = _TendermintABCISerializer.parse_varint(remaining)
+        if parsed is None:
+            raise DecodeVarintError("could not decode varint")
+        varint, start = parsed
+        raise ShortBufferLengthError(varint, bytes(remaining[start:]))
+
+
+class RequestQueue(asyncio.Queue):  # pylint: disable=too-many-instance-attributes
+    """
+    The queue of the requests waiting for the skill.
+
+    The queue is bounded, so that the channels stop reading from Tendermint while the skill falls behind,
+    instead of buffering the requests without limit.
+    It keeps track of its depth and of the time the requests wait, both to be put and to be got,
+    and logs a warning when the skill is the bottleneck, i.e., when the queue is full or a request waited too long.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_REQUEST_QUEUE_SIZE,
+        alarm_wait: float = DEFAULT_REQUEST_QUEUE_ALARM_WAIT,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        :param maxsize: the maximum number of queued requests. Unbounded if not positive.
+        :param alarm_wait: the time a request may wait for the skill before raising an alarm, in seconds.
+        :param logger: the logger.
+        """
+        super().__init__(maxsize)
+        self.alarm_wait = alarm_wait
+        self.logger = logger or logging.getLogger()
+        self._enqueued_at: Deque[float] = deque()
+        self._last_alarm = -REQUEST_QUEUE_ALARM_INTERVAL
+        self.max_depth = 0
+        self.requests = 0
+        self.blocked_puts = 0
+        self.alarms = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_put_wait = 0.0
+
+    async def put(self, item: Any) -> None:
+        """Put a request, waiting for a free slot if the queue is full."""
+        if not self.full():
+            self.put_nowait(item)
+            return
+        self.blocked_puts += 1
+        self._alarm(f"the request queue is full, with {self.qsize()} requests")
+        start = time.perf_counter()
+        await super().put(item)
+        self.max_put_wait = max(self.max_put_wait, time.perf_counter() - start)
+
+    def _put(self, item: Any) -> None:
+        """Put a request, recording when."""
+        super()._put(item)
+        self._enqueued_at.append(time.perf_counter())
+        self.max_depth = max(self.max_depth, self.qsize())
+
+    def _get(self) -> Any:
+        """Get the oldest request, recording how long it waited."""
+        wait = time.perf_counter() - self._enqueued_at.popleft()
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if wait > self.alarm_wait:
+            self._alarm(f"a request waited {wait:.3f}s to be handled")
+        return super()._get()
+
+    def _alarm(self, reason: str) -> None:
+        """Warn that the skill is the bottleneck, at most once per interval."""
+        self.alarms += 1
+        now = time.perf_counter()
+        if now - self._last_alarm < REQUEST_QUEUE_ALARM_INTERVAL:
+            return
+        self._last_alarm = now
+        self.logger.warning(
+            f"The skill is not keeping up with the ABCI requests: {reason}. Queue stats: {self.summary()}"
+        )
+
+    def summary(self) -> Dict[str, float]:
+        """Get the depth of the queue and the time the requests waited in it, in milliseconds."""
+        return {
+            "max_size": self.maxsize,
+            "depth": self.qsize(),
+            "max_depth": self.max_depth,
+            "requests": self.requests,
+            "blocked_puts": self.blocked_puts,
+            "alarms": self.alarms,
+            "mean_wait_ms": self.total_wait / max(self.requests, 1) * 1000,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_put_wait_ms": self.max_put_wait * 1000,
+        }
+
+
+class GrpcLatencyStats:
+    """Per-method latency counters of the gRPC calls."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._counts: Dict[str, int] = {}
+        self._fast_path_counts: Dict[str, int] = {}
+        self._totals: Dict[str, float] = {}
+        self._maxima: Dict[str, float] = {}
+
+    def record(self, method: str, latency: float, fast_path: bool = False) -> None:
+        """
+        Record the latency of a call.
+
+        :param method: the name of the method.
+        :param latency: the latency of the call, in seconds.
+        :param fast_path: whether the call was answered without going through the skill.
+        """
+        self._counts[method] = self._counts.get(method, 0) + 1
+        if fast_path:
+            self._fast_path_counts[method] = self._fast_path_counts.get(method, 0) + 1
+        self._totals[method] = self._totals.get(method, 0.0) + latency
+        self._maxima[method] = max(self._maxima.get(method, 0.0), latency)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get the number of calls, of fast path calls, and the mean and max latencies in milliseconds, by method."""
+        return {
+            method: {
+                "calls": count,
+                "fast_path_calls": self._fast_path_counts.get(method, 0),
+                "mean_ms": self._totals[method] / count * 1000,
+                "max_ms": self._maxima[method] * 1000,
+            }
+            for method, count in sorted(self._counts.items())
+        }
 
 
 class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
-    """Implements the gRPC servicer (handler)"""
+    """
+    Implements the gRPC servicer (handler)
+
+    Every call is decoded into an ABCI message, put on the request queue of the skill,
+    and answered with the skill's response to it.
+    The read-only methods in `fast_path_methods` bypass the queue when possible:
+    `echo` is answered by the servicer itself, while the responses to `info` and `query`
+    are cached by request until the skill responds to a request which changes its state.
+    """
 
     # pylint: disable=invalid-overridden-method, no-member
 
     def __init__(
-        self, request_queue: asyncio.Queue, dialogues: AbciDialogues, target_skill: str
+        self,
+        request_queue: asyncio.Queue,
+        dialogues: AbciDialogues,
+        target_skill: str,
+        fast_path_methods: Iterable[str] = DEFAULT_GRPC_FAST_PATH_METHODS,
     ):
         """
         Initializes the abci handler.
@@ -270,11 +540,24 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
         :param request_queue: queue holding translated abci messages.
         :param dialogues: dialogues
         :param target_skill: target skill of messages
+        :param fast_path_methods: the read-only methods to answer without going through the skill, when possible.
         """
         super().__init__()
+        fast_path_methods = frozenset(fast_path_methods)
+        unsupported = fast_path_methods - GRPC_READ_ONLY_METHODS
+        if unsupported:
+            raise ValueError(
+                f"Only the read-only methods {sorted(GRPC_READ_ONLY_METHODS)} can use the fast path, "
+                f"got {sorted(unsupported)}."
+            )
         self._request_queue = request_queue
         self._dialogues = dialogues
         self._target_skill = target_skill
+        self._fast_path_methods = fast_path_methods
+        self._fast_path_cache: Dict[Tuple[str, bytes], Any] = {}
+        # incremented whenever the state of the skill changes, to avoid caching responses computed on a stale state
+        self._state_version = 0
+        self.latency = GrpcLatencyStats()
         self._response_queues: Dict[str, asyncio.Queue] = {
             AbciMessage.Performative.RESPONSE_ECHO: asyncio.Queue(),
             AbciMessage.Performative.RESPONSE_FLUSH: asyncio.Queue(),
@@ -305,38 +588,80 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
             logging.warning(f"Could not create dialogue for message={message}")
             return
 
+        if message.performative in STATE_CHANGING_PERFORMATIVES:
+            self._state_version += 1
+            self._fast_path_cache.clear()
         await self._response_queues[message.performative].put(envelope)
 
-    async def Echo(
-        self, request: RequestEcho, context: grpc.ServicerContext
-    ) -> ResponseEcho:
+    async def _call(
+        self, request_type: str, request: Any, context: grpc.ServicerContext
+    ) -> Any:
         """
-        Handles "Echo" gRPC requests
+        Handle a gRPC call, recording its latency.
 
-        :param: request: The request from the Tendermint node
-        :param: context: The request context
-        :return: the Echo response
+        :param request_type: the type of the request, i.e., the name of the field of the `Request` which wraps it.
+        :param request: the request from the Tendermint node.
+        :param context: the request context.
+        :return: the response.
         """
-        packed_req = Request(echo=request)
-        message, _ = _TendermintProtocolDecoder.request_echo(
-            packed_req, self._dialogues, self._target_skill
+        start = time.perf_counter()
+        fast_path = request_type in self._fast_path_methods
+        response = None
+        try:
+            if fast_path:
+                response = self._fast_path(request_type, request)
+            if response is None:
+                fast_path = False
+                response = await self._call_skill(request_type, request)
+            context.set_code(grpc.StatusCode.OK)
+            return response
+        finally:
+            self.latency.record(request_type, time.perf_counter() - start, fast_path)
+
+    def _fast_path(self, request_type: str, request: Any) -> Any:
+        """Get the response to a read-only request without going through the skill, if possible."""
+        if request_type == "echo":
+            return ResponseEcho(message=request.message)
+        key = (request_type, request.SerializeToString(deterministic=True))
+        return self._fast_path_cache.get(key)
+
+    async def _call_skill(self, request_type: str, request: Any) -> Any:
+        """Get the response of the skill to a request, caching it if it is read-only."""
+        state_version = self._state_version
+        decode = getattr(_TendermintProtocolDecoder, f"request_{request_type}")
+        message, _ = decode(
+            Request(**{request_type: request}), self._dialogues, self._target_skill
         )
         envelope = Envelope(to=message.to, sender=message.sender, message=message)
 
         await self._request_queue.put(envelope)
+        performative = AbciMessage.Performative(f"response_{request_type}")
         message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_ECHO
-                ].get()
-            ).message,
+            AbciMessage, (await self._response_queues[performative].get()).message
         )
 
-        response = _TendermintProtocolEncoder.response_echo(message)
-        context.set_code(grpc.StatusCode.OK)
+        encode = getattr(_TendermintProtocolEncoder, f"response_{request_type}")
+        response = getattr(encode(message), request_type)
+        if (
+            request_type in self._fast_path_methods
+            and state_version == self._state_version
+            and len(self._fast_path_cache) < MAX_GRPC_FAST_PATH_CACHE_SIZE
+        ):
+            key = (request_type, request.SerializeToString(deterministic=True))
+            self._fast_path_cache[key] = response
+        return response
 
-        return response.echo
+    async def Echo(
+        self, request: RequestEcho, context: grpc.ServicerContext
+    ) -> ResponseEcho:
+        """
+        Handles "Echo" gRPC requests
+
+        :param: request: The request from the Tendermint node
+        :param: context: The request context
+        :return: the Echo response
+        """
+        return await self._call("echo", request, context)
 
     async def Flush(
         self, request: RequestFlush, context: grpc.ServicerContext
@@ -346,28 +671,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the Flush response
         """
-        packed_req = Request(flush=request)
-        message, _ = _TendermintProtocolDecoder.request_flush(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_FLUSH
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_flush(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.flush
+        return await self._call("flush", request, context)
 
     async def Info(
         self, request: RequestInfo, context: grpc.ServicerContext
@@ -377,28 +683,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the Info response
         """
-        packed_req = Request(info=request)
-        message, _ = _TendermintProtocolDecoder.request_info(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_INFO
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_info(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.info
+        return await self._call("info", request, context)
 
     async def SetOption(
         self, request: RequestSetOption, context: grpc.ServicerContext
@@ -408,28 +695,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the SetOption response
         """
-        packed_req = Request(set_option=request)
-        message, _ = _TendermintProtocolDecoder.request_set_option(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_SET_OPTION
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_set_option(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.set_option
+        return await self._call("set_option", request, context)
 
     async def DeliverTx(
         self, request: RequestDeliverTx, context: grpc.ServicerContext
@@ -439,28 +707,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the DeliverTx response
         """
-        packed_req = Request(deliver_tx=request)
-        message, _ = _TendermintProtocolDecoder.request_deliver_tx(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_DELIVER_TX
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_deliver_tx(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.deliver_tx
+        return await self._call("deliver_tx", request, context)
 
     async def CheckTx(
         self, request: RequestCheckTx, context: grpc.ServicerContext
@@ -470,28 +719,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the CheckTx response
         """
-        packed_req = Request(check_tx=request)
-        message, _ = _TendermintProtocolDecoder.request_check_tx(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_CHECK_TX
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_check_tx(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.check_tx
+        return await self._call("check_tx", request, context)
 
     async def Query(
         self, request: RequestQuery, context: grpc.ServicerContext
@@ -501,28 +731,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the Query response
         """
-        packed_req = Request(query=request)
-        message, _ = _TendermintProtocolDecoder.request_query(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_QUERY
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_query(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.query
+        return await self._call("query", request, context)
 
     async def Commit(
         self, request: RequestCommit, context: grpc.ServicerContext
@@ -532,28 +743,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the Commit response
         """
-        packed_req = Request(commit=request)
-        message, _ = _TendermintProtocolDecoder.request_commit(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_COMMIT
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_commit(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.commit
+        return await self._call("commit", request, context)
 
     async def InitChain(
         self, request: RequestInitChain, context: grpc.ServicerContext
@@ -563,28 +755,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the InitChain response
         """
-        packed_req = Request(init_chain=request)
-        message, _ = _TendermintProtocolDecoder.request_init_chain(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_INIT_CHAIN
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_init_chain(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.init_chain
+        return await self._call("init_chain", request, context)
 
     async def BeginBlock(
         self, request: RequestBeginBlock, context: grpc.ServicerContext
@@ -594,28 +767,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the BeginBlock response
         """
-        packed_req = Request(begin_block=request)
-        message, _ = _TendermintProtocolDecoder.request_begin_block(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_BEGIN_BLOCK
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_begin_block(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.begin_block
+        return await self._call("begin_block", request, context)
 
     async def EndBlock(
         self, request: RequestEndBlock, context: grpc.ServicerContext
@@ -625,28 +779,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the EndBlock response
         """
-        packed_req = Request(end_block=request)
-        message, _ = _TendermintProtocolDecoder.request_end_block(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_END_BLOCK
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_end_block(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.end_block
+        return await self._call("end_block", request, context)
 
     async def ListSnapshots(
         self, request: RequestListSnapshots, context: grpc.ServicerContext
@@ -656,28 +791,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the ListSnapshots response
         """
-        packed_req = Request(list_snapshots=request)
-        message, _ = _TendermintProtocolDecoder.request_list_snapshots(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_LIST_SNAPSHOTS
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_list_snapshots(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.list_snapshots
+        return await self._call("list_snapshots", request, context)
 
     async def OfferSnapshot(
         self, request: RequestOfferSnapshot, context: grpc.ServicerContext
@@ -687,28 +803,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the OfferSnapshot response
         """
-        packed_req = Request(offer_snapshot=request)
-        message, _ = _TendermintProtocolDecoder.request_offer_snapshot(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_OFFER_SNAPSHOT
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_offer_snapshot(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.list_snapshots
+        return await self._call("offer_snapshot", request, context)
 
     async def LoadSnapshotChunk(
         self, request: RequestLoadSnapshotChunk, context: grpc.ServicerContext
@@ -718,28 +815,9 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the LoadSnapshotChunk response
         """
-        packed_req = Request(load_snapshot_chunk=request)
-        message, _ = _TendermintProtocolDecoder.request_load_snapshot_chunk(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_LOAD_SNAPSHOT_CHUNK
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_load_snapshot_chunk(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.load_snapshot_chunk
+        return await self._call("load_snapshot_chunk", request, context)
 
     async def ApplySnapshotChunk(
         self, request: RequestApplySnapshotChunk, context: grpc.ServicerContext
@@ -749,58 +827,65 @@ class ABCIApplicationServicer(types_pb2_grpc.ABCIApplicationServicer):
 
         :param: request: The request from the Tendermint node
         :param: context: The request context
-        :return: the Echo response
+        :return: the ApplySnapshotChunk response
         """
-        packed_req = Request(apply_snapshot_chunk=request)
-        message, _ = _TendermintProtocolDecoder.request_apply_snapshot_chunk(
-            packed_req, self._dialogues, self._target_skill
-        )
-        envelope = Envelope(to=message.to, sender=message.sender, message=message)
-
-        await self._request_queue.put(envelope)
-        message = cast(
-            AbciMessage,
-            (
-                await self._response_queues[
-                    AbciMessage.Performative.RESPONSE_APPLY_SNAPSHOT_CHUNK
-                ].get()
-            ).message,
-        )
-
-        response = _TendermintProtocolEncoder.response_apply_snapshot_chunk(message)
-        context.set_code(grpc.StatusCode.OK)
-
-        return response.apply_snapshot_chunk
+        return await self._call("apply_snapshot_chunk", request, context)
 
 
 class GrpcServerChannel:  # pylint: disable=too-many-instance-attributes
     """gRPC server channel to handle incoming communication from the Tendermint node."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         target_skill_id: PublicId,
         address: str,
         port: int,
         logger: Optional[Logger] = None,
+        max_message_length: Optional[int] = None,
+        keepalive_time_ms: Optional[int] = None,
+        max_concurrent_rpcs: Optional[int] = None,
+        fast_path_methods: Iterable[str] = DEFAULT_GRPC_FAST_PATH_METHODS,
+        request_queue_size: int = DEFAULT_REQUEST_QUEUE_SIZE,
+        request_queue_alarm_wait: float = DEFAULT_REQUEST_QUEUE_ALARM_WAIT,
     ):
         """
         Initialize the gRPC server.
 
+        While the request queue is full, the calls wait for a free slot before going through the skill.
+
         :param target_skill_id: the public id of the target skill.
         :param address: the listen address.
         :param port: the port to listen from.
         :param logger: the logger.
+        :param max_message_length: the maximum size of the messages sent and received, in bytes. gRPC's default if `None`.
+        :param keepalive_time_ms: the interval of the keepalive pings, in milliseconds. gRPC's default if `None`.
+        :param max_concurrent_rpcs: the maximum number of calls served concurrently. Unlimited if `None`.
+        :param fast_path_methods: the read-only methods to answer without going through the skill, when possible.
+        :param request_queue_size: the maximum number of requests waiting for the skill.
+        :param request_queue_alarm_wait: the time a request may wait for the skill before raising an alarm, in seconds.
         """
         self.target_skill_id = target_skill_id
         self.address = address
         self.port = port
         self.logger = logger
+        self.max_concurrent_rpcs = max_concurrent_rpcs
+        self.fast_path_methods = tuple(fast_path_methods)
+        self.request_queue_size = request_queue_size
+        self.request_queue_alarm_wait = request_queue_alarm_wait
+        self.server_options: List[Tuple[str, int]] = []
+        if max_message_length is not None:
+            self.server_options += [
+                ("grpc.max_send_message_length", max_message_length),
+                ("grpc.max_receive_message_length", max_message_length),
+            ]
+        if keepalive_time_ms is not None:
+            self.server_options.append(("grpc.keepalive_time_ms", keepalive_time_ms))
 
         # channel state
         self._loop: Optional[AbstractEventLoop] = None
         self._dialogues = AbciDialogues(connection_id=PUBLIC_ID)
         self._is_stopped: bool = True
-        self.queue: Optional[asyncio.Queue] = None
+        self.queue: Optional[RequestQueue] = None
         self._server: Optional[grpc.Server] = None
         self._server_task: Optional[Task] = None
         self._servicer: Optional[ABCIApplicationServicer] = None
@@ -813,14 +898,21 @@ class GrpcServerChannel:  # pylint: disable=too-many-instance-attributes
     async def _start_server(self) -> None:
         """Start the gRPC server."""
         self.logger = cast(Logger, self.logger)
-        self.queue = cast(asyncio.Queue, self.queue)
+        self.queue = cast(RequestQueue, self.queue)
         self.logger.info("Starting gRPC server")
-        server = grpc.aio.server()
+        server = grpc.aio.server(
+            options=self.server_options,
+            maximum_concurrent_rpcs=self.max_concurrent_rpcs,
+        )
         self._servicer = ABCIApplicationServicer(
-            self.queue, self._dialogues, str(self.target_skill_id)
+            self.queue,
+            self._dialogues,
+            str(self.target_skill_id),
+            self.fast_path_methods,
         )
         types_pb2_grpc.add_ABCIApplicationServicer_to_server(self._servicer, server)
-        server.add_insecure_port(f"[::]:{self.port}")
+        # the port is only known once bound, if it was left to the OS
+        self.port = server.add_insecure_port(f"[::]:{self.port}")
         self._server = server
         await self._server.start()
         await self._server.wait_for_termination()
@@ -835,7 +927,9 @@ class GrpcServerChannel:  # pylint: disable=too-many-instance-attributes
             return
         self._loop = loop
         self._is_stopped = False
-        self.queue = asyncio.Queue()
+        self.queue = RequestQueue(
+            self.request_queue_size, self.request_queue_alarm_wait, self.logger
+        )
 
         asyncio.create_task(self._start_server())
 
@@ -846,13 +940,22 @@ class GrpcServerChannel:  # pylint: disable=too-many-instance-attributes
         self._is_stopped = True
         self._server = cast(grpc.Server, self._server)
         await self._server.stop(0)
+        if self._servicer is not None:
+            cast(Logger, self.logger).info(
+                f"gRPC latency by method: {self._servicer.latency.summary()}"
+            )
+        cast(Logger, self.logger).info(f"ABCI channel stats: {self.stats()}")
 
         self.queue = None
         self._server = None
 
+    def stats(self) -> Dict[str, float]:
+        """Get the stats of the request queue."""
+        return self.queue.summary() if self.queue is not None else {}
+
     async def get_message(self) -> Envelope:
         """Get a message from the queue."""
-        return await cast(asyncio.Queue, self.queue).get()
+        return await cast(RequestQueue, self.queue).get()
 
     async def send(self, envelope: Envelope) -> None:
         """Send a message."""
@@ -869,25 +972,38 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
         address: str,
         port: int,
         logger: Optional[Logger] = None,
+        max_write_buffer_size: int = DEFAULT_MAX_WRITE_BUFFER_SIZE,
+        request_queue_size: int = DEFAULT_REQUEST_QUEUE_SIZE,
+        request_queue_alarm_wait: float = DEFAULT_REQUEST_QUEUE_ALARM_WAIT,
     ):
         """
         Initialize the TCP server.
 
+        The responses to a peer are buffered until Tendermint asks for them with a `Flush` request,
+        or until their size reaches `max_write_buffer_size`, and are then written at once.
+        While the request queue is full, the requests are not read from the peers.
+
         :param target_skill_id: the public id of the target skill.
         :param address: the listen address.
         :param port: the port to listen from.
         :param logger: the logger.
+        :param max_write_buffer_size: the size, in bytes, of the buffered responses which triggers a write.
+        :param request_queue_size: the maximum number of requests waiting for the skill.
+        :param request_queue_alarm_wait: the time a request may wait for the skill before raising an alarm, in seconds.
         """
         self.target_skill_id = target_skill_id
         self.address = address
         self.port = port
         self.logger = logger or logging.getLogger()
+        self.max_write_buffer_size = max_write_buffer_size
+        self.request_queue_size = request_queue_size
+        self.request_queue_alarm_wait = request_queue_alarm_wait
 
         # channel state
         self._loop: Optional[AbstractEventLoop] = None
         self._dialogues = AbciDialogues(connection_id=PUBLIC_ID)
         self._is_stopped: bool = True
-        self.queue: Optional[asyncio.Queue] = None
+        self.queue: Optional[RequestQueue] = None
         self._server: Optional[AbstractServer] = None
         self._server_task: Optional[Task] = None
         # a single Tendermint opens four concurrent connections:
@@ -900,6 +1016,8 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
         # this dictionary associates requests to socket name
         # such that responses are sent to the right receiver
         self._request_id_to_socket: Dict[DialogueLabel, str] = {}
+        self._pending_writes: Dict[str, List[bytes]] = {}
+        self._pending_sizes: Dict[str, int] = {}
 
     @property
     def is_stopped(self) -> bool:
@@ -918,7 +1036,9 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
             return
         self._loop = loop
         self._is_stopped = False
-        self.queue = asyncio.Queue()
+        self.queue = RequestQueue(
+            self.request_queue_size, self.request_queue_alarm_wait, self.logger
+        )
         self._server = await asyncio.start_server(
             self.receive_messages, host=self.address, port=self.port
         )
@@ -931,23 +1051,43 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
         self._server = cast(AbstractServer, self._server)
         self._server.close()
         await self._server.wait_closed()
+        self.logger.info(f"ABCI channel stats: {self.stats()}")
 
         self.queue = None
         self._server = None
         self._streams_by_socket = {}
         self._request_id_to_socket = {}
+        self._pending_writes = {}
+        self._pending_sizes = {}
+
+    def stats(self) -> Dict[str, float]:
+        """Get the stats of the request queue, the number of connected peers and of requests waiting for a response."""
+        stats = self.queue.summary() if self.queue is not None else {}
+        stats["peers"] = len(self._streams_by_socket)
+        stats["pending_requests"] = len(self._request_id_to_socket)
+        return stats
 
     async def receive_messages(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """Receive incoming messages."""
         self.logger = cast(Logger, self.logger)
-        self.queue = cast(asyncio.Queue, self.queue)
         ip_address, socket, *_ = writer.get_extra_info("peername")
         peer_name = f"{ip_address}:{socket}"
         self._streams_by_socket[peer_name] = (reader, writer)
         self.logger.debug(f"Connection with Tendermint @ {peer_name}")
-
+        try:
+            await self._receive_messages(reader, peer_name)
+        finally:
+            # the responses to the requests of a closed connection cannot be delivered anyway
+            self._streams_by_socket.pop(peer_name, None)
+            self._pending_writes.pop(peer_name, None)
+            self._pending_sizes.pop(peer_name, None)
+
+    async def _receive_messages(
+        self, reader: asyncio.StreamReader, peer_name: str
+    ) -> None:
+        """Read the requests of a peer, until its connection is closed."""
         varint_message_reader = VarintMessageReader(reader)
         while not self.is_stopped:
             try:
@@ -963,10 +1103,7 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
                 )
                 message = Request()
                 message.ParseFromString(message_bytes)
-            except (
-                DecodeVarintError,
-                DecodeError,
-            ) as e:  # pragma: nocover
+            except DecodeError as e:  # pragma: nocover
                 self.logger.error(
                     f"an error occurred while reading a message: "
                     f"{type(e).__name__}: {e}. "
@@ -976,6 +1113,16 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
                     self.logger.info("connection at EOF, stop receiving loop.")
                     return
                 continue
+            except DecodeVarintError as e:
+                # the bytes after an invalid length prefix cannot be split into messages anymore
+                self.logger.error(
+                    f"an error occurred while reading the length of a message: "
+                    f"{type(e).__name__}: {e}. "
+                    f"Closing the connection to {peer_name}."
+                )
+                _, writer = self._streams_by_socket[peer_name]
+                writer.close()
+                return
             except TooLargeVarint as e:  # pragma: nocover
                 self.logger.error(
                     f"A message exceeding the configured max size was received. "
@@ -987,6 +1134,11 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
             except EOFError:
                 self.logger.info("connection at EOF, stop receiving loop.")
                 return
+            except ShortBufferLengthError as e:
+                self.logger.error(
+                    f"connection at EOF in the middle of a message, stop receiving loop. {e}"
+                )
+                return
             except CancelledError:  # pragma: nocover
                 self.logger.debug(f"Read task for peer {peer_name} cancelled.")
                 return
@@ -1002,13 +1154,14 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
             if result is not None:
                 request, dialogue = result
                 # associate request to peer, so we remember who to reply to
-                self._request_id_to_socket[
-                    dialogue.incomplete_dialogue_label
-                ] = peer_name
+                self._request_id_to_socket[dialogue.incomplete_dialogue_label] = (
+                    peer_name
+                )
                 envelope = Envelope(
                     to=request.to, sender=request.sender, message=request
                 )
-                await cast(asyncio.Queue, self.queue).put(envelope)
+                # while the queue is full, the peer's requests are not read, so that Tendermint slows down
+                await cast(RequestQueue, self.queue).put(envelope)
             else:  # pragma: nocover
                 self.logger.warning(f"Decoded request {req_type} was not a match.")
         except Exception as e:  # pylint: disable=broad-except  # pragma: no cover
@@ -1016,7 +1169,7 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
 
     async def get_message(self) -> Envelope:
         """Get a message from the queue."""
-        return await cast(asyncio.Queue, self.queue).get()
+        return await cast(RequestQueue, self.queue).get()
 
     async def send(self, envelope: Envelope) -> None:
         """Send a message."""
@@ -1029,11 +1182,43 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
 
         # we only deal with atomic request-response cycles, so it is safe to remove the reference
         peer_name = self._request_id_to_socket.pop(dialogue.incomplete_dialogue_label)
-        _reader, writer = self._streams_by_socket[peer_name]
+        if peer_name not in self._streams_by_socket:
+            self.logger.warning(
+                f"Dropping the response to {peer_name}, as the connection was closed."
+            )
+            return
         protobuf_message = _TendermintProtocolEncoder.process(message)
         data = _TendermintABCISerializer.write_message(protobuf_message)
-        self.logger.debug(f"Writing {len(data)} bytes")
-        writer.write(data)
+        self._pending_writes.setdefault(peer_name, []).append(data)
+        pending_size = self._pending_sizes.get(peer_name, 0) + len(data)
+        self._pending_sizes[peer_name] = pending_size
+
+        if (
+            message.performative
+            in (
+                AbciMessage.Performative.RESPONSE_FLUSH,
+                AbciMessage.Performative.RESPONSE_EXCEPTION,
+            )
+            or pending_size >= self.max_write_buffer_size
+        ):
+            await self._flush(peer_name)
+
+    async def _flush(self, peer_name: str) -> None:
+        """Write the buffered responses to a peer at once, and wait for the stream to drain."""
+        self.logger = cast(Logger, self.logger)
+        chunks = self._pending_writes.pop(peer_name, [])
+        size = self._pending_sizes.pop(peer_name, 0)
+        if not chunks:  # pragma: nocover
+            return
+        _reader, writer = self._streams_by_socket[peer_name]
+        self.logger.debug(f"Writing {size} bytes in {len(chunks)} responses")
+        try:
+            writer.writelines(chunks)
+            await writer.drain()
+        except ConnectionError as e:  # pragma: nocover
+            self.logger.error(
+                f"Could not write the responses to {peer_name}: {type(e).__name__}: {e}"
+            )
 
 
 class StoppableThread(
@@ -1348,6 +1533,20 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
                 address=self.host,
                 port=self.port,
                 logger=self.logger,
+                max_message_length=self.configuration.config.get(
+                    "grpc_max_message_length"
+                ),
+                keepalive_time_ms=self.configuration.config.get(
+                    "grpc_keepalive_time_ms"
+                ),
+                max_concurrent_rpcs=self.configuration.config.get(
+                    "grpc_max_concurrent_rpcs"
+                ),
+                fast_path_methods=self.configuration.config.get(
+                    "grpc_fast_path_methods", DEFAULT_GRPC_FAST_PATH_METHODS
+                ),
+                request_queue_size=self.request_queue_size,
+                request_queue_alarm_wait=self.request_queue_alarm_wait,
             )
         else:
             self.channel = TcpServerChannel(
@@ -1355,6 +1554,9 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
                 address=self.host,
                 port=self.port,
                 logger=self.logger,
+                max_write_buffer_size=self.max_write_buffer_size,
+                request_queue_size=self.request_queue_size,
+                request_queue_alarm_wait=self.request_queue_alarm_wait,
             )
 
     def _process_connection_params(self) -> None:
@@ -1365,9 +1567,30 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
         - host
         - port
         - target_skill_id
+        - max_write_buffer_size
+        - request_queue_size
+        - request_queue_alarm_wait
         """
         self.host = cast(str, self.configuration.config.get("host"))
         self.port = cast(int, self.configuration.config.get("port"))
+        self.max_write_buffer_size = cast(
+            int,
+            self.configuration.config.get(
+                "max_write_buffer_size", DEFAULT_MAX_WRITE_BUFFER_SIZE
+            ),
+        )
+        self.request_queue_size = cast(
+            int,
+            self.configuration.config.get(
+                "request_queue_size", DEFAULT_REQUEST_QUEUE_SIZE
+            ),
+        )
+        self.request_queue_alarm_wait = cast(
+            float,
+            self.configuration.config.get(
+                "request_queue_alarm_wait", DEFAULT_REQUEST_QUEUE_ALARM_WAIT
+            ),
+        )
         target_skill_id_string = cast(
             Optional[str], self.configuration.config.get("target_skill_id")
         )
@@ -20,8 +20,9 @@
 
 # isort: skip_file  # noqa
 
-from typing import Callable, Optional, Tuple, cast
+from typing import Any, Callable, Optional, Tuple, cast
 
+import aea
 from aea.exceptions import enforce
 from google.protobuf.timestamp_pb2 import (  # pylint: disable=no-name-in-module
     Timestamp as TimestampPb,
@@ -73,6 +74,112 @@ from packages.valory.connections.abci.tendermint.types.types_pb2 import (  # typ
 )
 
 
+# the types of check_tx requests are immutable, so they can be shared by all the messages
+_CHECK_TX_TYPES = {
+    check_tx_type.value: CheckTxType(check_tx_type) for check_tx_type in CheckTxTypeEnum
+}
+
+# the open-aea versions, as "major.minor", whose message and dialogue internals `_create_tx_request_fast` relies on
+_FAST_TX_REQUEST_AEA_VERSIONS = frozenset({"1.50"})
+
+
+def _supports_fast_tx_requests() -> bool:
+    """Check whether the installed open-aea is one that the fast creation of the tx requests was tested against."""
+    version = ".".join(aea.__version__.split(".")[:2])
+    return (
+        version in _FAST_TX_REQUEST_AEA_VERSIONS
+        and hasattr(AbciMessage, "_SlotsCls")
+        and hasattr(AbciMessage, "_update_slots_from_dict")
+        and hasattr(AbciDialogues, "_create_dialogue")
+    )
+
+
+_FAST_TX_REQUESTS = _supports_fast_tx_requests()
+
+
+def _check_tx_type(value: int) -> CheckTxType:
+    """
+    Get the type of a check_tx request.
+
+    :param value: the value of the type in the request.
+    :return: the shared type.
+    :raises ValueError: if the value is not a known type.
+    """
+    check_tx_type = _CHECK_TX_TYPES.get(value)
+    if check_tx_type is None:
+        # raises the ValueError of the enum
+        return CheckTxType(CheckTxTypeEnum(value))
+    return check_tx_type
+
+
+def _create_tx_request(
+    dialogues: AbciDialogues,
+    counterparty: str,
+    performative: AbciMessage.Performative,
+    **kwargs: Any,
+) -> Tuple[AbciMessage, AbciDialogue]:
+    """
+    Create the dialogue of a request which carries a transaction.
+
+    The request is created by `_create_tx_request_fast` with the versions of open-aea it was tested against,
+    and through the public `Dialogues.create` otherwise.
+
+    :param dialogues: the dialogues object.
+    :param counterparty: the counterparty.
+    :param performative: the performative of the request.
+    :param kwargs: the contents of the request.
+    :return: the AbciMessage request and its dialogue.
+    """
+    if _FAST_TX_REQUESTS:
+        return _create_tx_request_fast(dialogues, counterparty, performative, **kwargs)
+    abci_message, abci_dialogue = dialogues.create(counterparty, performative, **kwargs)
+    return cast(AbciMessage, abci_message), cast(AbciDialogue, abci_dialogue)
+
+
+def _create_tx_request_fast(
+    dialogues: AbciDialogues,
+    counterparty: str,
+    performative: AbciMessage.Performative,
+    **kwargs: Any,
+) -> Tuple[AbciMessage, AbciDialogue]:
+    """
+    Create the dialogue of a request which carries a transaction, skipping the consistency checks of its message.
+
+    The transactions are the bulk of the requests, and the contents of their messages are valid by construction,
+    i.e., bytes and a `CheckTxType`, so the generic checks of `Message.__init__`,
+    which only log the inconsistencies anyway, are the most expensive part of their decoding.
+    The message is still validated by the dialogue, as any other initial message.
+    This relies on the internals of open-aea's messages and dialogues,
+    and is tested to create the same request as `Dialogues.create`.
+
+    :param dialogues: the dialogues object.
+    :param counterparty: the counterparty.
+    :param performative: the performative of the request.
+    :param kwargs: the contents of the request.
+    :return: the AbciMessage request and its dialogue.
+    """
+    abci_message = AbciMessage.__new__(AbciMessage)
+    abci_message._slots = AbciMessage._SlotsCls()  # pylint: disable=protected-access
+    abci_message._to = None  # pylint: disable=protected-access
+    abci_message._sender = None  # pylint: disable=protected-access
+    abci_message._update_slots_from_dict(  # pylint: disable=protected-access
+        dict(
+            dialogue_reference=dialogues.new_self_initiated_dialogue_reference(),
+            message_id=AbciDialogue.STARTING_MESSAGE_ID,
+            target=AbciDialogue.STARTING_TARGET,
+            performative=performative,
+            **kwargs,
+        )
+    )
+    abci_message.sender = dialogues.self_address
+    abci_message.to = counterparty
+    # not `create_with_message`, which formats the message for its checks even when they pass
+    abci_dialogue = dialogues._create_dialogue(  # pylint: disable=protected-access
+        counterparty, abci_message
+    )
+    return abci_message, cast(AbciDialogue, abci_dialogue)
+
+
 class _TendermintProtocolDecoder:
     """
     Decoder called by the server to process requests from the TCP connection with Tendermint.
@@ -260,15 +367,13 @@ class _TendermintProtocolDecoder:
         :return: the AbciMessage request.
         """
         check_tx = request.check_tx
-        transaction = check_tx.tx
-        check_tx_type = CheckTxType(CheckTxTypeEnum(check_tx.type))
-        abci_message, abci_dialogue = dialogues.create(
-            performative=AbciMessage.Performative.REQUEST_CHECK_TX,
-            counterparty=counterparty,
-            tx=transaction,
-            type=check_tx_type,
+        return _create_tx_request(
+            dialogues,
+            counterparty,
+            AbciMessage.Performative.REQUEST_CHECK_TX,
+            tx=check_tx.tx,
+            type=_check_tx_type(check_tx.type),
         )
-        return cast(AbciMessage, abci_message), cast(AbciDialogue, abci_dialogue)
 
     @classmethod
     def request_deliver_tx(
@@ -282,12 +387,12 @@ class _TendermintProtocolDecoder:
         :param counterparty: the counterparty.
         :return: the AbciMessage request.
         """
-        abci_message, abci_dialogue = dialogues.create(
-            performative=AbciMessage.Performative.REQUEST_DELIVER_TX,
-            counterparty=counterparty,
+        return _create_tx_request(
+            dialogues,
+            counterparty,
+            AbciMessage.Performative.REQUEST_DELIVER_TX,
             tx=request.deliver_tx.tx,
         )
-        return cast(AbciMessage, abci_message), cast(AbciDialogue, abci_dialogue)
 
     @classmethod
     def request_query(
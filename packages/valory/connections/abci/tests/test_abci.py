@@ -27,7 +27,6 @@ import os
 import shutil
 import time
 from abc import ABC, abstractmethod
-from cmath import inf
 from contextlib import suppress
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -36,10 +35,11 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import docker
+import grpc
 import pytest
 import requests
 from _pytest.fixtures import SubRequest  # type: ignore
-from aea.configurations.base import ConnectionConfig
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.connections.base import ConnectionStates
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
@@ -65,16 +65,35 @@ from hypothesis.strategies import integers
 
 from packages.valory.connections.abci import check_dependencies as dep_utils
 from packages.valory.connections.abci.connection import (
+    ABCIApplicationServicer,
     ABCIServerConnection,
     DEFAULT_ABCI_PORT,
     DEFAULT_LISTEN_ADDRESS,
     DecodeVarintError,
     EncodeVarintError,
+    GrpcServerChannel,
+    LOCALHOST,
+    MAX_VARINT_BYTES,
+    READ_CHUNK_SIZE,
+    RequestQueue,
     ShortBufferLengthError,
+    TcpServerChannel,
     TooLargeVarint,
     VarintMessageReader,
     _TendermintABCISerializer,
 )
+from packages.valory.connections.abci.tendermint.abci import (  # type: ignore
+    types_pb2_grpc,
+)
+from packages.valory.connections.abci.tendermint.abci.types_pb2 import (  # type: ignore
+    Request,
+    RequestCommit,
+    RequestDeliverTx,
+    RequestEcho,
+    RequestFlush,
+    RequestQuery,
+    Response,
+)
 from packages.valory.protocols.abci import AbciMessage
 from packages.valory.protocols.abci.custom_types import (
     BlockParams,
@@ -588,6 +607,9 @@ async def test_encode_decode_varint(value: int) -> None:
     decoder = _TendermintABCISerializer.decode_varint
     decoded_value = await decoder(reader)
     assert decoded_value == value
+    parsed = _TendermintABCISerializer.parse_varint(encoded_value)
+    assert parsed == (value, len(encoded_value))
+    assert _TendermintABCISerializer.parse_varint(encoded_value[:-1]) is None
 
 
 @pytest.mark.parametrize("value", [-1, 1 << 64])
@@ -625,37 +647,390 @@ def test_dep_util() -> None:
     assert dep_utils.version_to_string((1, 0, 0)) == "1.0.0"
 
 
+def _frame(message: bytes) -> bytes:
+    """Prefix a message with its varint-encoded length."""
+    return _TendermintABCISerializer.encode_varint(len(message)) + message
+
+
 @pytest.mark.asyncio
 async def test_varint_message_reader() -> None:
     """Test VarintMessageReader"""
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(_TendermintABCISerializer.encode_varint(1 << 40))
+    with pytest.raises(TooLargeVarint):
+        await VarintMessageReader(stream_reader).read_next_message()
+
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(_frame(b"hello")[:-1])
+    stream_reader.feed_eof()
+    with pytest.raises(ShortBufferLengthError):
+        await VarintMessageReader(stream_reader).read_next_message()
+
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(_frame(b"hello"))
+    stream_reader.feed_eof()
+    vmr = VarintMessageReader(stream_reader)
+    res = await vmr.read_next_message()
+    assert res == b"hello"
+    with pytest.raises(EOFError):
+        await vmr.read_next_message()
 
-    async def read(nb: int) -> bytes:
-        return b"hello"
-
-    def patch_async_methods(value: Any) -> Callable:
-        async def decode_varint(*args: Any, **kwargs: Any) -> Any:
-            return value
 
-        return decode_varint
+@pytest.mark.asyncio
+@pytest.mark.parametrize("read_size", [1, 3, 64, READ_CHUNK_SIZE])
+async def test_varint_message_reader_buffers_frames(read_size: int) -> None:
+    """Test that VarintMessageReader parses many frames per read, and completes the frames split across reads."""
+    messages = [b"", b"hello", os.urandom(300), os.urandom(1000)]
+    stream_reader = asyncio.StreamReader()
+    with mock.patch.object(
+        stream_reader, "read", wraps=stream_reader.read
+    ) as mock_read:
+        vmr = VarintMessageReader(stream_reader, read_size=read_size)
+        stream_reader.feed_data(b"".join(_frame(message) for message in messages))
+        stream_reader.feed_eof()
+        assert [await vmr.read_next_message() for _ in messages] == messages
+        with pytest.raises(EOFError):
+            await vmr.read_next_message()
+    if read_size == READ_CHUNK_SIZE:
+        # all the frames are parsed from a single read, and EOF is read once
+        assert mock_read.call_count == 2
 
-    stream_reader = MagicMock(read=read)
-    vmr = VarintMessageReader(stream_reader)
 
+@pytest.mark.asyncio
+async def test_varint_message_reader_large_frames() -> None:
+    """Test that VarintMessageReader reads the rest of a frame larger than the chunks at once."""
+    large = os.urandom(1000)
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(_frame(large) + _frame(b"hello") + _frame(large)[:-1])
+    stream_reader.feed_eof()
     with mock.patch.object(
-        _TendermintABCISerializer, "decode_varint", new=patch_async_methods(inf)
-    ):
-        with pytest.raises(TooLargeVarint):
+        stream_reader, "read", wraps=stream_reader.read
+    ) as mock_read:
+        vmr = VarintMessageReader(stream_reader, read_size=64)
+        assert await vmr.read_next_message() == large
+        # a chunk, and then the rest of the frame at once
+        assert mock_read.call_count == 2
+        assert await vmr.read_next_message() == b"hello"
+        with pytest.raises(ShortBufferLengthError):
             await vmr.read_next_message()
 
-    with mock.patch.object(
-        _TendermintABCISerializer, "decode_varint", new=patch_async_methods(10)
-    ):
-        with mock.patch.object(vmr, "read_until", new=patch_async_methods(b"")):
-            with pytest.raises(ShortBufferLengthError):
-                await vmr.read_next_message()
 
-    with mock.patch.object(
-        _TendermintABCISerializer, "decode_varint", new=patch_async_methods(5)
-    ):
-        res = await vmr.read_next_message()
-        assert res == b"hello"
+@pytest.mark.asyncio
+async def test_varint_message_reader_invalid_varint() -> None:
+    """Test that VarintMessageReader raises when a varint is invalid."""
+    stream_reader = asyncio.StreamReader()
+    stream_reader.feed_data(b"\x80" * (MAX_VARINT_BYTES + 1) + _frame(b"hello"))
+    vmr = VarintMessageReader(stream_reader)
+    with pytest.raises(DecodeVarintError):
+        await vmr.read_next_message()
+
+
+class TestRequestQueue:
+    """Test the bounded queue of the requests to the skill."""
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self) -> None:
+        """Test that the puts wait while the queue is full, and that the skill is reported as the bottleneck once."""
+        logger = MagicMock()
+        queue = RequestQueue(maxsize=2, alarm_wait=0, logger=logger)
+        await queue.put("first")
+        await queue.put("second")
+        blocked_put = asyncio.create_task(queue.put("third"))
+        await asyncio.sleep(0.05)
+        assert not blocked_put.done()
+
+        assert [await queue.get() for _ in range(3)] == ["first", "second", "third"]
+        assert blocked_put.done()
+        summary = queue.summary()
+        assert summary["max_size"] == 2
+        assert summary["depth"] == 0
+        assert summary["max_depth"] == 2
+        assert summary["requests"] == 3
+        assert summary["blocked_puts"] == 1
+        assert summary["max_put_wait_ms"] >= 50
+        assert summary["max_wait_ms"] >= summary["mean_wait_ms"] > 0
+        # the queue was full once, and every request waited longer than the alarm threshold
+        assert summary["alarms"] == 4
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unbounded(self) -> None:
+        """Test that the queue is unbounded if its size is not positive, and that short waits raise no alarm."""
+        logger = MagicMock()
+        queue = RequestQueue(maxsize=0, logger=logger)
+        for i in range(10):
+            await queue.put(i)
+        assert [await queue.get() for _ in range(10)] == list(range(10))
+        assert queue.summary()["blocked_puts"] == 0
+        assert queue.summary()["alarms"] == 0
+        logger.warning.assert_not_called()
+
+
+class TestTcpServerChannelBatching:
+    """Test that the TCP server channel batches the responses to a peer."""
+
+    TARGET_SKILL_ID = "dummy_author/dummy:0.1.0"
+
+    async def _serve(self, **kwargs: Any) -> None:
+        """Start the channel, and connect a client to it."""
+        self.channel = TcpServerChannel(
+            PublicId.from_str(self.TARGET_SKILL_ID), LOCALHOST, 0, **kwargs
+        )
+        await self.channel.connect(asyncio.get_event_loop())
+        server = cast(asyncio.AbstractServer, self.channel._server)
+        port = server.sockets[0].getsockname()[1]
+        self.app = ABCIAppTest(self.TARGET_SKILL_ID)
+        self.reader, self.writer = await asyncio.open_connection(LOCALHOST, port)
+        self.responses = VarintMessageReader(self.reader)
+
+    async def _request(self, *requests: Request) -> None:
+        """Send requests to the channel, and let the app reply to them."""
+        self.writer.write(
+            b"".join(_TendermintABCISerializer.write_message(r) for r in requests)
+        )
+        for _ in requests:
+            request_envelope = await asyncio.wait_for(self.channel.get_message(), 5)
+            response = self.app.handle(cast(AbciMessage, request_envelope.message))
+            await self.channel.send(
+                Envelope(
+                    to=request_envelope.sender,
+                    sender=request_envelope.to,
+                    message=response,
+                )
+            )
+
+    async def _read_response(self, timeout: float = 5) -> Response:
+        """Read a response from the channel."""
+        response = Response()
+        response.ParseFromString(
+            await asyncio.wait_for(self.responses.read_next_message(), timeout)
+        )
+        return response
+
+    async def _teardown(self) -> None:
+        """Close the client and the channel."""
+        self.writer.close()
+        await self.writer.wait_closed()
+        # let the channel read the end of the stream
+        await asyncio.sleep(0.1)
+        await self.channel.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_responses_are_written_on_flush(self) -> None:
+        """Test that the responses are buffered until a flush request is answered."""
+        await self._serve()
+        try:
+            await self._request(
+                *(Request(echo=RequestEcho(message=str(i))) for i in range(3))
+            )
+            assert self.channel._pending_sizes
+            with pytest.raises(asyncio.TimeoutError):
+                await self._read_response(timeout=0.2)
+
+            await self._request(Request(flush=RequestFlush()))
+            assert not self.channel._pending_writes
+            responses = [await self._read_response() for _ in range(4)]
+            assert [r.echo.message for r in responses[:3]] == ["0", "1", "2"]
+            assert responses[3].WhichOneof("value") == "flush"
+        finally:
+            await self._teardown()
+
+    @pytest.mark.asyncio
+    async def test_requests_are_not_read_while_the_queue_is_full(self) -> None:
+        """Test that the channel stops reading the requests of a peer while the skill falls behind."""
+        await self._serve(request_queue_size=1)
+        try:
+            self.writer.write(
+                b"".join(
+                    _TendermintABCISerializer.write_message(
+                        Request(echo=RequestEcho(message=str(i)))
+                    )
+                    for i in range(3)
+                )
+            )
+            await asyncio.sleep(0.1)
+            stats = self.channel.stats()
+            assert stats["depth"] == 1
+            assert stats["blocked_puts"] == 1
+            assert stats["peers"] == 1
+            assert stats["pending_requests"] == 2
+
+            for i in range(3):
+                envelope = await asyncio.wait_for(self.channel.get_message(), 5)
+                assert cast(AbciMessage, envelope.message).message == str(i)
+            assert self.channel.stats()["pending_requests"] == 3
+        finally:
+            await self._teardown()
+
+    @pytest.mark.asyncio
+    async def test_responses_to_closed_connections_are_dropped(self) -> None:
+        """Test that the streams of a closed connection are forgotten, along with the responses to it."""
+        await self._serve()
+        self.writer.write(
+            _TendermintABCISerializer.write_message(
+                Request(echo=RequestEcho(message="hello"))
+            )
+        )
+        request_envelope = await asyncio.wait_for(self.channel.get_message(), 5)
+        self.writer.close()
+        await self.writer.wait_closed()
+        await asyncio.sleep(0.1)
+        assert self.channel.stats()["peers"] == 0
+
+        response = self.app.handle(cast(AbciMessage, request_envelope.message))
+        await self.channel.send(
+            Envelope(
+                to=request_envelope.sender, sender=request_envelope.to, message=response
+            )
+        )
+        assert self.channel.stats()["pending_requests"] == 0
+        assert not self.channel._pending_writes
+        await self.channel.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_invalid_varint_closes_the_connection(self) -> None:
+        """Test that the connection is closed when the length of a message cannot be read."""
+        await self._serve()
+        self.writer.write(
+            b"\x80" * (MAX_VARINT_BYTES + 1)
+            + _TendermintABCISerializer.write_message(
+                Request(echo=RequestEcho(message="hello"))
+            )
+        )
+        assert await asyncio.wait_for(self.reader.read(), 5) == b""
+        assert self.channel.stats()["peers"] == 0
+        assert self.channel.queue.empty()
+        self.writer.close()
+        await self.channel.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_responses_are_written_on_size_threshold(self) -> None:
+        """Test that the buffered responses are written once their size reaches the threshold."""
+        await self._serve(max_write_buffer_size=1)
+        try:
+            await self._request(Request(echo=RequestEcho(message="hello")))
+            assert not self.channel._pending_writes
+            assert (await self._read_response()).echo.message == "hello"
+        finally:
+            await self._teardown()
+
+
+class TestGrpcServerChannel:
+    """Test the gRPC server channel's fast path and latency counters."""
+
+    TARGET_SKILL_ID = "dummy_author/dummy:0.1.0"
+
+    async def _serve(self, **kwargs: Any) -> None:
+        """Start the channel and an app replying to its requests, and connect a client to it."""
+        self.channel = GrpcServerChannel(
+            PublicId.from_str(self.TARGET_SKILL_ID),
+            LOCALHOST,
+            0,
+            logger=logging.getLogger(),
+            **kwargs,
+        )
+        await self.channel.connect(asyncio.get_event_loop())
+        while self.channel._server is None:
+            await asyncio.sleep(0.01)
+        self.app = ABCIAppTest(self.TARGET_SKILL_ID)
+        self.handled: List[str] = []
+        self.app_task = asyncio.create_task(self._run_app())
+        self.client = grpc.aio.insecure_channel(f"{LOCALHOST}:{self.channel.port}")
+        self.stub = types_pb2_grpc.ABCIApplicationStub(self.client)
+
+    async def _run_app(self) -> None:
+        """Reply to the requests of the channel."""
+        while True:
+            request_envelope = await self.channel.get_message()
+            request = cast(AbciMessage, request_envelope.message)
+            self.handled.append(request.performative.value)
+            await self.channel.send(
+                Envelope(
+                    to=request_envelope.sender,
+                    sender=request_envelope.to,
+                    message=self.app.handle(request),
+                )
+            )
+
+    async def _teardown(self) -> None:
+        """Close the client and the channel."""
+        self.app_task.cancel()
+        await self.client.close()
+        await self.channel.disconnect()
+
+    def test_fast_path_only_for_read_only_methods(self) -> None:
+        """Test that only the read-only methods can use the fast path."""
+        with pytest.raises(ValueError, match="Only the read-only methods"):
+            ABCIApplicationServicer(
+                asyncio.Queue(), MagicMock(), self.TARGET_SKILL_ID, ("deliver_tx",)
+            )
+
+    def test_server_options(self) -> None:
+        """Test that the server options are set only if they are configured."""
+        channel = GrpcServerChannel(
+            PublicId.from_str(self.TARGET_SKILL_ID), LOCALHOST, 0
+        )
+        assert channel.server_options == []
+        channel = GrpcServerChannel(
+            PublicId.from_str(self.TARGET_SKILL_ID),
+            LOCALHOST,
+            0,
+            max_message_length=2**20,
+            keepalive_time_ms=1000,
+        )
+        assert channel.server_options == [
+            ("grpc.max_send_message_length", 2**20),
+            ("grpc.max_receive_message_length", 2**20),
+            ("grpc.keepalive_time_ms", 1000),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_echo_fast_path(self) -> None:
+        """Test that the echo requests are answered without going through the skill."""
+        await self._serve()
+        try:
+            response = await self.stub.Echo(RequestEcho(message="hello"))
+            assert response.message == "hello"
+            assert self.handled == []
+            latency = self.channel._servicer.latency.summary()["echo"]
+            assert latency["calls"] == latency["fast_path_calls"] == 1
+        finally:
+            await self._teardown()
+
+    @pytest.mark.asyncio
+    async def test_query_cached_until_commit(self) -> None:
+        """Test that the responses to the queries are cached until the state of the skill changes."""
+        await self._serve()
+        try:
+            request = RequestQuery(path="/round")
+            for _ in range(3):
+                await self.stub.Query(request)
+            assert self.handled == ["request_query"]
+
+            await self.stub.DeliverTx(RequestDeliverTx(tx=b"tx"))
+            await self.stub.Query(request)
+            assert self.handled == ["request_query", "request_deliver_tx"]
+
+            await self.stub.Commit(RequestCommit())
+            await self.stub.Query(request)
+            assert self.handled[-2:] == ["request_commit", "request_query"]
+
+            summary = self.channel._servicer.latency.summary()
+            assert summary["query"]["calls"] == 5
+            assert summary["query"]["fast_path_calls"] == 3
+            assert summary["deliver_tx"]["fast_path_calls"] == 0
+            assert summary["commit"]["max_ms"] >= summary["commit"]["mean_ms"] > 0
+        finally:
+            await self._teardown()
+
+    @pytest.mark.asyncio
+    async def test_without_fast_path(self) -> None:
+        """Test that all the requests go through the skill if the fast path is disabled."""
+        await self._serve(fast_path_methods=())
+        try:
+            await self.stub.Echo(RequestEcho(message="hello"))
+            await self.stub.Query(RequestQuery(path="/round"))
+            await self.stub.Query(RequestQuery(path="/round"))
+            assert self.handled == ["request_echo", "request_query", "request_query"]
+        finally:
+            await self._teardown()
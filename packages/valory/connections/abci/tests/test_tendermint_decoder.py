@@ -21,11 +21,18 @@
 
 # pylint: skip-file
 
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
 from packages.valory.connections.abci.connection import PUBLIC_ID
 from packages.valory.connections.abci.dialogues import AbciDialogue, AbciDialogues
 from packages.valory.connections.abci.tendermint.abci.types_pb2 import (  # type: ignore
     Request,
     RequestApplySnapshotChunk,
+    RequestCheckTx,
+    RequestDeliverTx,
     RequestEcho,
     RequestListSnapshots,
     RequestLoadSnapshotChunk,
@@ -35,8 +42,16 @@ from packages.valory.connections.abci.tendermint.abci.types_pb2 import (  # type
 )
 from packages.valory.connections.abci.tendermint_decoder import (
     _TendermintProtocolDecoder,
+    _create_tx_request,
+    _create_tx_request_fast,
+    _supports_fast_tx_requests,
 )
 from packages.valory.protocols.abci import AbciMessage
+from packages.valory.protocols.abci.custom_types import (
+    CheckTxType,
+    CheckTxTypeEnum,
+    Events,
+)
 
 
 class TestTendermintProtocolDecoder:
@@ -119,3 +134,93 @@ class TestTendermintProtocolDecoder:
         )
         assert isinstance(message, AbciMessage)
         assert isinstance(dialogue, AbciDialogue)
+
+    @pytest.mark.parametrize(
+        "request_, expected_type",
+        (
+            (Request(check_tx=RequestCheckTx(tx=b"tx", type=0)), "new"),
+            (Request(check_tx=RequestCheckTx(tx=b"tx", type=1)), "recheck"),
+            (Request(deliver_tx=RequestDeliverTx(tx=b"tx")), None),
+        ),
+    )
+    def test_request_tx(self, request_: Request, expected_type: str) -> None:
+        """Test that the requests carrying a transaction are decoded like the other requests."""
+        dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+        message, dialogue = _TendermintProtocolDecoder.process(
+            request_, dialogues, "counterparty"
+        )
+        assert isinstance(message, AbciMessage)
+        assert message._is_consistent()
+        assert message.tx == b"tx"
+        assert message.sender == str(PUBLIC_ID)
+        assert message.to == "counterparty"
+        if expected_type is not None:
+            assert message.type.check_tx_type.name.lower() == expected_type
+        assert isinstance(dialogue, AbciDialogue)
+        assert dialogues.get_dialogue(message) is dialogue
+        assert dialogue.last_outgoing_message is message
+        assert AbciMessage.decode(message.encode()).encode() == message.encode()
+
+    def test_request_check_tx_unknown_type(self) -> None:
+        """Test that a check_tx request of an unknown type is rejected."""
+        dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+        request = Request(check_tx=RequestCheckTx(tx=b"tx", type=2))
+        with pytest.raises(ValueError, match="is not a valid CheckTxTypeEnum"):
+            _TendermintProtocolDecoder.process(request, dialogues, "counterparty")
+
+    def test_fast_tx_requests_supported(self) -> None:
+        """Test that the installed open-aea supports the fast creation of the tx requests."""
+        assert _supports_fast_tx_requests()
+        with mock.patch("aea.__version__", "0.0.0"):
+            assert not _supports_fast_tx_requests()
+
+    @pytest.mark.parametrize(
+        "performative, kwargs",
+        (
+            (
+                AbciMessage.Performative.REQUEST_CHECK_TX,
+                dict(tx=b"tx", type=CheckTxType(CheckTxTypeEnum.NEW)),
+            ),
+            (
+                AbciMessage.Performative.REQUEST_CHECK_TX,
+                dict(tx=b"tx", type=CheckTxType(CheckTxTypeEnum.RECHECK)),
+            ),
+            (AbciMessage.Performative.REQUEST_DELIVER_TX, dict(tx=b"tx")),
+        ),
+    )
+    @pytest.mark.parametrize("fast", (True, False))
+    def test_create_tx_request(
+        self, performative: AbciMessage.Performative, kwargs: Dict[str, Any], fast: bool
+    ) -> None:
+        """Test that the tx requests are created as by the public `Dialogues.create`."""
+        reference = ("1" * 32, "")
+        public_dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+        dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+        for dialogues_ in (public_dialogues, dialogues):
+            dialogues_.new_self_initiated_dialogue_reference = (  # type: ignore
+                lambda: reference
+            )
+
+        expected_message, expected_dialogue = public_dialogues.create(
+            "counterparty", performative, **kwargs
+        )
+        with mock.patch(
+            "packages.valory.connections.abci.tendermint_decoder._FAST_TX_REQUESTS",
+            fast,
+        ), mock.patch(
+            "packages.valory.connections.abci.tendermint_decoder._create_tx_request_fast",
+            wraps=_create_tx_request_fast,
+        ) as create_fast:
+            message, dialogue = _create_tx_request(
+                dialogues, "counterparty", performative, **kwargs
+            )
+
+        assert create_fast.called is fast
+        assert message == expected_message
+        assert message.sender == expected_message.sender
+        assert message.to == expected_message.to
+        assert message.encode() == expected_message.encode()
+        assert dialogue.dialogue_label == expected_dialogue.dialogue_label
+        assert dialogue.role == expected_dialogue.role
+        assert dialogue.last_outgoing_message is message
+        assert dialogues.get_dialogue(message) is dialogue
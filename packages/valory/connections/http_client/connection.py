@@ -22,11 +22,14 @@ import asyncio
 import email
 import logging
 import ssl
+import time
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.tasks import Task
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from traceback import format_exc
-from typing import Any, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, Optional, Set, Tuple, Union, cast
 
 import aiohttp
 import certifi  # pylint: disable=wrong-import-order
@@ -49,6 +52,7 @@ from packages.valory.protocols.http.message import HttpMessage
 
 
 SUCCESS = 200
+NOT_MODIFIED = 304
 NOT_FOUND = 404
 REQUEST_TIMEOUT = 408
 SERVER_ERROR = 500
@@ -57,9 +61,21 @@ PUBLIC_ID = PublicId.from_str("valory/http_client:0.23.0")
 _default_logger = logging.getLogger("aea.packages.valory.connections.http_client")
 
 RequestId = str
+CacheKey = Tuple[str, str, str, bytes]
 
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+CACHE_CONTROL_HEADER = "Cache-Control"
+MAX_AGE_DIRECTIVE = "max-age"
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+DEFAULT_RESPONSE_CACHE_SIZE = 128
+# the statistics of the response cache are logged every this many lookups
+RESPONSE_CACHE_STATS_INTERVAL = 100
+
 
 def headers_to_string(headers: CIMultiDictProxy) -> str:
     """
@@ -75,6 +91,140 @@ def headers_to_string(headers: CIMultiDictProxy) -> str:
     return msg.as_string()
 
 
+def get_max_age(headers: Optional[Dict[str, str]]) -> Optional[int]:
+    """
+    Get the `max-age` directive of a request's `Cache-Control` header.
+
+    A request carrying `Cache-Control: max-age=N` accepts a stored response which is at most N seconds old.
+
+    :param headers: the request headers.
+    :return: the max age in seconds, or None if the request did not opt in to caching.
+    """
+    if not headers:
+        return None
+    cache_control = CIMultiDict(headers).get(CACHE_CONTROL_HEADER)
+    if cache_control is None:
+        return None
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() != MAX_AGE_DIRECTIVE:
+            continue
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass
+class CachedResponse:
+    """A stored http response."""
+
+    status: int
+    reason: Optional[str]
+    headers: CIMultiDictProxy
+    body: bytes
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        """Get the age of the stored response, in seconds."""
+        return time.monotonic() - self.stored_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Get the conditional request headers which can be used to revalidate the stored response."""
+        validators = {}
+        etag = self.headers.get(ETAG_HEADER)
+        if etag is not None:
+            validators[IF_NONE_MATCH_HEADER] = etag
+        last_modified = self.headers.get(LAST_MODIFIED_HEADER)
+        if last_modified is not None:
+            validators[IF_MODIFIED_SINCE_HEADER] = last_modified
+        return validators
+
+    def is_fresh(self, max_age: int) -> bool:
+        """Check whether the stored response is not older than the given max age."""
+        return self.age <= max_age
+
+    def refresh(self) -> None:
+        """Mark the stored response as just validated by the server."""
+        self.stored_at = time.monotonic()
+
+
+class ResponseCache:
+    """A bounded, least recently used cache of http responses."""
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of responses to store. A non-positive value disables the cache.
+        """
+        self.max_size = max_size
+        self._responses: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the cache is enabled."""
+        return self.max_size > 0
+
+    @staticmethod
+    def make_key(message: HttpMessage) -> CacheKey:
+        """Get the key under which the response to the given request message is stored."""
+        headers = message.headers if message.is_set("headers") else ""
+        return message.method.upper(), message.url, headers, message.body
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Get a stored response, if any."""
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+        return response
+
+    def put(self, key: CacheKey, response: CachedResponse) -> None:
+        """Store a response, evicting the least recently used one if the cache is full."""
+        if not self.enabled:
+            return
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the stored responses."""
+        self._responses.clear()
+
+    @property
+    def lookups(self) -> int:
+        """Get the number of the requests which opted in to the cache."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the ratio of the requests which were served without transferring the response body."""
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get the cache statistics."""
+        return {
+            "size": len(self._responses),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of stored responses."""
+        return len(self._responses)
+
+
 HttpDialogue = BaseHttpDialogue
 
 
@@ -118,6 +268,7 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         address: str,
         port: int,
         connection_id: PublicId,
+        response_cache_size: int = DEFAULT_RESPONSE_CACHE_SIZE,
     ):
         """
         Initialize an http client channel.
@@ -126,12 +277,14 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         :param address: server hostname / IP address
         :param port: server port number
         :param connection_id: the id of the connection
+        :param response_cache_size: the maximum number of cached responses.
         """
         self.agent_address = agent_address
         self.address = address
         self.port = port
         self.connection_id = connection_id
         self._dialogues = HttpDialogues()
+        self.response_cache = ResponseCache(response_cache_size)
 
         self._in_queue = None  # type: Optional[asyncio.Queue]  # pragma: no cover
         self._loop = (
@@ -188,7 +341,7 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
 
         try:
             resp = await asyncio.wait_for(
-                self._perform_http_request(request_http_message),
+                self._get_response(request_http_message),
                 timeout=self.DEFAULT_TIMEOUT,
             )
             envelope = self.to_envelope(
@@ -196,9 +349,7 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
                 status_code=resp.status,
                 headers=resp.headers,
                 status_text=resp.reason,
-                body=resp._body  # pylint: disable=protected-access
-                if resp._body is not None  # pylint: disable=protected-access
-                else b"",
+                body=resp.body,
                 dialogue=dialogue,
             )
         except Exception:  # pylint: disable=broad-except
@@ -214,23 +365,110 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         if self._in_queue is not None:
             await self._in_queue.put(envelope)
 
+    @staticmethod
+    def _parse_request_headers(
+        request_http_message: HttpMessage,
+    ) -> Optional[Dict[str, str]]:
+        """Parse the headers of an http request message."""
+        if request_http_message.is_set("headers") and request_http_message.headers:
+            return dict(email.message_from_string(request_http_message.headers).items())
+        return None
+
+    async def _get_response(self, request_http_message: HttpMessage) -> CachedResponse:
+        """
+        Get the response to an http request, using the response cache if the request opted in to it.
+
+        Requests opt in by setting a `Cache-Control: max-age=N` header.
+        A stored response younger than N seconds is served without touching the network.
+        An older one is revalidated using its `ETag`/`Last-Modified` validators, if it has any.
+
+        :param request_http_message: HttpMessage with http request constructed.
+        :return: the response.
+        """
+        max_age = get_max_age(self._parse_request_headers(request_http_message))
+        if (
+            max_age is None
+            or not self.response_cache.enabled
+            or request_http_message.method.upper() not in CACHEABLE_METHODS
+        ):
+            return self._to_cached_response(
+                await self._perform_http_request(request_http_message)
+            )
+
+        response = await self._get_cached_response(request_http_message, max_age)
+        if self.response_cache.lookups % RESPONSE_CACHE_STATS_INTERVAL == 0:
+            self.logger.info(f"Response cache stats: {self.response_cache.stats}")
+        return response
+
+    async def _get_cached_response(
+        self, request_http_message: HttpMessage, max_age: int
+    ) -> CachedResponse:
+        """
+        Get the response to an http request which opted in to the response cache.
+
+        :param request_http_message: HttpMessage with http request constructed.
+        :param max_age: the maximum age in seconds of a stored response which is served without revalidation.
+        :return: the response.
+        """
+        key = self.response_cache.make_key(request_http_message)
+        cached = self.response_cache.get(key)
+        if cached is not None and cached.is_fresh(max_age):
+            self.response_cache.hits += 1
+            self.logger.debug(
+                f"Serving {request_http_message.url} from the response cache: {self.response_cache.stats}"
+            )
+            return cached
+
+        validators = cached.validators if cached is not None else {}
+        resp = await self._perform_http_request(
+            request_http_message, extra_headers=validators
+        )
+        if cached is not None and validators and resp.status == NOT_MODIFIED:
+            self.response_cache.hits += 1
+            self.response_cache.revalidations += 1
+            cached.refresh()
+            self.logger.debug(
+                f"Revalidated the cached response of {request_http_message.url}: {self.response_cache.stats}"
+            )
+            return cached
+
+        self.response_cache.misses += 1
+        response = self._to_cached_response(resp)
+        if response.status == SUCCESS:
+            self.response_cache.put(key, response)
+        self.logger.debug(
+            f"Response cache miss for {request_http_message.url}: {self.response_cache.stats}"
+        )
+        return response
+
+    @staticmethod
+    def _to_cached_response(resp: ClientResponse) -> CachedResponse:
+        """Convert an aiohttp response to a response which can be stored."""
+        body = resp._body  # pylint: disable=protected-access
+        return CachedResponse(
+            status=resp.status,
+            reason=resp.reason,
+            headers=resp.headers,
+            body=body if body is not None else b"",
+        )
+
     async def _perform_http_request(
-        self, request_http_message: HttpMessage
+        self,
+        request_http_message: HttpMessage,
+        extra_headers: Optional[Dict[str, str]] = None,
     ) -> ClientResponse:
         """
         Perform http request and return response.
 
         :param request_http_message: HttpMessage with http request constructed.
+        :param extra_headers: headers to add to the ones of the request message.
 
         :return: aiohttp.ClientResponse
         """
         try:
-            if request_http_message.is_set("headers") and request_http_message.headers:
-                headers: Optional[dict] = dict(
-                    email.message_from_string(request_http_message.headers).items()
-                )
-            else:
-                headers = None
+            headers = self._parse_request_headers(request_http_message)
+            if extra_headers:
+                headers = {**(headers or {}), **extra_headers}
             async with aiohttp.ClientSession() as session:
                 async with session.request(
                     method=request_http_message.method,
@@ -368,6 +606,8 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
             self.is_stopped = True
 
             await self._cancel_tasks()
+            if self.response_cache.lookups > 0:
+                self.logger.info(f"Response cache stats: {self.response_cache.stats}")
 
 
 class HTTPClientConnection(Connection):
@@ -386,13 +626,25 @@ class HTTPClientConnection(Connection):
         port = cast(int, self.configuration.config.get("port"))
         if host is None or port is None:  # pragma: nocover
             raise ValueError("host and port must be set!")
+        response_cache_size = cast(
+            int,
+            self.configuration.config.get(
+                "response_cache_size", DEFAULT_RESPONSE_CACHE_SIZE
+            ),
+        )
         self.channel = HTTPClientAsyncChannel(
             self.address,
             host,
             port,
             connection_id=self.connection_id,
+            response_cache_size=response_cache_size,
         )
 
+    @property
+    def response_cache_stats(self) -> Dict[str, Union[int, float]]:
+        """Get the statistics of the response cache, including its hit rate."""
+        return self.channel.response_cache.stats
+
     async def connect(self) -> None:
         """Connect to a HTTP server."""
         if self.is_connected:  # pragma: nocover
@@ -28,6 +28,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import aiohttp
 import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig
@@ -38,7 +39,12 @@ from aea.test_tools.constants import UNKNOWN_PROTOCOL_PUBLIC_ID
 from aea.test_tools.mocks import AnyStringWith
 from aea.test_tools.network import get_host, get_unused_tcp_port
 
-from packages.valory.connections.http_client.connection import HTTPClientConnection
+from packages.valory.connections.http_client.connection import (
+    CachedResponse,
+    HTTPClientConnection,
+    ResponseCache,
+    get_max_age,
+)
 from packages.valory.protocols.http.dialogues import HttpDialogue
 from packages.valory.protocols.http.dialogues import HttpDialogues as BaseHttpDialogues
 from packages.valory.protocols.http.message import HttpMessage
@@ -360,3 +366,210 @@ class TestHTTPClientConnect:
         message = cast(HttpMessage, envelope.message)
         assert message.performative == HttpMessage.Performative.RESPONSE
         assert b"expected exception" in message.body
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    (
+        (None, None),
+        ({}, None),
+        ({"Accept": "application/json"}, None),
+        ({"Cache-Control": "no-cache"}, None),
+        ({"Cache-Control": "max-age=30"}, 30),
+        ({"cache-control": "no-transform, MAX-AGE=5"}, 5),
+        ({"Cache-Control": "max-age=-1"}, 0),
+        ({"Cache-Control": "max-age=invalid"}, None),
+    ),
+)
+def test_get_max_age(headers: Any, expected: Any) -> None:
+    """Test `get_max_age`."""
+    assert get_max_age(headers) == expected
+
+
+def _cached_response(**headers: str) -> CachedResponse:
+    """Create a cached response with the given headers."""
+    return CachedResponse(
+        status=200,
+        reason="OK",
+        headers=CIMultiDictProxy(CIMultiDict(headers)),
+        body=b"content",
+    )
+
+
+class TestResponseCache:
+    """Tests for the `ResponseCache`."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used response is evicted when the cache is full."""
+        cache = ResponseCache(max_size=2)
+        first, second, third = (("GET", f"url_{i}", "", b"") for i in range(3))
+        cache.put(first, _cached_response())
+        cache.put(second, _cached_response())
+        assert cache.get(first) is not None
+        cache.put(third, _cached_response())
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+
+    def test_disabled(self) -> None:
+        """Test that nothing is stored when the cache is disabled."""
+        cache = ResponseCache(max_size=0)
+        assert not cache.enabled
+        cache.put(("GET", "url", "", b""), _cached_response())
+        assert len(cache) == 0
+
+    def test_stats(self) -> None:
+        """Test the cache statistics."""
+        cache = ResponseCache()
+        assert cache.hit_rate == 0.0
+        cache.hits, cache.misses = 3, 1
+        assert cache.lookups == 4
+        assert cache.stats == {
+            "size": 0,
+            "hits": 3,
+            "misses": 1,
+            "revalidations": 0,
+            "hit_rate": 0.75,
+        }
+
+    def test_validators_and_freshness(self) -> None:
+        """Test the conditional request headers and the freshness of a cached response."""
+        response = _cached_response(
+            ETag='"abc"', **{"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert response.validators == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        assert _cached_response().validators == {}
+
+        response.stored_at -= 10
+        assert not response.is_fresh(5)
+        response.refresh()
+        assert response.is_fresh(5)
+
+
+@pytest.mark.asyncio
+class TestHTTPClientResponseCache:
+    """Tests the http client connection's response cache."""
+
+    def setup(self) -> None:
+        """Initialise the class."""
+        self.agent_identity = Identity(
+            "name", address="some string", public_key="some public_key"
+        )
+        self.client_skill_id = "some/skill:0.1.0"
+        configuration = ConnectionConfig(
+            host=get_host(),
+            port=get_unused_tcp_port(),
+            connection_id=HTTPClientConnection.connection_id,
+        )
+        self.http_client_connection = HTTPClientConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+            identity=self.agent_identity,
+        )
+        self.connection_address = str(HTTPClientConnection.connection_id)
+        self.http_dialogs = HttpDialogues(self.client_skill_id)
+
+    async def _request(self, response_mock: Mock, headers: str) -> HttpMessage:
+        """Send a request and return the response message."""
+        request_http_message, _ = self.http_dialogs.create(
+            counterparty=self.connection_address,
+            performative=HttpMessage.Performative.REQUEST,
+            method="get",
+            url="https://not-a-google.com",
+            headers=headers,
+            version="",
+            body=b"",
+        )
+        request_envelope = Envelope(
+            to=self.connection_address,
+            sender=self.client_skill_id,
+            message=request_http_message,
+        )
+        with patch.object(
+            aiohttp.ClientSession,
+            "request",
+            return_value=_MockRequest(response_mock),
+        ) as request_mock:
+            await self.http_client_connection.send(envelope=request_envelope)
+            envelope = await asyncio.wait_for(
+                self.http_client_connection.receive(), timeout=10
+            )
+        self.request_mock = request_mock
+        assert envelope is not None
+        return cast(HttpMessage, envelope.message)
+
+    @staticmethod
+    def _response_mock(status: int, body: bytes, **headers: str) -> Mock:
+        """Create a mocked aiohttp response."""
+        response_mock = Mock()
+        response_mock.status = status
+        response_mock.headers = CIMultiDictProxy(CIMultiDict(headers))
+        response_mock.reason = "OK"
+        response_mock._body = body
+        response_mock.read.return_value = asyncio.Future()
+        response_mock.read.return_value.set_result("")
+        return response_mock
+
+    async def test_fresh_response_is_served_from_cache(self) -> None:
+        """Test that a fresh response is served without performing a request."""
+        await self.http_client_connection.connect()
+        headers = "Cache-Control: max-age=60\r\n"
+        message = await self._request(self._response_mock(200, b"first"), headers)
+        assert message.body == b"first"
+        self.request_mock.assert_called_once()
+
+        message = await self._request(self._response_mock(200, b"second"), headers)
+        assert message.body == b"first"
+        self.request_mock.assert_not_called()
+        stats = self.http_client_connection.response_cache_stats
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        with patch.object(self.http_client_connection.logger, "info") as mock_info:
+            await self.http_client_connection.disconnect()
+        mock_info.assert_any_call(f"Response cache stats: {stats}")
+
+    async def test_response_cache_stats_are_logged(self) -> None:
+        """Test that the statistics of the response cache are logged periodically."""
+        await self.http_client_connection.connect()
+        headers = "Cache-Control: max-age=60\r\n"
+        with patch(
+            "packages.valory.connections.http_client.connection.RESPONSE_CACHE_STATS_INTERVAL",
+            2,
+        ), patch.object(self.http_client_connection.logger, "info") as mock_info:
+            await self._request(self._response_mock(200, b"first"), headers)
+            mock_info.assert_not_called()
+            await self._request(self._response_mock(200, b"second"), headers)
+        mock_info.assert_called_once_with(
+            f"Response cache stats: {self.http_client_connection.response_cache_stats}"
+        )
+        await self.http_client_connection.disconnect()
+
+    async def test_stale_response_is_revalidated(self) -> None:
+        """Test that a stale response is revalidated using its `ETag`."""
+        await self.http_client_connection.connect()
+        headers = "Cache-Control: max-age=0\r\n"
+        message = await self._request(
+            self._response_mock(200, b"first", ETag='"v1"'), headers
+        )
+        assert message.body == b"first"
+
+        message = await self._request(self._response_mock(304, b""), headers)
+        assert message.status_code == 200
+        assert message.body == b"first"
+        sent_headers = self.request_mock.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert self.http_client_connection.channel.response_cache.revalidations == 1
+        await self.http_client_connection.disconnect()
+
+    async def test_requests_without_max_age_are_not_cached(self) -> None:
+        """Test that requests which do not opt in always reach the network."""
+        await self.http_client_connection.connect()
+        await self._request(self._response_mock(200, b"first"), "")
+        message = await self._request(self._response_mock(200, b"second"), "")
+        assert message.body == b"second"
+        assert len(self.http_client_connection.channel.response_cache) == 0
+        await self.http_client_connection.disconnect()
@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the backends which store and get the files of the IPFS connection."""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from shutil import rmtree
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
+
+import aiohttp
+import base58
+from aea.helpers.ipfs.base import IPFSHashOnly, PBNode, unixfs_pb2
+from aea_cli_ipfs.exceptions import DownloadError, NodeError
+from aea_cli_ipfs.ipfs_utils import DEFAULT_IPFS_URI_BASE, IPFSTool, addr_to_url
+
+
+DAEMON_BACKEND = "daemon"
+LOCAL_BACKEND = "local"
+DEFAULT_MAX_TRANSFER_SIZE = 50 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_TRANSFERS = 4
+TRANSFER_TIMEOUT = 60.0
+GC_TIMEOUT = 600.0
+TRANSFER_CHUNK_SIZE = 256 * 1024
+FILE_CONTENT_TYPE = "application/octet-stream"
+DIRECTORY_CONTENT_TYPE = "application/x-directory"
+# the type of the links which point to files, in the responses of the `ls` endpoint
+UNIXFS_FILE = 2
+
+# a node of the local store is either the content of a file or the hashes of the links of a directory, by name
+LocalNode = Union[bytes, Dict[str, str]]
+
+_default_logger = logging.getLogger("aea.packages.valory.connections.ipfs.backends")
+
+
+class TransferSizeError(ValueError):
+    """Error raised when a transfer exceeds the maximum allowed size."""
+
+
+def _check_transfer_size(size: int, max_transfer_size: int) -> None:
+    """Raise a `TransferSizeError` if the size of the files exceeds the maximum transfer size."""
+    if size > max_transfer_size:
+        raise TransferSizeError(
+            f"The files' size of {size} bytes exceeds "
+            f"the maximum size of {max_transfer_size} bytes."
+        )
+
+
+def _multipart_chunks(
+    parts: List[Tuple[str, bytes, str]], boundary: str
+) -> Iterator[Union[bytes, memoryview]]:
+    """
+    Encode the parts of a multipart request lazily, streaming the content of the files in chunks.
+
+    :param parts: the name, the content and the content type of each part.
+    :param boundary: the boundary which separates the parts.
+    :yield: the chunks of the request's body.
+    """
+    for name, data, content_type in parts:
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        # the chunks are views of the files, so that their content is not copied
+        view = memoryview(data)
+        for i in range(0, len(view), TRANSFER_CHUNK_SIZE):
+            yield view[i : i + TRANSFER_CHUNK_SIZE]
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode("utf-8")
+
+
+class IpfsBackend(ABC):
+    """
+    An interface to store files and get them back by their IPFS hash, asynchronously.
+
+    A single file is stored wrapped in a directory, while multiple files, which belong to the same directory,
+    are stored in that directory, wrapped in another one. Getting a hash returns the file or the files
+    of the directory it points to, or the top-level files if it points to a directory with multiple entries.
+    """
+
+    def __init__(
+        self,
+        max_transfer_size: int = DEFAULT_MAX_TRANSFER_SIZE,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        :param max_transfer_size: the maximum size of the files of a single transfer, in bytes.
+        :param logger: the logger.
+        """
+        self.max_transfer_size = max_transfer_size
+        self.logger = logger
+
+    @abstractmethod
+    async def check_running(self) -> None:
+        """Check that the backend is available, raising an exception if it is not."""
+
+    @abstractmethod
+    async def add(self, files: Dict[str, bytes]) -> str:
+        """
+        Store files.
+
+        :param files: the content of the files, by path.
+        :return: the hash of the stored files.
+        """
+
+    @abstractmethod
+    async def get(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Get the files of an IPFS hash.
+
+        :param ipfs_hash: the hash of the files.
+        :return: the content of the files, by name.
+        """
+
+    @abstractmethod
+    async def unpin(self, ipfs_hash: str) -> None:
+        """
+        Unpin stored files, so that they can be garbage collected.
+
+        :param ipfs_hash: the hash of the stored files.
+        """
+
+    @abstractmethod
+    async def collect_garbage(self) -> int:
+        """
+        Remove the blocks which are not pinned.
+
+        :return: the number of removed blocks.
+        """
+
+    async def close(self) -> None:
+        """Release the resources of the backend."""
+
+
+class DaemonIpfsBackend(IpfsBackend):
+    """
+    A backend which transfers the files to and from an IPFS daemon.
+
+    The requests are sent by an `aiohttp` client, whose session pools the connections to the daemon
+    and bounds the number of concurrent requests, so that they can be cancelled when they time out.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ipfs_domain: Optional[str] = None,
+        in_memory: bool = True,
+        max_concurrent_transfers: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
+        max_transfer_size: int = DEFAULT_MAX_TRANSFER_SIZE,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        :param ipfs_domain: the multiaddress of the IPFS daemon.
+        :param in_memory: whether to transfer the files in memory, instead of via the filesystem.
+        :param max_concurrent_transfers: the maximum number of concurrent requests to the daemon.
+        :param max_transfer_size: the maximum size of the files of a single transfer, in bytes.
+        :param logger: the logger.
+        """
+        super().__init__(max_transfer_size, logger)
+        self.ipfs_tool: IPFSTool = IPFSTool(ipfs_domain)
+        self.api_url = f"{addr_to_url(self.ipfs_tool.addr)}/{DEFAULT_IPFS_URI_BASE}"
+        self.in_memory = in_memory
+        self.max_concurrent_transfers = max_concurrent_transfers
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._transfer_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session of the client, which pools and bounds the connections to the daemon."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent_transfers),
+                timeout=aiohttp.ClientTimeout(total=TRANSFER_TIMEOUT),
+            )
+        return self._session
+
+    @property
+    def transfer_executor(self) -> ThreadPoolExecutor:
+        """Get the executor which runs the blocking transfers via the filesystem."""
+        if self._transfer_executor is None:
+            self._transfer_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_transfers,
+                thread_name_prefix="ipfs_transfer",
+            )
+        return self._transfer_executor
+
+    async def _run_in_executor(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking function in the executor of the transfers via the filesystem."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.transfer_executor, func, *args)
+
+    async def check_running(self) -> None:
+        """Check that the IPFS daemon is running."""
+        try:
+            async with self.session.post(f"{self.api_url}/id") as response:
+                response.raise_for_status()
+        except aiohttp.ClientError as e:
+            raise NodeError(f"Can not connect to node. Is node running?:\n{e}") from e
+
+    async def close(self) -> None:
+        """Close the session of the client, and shut down the executor of the transfers via the filesystem."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._transfer_executor is not None:
+            self._transfer_executor.shutdown(wait=False)
+            self._transfer_executor = None
+
+    async def add(self, files: Dict[str, bytes]) -> str:
+        """
+        Store files, in memory if possible, otherwise via the filesystem.
+
+        :param files: the content of the files, by path.
+        :return: the hash of the stored files.
+        """
+        if self.in_memory:
+            try:
+                return await self._add_in_memory(files)
+            except TransferSizeError:
+                raise
+            except (ValueError, aiohttp.ClientError) as e:
+                self.logger.warning(
+                    f"Could not store the files in memory: {e}. "
+                    "Falling back to storing them via the filesystem."
+                )
+        return await self._run_in_executor(self._add_via_filesystem, files)
+
+    async def _add_in_memory(self, files: Dict[str, bytes]) -> str:
+        """
+        Upload the files by streaming their content directly to the IPFS HTTP API.
+
+        The files are named and wrapped in a directory like `IPFSTool.add` does for the same paths,
+        so that storing the files in memory or via the filesystem results in the same hash.
+        All the files of a directory are sent in a single multipart request, which is streamed in chunks,
+        so that the node builds the directory, and therefore its hash, in one go.
+
+        :param files: the files to upload, by path.
+        :return: the hash of the uploaded files.
+        """
+        _check_transfer_size(
+            sum(len(data) for data in files.values()), self.max_transfer_size
+        )
+
+        # the names of the multipart files are url-encoded, like `ipfshttpclient` does
+        parts: List[Tuple[str, bytes, str]] = []
+        if len(files) == 1:
+            path, data = next(iter(files.items()))
+            name = quote(os.path.basename(path), safe="")
+            parts.append((name, data, FILE_CONTENT_TYPE))
+        else:
+            dir_name = os.path.basename(os.path.dirname(next(iter(files))))
+            name = quote(dir_name, safe="")
+            parts.append((name, b"", DIRECTORY_CONTENT_TYPE))
+            for path, data in files.items():
+                name = quote(f"{dir_name}/{os.path.basename(path)}", safe="")
+                parts.append((name, data, FILE_CONTENT_TYPE))
+
+        boundary = uuid.uuid4().hex
+
+        async def stream() -> AsyncIterator[Union[bytes, memoryview]]:
+            """Stream the chunks of the multipart request."""
+            for chunk in _multipart_chunks(parts, boundary):
+                yield chunk
+
+        async with self.session.post(
+            f"{self.api_url}/add",
+            params={"wrap-with-directory": "true", "pin": "true"},
+            data=stream(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        ) as response:
+            response.raise_for_status()
+            text = await response.text()
+        # the response contains a json object per added node, the last one is the wrapping dir
+        added = [json.loads(line) for line in text.splitlines() if line]
+        if len(added) == 0:
+            raise ValueError("The IPFS node did not return the hash of the files.")
+        return added[-1]["Hash"]
+
+    def _add_via_filesystem(self, files: Dict[str, bytes]) -> str:
+        """
+        Upload the files by writing them to the filesystem and adding their path.
+
+        :param files: the files to upload, by path.
+        :return: the hash of the uploaded files.
+        """
+        if len(files) == 1:
+            # a single file needs to be stored,
+            # we don't need to create a dir
+            path, data = next(iter(files.items()))
+            self.__create_file(path, data)
+        else:
+            # "path" is the directory, it's the same for all the files
+            path = os.path.dirname(next(iter(files)))
+            os.makedirs(path, exist_ok=True)
+            for file_path, data in files.items():
+                self.__create_file(file_path, data)
+        try:
+            # note that path will be a dir if multiple files
+            # are being uploaded.
+            _, hash_, _ = self.ipfs_tool.add(path)
+        finally:
+            self.__remove_filepath(path)
+        return hash_
+
+    async def get(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Get the files of an IPFS hash, in memory if possible, otherwise via the filesystem.
+
+        :param ipfs_hash: the hash of the files.
+        :return: the content of the files, by name.
+        """
+        if self.in_memory:
+            try:
+                return await self._get_in_memory(ipfs_hash)
+            except TransferSizeError:
+                raise
+            except (ValueError, KeyError, aiohttp.ClientError) as e:
+                self.logger.warning(
+                    f"Could not get the files in memory: {e}. "
+                    "Falling back to getting them via the filesystem."
+                )
+        return await self._run_in_executor(self._get_via_filesystem, ipfs_hash)
+
+    async def _get_in_memory(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Download the files by streaming them from the IPFS HTTP API into memory.
+
+        The files are listed first, and then their content is streamed in chunks,
+        concurrently for the files of a directory.
+
+        :param ipfs_hash: the hash of the files to download.
+        :return: the downloaded files, by name.
+        """
+        links = await self._ls(ipfs_hash)
+        if links is None:
+            # the hash points to a file
+            return {ipfs_hash: await self._cat(ipfs_hash)}
+        if len(links) == 1:
+            (link,) = links
+            if link["Type"] == UNIXFS_FILE:
+                return {link["Name"]: await self._cat(link["Hash"])}
+            links = await self._ls(link["Hash"]) or []
+        files = {
+            link["Name"]: link["Hash"] for link in links if link["Type"] == UNIXFS_FILE
+        }
+        size = sum(link.get("Size", 0) for link in links if link["Name"] in files)
+        _check_transfer_size(size, self.max_transfer_size)
+        contents = await asyncio.gather(*(self._cat(hash_) for hash_ in files.values()))
+        return dict(zip(files, contents))
+
+    async def _ls(self, ipfs_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        List the links of an IPFS hash.
+
+        :param ipfs_hash: the hash to list.
+        :return: the named links, if the hash points to a directory, otherwise `None`.
+        """
+        async with self.session.post(
+            f"{self.api_url}/ls", params={"arg": ipfs_hash}
+        ) as response:
+            response.raise_for_status()
+            listing = await response.json(content_type=None)
+        links = listing["Objects"][0]["Links"] or []
+        # the blocks of a chunked file are listed as unnamed links
+        if all(link["Name"] == "" for link in links):
+            return None
+        return links
+
+    async def _cat(self, ipfs_hash: str) -> bytes:
+        """
+        Stream the content of a file in chunks.
+
+        :param ipfs_hash: the hash of the file.
+        :return: the content of the file.
+        """
+        async with self.session.post(
+            f"{self.api_url}/cat", params={"arg": ipfs_hash}
+        ) as response:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(TRANSFER_CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.max_transfer_size:
+                    raise TransferSizeError(
+                        f"The transfer exceeds the maximum size of {self.max_transfer_size} bytes."
+                    )
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def unpin(self, ipfs_hash: str) -> None:
+        """
+        Unpin stored files from the IPFS daemon.
+
+        :param ipfs_hash: the hash of the stored files.
+        """
+        async with self.session.post(
+            f"{self.api_url}/pin/rm", params={"arg": ipfs_hash}
+        ) as response:
+            response.raise_for_status()
+
+    async def collect_garbage(self) -> int:
+        """
+        Run the garbage collection of the repo of the IPFS daemon.
+
+        :return: the number of removed blocks.
+        """
+        async with self.session.post(
+            f"{self.api_url}/repo/gc",
+            params={"quiet": "true"},
+            timeout=aiohttp.ClientTimeout(total=GC_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            # the response contains a json object per removed block
+            removed = 0
+            async for line in response.content:
+                removed += bool(line.strip())
+        return removed
+
+    def _get_via_filesystem(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Download the files in a temporary directory and read them back.
+
+        :param ipfs_hash: the hash of the files to download.
+        :return: the downloaded files, by name.
+        """
+        response_body: Dict[str, bytes] = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.ipfs_tool.download(ipfs_hash, tmp_dir)
+
+            files = os.listdir(tmp_dir)
+            if len(files) > 1:
+                self.logger.warning(
+                    f"Multiple files or dirs found in {tmp_dir}. "
+                    f"The first will be used. "
+                )
+            downloaded_file = files.pop()
+            files_to_be_read = [downloaded_file]
+            base_dir = Path(tmp_dir)
+            if os.path.isdir(base_dir / downloaded_file):
+                base_dir = base_dir / downloaded_file
+                files_to_be_read = os.listdir(base_dir)
+
+            for file_path in files_to_be_read:
+                response_body[file_path] = (base_dir / file_path).read_bytes()
+        return response_body
+
+    @staticmethod
+    def __create_file(path: str, data: bytes) -> None:
+        """Creates a file in the specified path."""
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def __remove_filepath(self, filepath: str) -> None:
+        """Remove a file or a folder. If filepath is not a file or a folder, an `IPFSInteractionError` is raised."""
+        if os.path.isfile(filepath):
+            os.remove(filepath)
+        elif os.path.isdir(filepath):
+            rmtree(filepath)
+        else:  # pragma: no cover
+            self.logger.error(f"`{filepath}` is not an existing filepath!")
+
+
+# the nodes stored by the local backends of the process, so that they can share files like the nodes of IPFS do
+_local_nodes: Dict[str, LocalNode] = {}
+# the hashes of the files pinned by the local backends of the process
+_local_pins: Set[str] = set()
+
+
+class LocalIpfsBackend(IpfsBackend):
+    """
+    A backend which stores the files in memory, in-process, without an IPFS daemon.
+
+    The files are addressed by the same hashes that an IPFS daemon, with its default settings, returns for them,
+    so that they can be used for tests, benchmarks and air-gapped runs in place of the daemon.
+    By default, the files are shared by all the local backends of the process.
+    """
+
+    def __init__(
+        self,
+        nodes: Optional[Dict[str, LocalNode]] = None,
+        max_transfer_size: int = DEFAULT_MAX_TRANSFER_SIZE,
+        logger: logging.Logger = _default_logger,
+        pins: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        :param nodes: the store of the nodes, by hash. Defaults to the store shared by the process.
+        :param max_transfer_size: the maximum size of the files of a single transfer, in bytes.
+        :param logger: the logger.
+        :param pins: the pinned hashes. Defaults to the ones shared by the process, if the nodes are too.
+        """
+        super().__init__(max_transfer_size, logger)
+        self.nodes = _local_nodes if nodes is None else nodes
+        if pins is None:
+            pins = _local_pins if nodes is None else set()
+        self.pins = pins
+        self._lock = threading.Lock()
+
+    async def check_running(self) -> None:
+        """The local backend is always running."""
+
+    async def add(self, files: Dict[str, bytes]) -> str:
+        """
+        Store files, wrapping them in directories like an IPFS daemon does.
+
+        :param files: the content of the files, by path.
+        :return: the hash of the stored files.
+        """
+        _check_transfer_size(
+            sum(len(data) for data in files.values()), self.max_transfer_size
+        )
+        links = {
+            os.path.basename(path): self._add_file(data) for path, data in files.items()
+        }
+        if len(files) > 1:
+            dir_name = os.path.basename(os.path.dirname(next(iter(files))))
+            links = {dir_name: self._add_dir(links)}
+        hash_bytes, _ = self._add_dir(links)
+        hash_ = base58.b58encode(hash_bytes).decode()
+        with self._lock:
+            self.pins.add(hash_)
+        return hash_
+
+    def _put(self, hash_bytes: bytes, node: LocalNode) -> None:
+        """Store a node by its hash."""
+        with self._lock:
+            self.nodes[base58.b58encode(hash_bytes).decode()] = node
+
+    def _add_file(self, data: bytes) -> Tuple[bytes, int]:
+        """
+        Store a file, hashing it with the default chunker of IPFS.
+
+        :param data: the content of the file.
+        :return: the multihash of the file and the cumulative size of its blocks.
+        """
+        # pylint: disable=protected-access
+        file_pb, size = IPFSHashOnly._pb_serialize_bytes(data)
+        hash_bytes = IPFSHashOnly._generate_multihash_bytes(file_pb)
+        self._put(hash_bytes, data)
+        return hash_bytes, size
+
+    def _add_dir(self, links: Dict[str, Tuple[bytes, int]]) -> Tuple[bytes, int]:
+        """
+        Store a directory.
+
+        :param links: the multihash and the cumulative size of the entries of the directory, by name.
+        :return: the multihash of the directory and its cumulative size.
+        """
+        dir_node = PBNode()
+        for name in sorted(links):
+            hash_bytes, size = links[name]
+            dir_node.Links.append(  # pylint: disable=no-member
+                IPFSHashOnly.create_link(hash_bytes, size, name)
+            )
+        dir_data = unixfs_pb2.Data()  # pylint: disable=no-member
+        dir_data.Type = unixfs_pb2.Data.Directory  # pylint: disable=no-member
+        dir_node.Data = dir_data.SerializeToString(deterministic=True)
+        # pylint: disable=protected-access
+        serialization = IPFSHashOnly._serialize(dir_node)
+        hash_bytes = IPFSHashOnly._generate_multihash_bytes(serialization)
+        self._put(
+            hash_bytes,
+            {
+                name: base58.b58encode(link_hash).decode()
+                for name, (link_hash, _) in links.items()
+            },
+        )
+        return hash_bytes, len(serialization) + sum(size for _, size in links.values())
+
+    def _node(self, ipfs_hash: str) -> LocalNode:
+        """Get a stored node."""
+        node = self.nodes.get(ipfs_hash)
+        if node is None:
+            raise DownloadError(
+                f"The hash {ipfs_hash} was not found in the local store."
+            )
+        return node
+
+    async def get(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Get the files of an IPFS hash from the store.
+
+        :param ipfs_hash: the hash of the files.
+        :return: the content of the files, by name.
+        """
+        node = self._node(ipfs_hash)
+        if isinstance(node, bytes):
+            files = {ipfs_hash: node}
+        else:
+            if len(node) == 1:
+                ((_, hash_),) = node.items()
+                child = self._node(hash_)
+                if not isinstance(child, bytes):
+                    node = child
+            files = {}
+            for name, hash_ in node.items():
+                child = self._node(hash_)
+                if isinstance(child, bytes):
+                    files[name] = child
+        _check_transfer_size(
+            sum(len(data) for data in files.values()), self.max_transfer_size
+        )
+        return files
+
+    async def unpin(self, ipfs_hash: str) -> None:
+        """
+        Unpin stored files.
+
+        :param ipfs_hash: the hash of the stored files.
+        """
+        with self._lock:
+            if ipfs_hash not in self.pins:
+                raise DownloadError(f"The hash {ipfs_hash} is not pinned.")
+            self.pins.discard(ipfs_hash)
+
+    async def collect_garbage(self) -> int:
+        """
+        Remove the nodes which cannot be reached from the pinned hashes.
+
+        :return: the number of removed nodes.
+        """
+        with self._lock:
+            reachable: Set[str] = set()
+            to_visit = [hash_ for hash_ in self.pins if hash_ in self.nodes]
+            while to_visit:
+                hash_ = to_visit.pop()
+                if hash_ in reachable:
+                    continue
+                reachable.add(hash_)
+                node = self.nodes.get(hash_)
+                if isinstance(node, dict):
+                    to_visit.extend(h for h in node.values() if h in self.nodes)
+            removed = [hash_ for hash_ in self.nodes if hash_ not in reachable]
+            for hash_ in removed:
+                del self.nodes[hash_]
+        return len(removed)
+
+
+def make_backend(
+    config: Dict[str, Any], logger: logging.Logger = _default_logger
+) -> IpfsBackend:
+    """
+    Make the backend selected by the configuration of the connection.
+
+    :param config: the configuration of the connection.
+    :param logger: the logger.
+    :return: the backend.
+    """
+    backend = config.get("backend", DAEMON_BACKEND)
+    max_transfer_size = config.get("max_transfer_size", DEFAULT_MAX_TRANSFER_SIZE)
+    if backend == DAEMON_BACKEND:
+        return DaemonIpfsBackend(
+            config.get("ipfs_domain"),
+            config.get("in_memory", True),
+            config.get("max_concurrent_transfers", DEFAULT_MAX_CONCURRENT_TRANSFERS),
+            max_transfer_size,
+            logger,
+        )
+    if backend == LOCAL_BACKEND:
+        return LocalIpfsBackend(max_transfer_size=max_transfer_size, logger=logger)
+    raise ValueError(
+        f"Unknown IPFS backend {backend!r}, "
+        f"expected one of {[DAEMON_BACKEND, LOCAL_BACKEND]}."
+    )
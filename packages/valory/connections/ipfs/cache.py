@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a content-addressed cache of the files transferred to and from IPFS."""
+
+import base64
+import binascii
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union, cast
+
+
+DEFAULT_CACHE_SIZE = 128
+DEFAULT_MAX_CACHE_DIR_SIZE = 100 * 1024 * 1024
+
+Files = Dict[str, bytes]
+
+_default_logger = logging.getLogger("aea.packages.valory.connections.ipfs.cache")
+
+
+class IpfsCache:
+    """
+    A cache of files by their IPFS hash.
+
+    Since the content behind a hash never changes, the cached files never need to be invalidated.
+    The most recently used files are kept in memory, by reference, and, if a directory is given, all the files
+    are also stored on disk, base64-encoded, evicting the least recently used ones when its size exceeds a cap.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_cache_dir_size: int = DEFAULT_MAX_CACHE_DIR_SIZE,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of hashes to keep in memory.
+            A non-positive value disables the cache.
+        :param cache_dir: the directory to store the cached files in, if any.
+        :param max_cache_dir_size: the maximum size of the cache directory, in bytes.
+        :param logger: the logger.
+        """
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_cache_dir_size = max_cache_dir_size
+        self.logger = logger
+        self._files: "OrderedDict[str, Files]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_dir_size = 0
+        self.hits = 0
+        self.misses = 0
+        if self.enabled and self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir_size = sum(
+                path.stat().st_size for path in self.cache_dir.glob("*.json")
+            )
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the cache is enabled."""
+        return self.max_size > 0
+
+    def _path(self, ipfs_hash: str) -> Optional[Path]:
+        """Get the path under which the files of the given hash are stored on disk, if any."""
+        if self.cache_dir is None or not ipfs_hash.isalnum():
+            return None
+        return self.cache_dir / f"{ipfs_hash}.json"
+
+    def get(self, ipfs_hash: str) -> Optional[Files]:
+        """Get the files of the given hash, if they are cached."""
+        with self._lock:
+            files = self._files.get(ipfs_hash)
+            if files is not None:
+                self._files.move_to_end(ipfs_hash)
+            elif self.enabled:
+                files = self._read(ipfs_hash)
+                if files is not None:
+                    self._put_in_memory(ipfs_hash, files)
+            if files is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(files)
+
+    def put(self, ipfs_hash: str, files: Files) -> None:
+        """Cache the files of the given hash."""
+        if not self.enabled:
+            return
+        files = dict(files)
+        with self._lock:
+            self._put_in_memory(ipfs_hash, files)
+            self._write(ipfs_hash, files)
+
+    def _put_in_memory(self, ipfs_hash: str, files: Files) -> None:
+        """Keep the files in memory, evicting the least recently used ones if the cache is full."""
+        self._files[ipfs_hash] = files
+        self._files.move_to_end(ipfs_hash)
+        while len(self._files) > self.max_size:
+            self._files.popitem(last=False)
+
+    def _read(self, ipfs_hash: str) -> Optional[Files]:
+        """Read the files of the given hash from disk."""
+        path = self._path(ipfs_hash)
+        if path is None or not path.is_file():
+            return None
+        try:
+            encoded = json.loads(path.read_text(encoding="utf-8"))["files"]
+            files = {
+                name: base64.b64decode(data, validate=True)
+                for name, data in encoded.items()
+            }
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+            binascii.Error,
+        ) as e:
+            self.logger.warning(f"Could not read the cached files of {ipfs_hash}: {e}")
+            return None
+        # mark the files as recently used
+        os.utime(path)
+        return files
+
+    def _write(self, ipfs_hash: str, files: Files) -> None:
+        """Write the files of the given hash to disk, evicting the least recently used if needed."""
+        path = self._path(ipfs_hash)
+        if path is None or path.exists():
+            return
+        encoded = {
+            name: base64.b64encode(content).decode("ascii")
+            for name, content in files.items()
+        }
+        data = json.dumps({"files": encoded}).encode("utf-8")
+        if len(data) > self.max_cache_dir_size:
+            return
+        try:
+            path.write_bytes(data)
+        except OSError as e:
+            self.logger.warning(f"Could not cache the files of {ipfs_hash}: {e}")
+            return
+        self._cache_dir_size += len(data)
+        if self._cache_dir_size > self.max_cache_dir_size:
+            self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        """Remove the least recently used files from disk, until the cap is respected."""
+        entries = []
+        for path in cast(Path, self.cache_dir).glob("*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        for _, size, path in sorted(entries):
+            if self._cache_dir_size <= self.max_cache_dir_size:
+                break
+            try:
+                path.unlink()
+            except OSError:  # pragma: nocover
+                continue
+            self._cache_dir_size -= size
+
+    def clear(self) -> None:
+        """Remove all the cached files from memory."""
+        with self._lock:
+            self._files.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the ratio of the lookups which were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get the cache statistics."""
+        return {
+            "size": len(self._files),
+            "disk_size": self._cache_dir_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of hashes kept in memory."""
+        return len(self._files)
@@ -19,13 +19,10 @@
 """A connection responsible for uploading and downloading files from IPFS."""
 import asyncio
 import os
-import tempfile
 from asyncio import Task
-from concurrent.futures import Executor
-from pathlib import Path
-from shutil import rmtree
-from typing import Any, Callable, Dict, Optional, cast
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, cast
 
+import aiohttp
 import requests
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
@@ -33,15 +30,37 @@ from aea.mail.base import Envelope
 from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea_cli_ipfs.exceptions import DownloadError
-from aea_cli_ipfs.ipfs_utils import IPFSTool
-from ipfshttpclient.exceptions import ErrorResponse
-
+from ipfshttpclient.exceptions import Error as IpfsClientError
+
+from packages.valory.connections.ipfs.backends import (
+    IpfsBackend,
+    TransferSizeError,
+    make_backend,
+)
+from packages.valory.connections.ipfs.cache import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MAX_CACHE_DIR_SIZE,
+    IpfsCache,
+)
+from packages.valory.connections.ipfs.retention import DEFAULT_RETAIN_LAST, PinRetention
 from packages.valory.protocols.ipfs import IpfsMessage
 from packages.valory.protocols.ipfs.dialogues import IpfsDialogue
 from packages.valory.protocols.ipfs.dialogues import IpfsDialogues as BaseIpfsDialogues
 
 
 PUBLIC_ID = PublicId.from_str("valory/ipfs:0.1.0")
+DEFAULT_REQUEST_TIMEOUT = 120.0
+
+# the errors of the daemon's transfers, including those of the filesystem fallback through `IPFSTool`
+_BACKEND_ERRORS = (
+    DownloadError,
+    IpfsClientError,
+    aiohttp.ClientError,
+    requests.exceptions.RequestException,
+)
+_STORE_ERRORS = (ValueError, PermissionError) + _BACKEND_ERRORS
+_GET_ERRORS = (TransferSizeError, PermissionError) + _BACKEND_ERRORS
+_RELEASE_ERRORS = (asyncio.TimeoutError,) + _BACKEND_ERRORS
 
 
 class IpfsDialogues(BaseIpfsDialogues):
@@ -85,10 +104,26 @@ class IpfsConnection(Connection):
         :param kwargs: keyword arguments passed to component base.
         """
         super().__init__(**kwargs)  # pragma: no cover
-        ipfs_domain = self.configuration.config.get("ipfs_domain")
-        self.ipfs_tool: IPFSTool = IPFSTool(ipfs_domain)
+        self.backend: IpfsBackend = make_backend(self.configuration.config, self.logger)
+        self.cache = IpfsCache(
+            self.configuration.config.get("cache_size", DEFAULT_CACHE_SIZE),
+            self.configuration.config.get("cache_dir"),
+            self.configuration.config.get(
+                "max_cache_dir_size", DEFAULT_MAX_CACHE_DIR_SIZE
+            ),
+            self.logger,
+        )
+        self.retention = PinRetention(
+            self.configuration.config.get("retain_last", DEFAULT_RETAIN_LAST),
+            self.configuration.config.get("retention_index_path"),
+            self.logger,
+        )
+        self.request_timeout: Optional[float] = self.configuration.config.get(
+            "request_timeout", DEFAULT_REQUEST_TIMEOUT
+        )
+        self._release_tasks: Set[asyncio.Task] = set()
+        self._release_lock: Optional[asyncio.Lock] = None
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
-        self.loop_executor: Optional[Executor] = None
         self.dialogues = IpfsDialogues(connection_id=PUBLIC_ID)
         self._response_envelopes: Optional[asyncio.Queue] = None
 
@@ -103,8 +138,9 @@ class IpfsConnection(Connection):
 
     async def connect(self) -> None:
         """Set up the connection."""
-        self.ipfs_tool.check_ipfs_node_running()
+        await self.backend.check_running()
         self._response_envelopes = asyncio.Queue()
+        self._release_lock = asyncio.Lock()
         self.state = ConnectionStates.connected
 
     async def disconnect(self) -> None:
@@ -118,6 +154,9 @@ class IpfsConnection(Connection):
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
         self._response_envelopes = None
+        # the hashes which are no longer retained are released before the backend is closed
+        await asyncio.gather(*self._release_tasks, return_exceptions=True)
+        await self.backend.close()
 
         self.state = ConnectionStates.disconnected
 
@@ -131,16 +170,9 @@ class IpfsConnection(Connection):
         """Receive an envelope."""
         return await self.response_envelopes.get()
 
-    def run_async(
-        self, func: Callable, *args: Any, timeout: Optional[float] = None
-    ) -> Task:
-        """Run a function asynchronously by using threads."""
-        ipfs_operation = self.loop.run_in_executor(
-            self.loop_executor,
-            func,
-            *args,
-        )
-        timely_operation = asyncio.wait_for(ipfs_operation, timeout=timeout)
+    def run_async(self, coroutine: Awaitable, timeout: Optional[float] = None) -> Task:
+        """Run a coroutine as a task, which is cancelled if it times out."""
+        timely_operation = asyncio.wait_for(coroutine, timeout=timeout)
         task = self.loop.create_task(timely_operation)
         return task
 
@@ -152,65 +184,123 @@ class IpfsConnection(Connection):
         if handler is None:
             err = f"Performative `{performative.value}` is not supported."
             self.logger.error(err)
-            task = self.run_async(self._handle_error, err)
+            task = self.run_async(self._handle_unsupported())
             return task
         dialogue = self.dialogues.update(message)
-        task = self.run_async(handler, message, dialogue)
+        task = self.run_async(self._handle_request(handler, message, dialogue))
         return task
 
-    def _handle_store_files(
+    async def _handle_unsupported(self) -> None:
+        """Handle a request with an unsupported performative, which gets no response."""
+
+    async def _handle_request(
+        self,
+        handler: Callable[[IpfsMessage, BaseDialogue], Awaitable[IpfsMessage]],
+        message: IpfsMessage,
+        dialogue: BaseDialogue,
+    ) -> IpfsMessage:
+        """
+        Handle a request, replying with an error if it does not complete in time or fails unexpectedly.
+
+        The transfers of a request which times out are cancelled.
+
+        :param handler: the handler of the request's performative.
+        :param message: The ipfs request.
+        :param dialogue: the dialogue of the request.
+        :returns: the response.
+        """
+        try:
+            return await asyncio.wait_for(
+                handler(message, dialogue), timeout=self.request_timeout
+            )
+        except asyncio.TimeoutError:
+            err = f"The request timed out after {self.request_timeout} seconds."
+            self.logger.error(err)
+            return self._handle_error(err, dialogue)
+        except Exception as e:  # pylint: disable=broad-except
+            err = f"Unexpected error while handling the request: {e!r}"
+            self.logger.exception(err)
+            return self._handle_error(err, dialogue)
+
+    async def _handle_store_files(
         self, message: IpfsMessage, dialogue: BaseDialogue
     ) -> IpfsMessage:
         """
         Handle a STORE_FILES performative.
 
-        Uploads the provided files to ipfs.
+        Uploads the provided text files to ipfs.
 
         :param message: The ipfs request.
         :returns: the hash of the uploaded files.
         """
         files = message.files
+        encoded = {path: data.encode("utf-8") for path, data in files.items()}
+        return await self._store(message, dialogue, encoded)
+
+    async def _handle_store_binary_files(
+        self, message: IpfsMessage, dialogue: BaseDialogue
+    ) -> IpfsMessage:
+        """
+        Handle a STORE_BINARY_FILES performative.
+
+        Uploads the provided binary files to ipfs, without copying them.
+
+        :param message: The ipfs request.
+        :returns: the hash of the uploaded files.
+        """
+        return await self._store(message, dialogue, message.binary_files)
+
+    async def _store(
+        self,
+        message: IpfsMessage,
+        dialogue: BaseDialogue,
+        files: Dict[str, bytes],
+    ) -> IpfsMessage:
+        """
+        Upload files to ipfs and reply with their hash.
+
+        :param message: The ipfs request.
+        :param dialogue: the dialogue of the request.
+        :param files: the content of the files to upload, by path.
+        :returns: the hash of the uploaded files.
+        """
         if len(files) == 0:
             err = "No files were present."
             self.logger.error(err)
             return self._handle_error(err, dialogue)
-        if len(files) == 1:
-            # a single file needs to be stored,
-            # we don't need to create a dir
-            path, data = files.popitem()
-            self.__create_file(path, data)
-        else:
-            # multiple files are present, which means that it's a directory
-            # we begin by checking that they belong to the same directory
-            dirs = {os.path.dirname(path) for path in files.keys()}
-            if len(dirs) > 1:
-                err = f"Received files from different dirs {dirs}. "
-                self.logger.error(err)
-                self.logger.info(
-                    "If you want to send multiple files as a single dir, "
-                    "make sure the their path matches to one directory only."
-                )
-                return self._handle_error(err, dialogue)
-
-            # "path" is the directory, it's the same for all the files
-            path = dirs.pop()
-            os.makedirs(path, exist_ok=True)
-            for file_path, data in files.items():
-                self.__create_file(file_path, data)
+        # multiple files are stored as a directory,
+        # we begin by checking that they belong to the same directory
+        dirs = {os.path.dirname(path) for path in files.keys()}
+        if len(files) > 1 and len(dirs) > 1:
+            err = f"Received files from different dirs {dirs}. "
+            self.logger.error(err)
+            self.logger.info(
+                "If you want to send multiple files as a single dir, "
+                "make sure the their path matches to one directory only."
+            )
+            return self._handle_error(err, dialogue)
+
         try:
-            # note that path will be a dir if multiple files
-            # are being uploaded.
-            _, hash_, _ = self.ipfs_tool.add(path)
-            self.logger.debug(f"Successfully stored files with hash: {hash_}.")
-        except (
-            ValueError,
-            requests.exceptions.ChunkedEncodingError,
-        ) as e:  # pragma: no cover
+            hash_ = await self.backend.add(files)
+        except _STORE_ERRORS as e:
             err = str(e)
             self.logger.error(err)
             return self._handle_error(err, dialogue)
-        finally:
-            self.__remove_filepath(path)
+
+        self.logger.debug(f"Successfully stored files with hash: {hash_}.")
+        # cache the files like they are returned when getting the hash
+        self.cache.put(
+            hash_, {os.path.basename(path): data for path, data in files.items()}
+        )
+        # multiple files are tracked by the name of their directory
+        path = next(iter(files))
+        name = os.path.basename(path if len(files) == 1 else os.path.dirname(path))
+        self.retention.track(name, hash_)
+        # the hashes of failed releases are retried along with the newly released ones
+        if self.retention.releasing():
+            task = self.loop.create_task(self._release())
+            self._release_tasks.add(task)
+            task.add_done_callback(self._release_tasks.discard)
         response_message = cast(
             IpfsMessage,
             dialogue.reply(
@@ -221,57 +311,112 @@ class IpfsConnection(Connection):
         )
         return response_message
 
-    def _handle_get_files(
+    async def _handle_get_files(
         self, message: IpfsMessage, dialogue: BaseDialogue
     ) -> IpfsMessage:
         """
         Handle GET_FILES performative.
 
-        Downloads and returns the files resulting from the ipfs hash.
+        Downloads and returns the text files resulting from the ipfs hash.
+
+        :param message: The ipfs request.
+        :returns: the downloaded files.
+        """
+        try:
+            files = await self._get(message.ipfs_hash)
+            response_body = {name: data.decode("utf-8") for name, data in files.items()}
+        except _GET_ERRORS + (UnicodeDecodeError,) as e:
+            err = str(e)
+            self.logger.error(err)
+            return self._handle_error(err, dialogue)
+
+        response_message = cast(
+            IpfsMessage,
+            dialogue.reply(
+                performative=IpfsMessage.Performative.FILES,
+                files=response_body,
+                target_message=message,
+            ),
+        )
+        return response_message
+
+    async def _handle_get_binary_files(
+        self, message: IpfsMessage, dialogue: BaseDialogue
+    ) -> IpfsMessage:
+        """
+        Handle GET_BINARY_FILES performative.
+
+        Downloads and returns the binary files resulting from the ipfs hash.
 
         :param message: The ipfs request.
         :returns: the downloaded files.
         """
-        response_body: Dict[str, str] = {}
-        ipfs_hash = message.ipfs_hash
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        try:
+            files = await self._get(message.ipfs_hash)
+        except _GET_ERRORS as e:
+            err = str(e)
+            self.logger.error(err)
+            return self._handle_error(err, dialogue)
+
+        response_message = cast(
+            IpfsMessage,
+            dialogue.reply(
+                performative=IpfsMessage.Performative.BINARY_FILES,
+                binary_files=files,
+                target_message=message,
+            ),
+        )
+        return response_message
+
+    async def _get(self, ipfs_hash: str) -> Dict[str, bytes]:
+        """
+        Get the files of an ipfs hash from the cache, or from the backend if they are not cached.
+
+        :param ipfs_hash: the hash of the files.
+        :return: the content of the files, by name.
+        """
+        files = self.cache.get(ipfs_hash)
+        if files is not None:
+            self.logger.debug(f"Retrieved files with hash {ipfs_hash} from the cache.")
+            return files
+        files = await self.backend.get(ipfs_hash)
+        self.cache.put(ipfs_hash, files)
+        return files
+
+    async def _release(self) -> None:
+        """
+        Unpin the hashes which are pending release, and collect the garbage of the backend.
+
+        The releases are serialized, so that a single garbage collection runs at a time.
+        A hash which fails to be unpinned remains pending, and is retried on the next release.
+        """
+        async with cast(asyncio.Lock, self._release_lock):
+            unpinned = 0
+            for ipfs_hash in self.retention.releasing():
+                # the hash may have been stored again while the previous ones were unpinned
+                if ipfs_hash not in self.retention.releasing():
+                    continue
+                try:
+                    await self.backend.unpin(ipfs_hash)
+                except _RELEASE_ERRORS as e:
+                    self.logger.warning(
+                        f"Could not unpin the hash {ipfs_hash}, "
+                        f"it will be retried on the next release: {e!r}"
+                    )
+                    continue
+                self.retention.confirm_release(ipfs_hash)
+                unpinned += 1
+            if unpinned == 0:
+                return
             try:
-                self.ipfs_tool.download(ipfs_hash, tmp_dir)
-            except (
-                DownloadError,
-                PermissionError,
-                ErrorResponse,
-            ) as e:
-                err = str(e)
-                self.logger.error(err)
-                return self._handle_error(err, dialogue)
-
-            files = os.listdir(tmp_dir)
-            if len(files) > 1:
-                self.logger.warning(
-                    f"Multiple files or dirs found in {tmp_dir}. "
-                    f"The first will be used. "
-                )
-            downloaded_file = files.pop()
-            files_to_be_read = [downloaded_file]
-            base_dir = Path(tmp_dir)
-            if os.path.isdir(base_dir / downloaded_file):
-                base_dir = base_dir / downloaded_file
-                files_to_be_read = os.listdir(base_dir)
-
-            for file_path in files_to_be_read:
-                with open(base_dir / file_path, encoding="utf-8", mode="r") as file:
-                    response_body[file_path] = file.read()
-
-            response_message = cast(
-                IpfsMessage,
-                dialogue.reply(
-                    performative=IpfsMessage.Performative.FILES,
-                    files=response_body,
-                    target_message=message,
-                ),
-            )
-            return response_message
+                removed = await self.backend.collect_garbage()
+            except _RELEASE_ERRORS as e:
+                self.logger.warning(f"Could not collect the garbage of IPFS: {e!r}")
+                return
+        self.logger.info(
+            f"Unpinned {unpinned} hashes which are no longer retained, "
+            f"and removed {removed} blocks."
+        )
 
     def _handle_error(  # pylint: disable=no-self-use
         self, reason: str, dialogue: BaseDialogue
@@ -293,6 +438,8 @@ class IpfsConnection(Connection):
         :param task: the done task.
         """
         request = self.task_to_request.pop(task)
+        if task.cancelled():
+            return
         response_message: Optional[Message] = task.result()
 
         response_envelope = None
@@ -306,18 +453,3 @@ class IpfsConnection(Connection):
 
         # not handling `asyncio.QueueFull` exception, because the maxsize we defined for the Queue is infinite
         self.response_envelopes.put_nowait(response_envelope)
-
-    @staticmethod
-    def __create_file(path: str, data: str) -> None:
-        """Creates a file in the specified path."""
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(data)
-
-    def __remove_filepath(self, filepath: str) -> None:
-        """Remove a file or a folder. If filepath is not a file or a folder, an `IPFSInteractionError` is raised."""
-        if os.path.isfile(filepath):
-            os.remove(filepath)
-        elif os.path.isdir(filepath):
-            rmtree(filepath)
-        else:  # pragma: no cover
-            self.logger.error(f"`{filepath}` is not an existing filepath!")
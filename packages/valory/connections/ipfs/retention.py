@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the retention policy of the objects stored to IPFS by the connection."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+DEFAULT_RETAIN_LAST = 0
+
+_default_logger = logging.getLogger("aea.packages.valory.connections.ipfs.retention")
+
+
+class PinRetention:
+    """
+    A retention policy which keeps the last stored hashes of each object pinned.
+
+    The hashes are tracked by the name of the object they were stored under, i.e., the name of the file,
+    or of the directory if multiple files were stored, so that an object which is stored once per period,
+    e.g., a snapshot, has its last `retain_last` periods retained, and its older hashes released.
+    A hash which is still retained under any name is never released.
+    The released hashes are kept pending until their release is confirmed, so that a failed release is retried.
+    If an index path is given, the tracked and pending hashes are persisted to it,
+    so that they are released after restarts too.
+    """
+
+    def __init__(
+        self,
+        retain_last: int = DEFAULT_RETAIN_LAST,
+        index_path: Optional[Union[str, Path]] = None,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the retention policy.
+
+        :param retain_last: the number of hashes to retain per name. A non-positive value retains all the hashes.
+        :param index_path: the path of the file to persist the tracked hashes to, if any.
+        :param logger: the logger.
+        """
+        self.retain_last = retain_last
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._stored: Dict[str, List[str]] = {}
+        self._releasing: List[str] = []
+        if self.enabled:
+            self._read()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the retention policy is enabled."""
+        return self.retain_last > 0
+
+    def _read(self) -> None:
+        """Read the tracked and pending hashes from the index."""
+        if self.index_path is None or not self.index_path.is_file():
+            return
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            stored = {
+                str(name): [str(hash_) for hash_ in hashes]
+                for name, hashes in index["stored"].items()
+            }
+            releasing = [str(hash_) for hash_ in index["releasing"]]
+        except (OSError, ValueError, TypeError, AttributeError, KeyError) as e:
+            self.logger.warning(f"Could not read the retention index: {e}")
+            return
+        self._stored, self._releasing = stored, releasing
+
+    def _write(self) -> None:
+        """Write the tracked and pending hashes to the index."""
+        if self.index_path is None:
+            return
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            index = {"stored": self._stored, "releasing": self._releasing}
+            tmp_path.write_text(json.dumps(index), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write the retention index: {e}")
+
+    def track(self, name: str, ipfs_hash: str) -> List[str]:
+        """
+        Track a hash which has been stored under a name, and get the hashes which are no longer retained.
+
+        The returned hashes are added to the pending ones, until their release is confirmed.
+        A pending hash which is stored again is retained instead.
+
+        :param name: the name of the stored object.
+        :param ipfs_hash: the hash of the stored object.
+        :return: the hashes to release, oldest first.
+        """
+        if not self.enabled:
+            return []
+        with self._lock:
+            hashes = self._stored.setdefault(name, [])
+            if hashes and hashes[-1] == ipfs_hash:
+                return []
+            hashes.append(ipfs_hash)
+            expired = hashes[: -self.retain_last]
+            del hashes[: -self.retain_last]
+            retained = {hash_ for series in self._stored.values() for hash_ in series}
+            released = [
+                hash_ for hash_ in dict.fromkeys(expired) if hash_ not in retained
+            ]
+            self._releasing = [
+                hash_ for hash_ in self._releasing if hash_ not in retained
+            ]
+            self._releasing.extend(
+                hash_ for hash_ in released if hash_ not in self._releasing
+            )
+            self._write()
+        return released
+
+    def releasing(self) -> List[str]:
+        """Get the hashes which are pending release, oldest first."""
+        with self._lock:
+            return list(self._releasing)
+
+    def confirm_release(self, ipfs_hash: str) -> None:
+        """
+        Confirm that a hash has been released, so that it is no longer pending.
+
+        :param ipfs_hash: the released hash.
+        """
+        with self._lock:
+            if ipfs_hash not in self._releasing:
+                return
+            self._releasing.remove(ipfs_hash)
+            self._write()
+
+    def retained(self, name: str) -> List[str]:
+        """Get the hashes retained under a name, oldest first."""
+        with self._lock:
+            return list(self._stored.get(name, []))
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the backends of the ipfs connection."""
+
+import os
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from aea.helpers.ipfs.base import IPFSHashOnly
+from aea_cli_ipfs.exceptions import DownloadError
+
+from packages.valory.connections.ipfs.backends import (
+    DaemonIpfsBackend,
+    LOCAL_BACKEND,
+    LocalIpfsBackend,
+    TRANSFER_CHUNK_SIZE,
+    TransferSizeError,
+    _multipart_chunks,
+    make_backend,
+)
+
+
+@pytest.mark.parametrize(
+    ("files", "expected_hash"),
+    [
+        (
+            {"dummy_filename": b"dummy_content"},
+            "QmYn1qHyFMDdVxYcwseLBdooLAyc3orNBH8vvj4iPTXd4R",
+        ),
+        (
+            {
+                "dummy_dir/dummy_filename1": b"dummy_content",
+                "dummy_dir/dummy_filename2": b"dummy_content",
+            },
+            "QmRP7wK1NZKwno9CFxQUeFaJip5eaaLBo1v8WFtyECgLCz",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_local_backend_hashes(
+    files: Dict[str, bytes], expected_hash: str
+) -> None:
+    """Test that the local backend returns the hashes of an IPFS daemon."""
+    assert await LocalIpfsBackend(nodes={}).add(files) == expected_hash
+
+
+@pytest.mark.asyncio
+async def test_local_backend_hashes_chunked_files(tmp_path: Path) -> None:
+    """Test that the hashes of files bigger than a chunk match the ones of IPFS."""
+    data = os.urandom(IPFSHashOnly.DEFAULT_CHUNK_SIZE * 3 + 1)
+    path = tmp_path / "dummy_filename"
+    path.write_bytes(data)
+    expected_hash = IPFSHashOnly.get(str(path), wrap=True, cid_v1=False)
+    assert await LocalIpfsBackend(nodes={}).add({str(path): data}) == expected_hash
+
+
+@pytest.mark.asyncio
+async def test_local_backend_get() -> None:
+    """Test that the local backend gets the files like an IPFS daemon does."""
+    backend = LocalIpfsBackend(nodes={})
+    file_hash = await backend.add({"dummy_filename": b"dummy_content"})
+    assert await backend.get(file_hash) == {"dummy_filename": b"dummy_content"}
+
+    files = {"dummy_filename1": b"dummy_content1", "dummy_filename2": b"\xff"}
+    dir_hash = await backend.add(
+        {f"dummy_dir/{name}": data for name, data in files.items()}
+    )
+    assert await backend.get(dir_hash) == files
+    (inner_dir_hash,) = backend.nodes[dir_hash].values()  # type: ignore
+    assert await backend.get(inner_dir_hash) == files
+    (content_hash,) = backend.nodes[file_hash].values()  # type: ignore
+    assert await backend.get(content_hash) == {content_hash: b"dummy_content"}
+
+    with pytest.raises(DownloadError):
+        await backend.get("QmNotStored")
+
+
+@pytest.mark.asyncio
+async def test_local_backend_shared_store() -> None:
+    """Test that the local backends of a process share their files."""
+    ipfs_hash = await LocalIpfsBackend().add({"dummy_filename": b"dummy_content"})
+    assert await LocalIpfsBackend().get(ipfs_hash) == {
+        "dummy_filename": b"dummy_content"
+    }
+
+
+@pytest.mark.asyncio
+async def test_local_backend_transfer_size() -> None:
+    """Test that the local backend rejects the transfers bigger than the maximum size."""
+    backend = LocalIpfsBackend(nodes={}, max_transfer_size=4)
+    with pytest.raises(TransferSizeError):
+        await backend.add({"dummy_filename": b"dummy_content"})
+    ipfs_hash = await LocalIpfsBackend(nodes=backend.nodes).add(
+        {"dummy_filename": b"12345"}
+    )
+    with pytest.raises(TransferSizeError):
+        await backend.get(ipfs_hash)
+
+
+def test_make_backend() -> None:
+    """Test making the backend selected by the configuration."""
+    assert isinstance(make_backend({}), DaemonIpfsBackend)
+    backend = make_backend({"backend": LOCAL_BACKEND, "max_transfer_size": 10})
+    assert isinstance(backend, LocalIpfsBackend)
+    assert backend.max_transfer_size == 10
+    with pytest.raises(ValueError, match="Unknown IPFS backend"):
+        make_backend({"backend": "unknown"})
+
+
+def test_multipart_chunks_do_not_copy_the_files() -> None:
+    """Test that the content of the files is streamed as views, without being copied."""
+    data = os.urandom(TRANSFER_CHUNK_SIZE * 2 + 1)
+    chunks = list(_multipart_chunks([("dummy_filename", data, "type")], "boundary"))
+    views = [chunk for chunk in chunks if isinstance(chunk, memoryview)]
+    assert len(views) == 3
+    assert all(view.obj is data for view in views)
+    assert b"".join(views) == data
+
+
+@pytest.mark.asyncio
+async def test_local_backend_garbage_collection() -> None:
+    """Test that the files which are unpinned are removed by the garbage collection."""
+    backend = LocalIpfsBackend(nodes={})
+    released_hash = await backend.add({"dummy_filename": b"released"})
+    retained_hash = await backend.add(
+        {"dummy_dir/dummy_filename1": b"retained", "dummy_dir/dummy_filename2": b""}
+    )
+    assert await backend.collect_garbage() == 0
+
+    await backend.unpin(released_hash)
+    with pytest.raises(DownloadError):
+        await backend.unpin(released_hash)
+    assert await backend.collect_garbage() == 2
+    with pytest.raises(DownloadError):
+        await backend.get(released_hash)
+    assert await backend.get(retained_hash) == {
+        "dummy_filename1": b"retained",
+        "dummy_filename2": b"",
+    }
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the ipfs cache."""
+
+import base64
+import json
+import os
+from pathlib import Path
+
+from packages.valory.connections.ipfs.cache import IpfsCache
+
+
+HASHES = [f"Qm{i}" for i in range(3)]
+
+
+def test_memory_cache() -> None:
+    """Test that the most recently used hashes are kept in memory."""
+    cache = IpfsCache(max_size=2)
+    for ipfs_hash in HASHES[:2]:
+        cache.put(ipfs_hash, {"file": ipfs_hash.encode()})
+    assert cache.get(HASHES[0]) == {"file": HASHES[0].encode()}
+    cache.put(HASHES[2], {"file": HASHES[2].encode()})
+
+    assert len(cache) == 2
+    assert cache.get(HASHES[1]) is None
+    assert cache.get(HASHES[2]) == {"file": HASHES[2].encode()}
+    assert cache.stats == {
+        "size": 2,
+        "disk_size": 0,
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+    }
+
+
+def test_cached_files_are_copies() -> None:
+    """Test that mutating the files does not affect the cache."""
+    cache = IpfsCache()
+    files = {"file": b"content"}
+    cache.put(HASHES[0], files)
+    files["file"] = b"changed"
+    cached_files = cache.get(HASHES[0])
+    assert cached_files == {"file": b"content"}
+    cached_files["file"] = b"changed"  # type: ignore
+    assert cache.get(HASHES[0]) == {"file": b"content"}
+
+
+def test_disabled_cache(tmp_path: Path) -> None:
+    """Test that a cache of non-positive size does not store anything."""
+    cache = IpfsCache(max_size=0, cache_dir=tmp_path)
+    cache.put(HASHES[0], {"file": b"content"})
+    assert cache.get(HASHES[0]) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    """Test that the files are read back from disk, even by a new cache."""
+    cache = IpfsCache(max_size=1, cache_dir=tmp_path)
+    cache.put(HASHES[0], {"file": b"content0"})
+    cache.put(HASHES[1], {"file": b"content1"})
+    assert cache.get(HASHES[0]) == {"file": b"content0"}
+
+    new_cache = IpfsCache(max_size=1, cache_dir=tmp_path)
+    assert new_cache.stats["disk_size"] == cache.stats["disk_size"]
+    assert new_cache.get(HASHES[1]) == {"file": b"content1"}
+    assert new_cache.get("../invalid") is None
+
+    # the files cached as text by previous versions are ignored
+    (tmp_path / f"{HASHES[2]}.json").write_text(json.dumps({"file": "content2"}))
+    assert new_cache.get(HASHES[2]) is None
+
+
+def test_disk_cache_eviction(tmp_path: Path) -> None:
+    """Test that the least recently used files are removed from disk when the cap is exceeded."""
+    entry_size = len(
+        json.dumps({"files": {"file": base64.b64encode(b"content0").decode()}})
+    )
+    cache = IpfsCache(max_size=1, cache_dir=tmp_path, max_cache_dir_size=2 * entry_size)
+    for i, ipfs_hash in enumerate(HASHES):
+        cache.put(ipfs_hash, {"file": f"content{i}".encode()})
+        # make the modification times distinct, from the oldest to the newest
+        os.utime(tmp_path / f"{ipfs_hash}.json", (i, i))
+
+    assert sorted(path.stem for path in tmp_path.iterdir()) == HASHES[1:]
+    assert cache.stats["disk_size"] == 2 * entry_size
@@ -20,14 +20,18 @@
 
 """Tests for ipfs connection."""
 import asyncio
+import json
 import os
 import platform
 import tempfile
-from typing import Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from unittest import mock
 from unittest.mock import MagicMock
 
+import aiohttp
 import pytest
+import requests
 from aea.configurations.base import ConnectionConfig
 from aea.connections.base import ConnectionStates
 from aea.mail.base import Envelope
@@ -38,7 +42,17 @@ from aea_test_autonomy.fixture_helpers import (  # noqa: F401; pylint: disable=u
     ipfs_daemon,
     use_ipfs_daemon,
 )
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ipfshttpclient.exceptions import ErrorResponse
 
+from packages.valory.connections.ipfs.backends import (
+    DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    DIRECTORY_CONTENT_TYPE,
+    DaemonIpfsBackend,
+    FILE_CONTENT_TYPE,
+    LOCAL_BACKEND,
+)
 from packages.valory.connections.ipfs.connection import (
     IpfsConnection,
     IpfsDialogues,
@@ -48,6 +62,9 @@ from packages.valory.protocols.ipfs import IpfsMessage
 
 
 ANY_SKILL = "skill/any:0.1.0"
+REMOTE_IPFS = "/dns/registry.autonolas.tech/tcp/443/https"
+DUMMY_HASH = "QmRP7wK1NZKwno9CFxQUeFaJip5eaaLBo1v8WFtyECgLCz"
+MAX_TRANSFER_SIZE = 64 * 1024
 
 
 @use_ipfs_daemon
@@ -90,8 +107,11 @@ class TestIpfsConnection:
         [
             (IpfsMessage.Performative.GET_FILES, False),
             (IpfsMessage.Performative.STORE_FILES, False),
+            (IpfsMessage.Performative.GET_BINARY_FILES, False),
+            (IpfsMessage.Performative.STORE_BINARY_FILES, False),
             (IpfsMessage.Performative.IPFS_HASH, True),
             (IpfsMessage.Performative.FILES, True),
+            (IpfsMessage.Performative.BINARY_FILES, True),
         ],
     )
     def test_handle_envelope(
@@ -106,11 +126,13 @@ class TestIpfsConnection:
             IpfsConnection,
             "run_async",
             return_value=MagicMock(),
-        ), mock.patch.object(
+        ) as mock_run_async, mock.patch.object(
             self.connection.logger,
             "error",
         ) as mock_logger:
             self.connection._handle_envelope(envelope)
+            # the handling coroutine is not run
+            mock_run_async.call_args.args[0].close()
             if expected_error:
                 mock_logger.assert_called_with(
                     f"Performative `{performative.value}` is not supported."
@@ -163,7 +185,7 @@ class TestIpfsConnection:
         """Test run async."""
         dummy_log = "dummy operation is being performed"
 
-        def dummy_operation() -> None:
+        async def dummy_operation() -> None:
             """A dummy handler."""
             self.connection.logger.info(dummy_log)
 
@@ -172,13 +194,17 @@ class TestIpfsConnection:
             self.connection.logger,
             "info",
         ) as mock_logger:
-            task = self.connection.run_async(dummy_operation)
+            task = self.connection.run_async(dummy_operation())
             assert task is not None
 
             # give some time for the task to be scheduled and run
             await asyncio.sleep(1)
             mock_logger.assert_called_with(dummy_log)
 
+        task = self.connection.run_async(asyncio.sleep(10), timeout=0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await task
+
     @pytest.mark.parametrize(
         ("files", "expected_log", "log_level"),
         [
@@ -207,7 +233,8 @@ class TestIpfsConnection:
             ),
         ],
     )
-    def test_handle_store_files(
+    @pytest.mark.asyncio
+    async def test_handle_store_files(
         self, files: Dict[str, str], expected_log: str, log_level: str
     ) -> None:
         """Test _handle_store_files."""
@@ -219,7 +246,7 @@ class TestIpfsConnection:
                 performative=IpfsMessage.Performative.STORE_FILES, files=files  # type: ignore
             )
             dialogue = MagicMock()
-            message = self.connection._handle_store_files(message, dialogue)
+            message = await self.connection._handle_store_files(message, dialogue)
             assert message is not None
             mock_logger.assert_called_with(expected_log)
 
@@ -236,7 +263,8 @@ class TestIpfsConnection:
             ([], None, True),
         ],
     )
-    def test_handle_get_files(
+    @pytest.mark.asyncio
+    async def test_handle_get_files(
         self,
         extra_files: List[str],
         download_side_effect: Optional[Exception],
@@ -248,6 +276,8 @@ class TestIpfsConnection:
             "listdir",
         ) as mock_listdir, mock.patch.object(
             IPFSTool, "download", side_effect=download_side_effect
+        ), mock.patch.object(
+            self.connection.backend, "in_memory", False
         ):
             listdir_value = [extra_files + [tmp_file.name]]
             if is_dir:
@@ -257,12 +287,12 @@ class TestIpfsConnection:
             tmp_file.write(b"dummy_data")
             tmp_file.flush()
 
-            _, ipfs_hash, _ = self.connection.ipfs_tool.add(tmp_file.name)
+            _, ipfs_hash, _ = self.connection.backend.ipfs_tool.add(tmp_file.name)
             message = IpfsMessage(
                 performative=IpfsMessage.Performative.GET_FILES, ipfs_hash=ipfs_hash  # type: ignore
             )
             dialogue = MagicMock()
-            message = self.connection._handle_get_files(message, dialogue)
+            message = await self.connection._handle_get_files(message, dialogue)
             assert message is not None
 
     def test_ipfs_dialogue(self) -> None:  # pylint: disable=no-self-use
@@ -272,3 +302,538 @@ class TestIpfsConnection:
             counterparty=ANY_SKILL,
             performative=IpfsMessage.Performative.GET_FILES,
         )
+
+
+def parse_multipart(body: bytes, boundary: str) -> List[Tuple[str, bytes, str]]:
+    """Parse the name, the content and the content type of the parts of a multipart body."""
+    parts = []
+    for part in body.split(f"--{boundary}".encode())[1:-1]:
+        headers, data = part.split(b"\r\n\r\n", 1)
+        disposition, content_type = headers.decode().strip().split("\r\n")
+        name = disposition.split('filename="')[1].rstrip('"')
+        parts.append((name, data[: -len(b"\r\n")], content_type.split(": ")[1]))
+    return parts
+
+
+class FakeNode:
+    """A stand-in for the endpoints of the IPFS HTTP API, served locally."""
+
+    def __init__(
+        self,
+        nodes: Optional[Dict[str, Union[bytes, Dict[str, str]]]] = None,
+        added_hash: str = DUMMY_HASH,
+        failing: bool = False,
+        cat_delay: float = 0.01,
+    ) -> None:
+        """Initialize the node with files, as bytes, and dirs, as links by name."""
+        self.nodes = nodes or {}
+        self.added_hash = added_hash
+        self.failing = failing
+        self.cat_delay = cat_delay
+        self.requests: List[Tuple[str, Dict[str, str], bytes, str]] = []
+        self.concurrent_cats = 0
+        self.max_concurrent_cats = 0
+        self._server: Optional[TestServer] = None
+
+    def _link(self, name: str, hash_: str) -> Dict[str, Any]:
+        """Get the link to a node."""
+        node = self.nodes[hash_]
+        is_file = isinstance(node, bytes)
+        size = len(node) if isinstance(node, bytes) else 0
+        return {"Name": name, "Hash": hash_, "Size": size, "Type": 2 if is_file else 1}
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Respond to a request."""
+        endpoint = request.path[len("/api/v0/") :]
+        body = await request.read()
+        content_type = request.headers.get("Content-Type", "")
+        self.requests.append((endpoint, dict(request.query), body, content_type))
+        if self.failing:
+            return web.Response(status=500, text="failing node")
+        if endpoint == "add":
+            added = [
+                {"Name": "dummy", "Hash": "dummy"},
+                {"Name": "", "Hash": self.added_hash},
+            ]
+            return web.Response(text="\n".join(json.dumps(node) for node in added))
+        if endpoint in ("id", "pin/rm"):
+            return web.json_response({})
+        if endpoint == "repo/gc":
+            return web.Response(text='{"Key": "Qm1"}\n{"Key": "Qm2"}\n')
+        node = self.nodes[request.query["arg"]]
+        if endpoint == "ls":
+            links = (
+                []
+                if isinstance(node, bytes)
+                else [self._link(name, hash_) for name, hash_ in node.items()]
+            )
+            return web.json_response({"Objects": [{"Links": links}]})
+        assert endpoint == "cat" and isinstance(node, bytes)
+        self.concurrent_cats += 1
+        self.max_concurrent_cats = max(self.max_concurrent_cats, self.concurrent_cats)
+        try:
+            await asyncio.sleep(self.cat_delay)
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for i in range(0, len(node), 4):
+                await response.write(node[i : i + 4])
+            await response.write_eof()
+            return response
+        finally:
+            self.concurrent_cats -= 1
+
+    def endpoints(self, endpoint: str) -> List[Tuple[Dict[str, str], bytes, str]]:
+        """Get the requests received by an endpoint."""
+        return [request[1:] for request in self.requests if request[0] == endpoint]
+
+    async def start(self) -> str:
+        """Start serving the node, and get the url of its api."""
+        app = web.Application()
+        app.router.add_route("POST", "/api/v0/{endpoint:.*}", self.handle)
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+        return f"http://127.0.0.1:{self._server.port}/api/v0"
+
+    async def stop(self) -> None:
+        """Stop serving the node."""
+        if self._server is not None:
+            await self._server.close()
+
+
+class TestIpfsConnectionInMemory:
+    """Tests for the in-memory transfers of IpfsConnection"""
+
+    def setup(self) -> None:
+        """Set up the tests."""
+        configuration = ConnectionConfig(
+            ipfs_domain=REMOTE_IPFS,
+            max_transfer_size=MAX_TRANSFER_SIZE,
+            connection_id=IpfsConnection.connection_id,
+        )
+        self.connection = IpfsConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+        )
+        self.dialogue = MagicMock()
+        self.node = FakeNode()
+
+    async def _serve(self, node: FakeNode) -> None:
+        """Serve a fake node, and connect to it."""
+        self.node = node
+        backend = cast(DaemonIpfsBackend, self.connection.backend)
+        backend.api_url = await node.start()
+        await self.connection.connect()
+
+    async def teardown_node(self) -> None:
+        """Disconnect from the fake node, and stop serving it."""
+        await self.connection.disconnect()
+        await self.node.stop()
+
+    async def _store(self, files: Dict[str, str]) -> None:
+        """Handle a STORE_FILES request."""
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.STORE_FILES, files=files  # type: ignore
+        )
+        await self.connection._handle_store_files(message, self.dialogue)
+
+    async def _get(self) -> None:
+        """Handle a GET_FILES request."""
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES, ipfs_hash=DUMMY_HASH  # type: ignore
+        )
+        await self.connection._handle_get_files(message, self.dialogue)
+
+    def _added_parts(self) -> List[Tuple[str, bytes, str]]:
+        """Get the parts of the multipart request sent to the `add` endpoint."""
+        ((params, body, content_type),) = self.node.endpoints("add")
+        assert params["wrap-with-directory"] == "true"
+        boundary = content_type.split("boundary=")[1]
+        return parse_multipart(body, boundary)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("files", "expected_parts"),
+        [
+            (
+                {"dummy_filename": "dummy_content"},
+                [("dummy_filename", b"dummy_content")],
+            ),
+            (
+                {
+                    "path/to/dummy_dir/dummy_filename1": "dummy_content1",
+                    "path/to/dummy_dir/dummy_filename2": "dummy_content2",
+                },
+                [
+                    ("dummy_dir", b""),
+                    ("dummy_dir%2Fdummy_filename1", b"dummy_content1"),
+                    ("dummy_dir%2Fdummy_filename2", b"dummy_content2"),
+                ],
+            ),
+        ],
+    )
+    async def test_store_files(
+        self, files: Dict[str, str], expected_parts: List[Tuple[str, bytes]]
+    ) -> None:
+        """Test that the files are streamed to the node without touching the filesystem."""
+        await self._serve(FakeNode())
+        with mock.patch.object(IPFSTool, "add") as mock_add:
+            await self._store(files)
+        await self.teardown_node()
+
+        mock_add.assert_not_called()
+        assert not any(os.path.exists(path) for path in files)
+        parts = self._added_parts()
+        assert [(name, data) for name, data, _ in parts] == expected_parts
+        if len(files) > 1:
+            assert parts[0][2] == DIRECTORY_CONTENT_TYPE
+        assert self.dialogue.reply.call_args.kwargs["ipfs_hash"] == DUMMY_HASH
+
+    @pytest.mark.asyncio
+    async def test_store_files_too_large(self) -> None:
+        """Test that files bigger than the maximum transfer size are rejected."""
+        await self._serve(FakeNode())
+        await self._store({"dummy_filename": "a" * (MAX_TRANSFER_SIZE + 1)})
+        await self.teardown_node()
+        assert [request[0] for request in self.node.requests] == ["id"]
+        reason = self.dialogue.reply.call_args.kwargs["reason"]
+        assert "exceeds the maximum size" in reason
+
+    @pytest.mark.asyncio
+    async def test_store_files_fallback(self) -> None:
+        """Test that the files are stored via the filesystem if the in-memory transfer fails."""
+        await self._serve(FakeNode())
+        self.node.failing = True
+        with mock.patch.object(
+            IPFSTool, "add", return_value=("", DUMMY_HASH, [])
+        ) as mock_add, tempfile.TemporaryDirectory() as tmp_dir:
+            await self._store(
+                {os.path.join(tmp_dir, "dummy_filename"): "dummy_content"}
+            )
+        await self.teardown_node()
+        mock_add.assert_called_once()
+        assert self.dialogue.reply.call_args.kwargs["ipfs_hash"] == DUMMY_HASH
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.exceptions.ChunkedEncodingError("dummy chunked encoding error"),
+            ErrorResponse("dummy error response", None),
+        ],
+    )
+    async def test_store_files_fallback_error(self, error: Exception) -> None:
+        """Test that an error of the filesystem fallback is replied with an error."""
+        await self._serve(FakeNode())
+        self.node.failing = True
+        with mock.patch.object(
+            IPFSTool, "add", side_effect=error
+        ), tempfile.TemporaryDirectory() as tmp_dir:
+            await self._store(
+                {os.path.join(tmp_dir, "dummy_filename"): "dummy_content"}
+            )
+        await self.teardown_node()
+        assert self.dialogue.reply.call_args.kwargs["reason"] == str(error)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("nodes", "expected_files"),
+        [
+            (
+                {
+                    DUMMY_HASH: {"dummy_filename": "file"},
+                    "file": b"dummy_content",
+                },
+                {"dummy_filename": "dummy_content"},
+            ),
+            (
+                {
+                    DUMMY_HASH: {"dummy_dir": "dir"},
+                    "dir": {"dummy_filename1": "file1", "dummy_filename2": "file2"},
+                    "file1": b"dummy_content1",
+                    "file2": b"dummy_content2",
+                },
+                {
+                    "dummy_filename1": "dummy_content1",
+                    "dummy_filename2": "dummy_content2",
+                },
+            ),
+            (
+                {
+                    DUMMY_HASH: {
+                        "dummy_filename1": "file1",
+                        "dummy_filename2": "file2",
+                        "dummy_dir": "dir",
+                    },
+                    "dir": {},
+                    "file1": b"dummy_content1",
+                    "file2": b"dummy_content2",
+                },
+                {
+                    "dummy_filename1": "dummy_content1",
+                    "dummy_filename2": "dummy_content2",
+                },
+            ),
+            ({DUMMY_HASH: b"dummy_content"}, {DUMMY_HASH: "dummy_content"}),
+        ],
+    )
+    async def test_get_files(
+        self,
+        nodes: Dict[str, Union[bytes, Dict[str, str]]],
+        expected_files: Dict[str, str],
+    ) -> None:
+        """Test that the files are streamed from the node into memory."""
+        await self._serve(FakeNode(nodes))
+        with mock.patch.object(IPFSTool, "download") as mock_download:
+            await self._get()
+        await self.teardown_node()
+        mock_download.assert_not_called()
+        assert self.dialogue.reply.call_args.kwargs["files"] == expected_files
+
+    @pytest.mark.asyncio
+    async def test_get_binary_files(self) -> None:
+        """Test that the files of a directory are downloaded concurrently, as binary, by a bounded number of requests."""
+        files = {f"dummy_filename{i}": bytes(range(i, i + 10)) for i in range(8)}
+        nodes: Dict[str, Union[bytes, Dict[str, str]]] = {
+            DUMMY_HASH: {name: f"file{i}" for i, name in enumerate(files)}
+        }
+        nodes.update({f"file{i}": data for i, data in enumerate(files.values())})
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_BINARY_FILES, ipfs_hash=DUMMY_HASH  # type: ignore
+        )
+        await self._serve(FakeNode(nodes))
+        await self.connection._handle_get_binary_files(message, self.dialogue)
+        await self.teardown_node()
+        assert self.dialogue.reply.call_args.kwargs["binary_files"] == files
+        max_concurrent_transfers = self.connection.configuration.config.get(
+            "max_concurrent_transfers", DEFAULT_MAX_CONCURRENT_TRANSFERS
+        )
+        assert 1 < self.node.max_concurrent_cats <= max_concurrent_transfers
+        assert len(self.connection.cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_store_binary_files(self) -> None:
+        """Test that binary files are uploaded as they are."""
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.STORE_BINARY_FILES,  # type: ignore
+            binary_files={"dummy_filename": b"\xff\x00"},
+        )
+        await self._serve(FakeNode())
+        await self.connection._handle_store_binary_files(message, self.dialogue)
+        await self.teardown_node()
+        assert self._added_parts() == [
+            ("dummy_filename", b"\xff\x00", FILE_CONTENT_TYPE)
+        ]
+        assert self.dialogue.reply.call_args.kwargs["ipfs_hash"] == DUMMY_HASH
+        assert self.connection.cache.get(DUMMY_HASH) == {"dummy_filename": b"\xff\x00"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "nodes",
+        [
+            {DUMMY_HASH: b"a" * (MAX_TRANSFER_SIZE + 1)},
+            {
+                DUMMY_HASH: {"dummy_filename1": "file", "dummy_filename2": "file"},
+                "file": b"a" * (MAX_TRANSFER_SIZE // 2 + 1),
+            },
+        ],
+    )
+    async def test_get_files_too_large(
+        self, nodes: Dict[str, Union[bytes, Dict[str, str]]]
+    ) -> None:
+        """Test that downloads bigger than the maximum transfer size are rejected."""
+        await self._serve(FakeNode(nodes))
+        with mock.patch.object(IPFSTool, "download") as mock_download:
+            await self._get()
+        await self.teardown_node()
+        mock_download.assert_not_called()
+        reason = self.dialogue.reply.call_args.kwargs["reason"]
+        assert "exceeds the maximum size" in reason
+
+    @pytest.mark.asyncio
+    async def test_get_non_text_files(self) -> None:
+        """Test that getting binary files as text fails."""
+        await self._serve(FakeNode({DUMMY_HASH: b"\xff"}))
+        await self._get()
+        await self.teardown_node()
+        assert "utf-8" in self.dialogue.reply.call_args.kwargs["reason"]
+
+    @pytest.mark.asyncio
+    async def test_get_files_fallback(self) -> None:
+        """Test that the files are downloaded via the filesystem if the in-memory transfer fails."""
+
+        def download(_: str, target_dir: str) -> None:
+            """Download a dummy file."""
+            with open(os.path.join(target_dir, "dummy_filename"), "w") as file:
+                file.write("dummy_content")
+
+        await self._serve(FakeNode())
+        self.node.failing = True
+        with mock.patch.object(IPFSTool, "download", side_effect=download):
+            await self._get()
+        await self.teardown_node()
+        assert self.dialogue.reply.call_args.kwargs["files"] == {
+            "dummy_filename": "dummy_content"
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_stored_files_from_cache(self) -> None:
+        """Test that getting files which were stored does not request them from the node."""
+        await self._serve(FakeNode())
+        await self._store({"path/to/dummy_filename": "dummy_content"})
+        await self._get()
+        await self.teardown_node()
+        assert [request[0] for request in self.node.requests] == ["id", "add"]
+        assert self.dialogue.reply.call_args.kwargs["files"] == {
+            "dummy_filename": "dummy_content"
+        }
+        assert self.connection.cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_request_timeout(self) -> None:
+        """Test that a request which times out is cancelled, and replied with an error."""
+        await self._serve(FakeNode({DUMMY_HASH: b"dummy_content"}, cat_delay=10))
+        self.connection.request_timeout = 0.1
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES, ipfs_hash=DUMMY_HASH  # type: ignore
+        )
+        start = time.monotonic()
+        await self.connection._handle_request(
+            self.connection._handle_get_files, message, self.dialogue
+        )
+        assert time.monotonic() - start < 5
+        await self.teardown_node()
+        reason = self.dialogue.reply.call_args.kwargs["reason"]
+        assert reason == "The request timed out after 0.1 seconds."
+        assert len(self.connection.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_request_unexpected_error(self) -> None:
+        """Test that a request which fails unexpectedly is replied with an error."""
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES, ipfs_hash=DUMMY_HASH  # type: ignore
+        )
+        with mock.patch.object(
+            self.connection.backend, "get", side_effect=RuntimeError("dummy error")
+        ), mock.patch.object(self.connection.logger, "exception"):
+            await self.connection._handle_request(
+                self.connection._handle_get_files, message, self.dialogue
+            )
+        reason = self.dialogue.reply.call_args.kwargs["reason"]
+        assert reason == (
+            "Unexpected error while handling the request: RuntimeError('dummy error')"
+        )
+
+    def _release_hashes(self, *hashes: str) -> None:
+        """Make the given hashes pending release, by storing a newer hash under the name of each."""
+        self.connection.retention.retain_last = 1
+        for i, ipfs_hash in enumerate(hashes):
+            self.connection.retention.track(f"object{i}", ipfs_hash)
+            self.connection.retention.track(f"object{i}", f"QmRetained{i}")
+
+    @pytest.mark.asyncio
+    async def test_release(self) -> None:
+        """Test that the hashes which are no longer retained are unpinned from the node, and its garbage collected."""
+        await self._serve(FakeNode())
+        self._release_hashes("QmReleased1", "QmReleased2")
+        with mock.patch.object(self.connection.logger, "info") as mock_logger:
+            await self.connection._release()
+        await self.teardown_node()
+        assert [params for params, _, _ in self.node.endpoints("pin/rm")] == [
+            {"arg": "QmReleased1"},
+            {"arg": "QmReleased2"},
+        ]
+        assert len(self.node.endpoints("repo/gc")) == 1
+        assert self.connection.retention.releasing() == []
+        mock_logger.assert_called_with(
+            "Unpinned 2 hashes which are no longer retained, and removed 2 blocks."
+        )
+
+    @pytest.mark.asyncio
+    async def test_release_retried(self) -> None:
+        """Test that a hash which fails to be unpinned, e.g., on a timeout, is retried on the next release."""
+        await self._serve(FakeNode())
+        self._release_hashes("QmReleased1", "QmReleased2")
+        backend = cast(DaemonIpfsBackend, self.connection.backend)
+        unpin = backend.unpin
+        with mock.patch.object(
+            backend, "unpin", side_effect=[asyncio.TimeoutError(), None]
+        ), mock.patch.object(self.connection.logger, "warning") as mock_warning:
+            await self.connection._release()
+        assert self.connection.retention.releasing() == ["QmReleased1"]
+        assert len(self.node.endpoints("repo/gc")) == 1
+        mock_warning.assert_called_once_with(
+            "Could not unpin the hash QmReleased1, "
+            "it will be retried on the next release: TimeoutError()"
+        )
+
+        with mock.patch.object(backend, "unpin", wraps=unpin) as mock_unpin:
+            await self.connection._release()
+        await self.teardown_node()
+        mock_unpin.assert_called_once_with("QmReleased1")
+        assert self.connection.retention.releasing() == []
+        assert len(self.node.endpoints("repo/gc")) == 2
+
+
+class TestIpfsConnectionLocalBackend:
+    """Tests for IpfsConnection with the local backend"""
+
+    def setup(self) -> None:
+        """Set up the tests."""
+        configuration = ConnectionConfig(
+            backend=LOCAL_BACKEND,
+            cache_size=0,
+            connection_id=IpfsConnection.connection_id,
+        )
+        self.connection = IpfsConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_files(self) -> None:
+        """Test that files are stored and got back end-to-end, without a daemon."""
+        files = {
+            "dummy_dir/dummy_filename1": "dummy_content",
+            "dummy_dir/dummy_filename2": "dummy_content",
+        }
+        with mock.patch.object(aiohttp.ClientSession, "post") as mock_post:
+            await self.connection.connect()
+            dialogue = MagicMock()
+            message = IpfsMessage(
+                performative=IpfsMessage.Performative.STORE_FILES, files=files  # type: ignore
+            )
+            await self.connection._handle_store_files(message, dialogue)
+            ipfs_hash = dialogue.reply.call_args.kwargs["ipfs_hash"]
+            message = IpfsMessage(
+                performative=IpfsMessage.Performative.GET_FILES, ipfs_hash=ipfs_hash  # type: ignore
+            )
+            await self.connection._handle_get_files(message, dialogue)
+            await self.connection.disconnect()
+        mock_post.assert_not_called()
+        assert ipfs_hash == DUMMY_HASH
+        assert dialogue.reply.call_args.kwargs["files"] == {
+            "dummy_filename1": "dummy_content",
+            "dummy_filename2": "dummy_content",
+        }
+
+    @pytest.mark.asyncio
+    async def test_retention(self) -> None:
+        """Test that the hashes stored in the periods which are no longer retained are released."""
+        self.connection.retention.retain_last = 2
+        await self.connection.connect()
+        dialogue = MagicMock()
+        hashes = []
+        for period in range(3):
+            message = IpfsMessage(
+                performative=IpfsMessage.Performative.STORE_BINARY_FILES,  # type: ignore
+                binary_files={"snapshot.json": f"retention period {period}".encode()},
+            )
+            await self.connection._handle_store_binary_files(message, dialogue)
+            hashes.append(dialogue.reply.call_args.kwargs["ipfs_hash"])
+        await self.connection.disconnect()
+
+        assert self.connection.retention.retained("snapshot.json") == hashes[1:]
+        with pytest.raises(DownloadError):
+            await self.connection.backend.get(hashes[0])
+        for ipfs_hash in hashes[1:]:
+            assert await self.connection.backend.get(ipfs_hash)
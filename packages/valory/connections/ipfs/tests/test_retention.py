@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the retention policy of the ipfs connection."""
+
+from pathlib import Path
+
+from packages.valory.connections.ipfs.retention import PinRetention
+
+
+HASHES = [f"Qm{i}" for i in range(5)]
+
+
+def test_retain_last() -> None:
+    """Test that the last hashes of each name are retained, and the older ones released."""
+    retention = PinRetention(retain_last=2)
+    assert retention.track("snapshot.json", HASHES[0]) == []
+    assert retention.track("snapshot.json", HASHES[1]) == []
+    assert retention.track("other.json", HASHES[2]) == []
+    assert retention.track("snapshot.json", HASHES[3]) == [HASHES[0]]
+    assert retention.retained("snapshot.json") == [HASHES[1], HASHES[3]]
+    assert retention.retained("other.json") == [HASHES[2]]
+
+
+def test_retained_hashes_are_not_released() -> None:
+    """Test that a hash which is still retained, under any name, is not released."""
+    retention = PinRetention(retain_last=1)
+    retention.track("other.json", HASHES[0])
+    retention.track("snapshot.json", HASHES[0])
+    assert retention.track("snapshot.json", HASHES[1]) == []
+
+    # storing the same hash again does not count as a new period
+    assert retention.track("snapshot.json", HASHES[1]) == []
+    assert retention.track("snapshot.json", HASHES[2]) == [HASHES[1]]
+
+
+def test_releasing() -> None:
+    """Test that the released hashes are pending until their release is confirmed, unless they are stored again."""
+    retention = PinRetention(retain_last=1)
+    retention.track("snapshot.json", HASHES[0])
+    retention.track("snapshot.json", HASHES[1])
+    retention.track("snapshot.json", HASHES[2])
+    assert retention.releasing() == HASHES[:2]
+
+    retention.confirm_release(HASHES[0])
+    retention.confirm_release(HASHES[0])
+    assert retention.releasing() == [HASHES[1]]
+
+    # a pending hash which is stored again is retained instead
+    retention.track("other.json", HASHES[1])
+    assert retention.releasing() == []
+
+
+def test_disabled() -> None:
+    """Test that all the hashes are retained when the policy is disabled."""
+    retention = PinRetention(retain_last=0)
+    assert not retention.enabled
+    for ipfs_hash in HASHES:
+        assert retention.track("snapshot.json", ipfs_hash) == []
+    assert retention.retained("snapshot.json") == []
+
+
+def test_index(tmp_path: Path) -> None:
+    """Test that the tracked hashes are persisted, so that they are released after a restart."""
+    index_path = tmp_path / "retention" / "index.json"
+    retention = PinRetention(retain_last=2, index_path=index_path)
+    for ipfs_hash in HASHES[:2]:
+        retention.track("snapshot.json", ipfs_hash)
+
+    restarted = PinRetention(retain_last=2, index_path=index_path)
+    assert restarted.retained("snapshot.json") == HASHES[:2]
+    assert restarted.track("snapshot.json", HASHES[2]) == [HASHES[0]]
+
+    # the hashes pending release are persisted too
+    restarted = PinRetention(retain_last=2, index_path=index_path)
+    assert restarted.releasing() == [HASHES[0]]
+
+    index_path.write_text("not json")
+    assert (
+        PinRetention(retain_last=2, index_path=index_path).retained("snapshot.json")
+        == []
+    )
@@ -20,11 +20,16 @@
 """This module contains base classes for the ledger API connection."""
 import asyncio
 import inspect
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task
+from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures._base import Executor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from enum import Enum
 from logging import Logger
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from aea.crypto.base import LedgerApi
 from aea.crypto.registries import Registry, ledger_apis_registry
@@ -35,6 +40,234 @@ from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue, Dialogues
 
 
+class Lane(Enum):
+    """The lanes in which the ledger requests are executed."""
+
+    READ = "read"
+    SUBMIT = "submit"
+
+
+DEFAULT_LANE_CONFIGS: Dict[Lane, Dict[str, int]] = {
+    Lane.READ: {"max_workers": 4, "queue_size": 32},
+    Lane.SUBMIT: {"max_workers": 2, "queue_size": 8},
+}
+
+# the executor of the request which is currently being handled by a task
+_request_executor: ContextVar[Optional["BoundedExecutor"]] = ContextVar(
+    "_request_executor", default=None
+)
+
+
+@dataclass
+class ExecutorStats:  # pylint: disable=too-many-instance-attributes
+    """Statistics of a bounded executor."""
+
+    max_workers: int
+    queue_size: int
+    submitted: int = 0
+    completed: int = 0
+    pending: int = 0
+    max_pending: int = 0
+    saturated: int = 0
+    total_wait_time: float = 0.0
+
+    @property
+    def active(self) -> int:
+        """Get the number of jobs which are being run by a worker."""
+        return min(self.pending, self.max_workers)
+
+    @property
+    def queued(self) -> int:
+        """Get the number of jobs which are waiting for a worker."""
+        return max(self.pending - self.max_workers, 0)
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Get the mean time a job waited before a worker picked it up."""
+        return self.total_wait_time / self.completed if self.completed else 0.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """Get the statistics as a dictionary."""
+        return {
+            **asdict(self),
+            "active": self.active,
+            "queued": self.queued,
+            "mean_wait_time": self.mean_wait_time,
+        }
+
+
+class BoundedExecutor:
+    """
+    A thread pool executor with a bounded queue.
+
+    At most `max_workers + queue_size` jobs can be pending at any time.
+    Callers which submit more jobs wait until a slot is released, applying backpressure to the requesters.
+    """
+
+    def __init__(
+        self, name: str, max_workers: int, queue_size: int, logger: Logger
+    ) -> None:
+        """
+        Initialize the executor.
+
+        :param name: the name of the executor, used as a prefix for the names of its threads.
+        :param max_workers: the number of worker threads.
+        :param queue_size: the number of jobs which can wait for a worker.
+        :param logger: the logger.
+        """
+        enforce(max_workers > 0, f"Executor {name} needs at least one worker.")
+        enforce(queue_size >= 0, f"Executor {name} cannot have a negative queue size.")
+        self.name = name
+        self.logger = logger
+        self.stats = ExecutorStats(max_workers, queue_size)
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._slots = asyncio.Semaphore(max_workers + queue_size)
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Run a non-coroutine callable in a worker thread.
+
+        :param func: the callable to run.
+        :param args: the arguments of the callable.
+        :return: the return value of the callable.
+        """
+        submitted_at = time.monotonic()
+        if self._slots.locked():
+            self.stats.saturated += 1
+            self.logger.warning(
+                f"Executor {self.name} is saturated: {self.stats.pending} jobs pending."
+            )
+
+        def timed_func() -> Tuple[float, Any]:
+            """Run the callable and report when a worker picked it up."""
+            return time.monotonic(), func(*args)
+
+        await self._slots.acquire()
+        self.stats.submitted += 1
+        self.stats.pending += 1
+        self.stats.max_pending = max(self.stats.max_pending, self.stats.pending)
+        loop = asyncio.get_event_loop()
+        try:
+            future = self._executor.submit(timed_func)
+        except Exception:
+            self._release()
+            raise
+        # the slot is released once the job is done, and not when the caller stops waiting for it,
+        # e.g. on a timeout, since the worker thread keeps running the job until it returns
+        future.add_done_callback(lambda _: self._release_threadsafe(loop))
+        started_at, result = await asyncio.wrap_future(future, loop=loop)
+        self.stats.total_wait_time += started_at - submitted_at
+        return result
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Release the slot of a job from the thread which finished it."""
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        """Release the slot of a job."""
+        self.stats.pending -= 1
+        self.stats.completed += 1
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        """Shut the executor down, without waiting for the running jobs."""
+        self._executor.shutdown(wait=False)
+
+
+class ExecutorPool:
+    """A pool of bounded executors, one per ledger id, chain id and lane."""
+
+    def __init__(
+        self,
+        logger: Logger,
+        lane_configs: Optional[Dict[str, Dict[str, int]]] = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param logger: the logger.
+        :param lane_configs: the `max_workers` and `queue_size` of the executors of each lane, by lane name.
+        """
+        self.logger = logger
+        lane_configs = lane_configs if lane_configs is not None else {}
+        self._lane_configs = {
+            lane: {**default, **lane_configs.get(lane.value, {})}
+            for lane, default in DEFAULT_LANE_CONFIGS.items()
+        }
+        self._executors: Dict[Tuple[str, str, Lane], BoundedExecutor] = {}
+
+    def get(self, ledger_id: str, chain_id: str, lane: Lane) -> BoundedExecutor:
+        """Get the executor for the given ledger id, chain id and lane, creating it if needed."""
+        key = (ledger_id, chain_id, lane)
+        executor = self._executors.get(key)
+        if executor is None:
+            executor = BoundedExecutor(
+                f"{ledger_id}-{chain_id}-{lane.value}",
+                logger=self.logger,
+                **self._lane_configs[lane],
+            )
+            self._executors[key] = executor
+        return executor
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the statistics of all the executors, by executor name."""
+        return {
+            executor.name: executor.stats.as_dict()
+            for executor in self._executors.values()
+        }
+
+    def shutdown(self) -> None:
+        """Shut all the executors down."""
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors.clear()
+
+
+class ContractInstanceCache:
+    """
+    A cache of the contract instances created by a ledger api.
+
+    `Contract.get_instance` calls `LedgerApi.get_contract_instance` on every contract callable,
+    which re-parses the contract's ABI. The instances only depend on the contract interface and the address,
+    so they can be reused for as long as the ledger api lives.
+    """
+
+    def __init__(self, get_contract_instance: Callable[..., Any]) -> None:
+        """
+        Initialize the cache.
+
+        :param get_contract_instance: the ledger api's method which creates the contract instances.
+        """
+        self._get_contract_instance = get_contract_instance
+        self._instances: Dict[Tuple[int, Optional[str]], Tuple[Dict, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(
+        self, contract_interface: Dict[str, str], contract_address: Optional[str] = None
+    ) -> Any:
+        """Get the instance of a contract, creating it if it is not cached."""
+        # the contract interfaces are class attributes of the contracts, so their identity is stable
+        key = (id(contract_interface), contract_address)
+        cached = self._instances.get(key)
+        if cached is not None and cached[0] is contract_interface:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        instance = self._get_contract_instance(contract_interface, contract_address)
+        self._instances[key] = (contract_interface, instance)
+        return instance
+
+    @classmethod
+    def install(cls, api: LedgerApi) -> "ContractInstanceCache":
+        """Make the given ledger api cache the contract instances it creates."""
+        cache = cls(api.get_contract_instance)
+        setattr(api, "get_contract_instance", cache)  # noqa: B010
+        return cache
+
+
 class RequestDispatcher(ABC):
     """Base class for a request dispatcher."""
 
@@ -47,6 +280,7 @@ class RequestDispatcher(ABC):
         loop: Optional[asyncio.AbstractEventLoop] = None,
         executor: Optional[Executor] = None,
         api_configs: Optional[Dict[str, Dict[str, str]]] = None,
+        executor_pool: Optional[ExecutorPool] = None,
     ):
         """
         Initialize the request dispatcher.
@@ -56,13 +290,16 @@ class RequestDispatcher(ABC):
         :param logger: the logger.
         :param connection_state: connection state.
         :param loop: the asyncio loop.
-        :param executor: an executor.
+        :param executor: an executor, used when no executor pool is given.
         :param api_configs: api configs.
+        :param executor_pool: a pool of bounded executors per ledger id, chain id and lane.
         """
         self.connection_state = connection_state
         self.loop = loop if loop is not None else asyncio.get_event_loop()
         self.executor = executor
+        self.executor_pool = executor_pool
         self._api_configs = api_configs
+        self._ledger_apis: Dict[Tuple[str, str], LedgerApi] = {}
         self.logger = logger
         self.retry_attempts = retry_attempts
         self.retry_timeout = retry_timeout
@@ -74,12 +311,66 @@ class RequestDispatcher(ABC):
             config = self._api_configs[ledger_id]
         return config
 
+    def get_ledger_api(self, ledger_id: str, chain_id: str) -> LedgerApi:
+        """
+        Get the ledger api for the given ledger id and chain id.
+
+        The ledger apis are created once per ledger id and chain id, as their configuration is static,
+        and they cache the contract instances they create.
+
+        :param ledger_id: the ledger id.
+        :param chain_id: the chain id.
+        :return: the ledger api.
+        """
+        key = (ledger_id, chain_id)
+        api = self._ledger_apis.get(key)
+        if api is None:
+            api = self.ledger_api_registry.make(ledger_id, **self.api_config(chain_id))
+            self.prepare_ledger_api(api)
+            self._ledger_apis[key] = api
+        return api
+
+    def prepare_ledger_api(self, api: LedgerApi) -> None:  # pylint: disable=no-self-use
+        """
+        Prepare a newly created ledger api before it gets cached.
+
+        By default, this makes the ledger api cache its contract instances. Override it in subclasses to extend it.
+
+        :param api: the ledger api.
+        """
+        ContractInstanceCache.install(api)
+
+    def get_lane(  # pylint: disable=no-self-use, unused-argument
+        self, message: Message
+    ) -> Lane:
+        """
+        Get the lane in which the given request should be executed.
+
+        By default, all the requests are reads. Override it in subclasses to route requests to other lanes.
+
+        :param message: the request message.
+        :return: the lane.
+        """
+        return Lane.READ
+
+    def _run_in_executor(
+        self,
+        executor: Optional[BoundedExecutor],
+        func: Callable,
+        *args: Any,
+    ) -> Any:
+        """Run a non-coroutine callable in the given bounded executor, or in the dispatcher's executor."""
+        if executor is not None:
+            return executor.run(func, *args)
+        return self.loop.run_in_executor(self.executor, func, *args)
+
     async def run_async(
         self,
         func: Callable[[Any], Task],
         api: LedgerApi,
         message: Message,
         dialogue: Dialogue,
+        executor: Optional[BoundedExecutor] = None,
     ) -> Union[Message, Task]:
         """
         Run a function in executor.
@@ -88,17 +379,18 @@ class RequestDispatcher(ABC):
         :param api: the ledger api.
         :param message: a Ledger API message.
         :param dialogue: a Ledger API dialogue.
+        :param executor: the bounded executor to use for this request, if any.
         :return: the return value of the function.
         """
+        # make the executor available to the blocking calls of async handlers
+        _request_executor.set(executor)
         try:
             if inspect.iscoroutinefunction(func):
                 # If it is a coroutine, no need to run it in an executor
                 # This can happen if the handler is async.
                 task = func(api, message, dialogue)  # type: ignore
             else:
-                task = self.loop.run_in_executor(  # type: ignore
-                    self.executor, func, api, message, dialogue
-                )
+                task = self._run_in_executor(executor, func, api, message, dialogue)
             response = await task
             return response
         except Exception as exception:  # pylint: disable=broad-except
@@ -125,8 +417,8 @@ class RequestDispatcher(ABC):
             'Hint: Look at "asyncio.wait_for()". ',
         )
 
-        # we run the passed function using the default executor
-        running_func = self.loop.run_in_executor(self.executor, func, *args)
+        # we run the passed function using the executor of the request being handled, if any
+        running_func = self._run_in_executor(_request_executor.get(), func, *args)
 
         # func_result will carry the value the function returns
         func_result = await asyncio.wait_for(running_func, timeout=timeout)
@@ -158,7 +450,7 @@ class RequestDispatcher(ABC):
         ledger_id = self.get_ledger_id(message)
         chain_id = self.get_chain_id(message)
         self.set_extra_kwargs(message)
-        api = self.ledger_api_registry.make(ledger_id, **self.api_config(chain_id))
+        api = self.get_ledger_api(ledger_id, chain_id)
         dialogue = self.dialogues.update(message)
         if dialogue is None:
             raise ValueError(  # pragma: nocover
@@ -166,7 +458,14 @@ class RequestDispatcher(ABC):
             )
         performative = message.performative
         handler = self.get_handler(performative)
-        return self.loop.create_task(self.run_async(handler, api, message, dialogue))
+        executor = (
+            self.executor_pool.get(ledger_id, chain_id, self.get_lane(message))
+            if self.executor_pool is not None
+            else None
+        )
+        return self.loop.create_task(
+            self.run_async(handler, api, message, dialogue, executor)
+        )
 
     def get_handler(self, performative: Any) -> Callable[[Any], Task]:
         """
@@ -21,14 +21,14 @@
 """Scaffold connection and channel."""
 
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import ExecutorPool, RequestDispatcher
 from packages.valory.connections.ledger.contract_dispatcher import (
     ContractApiRequestDispatcher,
 )
@@ -56,6 +56,7 @@ class LedgerConnection(Connection):
         self._ledger_dispatcher: Optional[LedgerApiRequestDispatcher] = None
         self._contract_dispatcher: Optional[ContractApiRequestDispatcher] = None
         self._response_envelopes: Optional[asyncio.Queue] = None
+        self._executor_pool: Optional[ExecutorPool] = None
 
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
         self.api_configs = self.configuration.config.get(
@@ -67,6 +68,12 @@ class LedgerConnection(Connection):
         self.request_retry_timeout = self.configuration.config.get(
             "retry_timeout", self.TIMEOUT
         )
+        self.executor_configs = self.configuration.config.get(
+            "executors", {}
+        )  # type: Dict[str, Dict[str, int]]
+        self.rpc_batching = self.configuration.config.get(
+            "rpc_batching", None
+        )  # type: Optional[Dict[str, Any]]
 
     @property
     def response_envelopes(self) -> asyncio.Queue:
@@ -77,6 +84,20 @@ class LedgerConnection(Connection):
             )
         return self._response_envelopes
 
+    @property
+    def executor_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the statistics of the executors, by executor name."""
+        if self._executor_pool is None:
+            return {}
+        return self._executor_pool.stats
+
+    @property
+    def rpc_batching_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the JSON-RPC batching statistics of the contract reads, by endpoint."""
+        if self._contract_dispatcher is None:
+            return {}
+        return self._contract_dispatcher.rpc_batching_stats
+
     async def connect(self) -> None:
         """Set up the connection."""
 
@@ -85,6 +106,8 @@ class LedgerConnection(Connection):
 
         self.state = ConnectionStates.connecting
 
+        # the ledger and the contract dispatchers share the executors of each chain
+        self._executor_pool = ExecutorPool(self.logger, self.executor_configs)
         self._ledger_dispatcher = LedgerApiRequestDispatcher(
             self._state,
             loop=self.loop,
@@ -93,6 +116,7 @@ class LedgerConnection(Connection):
             retry_attempts=self.request_retry_attempts,
             retry_timeout=self.request_retry_timeout,
             connection_id=self.connection_id,
+            executor_pool=self._executor_pool,
         )
         self._contract_dispatcher = ContractApiRequestDispatcher(
             self._state,
@@ -102,6 +126,8 @@ class LedgerConnection(Connection):
             retry_attempts=self.request_retry_attempts,
             retry_timeout=self.request_retry_timeout,
             connection_id=self.connection_id,
+            executor_pool=self._executor_pool,
+            rpc_batching=self.rpc_batching,
         )
 
         self._response_envelopes = asyncio.Queue()
@@ -117,9 +143,17 @@ class LedgerConnection(Connection):
         for task in self.task_to_request.keys():
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        if self._contract_dispatcher is not None:
+            self.logger.debug(
+                f"JSON-RPC batching stats: {self._contract_dispatcher.rpc_batching_stats}"
+            )
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
         self._response_envelopes = None
+        if self._executor_pool is not None:
+            self.logger.debug(f"Executor stats: {self._executor_pool.stats}")
+            self._executor_pool.shutdown()
+            self._executor_pool = None
 
         self.state = ConnectionStates.disconnected
 
@@ -22,7 +22,7 @@
 import inspect
 import logging
 from collections.abc import Mapping
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, Callable, Dict, Optional, Union, cast
 
 from aea.common import JSONLike
 from aea.contracts import Contract, contract_registry
@@ -35,7 +35,11 @@ from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import Lane, RequestDispatcher
+from packages.valory.connections.ledger.rpc_batching import (
+    BatchingHTTPProvider,
+    install_batching_provider,
+)
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.contract_api.dialogues import ContractApiDialogue
 from packages.valory.protocols.contract_api.dialogues import (
@@ -47,6 +51,13 @@ _default_logger = logging.getLogger(
     "aea.packages.valory.connections.ledger.contract_dispatcher"
 )
 
+SUBMISSION_PERFORMATIVES = frozenset(
+    {
+        ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION,
+        ContractApiMessage.Performative.GET_RAW_TRANSACTION,
+    }
+)
+
 
 class ContractApiDialogues(BaseContractApiDialogues):
     """The dialogues class keeps track of all dialogues."""
@@ -85,9 +96,28 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         """Initialize the dispatcher."""
         logger = kwargs.pop("logger", None)
         connection_id = kwargs.pop("connection_id")
+        # the `window` and `max_batch_size` of the JSON-RPC batching, or None to disable it
+        self.rpc_batching: Optional[Dict[str, Any]] = kwargs.pop("rpc_batching", None)
         logger = logger if logger is not None else _default_logger
         super().__init__(logger, *args, **kwargs)
         self._contract_api_dialogues = ContractApiDialogues(connection_id=connection_id)
+        self._batching_providers: Dict[str, BatchingHTTPProvider] = {}
+
+    def prepare_ledger_api(self, api: LedgerApi) -> None:
+        """Prepare a newly created ledger api, making it batch its concurrent reads if batching is enabled."""
+        super().prepare_ledger_api(api)
+        if self.rpc_batching is not None:
+            install_batching_provider(
+                api, self._batching_providers, **self.rpc_batching
+            )
+
+    @property
+    def rpc_batching_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the JSON-RPC batching statistics, by endpoint."""
+        return {
+            endpoint: provider.stats.as_dict()
+            for endpoint, provider in self._batching_providers.items()
+        }
 
     @property
     def dialogues(self) -> BaseDialogues:
@@ -99,6 +129,13 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         """Get the contract registry."""
         return contract_registry
 
+    def get_lane(self, message: Message) -> Lane:
+        """Get the lane of the request. Transaction building goes to the submission lane."""
+        message = cast(ContractApiMessage, message)
+        if message.performative in SUBMISSION_PERFORMATIVES:
+            return Lane.SUBMIT
+        return Lane.READ
+
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id."""
         if not isinstance(message, ContractApiMessage):  # pragma: nocover
@@ -30,7 +30,7 @@ from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import Lane, RequestDispatcher
 from packages.valory.protocols.ledger_api.custom_types import (
     TransactionDigests,
     TransactionReceipt,
@@ -46,6 +46,14 @@ _default_logger = logging.getLogger(
     "aea.packages.valory.connections.ledger.ledger_dispatcher"
 )
 
+SUBMISSION_PERFORMATIVES = frozenset(
+    {
+        LedgerApiMessage.Performative.GET_RAW_TRANSACTION,
+        LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION,
+        LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTIONS,
+    }
+)
+
 
 class LedgerApiDialogues(BaseLedgerApiDialogues):
     """The dialogues class keeps track of all dialogues."""
@@ -119,6 +127,13 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         """Get the dialogues."""
         return self._ledger_api_dialogues
 
+    def get_lane(self, message: Message) -> Lane:
+        """Get the lane of the request. Transaction building and submission go to the submission lane."""
+        message = cast(LedgerApiMessage, message)
+        if message.performative in SUBMISSION_PERFORMATIVES:
+            return Lane.SUBMIT
+        return Lane.READ
+
     def get_balance(
         self,
         api: LedgerApi,
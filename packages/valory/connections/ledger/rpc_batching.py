@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a JSON-RPC provider which batches concurrent read requests."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from eth_utils import to_bytes, to_text
+from web3 import HTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3._utils.request import make_post_request
+from web3.types import RPCEndpoint, RPCResponse
+
+from aea.crypto.base import LedgerApi
+
+
+DEFAULT_WINDOW = 0.005
+DEFAULT_MAX_BATCH_SIZE = 20
+
+# the read-only methods which can be safely grouped in a batch
+BATCHABLE_METHODS = frozenset(
+    {
+        "eth_call",
+        "eth_getBalance",
+        "eth_getCode",
+        "eth_getStorageAt",
+        "eth_getTransactionCount",
+        "eth_getTransactionByHash",
+        "eth_getTransactionReceipt",
+        "eth_getBlockByNumber",
+        "eth_blockNumber",
+        "eth_chainId",
+    }
+)
+
+
+@dataclass
+class _PendingCall:
+    """A read request waiting for its batch to be sent."""
+
+    method: RPCEndpoint
+    params: Any
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Optional[RPCResponse] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class BatchingStats:
+    """Statistics of a batching provider."""
+
+    batches: int = 0
+    calls: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """Get the number of http round trips saved by batching."""
+        return self.calls - self.batches
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Get the mean number of calls per batch."""
+        return self.calls / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """Get the statistics as a dictionary."""
+        return {
+            "batches": self.batches,
+            "calls": self.calls,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": self.mean_batch_size,
+            "round_trips_saved": self.round_trips_saved,
+        }
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """
+    An http provider which coalesces concurrent read requests into JSON-RPC batch calls.
+
+    The first read request of a batch waits for `window` seconds, collecting the read requests issued
+    by other threads in the meantime, and then sends all of them in a single http request.
+    A batch is sent early when it reaches `max_batch_size` calls. Other requests are sent as usual.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: Optional[str] = None,
+        request_kwargs: Optional[Any] = None,
+        window: float = DEFAULT_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        :param endpoint_uri: the uri of the JSON-RPC endpoint.
+        :param request_kwargs: the keyword arguments of the http requests.
+        :param window: the time to wait for other read requests before sending a batch, in seconds.
+        :param max_batch_size: the maximum number of calls in a batch.
+        """
+        super().__init__(endpoint_uri, request_kwargs)
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.stats = BatchingStats()
+        self._lock = threading.Lock()
+        self._pending: List[_PendingCall] = []
+        self._batch_full = threading.Event()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Make a request, batching it with the concurrent ones if it is a read."""
+        if method not in BATCHABLE_METHODS:
+            return super().make_request(method, params)
+
+        call = _PendingCall(method, params)
+        with self._lock:
+            self._pending.append(call)
+            is_leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch_size:
+                self._batch_full.set()
+
+        if is_leader:
+            self._batch_full.wait(self.window)
+            with self._lock:
+                batch, self._pending = self._pending, []
+                self._batch_full.clear()
+            self._send_batch(batch)
+
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.response  # type: ignore
+
+    def _send_batch(self, batch: List[_PendingCall]) -> None:
+        """Send a batch of calls and hand their responses over to the waiting threads."""
+        try:
+            if len(batch) == 1:
+                call = batch[0]
+                call.response = super().make_request(call.method, call.params)
+            else:
+                self._send_batch_request(batch)
+        except Exception as e:  # pylint: disable=broad-except
+            for call in batch:
+                call.error = e
+        finally:
+            with self._lock:
+                self.stats.batches += 1
+                self.stats.calls += len(batch)
+                self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+            for call in batch:
+                call.done.set()
+
+    def _send_batch_request(self, batch: List[_PendingCall]) -> None:
+        """Send the calls in a single JSON-RPC batch request."""
+        ids = [next(self.request_counter) for _ in batch]
+        rpc_batch = [
+            {
+                "jsonrpc": "2.0",
+                "method": call.method,
+                "params": call.params or [],
+                "id": id_,
+            }
+            for id_, call in zip(ids, batch)
+        ]
+        self.logger.debug(
+            f"Making batch request HTTP. URI: {self.endpoint_uri}, Size: {len(batch)}"
+        )
+        request_data = to_bytes(
+            text=FriendlyJsonSerde().json_encode(rpc_batch, Web3JsonEncoder)
+        )
+        raw_response = make_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        )
+        responses = FriendlyJsonSerde().json_decode(to_text(raw_response))
+        if not isinstance(responses, list):
+            # the endpoint does not support batches, or rejected the whole batch
+            raise ValueError(f"Invalid batch response: {responses}")
+
+        responses_by_id = {response.get("id"): response for response in responses}
+        for id_, call in zip(ids, batch):
+            response = responses_by_id.get(id_)
+            if response is None:
+                call.error = ValueError(f"No response for the call with id {id_}.")
+                continue
+            call.response = response
+
+
+def install_batching_provider(
+    api: LedgerApi,
+    providers: Dict[str, BatchingHTTPProvider],
+    window: float = DEFAULT_WINDOW,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+) -> Optional[BatchingHTTPProvider]:
+    """
+    Make the given ledger api batch its concurrent read requests.
+
+    Ledger apis which point to the same endpoint share the same batching provider,
+    so that their requests can be grouped together.
+
+    :param api: the ledger api.
+    :param providers: the batching providers, by endpoint uri.
+    :param window: the time to wait for other read requests before sending a batch, in seconds.
+    :param max_batch_size: the maximum number of calls in a batch.
+    :return: the batching provider, or None if the ledger api does not use an http JSON-RPC provider.
+    """
+    web3 = getattr(api, "api", None)
+    provider = getattr(web3, "provider", None)
+    if not isinstance(provider, HTTPProvider):
+        return None
+    if isinstance(provider, BatchingHTTPProvider):
+        return provider
+
+    endpoint_uri = str(provider.endpoint_uri)
+    batching_provider = providers.get(endpoint_uri)
+    if batching_provider is None:
+        batching_provider = BatchingHTTPProvider(
+            endpoint_uri,
+            provider._request_kwargs,  # pylint: disable=protected-access
+            window=window,
+            max_batch_size=max_batch_size,
+        )
+        providers[endpoint_uri] = batching_provider
+    web3.provider = batching_provider  # type: ignore
+    return batching_provider
@@ -20,6 +20,7 @@
 """This module contains the tests of the ledger connection module."""
 
 import asyncio
+import json
 import logging
 import time
 from asyncio import Task
@@ -41,12 +42,25 @@ from aea.multiplexer import Multiplexer
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue, DialogueLabel, Dialogues
 
-from packages.valory.connections.ledger.base import RequestDispatcher
+from packages.valory.connections.ledger.base import (
+    BoundedExecutor,
+    ContractInstanceCache,
+    ExecutorPool,
+    Lane,
+    RequestDispatcher,
+)
+from packages.valory.connections.ledger.contract_dispatcher import (
+    ContractApiRequestDispatcher,
+)
 from packages.valory.connections.ledger.connection import LedgerConnection, PUBLIC_ID
 from packages.valory.connections.ledger.ledger_dispatcher import (
     LedgerApiRequestDispatcher,
 )
-from packages.valory.connections.ledger.tests.conftest import make_ledger_api_connection
+from packages.valory.connections.ledger.tests.conftest import (
+    DEFAULT_ETHEREUM_TESTNET_CONFIG,
+    PACKAGE_DIR,
+    make_ledger_api_connection,
+)
 
 # pylint: skip-file
 from packages.valory.protocols.contract_api import ContractApiMessage
@@ -621,3 +635,230 @@ def test_ledger_connection_exceptions() -> None:
     connection._contract_dispatcher = mock.Mock()
     connection._contract_dispatcher.dispatch.return_value = 12
     assert connection._schedule_request(envelope) == 12
+
+
+class TestBoundedExecutor:
+    """Test `BoundedExecutor` class."""
+
+    @pytest.mark.asyncio
+    async def test_run(self) -> None:
+        """Test that jobs run in the executor and that the statistics are updated."""
+        executor = BoundedExecutor(
+            "test", max_workers=1, queue_size=0, logger=logging.getLogger()
+        )
+        assert await executor.run(lambda x, y: x + y, 1, 2) == 3
+        stats = executor.stats.as_dict()
+        assert stats["submitted"] == stats["completed"] == 1
+        assert stats["pending"] == stats["active"] == stats["queued"] == 0
+        assert stats["saturated"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self) -> None:
+        """Test that jobs beyond the queue size wait for a free slot."""
+        logger = mock.Mock()
+        executor = BoundedExecutor("test", max_workers=1, queue_size=1, logger=logger)
+        jobs = [executor.run(time.sleep, 0.1) for _ in range(3)]
+        await asyncio.gather(*jobs)
+        assert executor.stats.completed == 3
+        assert executor.stats.max_pending == 2
+        assert executor.stats.saturated == 1
+        assert executor.stats.mean_wait_time > 0
+        logger.warning.assert_called_once()
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exception(self) -> None:
+        """Test that the exceptions of the jobs are propagated."""
+
+        def raise_exc() -> None:
+            raise ValueError("expected")
+
+        executor = BoundedExecutor(
+            "test", max_workers=1, queue_size=0, logger=logging.getLogger()
+        )
+        with pytest.raises(ValueError, match="expected"):
+            await executor.run(raise_exc)
+        assert executor.stats.pending == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self) -> None:
+        """Test that the slot of a job is only released once the job is done, even if its caller timed out."""
+        executor = BoundedExecutor(
+            "test", max_workers=1, queue_size=0, logger=logging.getLogger()
+        )
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(executor.run(time.sleep, 0.3), timeout=0.05)
+        assert executor.stats.pending == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(executor.run(lambda: None), timeout=0.05)
+        assert await executor.run(lambda: 1) == 1
+        assert executor.stats.pending == 0
+        assert executor.stats.completed == 2
+        executor.shutdown()
+
+    def test_invalid_config(self) -> None:
+        """Test that invalid configurations are rejected."""
+        with pytest.raises(AEAEnforceError, match="needs at least one worker"):
+            BoundedExecutor(
+                "test", max_workers=0, queue_size=0, logger=logging.getLogger()
+            )
+
+
+def test_executor_pool() -> None:
+    """Test that the pool creates one executor per ledger id, chain id and lane."""
+    pool = ExecutorPool(logging.getLogger(), {"read": {"max_workers": 3}})
+    read = pool.get("ethereum", "gnosis", Lane.READ)
+    assert pool.get("ethereum", "gnosis", Lane.READ) is read
+    assert pool.get("ethereum", "gnosis", Lane.SUBMIT) is not read
+    assert pool.get("ethereum", "ethereum", Lane.READ) is not read
+    assert read.stats.max_workers == 3
+    assert read.stats.queue_size == 32
+    assert set(pool.stats) == {
+        "ethereum-gnosis-read",
+        "ethereum-gnosis-submit",
+        "ethereum-ethereum-read",
+    }
+    pool.shutdown()
+    assert pool.stats == {}
+
+
+@pytest.mark.parametrize(
+    "performative, lane",
+    (
+        (LedgerApiMessage.Performative.GET_BALANCE, Lane.READ),
+        (LedgerApiMessage.Performative.GET_STATE, Lane.READ),
+        (LedgerApiMessage.Performative.GET_RAW_TRANSACTION, Lane.SUBMIT),
+        (LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION, Lane.SUBMIT),
+        (LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT, Lane.READ),
+    ),
+)
+def test_ledger_dispatcher_lanes(
+    performative: LedgerApiMessage.Performative, lane: Lane
+) -> None:
+    """Test the lanes of the ledger api requests."""
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(), connection_id=PUBLIC_ID, connection_state=AsyncState()
+    )
+    assert dispatcher.get_lane(mock.Mock(performative=performative)) == lane
+
+
+@pytest.mark.parametrize(
+    "performative, lane",
+    (
+        (ContractApiMessage.Performative.GET_STATE, Lane.READ),
+        (ContractApiMessage.Performative.GET_RAW_MESSAGE, Lane.READ),
+        (ContractApiMessage.Performative.GET_RAW_TRANSACTION, Lane.SUBMIT),
+        (ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION, Lane.SUBMIT),
+    ),
+)
+def test_contract_dispatcher_lanes(
+    performative: ContractApiMessage.Performative, lane: Lane
+) -> None:
+    """Test the lanes of the contract api requests."""
+    dispatcher = ContractApiRequestDispatcher(
+        logger=mock.Mock(), connection_id=PUBLIC_ID, connection_state=AsyncState()
+    )
+    assert dispatcher.get_lane(mock.Mock(performative=performative)) == lane
+
+
+@pytest.mark.asyncio
+async def test_run_async_with_bounded_executor() -> None:
+    """Test that `run_async` and `wait_for` use the bounded executor of the request."""
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(), connection_id=PUBLIC_ID, connection_state=AsyncState()
+    )
+    executor = BoundedExecutor(
+        "test", max_workers=1, queue_size=0, logger=logging.getLogger()
+    )
+
+    async def async_handler(*_: Any) -> int:
+        """An async handler which runs blocking calls through `wait_for`."""
+        return await dispatcher.wait_for(lambda: 1) + await dispatcher.wait_for(
+            lambda: 2
+        )
+
+    assert (
+        await dispatcher.run_async(
+            lambda x, y, z: 12, mock.Mock(), mock.Mock(), mock.Mock(), executor  # type: ignore
+        )
+        == 12
+    )
+    assert executor.stats.completed == 1
+    assert (
+        await asyncio.create_task(
+            dispatcher.run_async(
+                async_handler, mock.Mock(), mock.Mock(), mock.Mock(), executor  # type: ignore
+            )
+        )
+        == 3
+    )
+    assert executor.stats.completed == 3
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_connection_executor_stats() -> None:
+    """Test that the connection creates and shuts down its executor pool."""
+    ledger_connection = LedgerConnection(
+        configuration=ConnectionConfig(
+            "ledger",
+            "valory",
+            "0.19.0",
+            executors={"submit": {"max_workers": 1, "queue_size": 1}},
+        ),
+        data_dir="test_data_dir",
+    )
+    assert ledger_connection.executor_stats == {}
+    await ledger_connection.connect()
+    pool = cast(ExecutorPool, ledger_connection._executor_pool)
+    assert pool is not None
+    executor = pool.get("ethereum", "ethereum", Lane.SUBMIT)
+    assert executor.stats.max_workers == 1
+    assert "ethereum-ethereum-submit" in ledger_connection.executor_stats
+    await ledger_connection.disconnect()
+    assert ledger_connection.executor_stats == {}
+
+
+ERC20_INTERFACE = {
+    "abi": json.loads(
+        (
+            PACKAGE_DIR.parent.parent / "contracts" / "erc20" / "build" / "ERC20.json"
+        ).read_text()
+    )["abi"],
+    "bytecode": "0x",
+}
+SOME_CONTRACT_ADDRESS = "0x21795D753752ccC1AC728002D23Ba33cbF13b8b0"
+
+
+def test_contract_instance_cache() -> None:
+    """Test that the contract instances are created once per contract interface and address."""
+    get_contract_instance = mock.Mock(side_effect=lambda *_: object())
+    cache = ContractInstanceCache(get_contract_instance)
+    other_interface = dict(ERC20_INTERFACE)
+
+    instance = cache(ERC20_INTERFACE, SOME_CONTRACT_ADDRESS)
+    assert cache(ERC20_INTERFACE, SOME_CONTRACT_ADDRESS) is instance
+    assert cache(ERC20_INTERFACE) is not instance
+    assert cache(other_interface, SOME_CONTRACT_ADDRESS) is not instance
+    assert get_contract_instance.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_get_ledger_api_cached() -> None:
+    """Test that the dispatcher creates one ledger api per ledger id and chain id."""
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=mock.Mock(),
+        connection_id=PUBLIC_ID,
+        connection_state=AsyncState(),
+        api_configs={"ethereum": DEFAULT_ETHEREUM_TESTNET_CONFIG},
+    )
+    api = dispatcher.get_ledger_api("ethereum", "ethereum")
+    assert dispatcher.get_ledger_api("ethereum", "ethereum") is api
+    assert dispatcher.get_ledger_api("ethereum", "gnosis") is not api
+    assert isinstance(api.get_contract_instance, ContractInstanceCache)
+    instance = api.get_contract_instance(ERC20_INTERFACE, SOME_CONTRACT_ADDRESS)
+    assert api.get_contract_instance(ERC20_INTERFACE, SOME_CONTRACT_ADDRESS) is instance
+    cache = cast(ContractInstanceCache, api.get_contract_instance)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the JSON-RPC batching of the ledger connection."""
+
+# pylint: skip-file
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+from unittest import mock
+
+import pytest
+from web3 import Web3
+
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+
+from packages.valory.connections.ledger.connection import PUBLIC_ID
+from packages.valory.connections.ledger.contract_dispatcher import (
+    ContractApiRequestDispatcher,
+)
+from packages.valory.connections.ledger.rpc_batching import (
+    BatchingHTTPProvider,
+    install_batching_provider,
+)
+from packages.valory.connections.ledger.tests.conftest import (
+    DEFAULT_ETHEREUM_TESTNET_CONFIG,
+    make_ledger_api_connection,
+)
+
+
+ENDPOINT = "http://localhost:8545"
+
+
+class _MockEndpoint:
+    """A JSON-RPC endpoint which echoes the method of each call."""
+
+    def __init__(self) -> None:
+        """Initialize the endpoint."""
+        self.requests: List[Any] = []
+
+    def __call__(self, endpoint_uri: str, data: bytes, **_: Any) -> bytes:
+        """Handle a request."""
+        request = json.loads(data)
+        self.requests.append(request)
+        if isinstance(request, list):
+            # answer in reverse order, to check that the responses are matched by id
+            response: Any = [
+                {"jsonrpc": "2.0", "id": call["id"], "result": call["params"]}
+                for call in reversed(request)
+            ]
+        else:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": request["params"],
+            }
+        return json.dumps(response).encode()
+
+
+def _patch_endpoint(endpoint: _MockEndpoint) -> Any:
+    """Patch the http requests of the providers."""
+    return mock.patch.multiple(
+        "packages.valory.connections.ledger.rpc_batching",
+        make_post_request=endpoint,
+    ), mock.patch("web3.providers.rpc.make_post_request", endpoint)
+
+
+def test_concurrent_reads_are_batched() -> None:
+    """Test that concurrent reads are sent in a single batch request."""
+    endpoint = _MockEndpoint()
+    provider = BatchingHTTPProvider(ENDPOINT, window=0.5, max_batch_size=4)
+    batch_patch, single_patch = _patch_endpoint(endpoint)
+    with batch_patch, single_patch, ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(provider.make_request, "eth_call", [i]) for i in range(4)
+        ]
+        responses = [future.result() for future in futures]
+
+    assert [response["result"] for response in responses] == [[i] for i in range(4)]
+    assert len(endpoint.requests) == 1
+    assert len(endpoint.requests[0]) == 4
+    assert provider.stats.as_dict() == {
+        "batches": 1,
+        "calls": 4,
+        "max_batch_size": 4,
+        "mean_batch_size": 4.0,
+        "round_trips_saved": 3,
+    }
+
+
+def test_single_read_and_writes_are_not_batched() -> None:
+    """Test that a lone read is sent as a normal request, and that writes bypass batching."""
+    endpoint = _MockEndpoint()
+    provider = BatchingHTTPProvider(ENDPOINT, window=0.0)
+    batch_patch, single_patch = _patch_endpoint(endpoint)
+    with batch_patch, single_patch:
+        assert provider.make_request("eth_call", [1])["result"] == [1]
+        assert provider.make_request("eth_sendRawTransaction", ["0x"])["result"] == [
+            "0x"
+        ]
+
+    assert all(isinstance(request, dict) for request in endpoint.requests)
+    assert provider.stats.batches == provider.stats.calls == 1
+
+
+def test_batch_errors_are_propagated() -> None:
+    """Test that an invalid batch response fails all the calls of the batch."""
+    provider = BatchingHTTPProvider(ENDPOINT, window=0.5, max_batch_size=2)
+    invalid_response = json.dumps({"jsonrpc": "2.0", "error": "unsupported"}).encode()
+    with mock.patch(
+        "packages.valory.connections.ledger.rpc_batching.make_post_request",
+        return_value=invalid_response,
+    ), ThreadPoolExecutor(2) as executor:
+        futures = [
+            executor.submit(provider.make_request, "eth_call", [i]) for i in range(2)
+        ]
+        for future in futures:
+            with pytest.raises(ValueError, match="Invalid batch response"):
+                future.result()
+
+
+def test_install_batching_provider() -> None:
+    """Test that ledger apis pointing to the same endpoint share a batching provider."""
+    providers: dict = {}
+    first = ledger_apis_registry.make("ethereum", **DEFAULT_ETHEREUM_TESTNET_CONFIG)
+    second = ledger_apis_registry.make("ethereum", **DEFAULT_ETHEREUM_TESTNET_CONFIG)
+    provider = install_batching_provider(first, providers, window=0.1)
+    assert isinstance(provider, BatchingHTTPProvider)
+    assert provider.window == 0.1
+    assert install_batching_provider(second, providers) is provider
+    assert install_batching_provider(first, providers) is provider
+    assert len(providers) == 1
+    assert install_batching_provider(mock.Mock(api=None), providers) is None
+
+
+def test_contract_dispatcher_batching() -> None:
+    """Test that the contract dispatcher installs the batching provider only when enabled."""
+    kwargs = dict(
+        logger=mock.Mock(),
+        connection_id=PUBLIC_ID,
+        connection_state=AsyncState(),
+        api_configs={"ethereum": DEFAULT_ETHEREUM_TESTNET_CONFIG},
+    )
+    dispatcher = ContractApiRequestDispatcher(
+        **kwargs, rpc_batching={"window": 0.01, "max_batch_size": 5}
+    )
+    api = dispatcher.get_ledger_api("ethereum", "ethereum")
+    assert isinstance(api.api.provider, BatchingHTTPProvider)
+    assert list(dispatcher.rpc_batching_stats.values())[0]["batches"] == 0
+
+    dispatcher = ContractApiRequestDispatcher(**kwargs)
+    api = dispatcher.get_ledger_api("ethereum", "ethereum")
+    assert not isinstance(api.api.provider, BatchingHTTPProvider)
+    assert isinstance(api.api, Web3)
+    assert dispatcher.rpc_batching_stats == {}
+
+
+def test_batching_disabled_by_default() -> None:
+    """Test that the connection does not batch the reads unless configured to."""
+    connection = make_ledger_api_connection()
+    assert connection.rpc_batching is None  # type: ignore
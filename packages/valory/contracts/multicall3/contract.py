@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the class to connect to a Multicall3 contract."""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from aea.common import JSONLike
+from aea.configurations.base import PublicId
+from aea.contracts.base import Contract
+from aea.crypto.base import LedgerApi
+from hexbytes import HexBytes
+from web3._utils.abi import get_abi_output_types
+from web3.contract.contract import Contract as Web3Contract
+
+
+PUBLIC_ID = PublicId.from_str("valory/multicall3:0.1.0")
+
+# the address of Multicall3 on most EVM chains, see https://www.multicall3.com/deployments
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+DEFAULT_MAX_CALLS_PER_CHUNK = 100
+# keep the calldata of a single eth_call well below the usual node request size limits
+DEFAULT_MAX_CALLDATA_SIZE = 64 * 1024
+# the abi-encoding overhead of a Call3 struct: offset, target, allowFailure, calldata offset and length
+CALL3_OVERHEAD = 5 * 32
+
+# a call is a dict with the "target" address, the hex "data" and, optionally, the abi "output_types" of the function,
+# since the kwargs of the contract api messages cannot carry tuples or lists of mixed types
+Call = Dict[str, Any]
+
+_logger = logging.getLogger(
+    f"aea.packages.{PUBLIC_ID.author}.contracts.{PUBLIC_ID.name}.contract"
+)
+
+
+def build_call(contract_instance: Web3Contract, fn_name: str, *args: Any) -> Call:
+    """
+    Build a call to be aggregated, using the abi of the target contract.
+
+    :param contract_instance: the instance of the target contract.
+    :param fn_name: the name of the function to call.
+    :param args: the arguments of the function.
+    :return: the call, with the target address, the calldata and the output types of the function.
+    """
+    call_data = contract_instance.encodeABI(fn_name=fn_name, args=args)
+    fn_abi = contract_instance.get_function_by_name(fn_name).abi
+    return dict(
+        target=contract_instance.address,
+        data=call_data,
+        output_types=get_abi_output_types(fn_abi),
+    )
+
+
+def _call_size(call: Call) -> int:
+    """Get the approximate abi-encoded size of a call, in bytes."""
+    call_data = HexBytes(call["data"])
+    padded_size = (len(call_data) + 31) // 32 * 32
+    return CALL3_OVERHEAD + padded_size
+
+
+def _to_json_like(value: Any) -> Any:
+    """Convert an abi-decoded value to one which the contract api messages can carry."""
+    if isinstance(value, (list, tuple)):
+        return [_to_json_like(item) for item in value]
+    if isinstance(value, bytes):
+        return HexBytes(value).hex()
+    return value
+
+
+def _is_carriable(value: Any) -> bool:
+    """Check that the contract api messages can carry a value, i.e., that it is not a list of lists or of mixed types."""
+    if not isinstance(value, list):
+        return True
+    return len({type(item) for item in value}) <= 1 and not any(
+        isinstance(item, list) for item in value
+    )
+
+
+def chunk_calls(
+    calls: Sequence[Call],
+    max_calls_per_chunk: int = DEFAULT_MAX_CALLS_PER_CHUNK,
+    max_calldata_size: int = DEFAULT_MAX_CALLDATA_SIZE,
+) -> Iterator[Sequence[Call]]:
+    """
+    Split the calls into chunks which can each be aggregated in a single eth_call.
+
+    :param calls: the calls.
+    :param max_calls_per_chunk: the maximum number of calls in a chunk.
+    :param max_calldata_size: the maximum size of the encoded calls of a chunk, in bytes.
+        A call bigger than this limit is sent in a chunk on its own.
+    :yield: the chunks of calls.
+    """
+    start, size = 0, 0
+    for i, call in enumerate(calls):
+        call_size = _call_size(call)
+        chunk_is_full = i - start >= max_calls_per_chunk
+        if i > start and (chunk_is_full or size + call_size > max_calldata_size):
+            yield calls[start:i]
+            start, size = i, 0
+        size += call_size
+    if start < len(calls):
+        yield calls[start:]
+
+
+class Multicall3Contract(Contract):
+    """The Multicall3 contract."""
+
+    contract_id = PUBLIC_ID
+
+    @classmethod
+    def get_raw_transaction(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[JSONLike]:
+        """Get raw transaction."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_raw_message(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[bytes]:
+        """Get raw message."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_state(
+        cls, ledger_api: LedgerApi, contract_address: str, **kwargs: Any
+    ) -> Optional[JSONLike]:
+        """Get state."""
+        raise NotImplementedError
+
+    @classmethod
+    def get_deploy_transaction(
+        cls, ledger_api: LedgerApi, deployer_address: str, **kwargs: Any
+    ) -> Optional[JSONLike]:
+        """Get deploy transaction."""
+        raise NotImplementedError
+
+    @classmethod
+    def aggregate(  # pylint: disable=too-many-arguments
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        calls: Sequence[Call],
+        allow_failure: bool = True,
+        max_calls_per_chunk: int = DEFAULT_MAX_CALLS_PER_CHUNK,
+        max_calldata_size: int = DEFAULT_MAX_CALLDATA_SIZE,
+        block_identifier: Any = "latest",
+    ) -> JSONLike:
+        """
+        Perform many read-only calls using as few eth_calls as possible.
+
+        The calls are split in chunks, and each chunk is aggregated in a single `aggregate3` eth_call.
+        The results of the calls which specify their output types are abi-decoded, like by web3's `call`,
+        i.e., as a single value if the function has a single output and as a list otherwise,
+        with the tuples as lists and the bytes as hex strings. The others are returned as hex strings.
+
+        :param ledger_api: ledger API object.
+        :param contract_address: the address of the Multicall3 contract.
+        :param calls: the calls, as dicts with the "target", the "data" and optionally the "output_types",
+            e.g., as built by `build_call`.
+        :param allow_failure: whether a failing call should not revert the whole chunk.
+        :param max_calls_per_chunk: the maximum number of calls aggregated in a single eth_call.
+        :param max_calldata_size: the maximum size of the calls aggregated in a single eth_call, in bytes.
+        :param block_identifier: the block to perform the calls at.
+        :return: a JSON-like object with the success flag and the result of each call, in order.
+        """
+        contract_instance = cls.get_instance(ledger_api, contract_address)
+        results: List[JSONLike] = []
+        for chunk in chunk_calls(calls, max_calls_per_chunk, max_calldata_size):
+            call3s = [
+                (
+                    ledger_api.api.to_checksum_address(call["target"]),
+                    allow_failure,
+                    HexBytes(call["data"]),
+                )
+                for call in chunk
+            ]
+            chunk_results = contract_instance.functions.aggregate3(call3s).call(
+                block_identifier=block_identifier
+            )
+            for call, (success, return_data) in zip(chunk, chunk_results):
+                results.append(
+                    cls._decode_result(ledger_api, call, success, return_data)
+                )
+        return dict(data=results)
+
+    @staticmethod
+    def _decode_result(
+        ledger_api: LedgerApi, call: Call, success: bool, return_data: bytes
+    ) -> JSONLike:
+        """Decode the result of a call, using its output types if given."""
+        output_types = call.get("output_types")
+        if not success or output_types is None:
+            return dict(success=success, result=HexBytes(return_data).hex())
+        try:
+            decoded = ledger_api.api.codec.decode(output_types, return_data)
+        except Exception as e:  # pylint: disable=broad-except
+            _logger.warning(
+                f"Could not decode the result of a call to {call['target']}: {e}"
+            )
+            return dict(success=False, result=HexBytes(return_data).hex())
+        result = _to_json_like(decoded[0] if len(decoded) == 1 else decoded)
+        if not _is_carriable(result):
+            _logger.warning(
+                f"The contract api messages cannot carry the result of a call to {call['target']} "
+                f"decoded as {output_types}, so it is returned undecoded."
+            )
+            return dict(success=False, result=HexBytes(return_data).hex())
+        return dict(success=True, result=result)
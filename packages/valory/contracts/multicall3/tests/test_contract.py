@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for valory/multicall3 contract."""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from aea.contracts.base import Contract
+from aea.crypto.base import Crypto, LedgerApi
+from aea.helpers.serializers import DictProtobufStructSerializer
+from aea.test_tools.test_contract import BaseContractTestCase
+from aea_ledger_ethereum import EthereumCrypto
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from packages.valory.contracts.multicall3.contract import (
+    MULTICALL3_ADDRESS,
+    Multicall3Contract,
+    build_call,
+    chunk_calls,
+)
+
+
+PACKAGE_DIR = Path(__file__).parent.parent
+ERC20_PATH = PACKAGE_DIR.parent / "erc20" / "build" / "ERC20.json"
+TOKEN_ADDRESS = "0x7BA9CD2a7D11a4b1d5Bd4D2d4dA1F14C3f5B3F7B"
+REVERTING_ADDRESS = "0x4a3b5C7A8b0E2B6c1D4F5E7A9b0C2d4e6f8a0B1C"
+SAFE_ADDRESS = "0x5aFE3855358E112B5647B952709E6165e1c1eEEe"
+HASH_ADDRESS = "0x1234567890123456789012345678901234567890"
+CHAIN_ID = 1
+
+Handler = Callable[[bytes], Tuple[bool, bytes]]
+
+
+class LocalMulticallProvider(BaseProvider):
+    """A local stand-in for a node with Multicall3 deployed, executing the calls against in-memory targets."""
+
+    def __init__(self, targets: Dict[str, Handler]) -> None:
+        """Initialize the provider."""
+        super().__init__()
+        self.targets = {Web3.to_checksum_address(a): h for a, h in targets.items()}
+        self.eth_calls = 0
+        self._multicall = Web3().eth.contract(
+            abi=json.loads((PACKAGE_DIR / "build" / "Multicall3.json").read_text())[
+                "abi"
+            ]
+        )
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Make a request."""
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 0, "result": hex(CHAIN_ID)}
+        assert method == "eth_call", method
+        assert Web3.to_checksum_address(params[0]["to"]) == MULTICALL3_ADDRESS
+        self.eth_calls += 1
+        _, inputs = self._multicall.decode_function_input(params[0]["data"])
+        results = []
+        for call in inputs["calls"]:
+            success, return_data = self.targets[call["target"]](call["callData"])
+            assert success or call["allowFailure"]
+            results.append((success, return_data))
+        encoded = Web3().codec.encode(["(bool,bytes)[]"], [results])
+        return {"jsonrpc": "2.0", "id": 0, "result": HexBytes(encoded).hex()}
+
+
+def erc20_handler(balances: Dict[str, int]) -> Handler:
+    """Get a handler of the `balanceOf` calls of an ERC20 token."""
+    token = Web3().eth.contract(abi=json.loads(ERC20_PATH.read_text())["abi"])
+
+    def handle(call_data: bytes) -> Tuple[bool, bytes]:
+        fn, inputs = token.decode_function_input(call_data)
+        assert fn.fn_name == "balanceOf"
+        (account,) = inputs.values()
+        balance = balances.get(account, 0)
+        return True, Web3().codec.encode(["uint256"], [balance])
+
+    return handle
+
+
+def reverting_handler(_: bytes) -> Tuple[bool, bytes]:
+    """Handle a call which reverts."""
+    return False, b""
+
+
+def safe_handler(owners: List[str]) -> Handler:
+    """Get a handler of the calls to a Safe, which return its owners and a flag, whatever the calldata."""
+
+    def handle(_: bytes) -> Tuple[bool, bytes]:
+        return True, Web3().codec.encode(["address[]", "bool"], [owners, True])
+
+    return handle
+
+
+def hash_handler(_: bytes) -> Tuple[bool, bytes]:
+    """Handle a call which returns a hash."""
+    return True, Web3().codec.encode(["bytes32"], [b"\x01" * 32])
+
+
+class TestMulticall3Contract(BaseContractTestCase):
+    """Test the Multicall3 contract against a local stand-in."""
+
+    path_to_contract = PACKAGE_DIR
+    ledger_identifier = EthereumCrypto.identifier
+    contract: Multicall3Contract
+    accounts: List[str] = [
+        Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 251)
+    ]
+
+    @classmethod
+    def finish_contract_deployment(cls) -> str:
+        """Finish the contract deployment."""
+        return MULTICALL3_ADDRESS
+
+    @classmethod
+    def _deploy_contract(
+        cls,
+        contract: Contract,
+        ledger_api: LedgerApi,
+        deployer_crypto: Crypto,
+        gas: int,
+    ) -> Dict:
+        """Deploy contract."""
+        return {}
+
+    def setup_method(self) -> None:
+        """Set up the test."""
+        self.setup()
+        self.balances = {account: i for i, account in enumerate(self.accounts)}
+        self.provider = LocalMulticallProvider(
+            {
+                TOKEN_ADDRESS: erc20_handler(self.balances),
+                REVERTING_ADDRESS: reverting_handler,
+                SAFE_ADDRESS: safe_handler(self.accounts[:3]),
+                HASH_ADDRESS: hash_handler,
+            }
+        )
+        self.ledger_api.api.provider = self.provider
+        token_interface = json.loads(ERC20_PATH.read_text())
+        self.token = self.ledger_api.api.eth.contract(
+            address=TOKEN_ADDRESS, abi=token_interface["abi"]
+        )
+
+    def test_non_implemented_methods(self) -> None:
+        """Test not implemented methods."""
+        with pytest.raises(NotImplementedError):
+            self.contract.get_raw_transaction(self.ledger_api, "")
+
+        with pytest.raises(NotImplementedError):
+            self.contract.get_raw_message(self.ledger_api, "")
+
+        with pytest.raises(NotImplementedError):
+            self.contract.get_state(self.ledger_api, "")
+
+        with pytest.raises(NotImplementedError):
+            self.contract.get_deploy_transaction(self.ledger_api, "")
+
+    def test_build_call(self) -> None:
+        """Test building a call from the abi of the target."""
+        call = build_call(self.token, "balanceOf", self.accounts[0])
+        assert call["target"] == TOKEN_ADDRESS
+        selector = Web3.keccak(text="balanceOf(address)")[:4]
+        assert HexBytes(call["data"])[:4] == selector
+        assert call["output_types"] == ["uint256"]
+
+    def test_aggregate(self) -> None:
+        """Test that many reads are aggregated in a few eth_calls and decoded."""
+        calls = [build_call(self.token, "balanceOf", a) for a in self.accounts]
+        result = self.contract.aggregate(
+            self.ledger_api, MULTICALL3_ADDRESS, calls, max_calls_per_chunk=100
+        )
+        assert self.provider.eth_calls == 3
+        assert result["data"] == [
+            dict(success=True, result=self.balances[a]) for a in self.accounts
+        ]
+
+    def test_aggregate_failures(self) -> None:
+        """Test that failing and undecoded calls are returned as raw data."""
+        call_data = build_call(self.token, "balanceOf", self.accounts[1])["data"]
+        calls = [
+            dict(target=REVERTING_ADDRESS, data=call_data, output_types=["uint256"]),
+            dict(target=TOKEN_ADDRESS, data=call_data),
+            dict(
+                target=TOKEN_ADDRESS,
+                data=call_data,
+                output_types=["uint256", "uint256"],
+            ),
+        ]
+        result = self.contract.aggregate(self.ledger_api, MULTICALL3_ADDRESS, calls)
+        assert self.provider.eth_calls == 1
+        assert result["data"] == [
+            dict(success=False, result="0x"),
+            dict(success=True, result=HexBytes(int(1).to_bytes(32, "big")).hex()),
+            dict(success=False, result=HexBytes(int(1).to_bytes(32, "big")).hex()),
+        ]
+
+    def test_aggregate_through_the_contract_api(self) -> None:
+        """
+        Test that the request and the response of an aggregation can be carried by the contract api messages.
+
+        The kwargs and the state of the contract api messages are serialized with `DictProtobufStructSerializer`.
+        """
+        calls = [
+            build_call(self.token, "balanceOf", self.accounts[1]),
+            dict(target=SAFE_ADDRESS, data="0x", output_types=["address[]"]),
+            dict(target=HASH_ADDRESS, data="0x", output_types=["bytes32"]),
+            dict(target=SAFE_ADDRESS, data="0x", output_types=["address[]", "bool"]),
+            dict(target=SAFE_ADDRESS, data="0x", output_types=None),
+        ]
+        kwargs = dict(calls=calls, allow_failure=True)
+        received_kwargs = DictProtobufStructSerializer.decode(
+            DictProtobufStructSerializer.encode(kwargs)
+        )
+        assert received_kwargs == kwargs
+
+        result = self.contract.aggregate(
+            self.ledger_api, MULTICALL3_ADDRESS, **received_kwargs
+        )
+        safe_data = HexBytes(self.provider.targets[SAFE_ADDRESS](b"")[1]).hex()
+        assert result["data"] == [
+            dict(success=True, result=1),
+            dict(success=True, result=self.accounts[:3]),
+            dict(success=True, result=HexBytes(b"\x01" * 32).hex()),
+            dict(success=False, result=safe_data),
+            dict(success=True, result=safe_data),
+        ]
+        received_result = DictProtobufStructSerializer.decode(
+            DictProtobufStructSerializer.encode(result)
+        )
+        assert received_result == result
+
+
+@pytest.mark.parametrize(
+    "sizes, max_calls, max_size, expected",
+    [
+        ([], 10, 1000, []),
+        ([4] * 5, 2, 10_000, [2, 2, 1]),
+        ([4] * 5, 10, 2 * (160 + 32), [2, 2, 1]),
+        ([4, 1000, 4], 10, 500, [1, 1, 1]),
+    ],
+)
+def test_chunk_calls(
+    sizes: List[int], max_calls: int, max_size: int, expected: List[int]
+) -> None:
+    """Test splitting the calls in chunks."""
+    calls = [dict(target=TOKEN_ADDRESS, data=b"\x00" * size) for size in sizes]
+    chunks = list(chunk_calls(calls, max_calls, max_size))
+    assert [len(chunk) for chunk in chunks] == expected
+    assert [call for chunk in chunks for call in chunk] == calls
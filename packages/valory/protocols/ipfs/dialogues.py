@@ -38,22 +38,35 @@ class IpfsDialogue(Dialogue):
     """The ipfs dialogue class maintains state of a dialogue and manages it."""
 
     INITIAL_PERFORMATIVES: FrozenSet[Message.Performative] = frozenset(
-        {IpfsMessage.Performative.GET_FILES, IpfsMessage.Performative.STORE_FILES}
+        {
+            IpfsMessage.Performative.GET_FILES,
+            IpfsMessage.Performative.STORE_FILES,
+            IpfsMessage.Performative.GET_BINARY_FILES,
+            IpfsMessage.Performative.STORE_BINARY_FILES,
+        }
     )
     TERMINAL_PERFORMATIVES: FrozenSet[Message.Performative] = frozenset(
         {
             IpfsMessage.Performative.IPFS_HASH,
             IpfsMessage.Performative.FILES,
+            IpfsMessage.Performative.BINARY_FILES,
             IpfsMessage.Performative.ERROR,
         }
     )
     VALID_REPLIES: Dict[Message.Performative, FrozenSet[Message.Performative]] = {
+        IpfsMessage.Performative.BINARY_FILES: frozenset(),
         IpfsMessage.Performative.ERROR: frozenset(),
         IpfsMessage.Performative.FILES: frozenset(),
+        IpfsMessage.Performative.GET_BINARY_FILES: frozenset(
+            {IpfsMessage.Performative.BINARY_FILES, IpfsMessage.Performative.ERROR}
+        ),
         IpfsMessage.Performative.GET_FILES: frozenset(
             {IpfsMessage.Performative.FILES, IpfsMessage.Performative.ERROR}
         ),
         IpfsMessage.Performative.IPFS_HASH: frozenset(),
+        IpfsMessage.Performative.STORE_BINARY_FILES: frozenset(
+            {IpfsMessage.Performative.IPFS_HASH, IpfsMessage.Performative.ERROR}
+        ),
         IpfsMessage.Performative.STORE_FILES: frozenset(
             {IpfsMessage.Performative.IPFS_HASH, IpfsMessage.Performative.ERROR}
         ),
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\nipfs.proto\x12\x16\x61\x65\x61.valory.ipfs.v0_1_0"\xb2\x07\n\x0bIpfsMessage\x12G\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x36.aea.valory.ipfs.v0_1_0.IpfsMessage.Error_PerformativeH\x00\x12G\n\x05\x66iles\x18\x06 \x01(\x0b\x32\x36.aea.valory.ipfs.v0_1_0.IpfsMessage.Files_PerformativeH\x00\x12O\n\tget_files\x18\x07 \x01(\x0b\x32:.aea.valory.ipfs.v0_1_0.IpfsMessage.Get_Files_PerformativeH\x00\x12O\n\tipfs_hash\x18\x08 \x01(\x0b\x32:.aea.valory.ipfs.v0_1_0.IpfsMessage.Ipfs_Hash_PerformativeH\x00\x12S\n\x0bstore_files\x18\t \x01(\x0b\x32<.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Files_PerformativeH\x00\x1a\xc9\x01\n\x18Store_Files_Performative\x12V\n\x05\x66iles\x18\x01 \x03(\x0b\x32G.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Files_Performative.FilesEntry\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a,\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a+\n\x16Ipfs_Hash_Performative\x12\x11\n\tipfs_hash\x18\x01 \x01(\t\x1aT\n\x16Get_Files_Performative\x12\x11\n\tipfs_hash\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a\x94\x01\n\x12\x46iles_Performative\x12P\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x41.aea.valory.ipfs.v0_1_0.IpfsMessage.Files_Performative.FilesEntry\x1a,\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a$\n\x12\x45rror_Performative\x12\x0e\n\x06reason\x18\x01 \x01(\tB\x0e\n\x0cperformativeb\x06proto3'
+    b'\n\nipfs.proto\x12\x16\x61\x65\x61.valory.ipfs.v0_1_0"\xcd\r\n\x0bIpfsMessage\x12G\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x36.aea.valory.ipfs.v0_1_0.IpfsMessage.Error_PerformativeH\x00\x12G\n\x05\x66iles\x18\x06 \x01(\x0b\x32\x36.aea.valory.ipfs.v0_1_0.IpfsMessage.Files_PerformativeH\x00\x12O\n\tget_files\x18\x07 \x01(\x0b\x32:.aea.valory.ipfs.v0_1_0.IpfsMessage.Get_Files_PerformativeH\x00\x12O\n\tipfs_hash\x18\x08 \x01(\x0b\x32:.aea.valory.ipfs.v0_1_0.IpfsMessage.Ipfs_Hash_PerformativeH\x00\x12S\n\x0bstore_files\x18\t \x01(\x0b\x32<.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Files_PerformativeH\x00\x12U\n\x0c\x62inary_files\x18\n \x01(\x0b\x32=.aea.valory.ipfs.v0_1_0.IpfsMessage.Binary_Files_PerformativeH\x00\x12]\n\x10get_binary_files\x18\x0b \x01(\x0b\x32\x41.aea.valory.ipfs.v0_1_0.IpfsMessage.Get_Binary_Files_PerformativeH\x00\x12\x61\n\x12store_binary_files\x18\x0c \x01(\x0b\x32\x43.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Binary_Files_PerformativeH\x00\x1a\xc9\x01\n\x18Store_Files_Performative\x12V\n\x05\x66iles\x18\x01 \x03(\x0b\x32G.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Files_Performative.FilesEntry\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a,\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\xea\x01\n\x1fStore_Binary_Files_Performative\x12j\n\x0c\x62inary_files\x18\x01 \x03(\x0b\x32T.aea.valory.ipfs.v0_1_0.IpfsMessage.Store_Binary_Files_Performative.BinaryFilesEntry\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a\x32\n\x10\x42inaryFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a+\n\x16Ipfs_Hash_Performative\x12\x11\n\tipfs_hash\x18\x01 \x01(\t\x1aT\n\x16Get_Files_Performative\x12\x11\n\tipfs_hash\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a[\n\x1dGet_Binary_Files_Performative\x12\x11\n\tipfs_hash\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x03 \x01(\x08\x1a\x94\x01\n\x12\x46iles_Performative\x12P\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x41.aea.valory.ipfs.v0_1_0.IpfsMessage.Files_Performative.FilesEntry\x1a,\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\xb5\x01\n\x19\x42inary_Files_Performative\x12\x64\n\x0c\x62inary_files\x18\x01 \x03(\x0b\x32N.aea.valory.ipfs.v0_1_0.IpfsMessage.Binary_Files_Performative.BinaryFilesEntry\x1a\x32\n\x10\x42inaryFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a$\n\x12\x45rror_Performative\x12\x0e\n\x06reason\x18\x01 \x01(\tB\x0e\n\x0cperformativeb\x06proto3'
 )
 
 _globals = globals()
@@ -24,22 +24,48 @@ if _descriptor._USE_C_DESCRIPTORS == False:
     DESCRIPTOR._options = None
     _IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY._options = None
     _IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY._serialized_options = b"8\001"
+    _IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY._options = None
+    _IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY._serialized_options = (
+        b"8\001"
+    )
     _IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY._options = None
     _IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY._serialized_options = b"8\001"
+    _IPFSMESSAGE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY._options = None
+    _IPFSMESSAGE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY._serialized_options = (
+        b"8\001"
+    )
     _globals["_IPFSMESSAGE"]._serialized_start = 39
-    _globals["_IPFSMESSAGE"]._serialized_end = 985
-    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE"]._serialized_start = 448
-    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE"]._serialized_end = 649
-    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_start = 605
-    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_end = 649
-    _globals["_IPFSMESSAGE_IPFS_HASH_PERFORMATIVE"]._serialized_start = 651
-    _globals["_IPFSMESSAGE_IPFS_HASH_PERFORMATIVE"]._serialized_end = 694
-    _globals["_IPFSMESSAGE_GET_FILES_PERFORMATIVE"]._serialized_start = 696
-    _globals["_IPFSMESSAGE_GET_FILES_PERFORMATIVE"]._serialized_end = 780
-    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE"]._serialized_start = 783
-    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE"]._serialized_end = 931
-    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_start = 605
-    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_end = 649
-    _globals["_IPFSMESSAGE_ERROR_PERFORMATIVE"]._serialized_start = 933
-    _globals["_IPFSMESSAGE_ERROR_PERFORMATIVE"]._serialized_end = 969
+    _globals["_IPFSMESSAGE"]._serialized_end = 1780
+    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE"]._serialized_start = 729
+    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE"]._serialized_end = 930
+    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_start = 886
+    _globals["_IPFSMESSAGE_STORE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_end = 930
+    _globals["_IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE"]._serialized_start = 933
+    _globals["_IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE"]._serialized_end = 1167
+    _globals[
+        "_IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY"
+    ]._serialized_start = 1117
+    _globals[
+        "_IPFSMESSAGE_STORE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY"
+    ]._serialized_end = 1167
+    _globals["_IPFSMESSAGE_IPFS_HASH_PERFORMATIVE"]._serialized_start = 1169
+    _globals["_IPFSMESSAGE_IPFS_HASH_PERFORMATIVE"]._serialized_end = 1212
+    _globals["_IPFSMESSAGE_GET_FILES_PERFORMATIVE"]._serialized_start = 1214
+    _globals["_IPFSMESSAGE_GET_FILES_PERFORMATIVE"]._serialized_end = 1298
+    _globals["_IPFSMESSAGE_GET_BINARY_FILES_PERFORMATIVE"]._serialized_start = 1300
+    _globals["_IPFSMESSAGE_GET_BINARY_FILES_PERFORMATIVE"]._serialized_end = 1391
+    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE"]._serialized_start = 1394
+    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE"]._serialized_end = 1542
+    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_start = 886
+    _globals["_IPFSMESSAGE_FILES_PERFORMATIVE_FILESENTRY"]._serialized_end = 930
+    _globals["_IPFSMESSAGE_BINARY_FILES_PERFORMATIVE"]._serialized_start = 1545
+    _globals["_IPFSMESSAGE_BINARY_FILES_PERFORMATIVE"]._serialized_end = 1726
+    _globals[
+        "_IPFSMESSAGE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY"
+    ]._serialized_start = 1117
+    _globals[
+        "_IPFSMESSAGE_BINARY_FILES_PERFORMATIVE_BINARYFILESENTRY"
+    ]._serialized_end = 1167
+    _globals["_IPFSMESSAGE_ERROR_PERFORMATIVE"]._serialized_start = 1728
+    _globals["_IPFSMESSAGE_ERROR_PERFORMATIVE"]._serialized_end = 1764
 # @@protoc_insertion_point(module_scope)
@@ -42,21 +42,34 @@ class IpfsMessage(Message):
     class Performative(Message.Performative):
         """Performatives for the ipfs protocol."""
 
+        BINARY_FILES = "binary_files"
         ERROR = "error"
         FILES = "files"
+        GET_BINARY_FILES = "get_binary_files"
         GET_FILES = "get_files"
         IPFS_HASH = "ipfs_hash"
+        STORE_BINARY_FILES = "store_binary_files"
         STORE_FILES = "store_files"
 
         def __str__(self) -> str:
             """Get the string representation."""
             return str(self.value)
 
-    _performatives = {"error", "files", "get_files", "ipfs_hash", "store_files"}
+    _performatives = {
+        "binary_files",
+        "error",
+        "files",
+        "get_binary_files",
+        "get_files",
+        "ipfs_hash",
+        "store_binary_files",
+        "store_files",
+    }
     __slots__: Tuple[str, ...] = tuple()
 
     class _SlotsCls:
         __slots__ = (
+            "binary_files",
             "dialogue_reference",
             "files",
             "ipfs_hash",
@@ -121,6 +134,12 @@ class IpfsMessage(Message):
         enforce(self.is_set("target"), "target is not set.")
         return cast(int, self.get("target"))
 
+    @property
+    def binary_files(self) -> Dict[str, bytes]:
+        """Get the 'binary_files' content from the message."""
+        enforce(self.is_set("binary_files"), "'binary_files' content is not set.")
+        return cast(Dict[str, bytes], self.get("binary_files"))
+
     @property
     def files(self) -> Dict[str, str]:
         """Get the 'files' content from the message."""
@@ -220,6 +239,39 @@ class IpfsMessage(Message):
                             type(timeout)
                         ),
                     )
+            elif self.performative == IpfsMessage.Performative.STORE_BINARY_FILES:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.binary_files, dict),
+                    "Invalid type for content 'binary_files'. Expected 'dict'. Found '{}'.".format(
+                        type(self.binary_files)
+                    ),
+                )
+                for (
+                    key_of_binary_files,
+                    value_of_binary_files,
+                ) in self.binary_files.items():
+                    enforce(
+                        isinstance(key_of_binary_files, str),
+                        "Invalid type for dictionary keys in content 'binary_files'. Expected 'str'. Found '{}'.".format(
+                            type(key_of_binary_files)
+                        ),
+                    )
+                    enforce(
+                        isinstance(value_of_binary_files, bytes),
+                        "Invalid type for dictionary values in content 'binary_files'. Expected 'bytes'. Found '{}'.".format(
+                            type(value_of_binary_files)
+                        ),
+                    )
+                if self.is_set("timeout"):
+                    expected_nb_of_contents += 1
+                    timeout = cast(float, self.timeout)
+                    enforce(
+                        isinstance(timeout, float),
+                        "Invalid type for content 'timeout'. Expected 'float'. Found '{}'.".format(
+                            type(timeout)
+                        ),
+                    )
             elif self.performative == IpfsMessage.Performative.IPFS_HASH:
                 expected_nb_of_contents = 1
                 enforce(
@@ -245,6 +297,23 @@ class IpfsMessage(Message):
                             type(timeout)
                         ),
                     )
+            elif self.performative == IpfsMessage.Performative.GET_BINARY_FILES:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.ipfs_hash, str),
+                    "Invalid type for content 'ipfs_hash'. Expected 'str'. Found '{}'.".format(
+                        type(self.ipfs_hash)
+                    ),
+                )
+                if self.is_set("timeout"):
+                    expected_nb_of_contents += 1
+                    timeout = cast(float, self.timeout)
+                    enforce(
+                        isinstance(timeout, float),
+                        "Invalid type for content 'timeout'. Expected 'float'. Found '{}'.".format(
+                            type(timeout)
+                        ),
+                    )
             elif self.performative == IpfsMessage.Performative.FILES:
                 expected_nb_of_contents = 1
                 enforce(
@@ -266,6 +335,30 @@ class IpfsMessage(Message):
                             type(value_of_files)
                         ),
                     )
+            elif self.performative == IpfsMessage.Performative.BINARY_FILES:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.binary_files, dict),
+                    "Invalid type for content 'binary_files'. Expected 'dict'. Found '{}'.".format(
+                        type(self.binary_files)
+                    ),
+                )
+                for (
+                    key_of_binary_files,
+                    value_of_binary_files,
+                ) in self.binary_files.items():
+                    enforce(
+                        isinstance(key_of_binary_files, str),
+                        "Invalid type for dictionary keys in content 'binary_files'. Expected 'str'. Found '{}'.".format(
+                            type(key_of_binary_files)
+                        ),
+                    )
+                    enforce(
+                        isinstance(value_of_binary_files, bytes),
+                        "Invalid type for dictionary values in content 'binary_files'. Expected 'bytes'. Found '{}'.".format(
+                            type(value_of_binary_files)
+                        ),
+                    )
             elif self.performative == IpfsMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
                 enforce(
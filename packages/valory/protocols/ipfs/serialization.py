@@ -63,6 +63,15 @@ class IpfsSerializer(Serializer):
                 timeout = msg.timeout
                 performative.timeout = timeout
             ipfs_msg.store_files.CopyFrom(performative)
+        elif performative_id == IpfsMessage.Performative.STORE_BINARY_FILES:
+            performative = ipfs_pb2.IpfsMessage.Store_Binary_Files_Performative()  # type: ignore
+            binary_files = msg.binary_files
+            performative.binary_files.update(binary_files)
+            if msg.is_set("timeout"):
+                performative.timeout_is_set = True
+                timeout = msg.timeout
+                performative.timeout = timeout
+            ipfs_msg.store_binary_files.CopyFrom(performative)
         elif performative_id == IpfsMessage.Performative.IPFS_HASH:
             performative = ipfs_pb2.IpfsMessage.Ipfs_Hash_Performative()  # type: ignore
             ipfs_hash = msg.ipfs_hash
@@ -77,11 +86,25 @@ class IpfsSerializer(Serializer):
                 timeout = msg.timeout
                 performative.timeout = timeout
             ipfs_msg.get_files.CopyFrom(performative)
+        elif performative_id == IpfsMessage.Performative.GET_BINARY_FILES:
+            performative = ipfs_pb2.IpfsMessage.Get_Binary_Files_Performative()  # type: ignore
+            ipfs_hash = msg.ipfs_hash
+            performative.ipfs_hash = ipfs_hash
+            if msg.is_set("timeout"):
+                performative.timeout_is_set = True
+                timeout = msg.timeout
+                performative.timeout = timeout
+            ipfs_msg.get_binary_files.CopyFrom(performative)
         elif performative_id == IpfsMessage.Performative.FILES:
             performative = ipfs_pb2.IpfsMessage.Files_Performative()  # type: ignore
             files = msg.files
             performative.files.update(files)
             ipfs_msg.files.CopyFrom(performative)
+        elif performative_id == IpfsMessage.Performative.BINARY_FILES:
+            performative = ipfs_pb2.IpfsMessage.Binary_Files_Performative()  # type: ignore
+            binary_files = msg.binary_files
+            performative.binary_files.update(binary_files)
+            ipfs_msg.binary_files.CopyFrom(performative)
         elif performative_id == IpfsMessage.Performative.ERROR:
             performative = ipfs_pb2.IpfsMessage.Error_Performative()  # type: ignore
             reason = msg.reason
@@ -125,6 +148,13 @@ class IpfsSerializer(Serializer):
             if ipfs_pb.store_files.timeout_is_set:
                 timeout = ipfs_pb.store_files.timeout
                 performative_content["timeout"] = timeout
+        elif performative_id == IpfsMessage.Performative.STORE_BINARY_FILES:
+            binary_files = ipfs_pb.store_binary_files.binary_files
+            binary_files_dict = dict(binary_files)
+            performative_content["binary_files"] = binary_files_dict
+            if ipfs_pb.store_binary_files.timeout_is_set:
+                timeout = ipfs_pb.store_binary_files.timeout
+                performative_content["timeout"] = timeout
         elif performative_id == IpfsMessage.Performative.IPFS_HASH:
             ipfs_hash = ipfs_pb.ipfs_hash.ipfs_hash
             performative_content["ipfs_hash"] = ipfs_hash
@@ -134,10 +164,20 @@ class IpfsSerializer(Serializer):
             if ipfs_pb.get_files.timeout_is_set:
                 timeout = ipfs_pb.get_files.timeout
                 performative_content["timeout"] = timeout
+        elif performative_id == IpfsMessage.Performative.GET_BINARY_FILES:
+            ipfs_hash = ipfs_pb.get_binary_files.ipfs_hash
+            performative_content["ipfs_hash"] = ipfs_hash
+            if ipfs_pb.get_binary_files.timeout_is_set:
+                timeout = ipfs_pb.get_binary_files.timeout
+                performative_content["timeout"] = timeout
         elif performative_id == IpfsMessage.Performative.FILES:
             files = ipfs_pb.files.files
             files_dict = dict(files)
             performative_content["files"] = files_dict
+        elif performative_id == IpfsMessage.Performative.BINARY_FILES:
+            binary_files = ipfs_pb.binary_files.binary_files
+            binary_files_dict = dict(binary_files)
+            performative_content["binary_files"] = binary_files_dict
         elif performative_id == IpfsMessage.Performative.ERROR:
             reason = ipfs_pb.error.reason
             performative_content["reason"] = reason
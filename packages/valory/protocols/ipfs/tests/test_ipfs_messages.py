@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2023 valory
+#   Copyright 2024 valory
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -24,6 +24,7 @@ from typing import List
 
 from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
 
+from packages.valory.protocols.ipfs import ipfs_pb2
 from packages.valory.protocols.ipfs.message import IpfsMessage
 
 
@@ -40,6 +41,11 @@ class TestMessageIpfs(BaseProtocolMessagesTestCase):
                 files={"some str": "some str"},
                 timeout=1.0,
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.STORE_BINARY_FILES,
+                binary_files={"some str": b"some_bytes"},
+                timeout=1.0,
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.IPFS_HASH,
                 ipfs_hash="some str",
@@ -49,10 +55,19 @@ class TestMessageIpfs(BaseProtocolMessagesTestCase):
                 ipfs_hash="some str",
                 timeout=1.0,
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.GET_BINARY_FILES,
+                ipfs_hash="some str",
+                timeout=1.0,
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.FILES,
                 files={"some str": "some str"},
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.BINARY_FILES,
+                binary_files={"some str": b"some_bytes"},
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.ERROR,
                 reason="some str",
@@ -67,6 +82,11 @@ class TestMessageIpfs(BaseProtocolMessagesTestCase):
                 # skip content: files
                 timeout=1.0,
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.STORE_BINARY_FILES,
+                # skip content: binary_files
+                timeout=1.0,
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.IPFS_HASH,
                 # skip content: ipfs_hash
@@ -76,12 +96,36 @@ class TestMessageIpfs(BaseProtocolMessagesTestCase):
                 # skip content: ipfs_hash
                 timeout=1.0,
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.GET_BINARY_FILES,
+                # skip content: ipfs_hash
+                timeout=1.0,
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.FILES,
                 # skip content: files
             ),
+            IpfsMessage(
+                performative=IpfsMessage.Performative.BINARY_FILES,
+                # skip content: binary_files
+            ),
             IpfsMessage(
                 performative=IpfsMessage.Performative.ERROR,
                 # skip content: reason
             ),
         ]
+
+
+def test_performative_field_numbers() -> None:
+    """Test that the performatives keep their field numbers, so that the messages remain wire compatible."""
+    fields = ipfs_pb2.IpfsMessage.DESCRIPTOR.fields_by_name  # type: ignore[attr-defined]
+    assert {name: field.number for name, field in fields.items()} == {
+        "error": 5,
+        "files": 6,
+        "get_files": 7,
+        "ipfs_hash": 8,
+        "store_files": 9,
+        "binary_files": 10,
+        "get_binary_files": 11,
+        "store_binary_files": 12,
+    }
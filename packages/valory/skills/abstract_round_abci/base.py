@@ -662,6 +662,20 @@ class AbciAppDB:
         """Get the latest key-value pairs from the data dictionary for the current period."""
         return self.get_latest_from_reset_index(self.reset_index)
 
+    def frozen_data(self) -> Dict[int, Dict[str, Tuple[Any, ...]]]:
+        """
+        Get a copy of the data which is not affected by the later updates.
+
+        The values are not copied, since they are deep-copied when they are added to the db and when they are read,
+        so only the histories are frozen, which is much cheaper than a deep copy.
+
+        :return: the data, by period and key, with their histories as tuples.
+        """
+        return {
+            reset_index: {key: tuple(history) for key, history in data.items()}
+            for reset_index, data in self._data.items()
+        }
+
     def increment_round_count(self) -> None:
         """Increment the round count."""
         self._round_count += 1
@@ -3150,6 +3164,8 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         self._last_round_transition_root_hash = b""
         self._last_round_transition_tm_height: Optional[int] = None
         self._tm_height: Optional[int] = None
+        # the heights of the blocks in which the periods started, by period, to compute which blocks can be pruned
+        self._period_start_heights: Dict[int, int] = {}
         self._block_stall_deadline: Optional[datetime.datetime] = None
         self._terminating_round_called: bool = False
         # a mapping of the validators' addresses to their agent addresses
@@ -3613,6 +3629,27 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
                 RoundSequence._BlockConstructionState.WAITING_FOR_BEGIN_BLOCK
             )
         self._blockchain = Blockchain(is_init=is_init)
+        # the blocks of the previous chain are gone
+        self._period_start_heights = {}
+
+    def retain_height(self, retain_periods: int) -> int:
+        """
+        Get the height of the oldest block which Tendermint needs to retain.
+
+        The blocks are retained from the block in which the oldest of the `retain_periods` most recent periods started,
+        so that the nodes which lag behind by less than that can still catch up by syncing the blocks.
+
+        :param retain_periods: the number of the most recent periods whose blocks are retained.
+        :return: the retain height, or 0 to retain all the blocks,
+            if the pruning is disabled or not enough periods have started yet.
+        """
+        if retain_periods <= 0 or len(self._period_start_heights) < retain_periods:
+            return 0
+        periods = sorted(self._period_start_heights)
+        for period in periods[:-retain_periods]:
+            # the blocks of the older periods will not be needed again
+            del self._period_start_heights[period]
+        return self._period_start_heights[periods[-retain_periods]]
 
     def _get_round_result(
         self,
@@ -3671,6 +3708,9 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             f"updating round, current_round {self.current_round.round_id}, event: {event}, round result {round_result}"
         )
         self.abci_app.process_event(event, result=round_result)
+        self._period_start_heights.setdefault(
+            self.latest_synchronized_data.period_count, self.height
+        )
 
     def _reset_to_default_params(self) -> None:
         """Resets the instance params to their default value."""
@@ -3679,6 +3719,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         self._last_round_transition_root_hash = b""
         self._last_round_transition_tm_height = None
         self._tm_height = None
+        self._period_start_heights = {}
         self._slashing_enabled = False
         self.pending_offences = set()
 
@@ -3720,6 +3761,52 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             )
         self.abci_app.schedule_round(restart_from_round_cls)
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Get the state to be included in a state-sync snapshot.
+
+        This is meant to be called right after the commit of a block in which a round transition took place,
+        so that the state can be restored by scheduling the current round afresh.
+
+        :return: the state.
+        """
+        timestamp = self._last_round_transition_timestamp
+        return {
+            "height": self.height,
+            "round_count": self.abci_app.synchronized_data.db.round_count,
+            "current_round_id": self.current_round_id,
+            "db": self.abci_app.synchronized_data.db.serialize(),
+            "last_round_transition_timestamp": (
+                timestamp.isoformat() if timestamp is not None else None
+            ),
+            "last_round_transition_tm_height": self._last_round_transition_tm_height,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the state from a state-sync snapshot, as returned by `snapshot_state`.
+
+        The blockchain is reset so that the block following the snapshot's height is the next one expected.
+
+        :param state: the state.
+        """
+        self.reset_state(
+            state["current_round_id"], state["round_count"] - 1, state["db"]
+        )
+        height = state["height"]
+        timestamp = state["last_round_transition_timestamp"]
+        self._blockchain = Blockchain(height_offset=height)
+        self._block_construction_phase = (
+            RoundSequence._BlockConstructionState.WAITING_FOR_BEGIN_BLOCK
+        )
+        self._last_round_transition_height = height
+        self._last_round_transition_tm_height = state["last_round_transition_tm_height"]
+        self._tm_height = self._last_round_transition_tm_height
+        if timestamp is not None:
+            self._last_round_transition_timestamp = datetime.datetime.fromisoformat(
+                timestamp
+            )
+
 
 @dataclass(frozen=True)
 class PendingOffencesPayload(BaseTxPayload):
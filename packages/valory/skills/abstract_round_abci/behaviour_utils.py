@@ -91,9 +91,16 @@ from packages.valory.skills.abstract_round_abci.dialogues import (
     SigningDialogues,
     TendermintDialogues,
 )
+from packages.valory.skills.abstract_round_abci.io_.delta import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    apply_delta,
+    build_snapshot,
+    is_checkpoint,
+)
 from packages.valory.skills.abstract_round_abci.io_.ipfs import (
     IPFSInteract,
     IPFSInteractionError,
+    get_ipfs_hash,
 )
 from packages.valory.skills.abstract_round_abci.io_.load import CustomLoaderType, Loader
 from packages.valory.skills.abstract_round_abci.io_.store import (
@@ -118,6 +125,7 @@ GENESIS_TIME_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
 INITIAL_APP_HASH = ""
 INITIAL_HEIGHT = "0"
 TM_REQ_TIMEOUT = 5  # 5 seconds
+IPFS_UPLOAD_WAIT_TIMEOUT = 60  # 60 seconds
 FLASHBOTS_LEDGER_ID = "ethereum_flashbots"
 SOLANA_LEDGER_ID = "solana"
 
@@ -415,7 +423,10 @@ class IPFSBehaviour(SimpleBehaviour, ABC):
         **kwargs: Any,
     ) -> Tuple[IpfsMessage, IpfsDialogue]:
         """
-        Builds a STORE_FILES ipfs message.
+        Builds a STORE_BINARY_FILES ipfs message.
+
+        The objects are serialized to bytes, which are passed by reference to the connection,
+        without being encoded as text.
 
         :param filename: the file name to store obj in. If "multiple" is True, filename will be the name of the dir.
         :param obj: the object(s) to serialize and store in IPFS as "filename".
@@ -424,12 +435,12 @@ class IPFSBehaviour(SimpleBehaviour, ABC):
         :param timeout: timeout for the request.
         :returns: the ipfs message, and its corresponding dialogue.
         """
-        serialized_objects = self._ipfs_interact.store(
+        serialized_objects = self._ipfs_interact.store_bytes(
             filename, obj, multiple, filetype, custom_storer, **kwargs
         )
         message, dialogue = self._build_ipfs_message(
-            performative=IpfsMessage.Performative.STORE_FILES,  # type: ignore
-            files=serialized_objects,
+            performative=IpfsMessage.Performative.STORE_BINARY_FILES,  # type: ignore
+            binary_files=serialized_objects,
             timeout=timeout,
         )
         return message, dialogue
@@ -440,14 +451,14 @@ class IPFSBehaviour(SimpleBehaviour, ABC):
         timeout: Optional[float] = None,
     ) -> Tuple[IpfsMessage, IpfsDialogue]:
         """
-        Builds a GET_FILES IPFS request.
+        Builds a GET_BINARY_FILES IPFS request.
 
         :param ipfs_hash: the ipfs hash of the file/dir to download.
         :param timeout: timeout for the request.
         :returns: the ipfs message, and its corresponding dialogue.
         """
         message, dialogue = self._build_ipfs_message(
-            performative=IpfsMessage.Performative.GET_FILES,  # type: ignore
+            performative=IpfsMessage.Performative.GET_BINARY_FILES,  # type: ignore
             ipfs_hash=ipfs_hash,
             timeout=timeout,
         )
@@ -455,12 +466,12 @@ class IPFSBehaviour(SimpleBehaviour, ABC):
 
     def _deserialize_ipfs_objects(  # pylint: disable=too-many-arguments
         self,
-        serialized_objects: Dict[str, str],
+        serialized_objects: Dict[str, bytes],
         filetype: Optional[SupportedFiletype] = None,
         custom_loader: CustomLoaderType = None,
     ) -> Optional[SupportedObjectType]:
         """Deserialize objects received from IPFS."""
-        deserialized_object = self._ipfs_interact.load(
+        deserialized_object = self._ipfs_interact.load_bytes(
             serialized_objects, filetype, custom_loader
         )
         return deserialized_object
@@ -575,6 +586,9 @@ class BaseBehaviour(
         self._check_started: Optional[datetime.datetime] = None
         self._timeout: float = 0
         self._is_healthy: bool = False
+        # the duration of the latest hard reset request, and when it completed, until the node is ready
+        self._reset_duration: float = 0.0
+        self._reset_completed_at: Optional[datetime.datetime] = None
         self._non_200_return_code_count: int = 0
         self.gentle_reset_attempted: bool = False
 
@@ -1840,9 +1854,10 @@ class BaseBehaviour(
     @property
     def hard_reset_sleep(self) -> float:
         """
-        Amount of time to sleep before and after performing a hard reset.
+        Amount of time to sleep before performing a hard reset.
 
-        We sleep for half the reset pause duration as there are no immediate transactions on either side of the reset.
+        We sleep for half the reset pause duration as there are no immediate transactions before the reset.
+        After the reset, the node is polled until it is ready instead.
 
         :returns: the amount of time to sleep in seconds
         """
@@ -1942,6 +1957,7 @@ class BaseBehaviour(
                 self.params.tendermint_com_url + "/hard_reset",
                 parameters=reset_params,
             )
+            reset_started = datetime.datetime.now()
             result = yield from self._do_request(request_message, http_dialogue)
             try:
                 response = json.loads(result.body.decode())
@@ -1976,6 +1992,10 @@ class BaseBehaviour(
                         self.params.cleanup_history_depth_current,
                     )
                     self._end_reset()
+                    self._reset_completed_at = datetime.datetime.now()
+                    self._reset_duration = (
+                        self._reset_completed_at - reset_started
+                    ).total_seconds()
 
                 else:
                     msg = response.get("message")
@@ -1998,7 +2018,7 @@ class BaseBehaviour(
             self.context.logger.error(
                 "Tendermint not accepting transactions yet, trying again!"
             )
-            yield from self.sleep(self.params.sleep_time)
+            yield from self.sleep(self.params.tendermint_ready_poll_interval)
             return False
 
         remote_height = int(json_body["result"]["sync_info"]["latest_block_height"])
@@ -2007,16 +2027,21 @@ class BaseBehaviour(
             self.context.logger.warning(
                 f"local height ({local_height}) != remote height ({remote_height}); retrying..."
             )
-            yield from self.sleep(self.params.sleep_time)
+            yield from self.sleep(self.params.tendermint_ready_poll_interval)
             return False
 
         self.context.logger.info(
             f"local height == remote height == {local_height}; continuing execution..."
         )
-        if not on_startup:
-            # if we are on startup we don't need to wait for the reset pause duration
-            # as the reset is being performed to update the tm config.
-            yield from self.wait_from_last_timestamp(self.hard_reset_sleep)
+        if self._reset_completed_at is not None:
+            ready_duration = (
+                datetime.datetime.now() - self._reset_completed_at
+            ).total_seconds()
+            self.context.logger.info(
+                f"Tendermint reset durations (s): reset={self._reset_duration:.3f}, "
+                f"ready={ready_duration:.3f}, total={self._reset_duration + ready_duration:.3f}"
+            )
+            self._reset_completed_at = None
         self._is_healthy = False
         return True
 
@@ -2028,6 +2053,7 @@ class BaseBehaviour(
         filetype: Optional[SupportedFiletype] = None,
         custom_storer: Optional[CustomStorerType] = None,
         timeout: Optional[float] = None,
+        wait_for_upload: bool = True,
         **kwargs: Any,
     ) -> Generator[None, None, Optional[str]]:
         """
@@ -2039,6 +2065,10 @@ class BaseBehaviour(
         :param filetype: the file type of the object being downloaded.
         :param custom_storer: a custom serializer for "obj".
         :param timeout: timeout for the request.
+        :param wait_for_upload: whether to wait for the upload to complete. If False, the hash is computed locally
+            and returned immediately, while the upload proceeds in the background. `get_from_ipfs` waits for
+            the upload to be confirmed before reading the hash, and `wait_for_ipfs_upload` can be used to make sure
+            that the upload succeeded, e.g., before sending the hash to the other agents.
         :returns: the downloaded object, corresponding to ipfs_hash.
         """
         try:
@@ -2051,6 +2081,8 @@ class BaseBehaviour(
                 timeout,
                 **kwargs,
             )
+            if not wait_for_upload:
+                return self._send_to_ipfs_in_background(dialogue, message)
             ipfs_message = yield from self._do_ipfs_request(dialogue, message, timeout)
             if ipfs_message.performative != IpfsMessage.Performative.IPFS_HASH:
                 self.context.logger.error(
@@ -2058,6 +2090,7 @@ class BaseBehaviour(
                 )
                 return None
             ipfs_hash = ipfs_message.ipfs_hash
+            cast(Requests, self.context.requests).failed_ipfs_uploads.discard(ipfs_hash)
             self.context.logger.info(
                 f"Successfully stored {filename} to IPFS with hash: {ipfs_hash}"
             )
@@ -2081,23 +2114,27 @@ class BaseBehaviour(
         :param ipfs_hash: the ipfs hash of the file/dir to download.
         :param filetype: the file type of the object being downloaded.
         :param custom_loader: a custom deserializer for the object received from IPFS.
-        :param timeout: timeout for the request.
+        :param timeout: timeout for the request, and for the confirmation of a background upload of the hash,
+            which defaults to `IPFS_UPLOAD_WAIT_TIMEOUT`.
         :returns: the downloaded object, corresponding to ipfs_hash.
         """
+        confirmed = yield from self._wait_for_pending_ipfs_upload(ipfs_hash, timeout)
+        if not confirmed:
+            return None
         try:
             message, dialogue = self._build_ipfs_get_file_req(ipfs_hash, timeout)
             ipfs_message = yield from self._do_ipfs_request(dialogue, message, timeout)
-            if ipfs_message.performative != IpfsMessage.Performative.FILES:
+            if ipfs_message.performative != IpfsMessage.Performative.BINARY_FILES:
                 self.context.logger.error(
-                    f"Expected performative {IpfsMessage.Performative.FILES} but got {ipfs_message.performative}."
+                    f"Expected performative {IpfsMessage.Performative.BINARY_FILES} but got {ipfs_message.performative}."
                 )
                 return None
-            serialized_objects = ipfs_message.files
+            serialized_objects = ipfs_message.binary_files
             deserialized_objects = self._deserialize_ipfs_objects(
                 serialized_objects, filetype, custom_loader
             )
             self.context.logger.info(
-                f"Retrieved {len(ipfs_message.files)} objects from ipfs."
+                f"Retrieved {len(serialized_objects)} objects from ipfs."
             )
             return deserialized_objects
         except IPFSInteractionError as e:
@@ -2106,6 +2143,192 @@ class BaseBehaviour(
             )
             return None
 
+    def wait_for_ipfs_upload(
+        self, ipfs_hash: str, timeout: Optional[float] = None
+    ) -> Generator[None, None, bool]:
+        """
+        Wait for the background upload of a hash to IPFS, and check whether it succeeded.
+
+        The hashes sent with `wait_for_upload=False` are precomputed, so a skill which shares such a hash
+        with the other agents should make sure that it was uploaded, and store the files again otherwise.
+
+        :param ipfs_hash: the ipfs hash of the files.
+        :param timeout: timeout for the confirmation of the upload, which defaults to `IPFS_UPLOAD_WAIT_TIMEOUT`.
+        :return: whether the files were uploaded with the hash.
+        """
+        confirmed = yield from self._wait_for_pending_ipfs_upload(ipfs_hash, timeout)
+        failed = cast(Requests, self.context.requests).failed_ipfs_uploads
+        return confirmed and ipfs_hash not in failed
+
+    def _wait_for_pending_ipfs_upload(
+        self, ipfs_hash: str, timeout: Optional[float] = None
+    ) -> Generator[None, None, bool]:
+        """Wait for the background upload of a hash to IPFS to be confirmed, if it is pending, and return whether it was in time."""
+        ctx_requests = cast(Requests, self.context.requests)
+        pending_uploads = ctx_requests.pending_ipfs_uploads
+        if ipfs_hash not in pending_uploads:
+            return True
+        self.context.logger.info(
+            f"Waiting for the upload of {ipfs_hash} to IPFS to be confirmed."
+        )
+        wait_timeout = IPFS_UPLOAD_WAIT_TIMEOUT if timeout is None else timeout
+        try:
+            yield from self.wait_for_condition(
+                lambda: ipfs_hash not in pending_uploads, wait_timeout
+            )
+        except TimeoutException:
+            pending_uploads.discard(ipfs_hash)
+            ctx_requests.failed_ipfs_uploads.add(ipfs_hash)
+            self.context.logger.error(
+                f"The upload of {ipfs_hash} to IPFS was not confirmed within {wait_timeout} seconds."
+            )
+            return False
+        return True
+
+    def send_snapshot_to_ipfs(  # pylint: disable=too-many-arguments
+        self,
+        filename: str,
+        obj: SupportedObjectType,
+        previous_hash: Optional[str],
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        filetype: SupportedFiletype = SupportedFiletype.COMPACT_JSON,
+        timeout: Optional[float] = None,
+        wait_for_upload: bool = True,
+    ) -> Generator[None, None, Optional[str]]:
+        """
+        Send a snapshot of a JSON-like object to IPFS, as a delta against a previous snapshot.
+
+        Only the changes since the previous snapshot are uploaded,
+        and a full checkpoint is uploaded every `checkpoint_interval` snapshots,
+        or if the previous snapshot cannot be retrieved.
+
+        :param filename: the file name to store the snapshot in.
+        :param obj: the object to take a snapshot of.
+        :param previous_hash: the IPFS hash of the previous snapshot, e.g., of the previous period, if any.
+        :param checkpoint_interval: the maximum number of snapshots between two consecutive checkpoints.
+        :param filetype: the file type of the snapshot.
+        :param timeout: timeout for the requests.
+        :param wait_for_upload: whether to wait for the upload to complete.
+        :return: the IPFS hash of the snapshot.
+        """
+        base = None
+        if previous_hash is not None:
+            yield from self.get_snapshot_from_ipfs(previous_hash, filetype, timeout)
+            base = self.shared_state.ipfs_snapshots.get(previous_hash)
+        depth, snapshot = build_snapshot(obj, previous_hash, base, checkpoint_interval)
+        ipfs_hash = yield from self.send_to_ipfs(
+            filename,
+            snapshot,
+            filetype=filetype,
+            timeout=timeout,
+            wait_for_upload=wait_for_upload,
+        )
+        if ipfs_hash is not None:
+            self.shared_state.ipfs_snapshots.put(ipfs_hash, depth, obj)
+        return ipfs_hash
+
+    def get_snapshot_from_ipfs(
+        self,
+        ipfs_hash: str,
+        filetype: SupportedFiletype = SupportedFiletype.COMPACT_JSON,
+        timeout: Optional[float] = None,
+    ) -> Generator[None, None, Optional[SupportedObjectType]]:
+        """
+        Get a snapshot of an object from IPFS, as sent by `send_snapshot_to_ipfs`.
+
+        The object is reconstructed from the closest cached snapshot or checkpoint,
+        by downloading and applying only the deltas which have not been seen yet.
+
+        :param ipfs_hash: the IPFS hash of the snapshot.
+        :param filetype: the file type of the snapshot.
+        :param timeout: timeout for the requests.
+        :return: the object, or None if it could not be reconstructed.
+        """
+        snapshots = self.shared_state.ipfs_snapshots
+        deltas = []
+        current_hash = ipfs_hash
+        base = snapshots.get(current_hash)
+        while base is None:
+            snapshot = yield from self.get_from_ipfs(
+                current_hash, filetype, timeout=timeout
+            )
+            try:
+                if is_checkpoint(cast(dict, snapshot)):
+                    base = (0, cast(dict, snapshot)["data"])
+                    snapshots.put(current_hash, *base)
+                    break
+            except ValueError as e:
+                self.context.logger.error(
+                    f"Could not get the snapshot with hash {current_hash} from IPFS: {e}"
+                )
+                return None
+            snapshot = cast(dict, snapshot)
+            deltas.append((current_hash, snapshot))
+            current_hash = snapshot["base"]
+            base = snapshots.get(current_hash)
+
+        _, obj = base
+        for delta_hash, snapshot in reversed(deltas):
+            try:
+                obj = apply_delta(obj, snapshot["delta"])
+            except (ValueError, KeyError, TypeError) as e:
+                self.context.logger.error(
+                    f"Could not apply the delta with hash {delta_hash}: {e}"
+                )
+                return None
+            snapshots.put(delta_hash, snapshot["depth"], obj)
+        if deltas:
+            self.context.logger.info(
+                f"Reconstructed the snapshot with hash {ipfs_hash} by applying {len(deltas)} deltas."
+            )
+        return obj
+
+    def _send_to_ipfs_in_background(
+        self, dialogue: IpfsDialogue, message: IpfsMessage
+    ) -> str:
+        """Send a STORE_BINARY_FILES request to IPFS without waiting for its response, and return the precomputed hash."""
+        ipfs_hash = get_ipfs_hash(message.binary_files)
+        ctx_requests = cast(Requests, self.context.requests)
+        ctx_requests.pending_ipfs_uploads.add(ipfs_hash)
+        self.context.outbox.put_message(message=message)
+        request_nonce = self._get_request_nonce_from_dialogue(dialogue)
+        ctx_requests.request_id_to_callback[request_nonce] = (
+            self._get_ipfs_upload_callback(ipfs_hash)
+        )
+        self.context.logger.info(
+            f"Storing files to IPFS in the background, with precomputed hash: {ipfs_hash}"
+        )
+        return ipfs_hash
+
+    def _get_ipfs_upload_callback(
+        self, ipfs_hash: str
+    ) -> Callable[[Message, "BaseBehaviour"], None]:
+        """Get a callback which confirms the background upload of the files with the given hash."""
+
+        def confirm_upload(message: Message, _current_behaviour: BaseBehaviour) -> None:
+            """Confirm that the files were uploaded with the precomputed hash."""
+            ctx_requests = cast(Requests, self.context.requests)
+            ctx_requests.pending_ipfs_uploads.discard(ipfs_hash)
+            ipfs_message = cast(IpfsMessage, message)
+            if ipfs_message.performative != IpfsMessage.Performative.IPFS_HASH:
+                ctx_requests.failed_ipfs_uploads.add(ipfs_hash)
+                self.context.logger.error(
+                    f"Could not upload the files with hash {ipfs_hash} to IPFS: {ipfs_message}"
+                )
+            elif ipfs_message.ipfs_hash != ipfs_hash:
+                ctx_requests.failed_ipfs_uploads.add(ipfs_hash)
+                self.context.logger.error(
+                    f"The files were uploaded to IPFS with hash {ipfs_message.ipfs_hash}, "
+                    f"which differs from the precomputed hash {ipfs_hash}."
+                )
+            else:
+                ctx_requests.failed_ipfs_uploads.discard(ipfs_hash)
+                self.context.logger.info(
+                    f"Confirmed the upload of the files with hash {ipfs_hash} to IPFS."
+                )
+
+        return confirm_upload
+
     def _do_ipfs_request(
         self,
         dialogue: IpfsDialogue,
@@ -2226,12 +2449,8 @@ class TmManager(BaseBehaviour):
                 self.context.logger.info("Tendermint reset was successfully performed.")
                 # we sleep to give some time for tendermint to start sending us blocks
                 # otherwise we might end-up assuming that tendermint is still not working.
-                # Note that the wait_from_last_timestamp() in reset_tendermint_with_wait()
-                # doesn't guarantee us this, since the block stall deadline is greater than the
-                # hard_reset_sleep, 60s vs 20s. In other words, we haven't received a block for at
-                # least 60s, so wait_from_last_timestamp() will return immediately.
-                # By setting "on_startup" to True in the reset_tendermint_with_wait() call above,
-                # wait_from_last_timestamp() will not be called at all.
+                # Note that reset_tendermint_with_wait() doesn't guarantee us this,
+                # since it only waits until the local and the remote heights match.
                 yield from self.sleep(self.hard_reset_sleep)
                 self.gentle_reset_attempted = False
                 return
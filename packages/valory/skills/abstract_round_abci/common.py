@@ -93,6 +93,7 @@ class RandomnessBehaviour(BaseBehaviour, ABC):
         response = yield from self.get_http_response(
             method=api_specs["method"],
             url=api_specs["url"],
+            headers=api_specs["headers"],
         )
         observation = self.context.randomness_api.process_response(response)
         if observation is not None:
@@ -25,7 +25,7 @@ from abc import ABC
 from calendar import timegm
 from dataclasses import asdict
 from enum import Enum
-from typing import Any, Callable, Dict, FrozenSet, List, Optional, cast
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, cast
 
 from aea.configurations.data_types import PublicId
 from aea.protocols.base import Message
@@ -34,7 +34,13 @@ from aea.skills.base import Handler
 
 from packages.open_aea.protocols.signing import SigningMessage
 from packages.valory.protocols.abci import AbciMessage
-from packages.valory.protocols.abci.custom_types import Events, ValidatorUpdates
+from packages.valory.protocols.abci.custom_types import (
+    Events,
+    ProofOps,
+    Result,
+    SnapShots,
+    ValidatorUpdates,
+)
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.http import HttpMessage
 from packages.valory.protocols.ipfs import IpfsMessage
@@ -66,6 +72,10 @@ from packages.valory.skills.abstract_round_abci.models import (
     SharedState,
     TendermintRecoveryParams,
 )
+from packages.valory.skills.abstract_round_abci.query import QueryError, StateView
+from packages.valory.skills.abstract_round_abci.snapshots import (
+    APPLY_CHUNK_REJECT_SNAPSHOT,
+)
 
 
 def exception_to_info_msg(exception: Exception) -> str:
@@ -153,6 +163,51 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return super().begin_block(message, dialogue)
 
+    def query(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
+        """
+        Handle the 'query' request.
+
+        As per Tendermint spec (https://github.com/tendermint/spec/blob/038f3e025a19fed9dc96e718b9834ab1b545f136/spec/abci/abci.md#query):
+
+        Query for data from the application at current or past height.
+
+        Only the state at the latest commit can be queried. It is read from an immutable view,
+        so that the queries never read a state which is being modified by the block under construction.
+        See `StateView` for the supported paths.
+
+        :param message: the ABCI request.
+        :param dialogue: the ABCI dialogue.
+        :return: the response.
+        """
+        state_view = cast(SharedState, self.context.state).state_view
+        code, log, value, height = OK_CODE, "", b"", 0
+        try:
+            if state_view is None:
+                raise QueryError("No state has been committed yet.")
+            height = state_view.height
+            if message.height not in (0, height):
+                raise QueryError(
+                    f"Only the state at the latest committed height {height} can be queried."
+                )
+            value = state_view.query(message.path)
+        except QueryError as e:
+            code, log = ERROR_CODE, str(e)
+
+        reply = dialogue.reply(
+            performative=AbciMessage.Performative.RESPONSE_QUERY,
+            target_message=message,
+            code=code,
+            log=log,
+            info="",
+            index=0,
+            key=message.path.encode("utf-8"),
+            value=value,
+            proof_ops=ProofOps([]),
+            height=height,
+            codespace="",
+        )
+        return cast(AbciMessage, reply)
+
     def check_tx(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """Handle the 'check_tx' request."""
         transaction_bytes = message.tx
@@ -295,10 +350,15 @@ class ABCIRoundHandler(ABCIHandler):
         except AddBlockError as exception:
             self._log_exception(exception)
             raise exception
+        shared_state = cast(SharedState, self.context.state)
+        shared_state.state_view = StateView.from_round_sequence(
+            shared_state.round_sequence
+        )
+        self._take_snapshot()
         # The Merkle root hash of the application state.
         data = self.context.state.round_sequence.root_hash
-        # Blocks below this height may be removed. Defaults to 0 (retain all).
-        retain_height = 0
+        # Blocks below this height may be removed. 0 retains all.
+        retain_height = self._retain_height()
         # return commit success
         reply = dialogue.reply(
             performative=AbciMessage.Performative.RESPONSE_COMMIT,
@@ -308,6 +368,155 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return cast(AbciMessage, reply)
 
+    def _take_snapshot(self) -> None:
+        """Take a state-sync snapshot, if one is due and a round transition took place in the committed block."""
+        shared_state = cast(SharedState, self.context.state)
+        round_sequence = shared_state.round_sequence
+        height = round_sequence.height
+        if not shared_state.abci_snapshots.is_due(height):
+            return
+        try:
+            transitioned = round_sequence.last_round_transition_height == height
+        except ValueError:
+            # no round transition has taken place yet
+            return
+        if not transitioned:
+            return
+        snapshot = shared_state.abci_snapshots.take(
+            height, round_sequence.snapshot_state()
+        )
+        self.context.logger.info(
+            f"Took a state-sync snapshot at height {height} in {len(snapshot.chunks)} chunks."
+        )
+
+    def _retain_height(self) -> int:
+        """Get the height below which Tendermint may prune the blocks, keeping those needed to sync from the latest snapshot."""
+        shared_state = cast(SharedState, self.context.state)
+        retain_height = shared_state.round_sequence.retain_height(
+            self.context.params.tendermint_retain_periods
+        )
+        if retain_height and shared_state.abci_snapshots.enabled:
+            # a node which restores the latest snapshot needs the blocks which follow it
+            retain_height = min(
+                retain_height, shared_state.abci_snapshots.latest_height or 0
+            )
+        return retain_height
+
+    def list_snapshots(
+        self, message: AbciMessage, dialogue: AbciDialogue
+    ) -> AbciMessage:
+        """
+        Handle the 'list_snapshots' request.
+
+        As per Tendermint spec (https://github.com/tendermint/spec/blob/038f3e025a19fed9dc96e718b9834ab1b545f136/spec/abci/abci.md#listsnapshots):
+
+        Used during state sync to discover available snapshots on peers.
+
+        :param message: the ABCI request.
+        :param dialogue: the ABCI dialogue.
+        :return: the response.
+        """
+        snapshots = cast(SharedState, self.context.state).abci_snapshots.list()
+        reply = dialogue.reply(
+            performative=AbciMessage.Performative.RESPONSE_LIST_SNAPSHOTS,
+            target_message=message,
+            snapshots=SnapShots(snapshots),
+        )
+        return cast(AbciMessage, reply)
+
+    def offer_snapshot(
+        self, message: AbciMessage, dialogue: AbciDialogue
+    ) -> AbciMessage:
+        """
+        Handle the 'offer_snapshot' request.
+
+        As per Tendermint spec (https://github.com/tendermint/spec/blob/038f3e025a19fed9dc96e718b9834ab1b545f136/spec/abci/abci.md#offersnapshot):
+
+        - The app_hash can be trusted, as it has been verified by the light client.
+        - The application can choose whether to accept the snapshot, reject it, or reject its format or sender.
+
+        :param message: the ABCI request.
+        :param dialogue: the ABCI dialogue.
+        :return: the response.
+        """
+        restorer = cast(SharedState, self.context.state).snapshot_restorer
+        result_type = restorer.offer(message.snapshot, message.app_hash)
+        self.context.logger.info(
+            f"Offered a state-sync snapshot at height {message.snapshot.height}: {result_type.name}."
+        )
+        reply = dialogue.reply(
+            performative=AbciMessage.Performative.RESPONSE_OFFER_SNAPSHOT,
+            target_message=message,
+            result=Result(result_type),
+        )
+        return cast(AbciMessage, reply)
+
+    def load_snapshot_chunk(
+        self, message: AbciMessage, dialogue: AbciDialogue
+    ) -> AbciMessage:
+        """
+        Handle the 'load_snapshot_chunk' request.
+
+        As per Tendermint spec (https://github.com/tendermint/spec/blob/038f3e025a19fed9dc96e718b9834ab1b545f136/spec/abci/abci.md#loadsnapshotchunk):
+
+        Used during state sync to retrieve snapshot chunks from peers.
+
+        :param message: the ABCI request.
+        :param dialogue: the ABCI dialogue.
+        :return: the response.
+        """
+        chunk = cast(SharedState, self.context.state).abci_snapshots.load_chunk(
+            message.height, message.format, message.chunk_index
+        )
+        reply = dialogue.reply(
+            performative=AbciMessage.Performative.RESPONSE_LOAD_SNAPSHOT_CHUNK,
+            target_message=message,
+            chunk=chunk,
+        )
+        return cast(AbciMessage, reply)
+
+    def apply_snapshot_chunk(
+        self, message: AbciMessage, dialogue: AbciDialogue
+    ) -> AbciMessage:
+        """
+        Handle the 'apply_snapshot_chunk' request.
+
+        As per Tendermint spec (https://github.com/tendermint/spec/blob/038f3e025a19fed9dc96e718b9834ab1b545f136/spec/abci/abci.md#applysnapshotchunk):
+
+        - The application can choose to refetch chunks and/or ban P2P peers as appropriate.
+        - When all chunks have been accepted, Tendermint will make an ABCI Info call to verify that
+          LastBlockAppHash and LastBlockHeight matches the expected values.
+
+        :param message: the ABCI request.
+        :param dialogue: the ABCI dialogue.
+        :return: the response.
+        """
+        shared_state = cast(SharedState, self.context.state)
+        result_type, refetch_chunks, state = shared_state.snapshot_restorer.apply_chunk(
+            message.index, message.chunk
+        )
+        reject_senders: Tuple[str, ...] = ()
+        if refetch_chunks and message.chunk_sender:
+            reject_senders = (message.chunk_sender,)
+        if state is not None:
+            try:
+                shared_state.round_sequence.restore_state(state)
+            except (ABCIAppInternalError, KeyError, TypeError, ValueError) as e:
+                self._log_exception(e)
+                result_type = APPLY_CHUNK_REJECT_SNAPSHOT
+            else:
+                self.context.logger.info(
+                    f"Restored the state from a state-sync snapshot at height {state['height']}."
+                )
+        reply = dialogue.reply(
+            performative=AbciMessage.Performative.RESPONSE_APPLY_SNAPSHOT_CHUNK,
+            target_message=message,
+            result=Result(result_type),
+            refetch_chunks=refetch_chunks,
+            reject_senders=reject_senders,
+        )
+        return cast(AbciMessage, reply)
+
     @classmethod
     def _check_tx_failed(
         cls, message: AbciMessage, dialogue: AbciDialogue, info: str = ""
@@ -743,9 +952,9 @@ class TendermintHandler(Handler):
         try:
             recovery_params = json.loads(message.params)
             shared_state = cast(SharedState, self.context.state)
-            shared_state.address_to_acn_deliverable[
-                message.sender
-            ] = TendermintRecoveryParams(**recovery_params)
+            shared_state.address_to_acn_deliverable[message.sender] = (
+                TendermintRecoveryParams(**recovery_params)
+            )
         except (json.JSONDecodeError, TypeError) as exc:
             log_message = self.LogMessages.failed_to_parse_params.value
             self.context.logger.error(f"{log_message}: {exc} {message}")
@@ -785,6 +994,7 @@ class IpfsHandler(AbstractResponseHandler):
         {
             IpfsMessage.Performative.IPFS_HASH,
             IpfsMessage.Performative.FILES,
+            IpfsMessage.Performative.BINARY_FILES,
             IpfsMessage.Performative.ERROR,
         }
     )
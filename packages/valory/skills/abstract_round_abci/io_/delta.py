@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the delta snapshots of the objects sent to IPFS."""
+
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_CHECKPOINT_INTERVAL = 10
+DEFAULT_SNAPSHOT_CACHE_SIZE = 16
+
+Delta = Dict[str, Any]
+Snapshot = Dict[str, Any]
+
+
+def compute_delta(base: Any, new: Any) -> Delta:
+    """
+    Compute the delta which transforms a JSON-like object into another one.
+
+    Dictionaries are compared by key and lists by index, recursively,
+    so that the delta only contains the values which have changed.
+
+    :param base: the base object.
+    :param new: the new object.
+    :return: the delta.
+    """
+    changes: Delta = {}
+    if isinstance(base, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            if key not in base:
+                changes[key] = {"set": value}
+            elif base[key] != value:
+                changes[key] = compute_delta(base[key], value)
+        removed = [key for key in base if key not in new]
+        return {"dict": changes, "removed": removed}
+    if isinstance(base, list) and isinstance(new, list):
+        for i, value in enumerate(new):
+            if i >= len(base):
+                changes[str(i)] = {"set": value}
+            elif base[i] != value:
+                changes[str(i)] = compute_delta(base[i], value)
+        return {"list": changes, "length": len(new)}
+    return {"set": new}
+
+
+def apply_delta(base: Any, delta: Delta) -> Any:
+    """
+    Apply a delta, as computed by `compute_delta`, to a JSON-like object.
+
+    :param base: the base object, which is not modified.
+    :param delta: the delta.
+    :return: the new object.
+    """
+    if "set" in delta:
+        return deepcopy(delta["set"])
+    if "dict" in delta:
+        if not isinstance(base, dict):
+            raise ValueError(f"Cannot apply a dictionary delta to a {type(base)}.")
+        new = {key: value for key, value in base.items() if key not in delta["removed"]}
+        for key, value_delta in delta["dict"].items():
+            new[key] = apply_delta(base.get(key), value_delta)
+        return new
+    if "list" in delta:
+        if not isinstance(base, list):
+            raise ValueError(f"Cannot apply a list delta to a {type(base)}.")
+        length = delta["length"]
+        new_list = base[:length] + [None] * (length - len(base))
+        for i, value_delta in delta["list"].items():
+            new_list[int(i)] = apply_delta(new_list[int(i)], value_delta)
+        return new_list
+    raise ValueError(f"Invalid delta {delta}.")
+
+
+def build_snapshot(
+    obj: Any,
+    base_hash: Optional[str] = None,
+    base: Optional[Tuple[int, Any]] = None,
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+) -> Tuple[int, Snapshot]:
+    """
+    Build the snapshot of an object, either as a full checkpoint or as a delta against a base snapshot.
+
+    :param obj: the object.
+    :param base_hash: the IPFS hash of the base snapshot, if any.
+    :param base: the depth and the object of the base snapshot, if known.
+    :param checkpoint_interval: the maximum number of snapshots between two consecutive checkpoints.
+    :return: the depth of the snapshot, i.e., its distance from the last checkpoint, and the snapshot.
+    """
+    if base_hash is None or base is None:
+        return 0, {"depth": 0, "base": None, "data": obj}
+    base_depth, base_obj = base
+    depth = base_depth + 1
+    if depth >= checkpoint_interval:
+        return 0, {"depth": 0, "base": None, "data": obj}
+    delta = compute_delta(base_obj, obj)
+    return depth, {"depth": depth, "base": base_hash, "delta": delta}
+
+
+def is_checkpoint(snapshot: Snapshot) -> bool:
+    """Check whether a snapshot is a full checkpoint, or else a delta with a base."""
+    if not isinstance(snapshot, dict) or "depth" not in snapshot:
+        raise ValueError(f"Invalid snapshot {snapshot}.")
+    if "data" in snapshot:
+        return True
+    if not isinstance(snapshot.get("base"), str) or "delta" not in snapshot:
+        raise ValueError(f"Invalid delta snapshot {snapshot}.")
+    return False
+
+
+class SnapshotCache:
+    """A cache of the reconstructed snapshots, by IPFS hash."""
+
+    def __init__(self, max_size: int = DEFAULT_SNAPSHOT_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self._snapshots: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+
+    def get(self, ipfs_hash: str) -> Optional[Tuple[int, Any]]:
+        """Get the depth and a copy of the object of a snapshot, if it is cached."""
+        cached = self._snapshots.get(ipfs_hash)
+        if cached is None:
+            return None
+        self._snapshots.move_to_end(ipfs_hash)
+        depth, obj = cached
+        return depth, deepcopy(obj)
+
+    def put(self, ipfs_hash: str, depth: int, obj: Any) -> None:
+        """Cache the depth and a copy of the object of a snapshot."""
+        self._snapshots[ipfs_hash] = (depth, deepcopy(obj))
+        self._snapshots.move_to_end(ipfs_hash)
+        while len(self._snapshots) > self.max_size:
+            self._snapshots.popitem(last=False)
+
+    def __contains__(self, ipfs_hash: str) -> bool:
+        """Check whether a snapshot is cached."""
+        return ipfs_hash in self._snapshots
+
+    def __len__(self) -> int:
+        """Get the number of cached snapshots."""
+        return len(self._snapshots)
@@ -21,7 +21,9 @@
 
 
 import os
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Mapping, Optional, Type, Union
+
+from aea.helpers.ipfs.base import IPFSHashOnly, PBNode, unixfs_pb2
 
 from packages.valory.skills.abstract_round_abci.io_.load import (
     CustomLoaderType,
@@ -39,6 +41,63 @@ class IPFSInteractionError(Exception):
     """A custom exception for IPFS interaction errors."""
 
 
+def _to_bytes(data: Union[str, bytes]) -> bytes:
+    """Get the bytes of a serialized file, which are stored as they are or UTF-8 encoded if they are text."""
+    return data if isinstance(data, bytes) else data.encode("utf-8")
+
+
+def get_ipfs_hash(serialized_objects: Mapping[str, Union[str, bytes]]) -> str:
+    """
+    Compute locally the hash that the IPFS connection returns when storing the given files.
+
+    Like the connection does, a single file is wrapped in a directory, while multiple files are
+    stored in a directory which is wrapped in another one. The hash is a CID v0, computed with the
+    default chunker and hash function of the IPFS node, so it can be used before the upload completes.
+
+    :param serialized_objects: the serialized files, by path, as returned by `IPFSInteract.store` or `store_bytes`
+    :return: the IPFS hash of the files.
+    """
+    if len(serialized_objects) == 0:
+        raise IPFSInteractionError("No files were present.")
+
+    # pylint: disable=protected-access
+    if len(serialized_objects) == 1:
+        path, data = next(iter(serialized_objects.items()))
+        return IPFSHashOnly.hash_bytes(
+            _to_bytes(data),
+            wrap=True,
+            cid_v1=False,
+            file_name_if_wrap=os.path.basename(path),
+        )
+
+    dir_names = {os.path.dirname(path) for path in serialized_objects}
+    if len(dir_names) > 1:
+        raise IPFSInteractionError(f"Received files from different dirs {dir_names}.")
+
+    dir_node = PBNode()
+    content_size = 0
+    files = {
+        os.path.basename(path): _to_bytes(data)
+        for path, data in serialized_objects.items()
+    }
+    for name in sorted(files):
+        file_pb, file_size = IPFSHashOnly._pb_serialize_bytes(files[name])
+        file_hash = IPFSHashOnly._generate_multihash_bytes(file_pb)
+        dir_node.Links.append(IPFSHashOnly.create_link(file_hash, file_size, name))
+        content_size += file_size
+
+    dir_data = unixfs_pb2.Data()
+    dir_data.Type = unixfs_pb2.Data.Directory
+    dir_node.Data = dir_data.SerializeToString(deterministic=True)
+    dir_serialization = IPFSHashOnly._serialize(dir_node)
+    link = IPFSHashOnly.create_link(
+        IPFSHashOnly._generate_multihash_bytes(dir_serialization),
+        len(dir_serialization) + content_size,
+        os.path.basename(dir_names.pop()),
+    )
+    return IPFSHashOnly.wrap_in_a_node(link)
+
+
 class IPFSInteract:
     """Class for interacting with IPFS."""
 
@@ -58,18 +117,43 @@ class IPFSInteract:
         **kwargs: Any,
     ) -> Dict[str, str]:
         """Temporarily store a file locally, in order to send it to IPFS and retrieve a hash, and then delete it."""
-        filepath = os.path.normpath(filepath)
-        if multiple:
-            # Add trailing slash in order to treat path as a folder.
-            filepath = os.path.join(filepath, "")
-        storer = self._storer_cls(filetype, custom_storer, filepath)
-
+        storer = self._get_storer(filepath, multiple, filetype, custom_storer)
         try:
             name_to_obj = storer.store(obj, multiple, **kwargs)
             return name_to_obj
         except Exception as e:  # pylint: disable=broad-except
             raise IPFSInteractionError(str(e)) from e
 
+    def store_bytes(  # pylint: disable=too-many-arguments
+        self,
+        filepath: str,
+        obj: SupportedObjectType,
+        multiple: bool,
+        filetype: Optional[SupportedFiletype] = None,
+        custom_storer: Optional[CustomStorerType] = None,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """Serialize objects as bytes, in order to send them to IPFS without encoding them as text."""
+        storer = self._get_storer(filepath, multiple, filetype, custom_storer)
+        try:
+            return storer.store_bytes(obj, multiple, **kwargs)
+        except Exception as e:  # pylint: disable=broad-except
+            raise IPFSInteractionError(str(e)) from e
+
+    def _get_storer(
+        self,
+        filepath: str,
+        multiple: bool,
+        filetype: Optional[SupportedFiletype],
+        custom_storer: Optional[CustomStorerType],
+    ) -> Storer:
+        """Get a storer of the objects to the given path."""
+        filepath = os.path.normpath(filepath)
+        if multiple:
+            # Add trailing slash in order to treat path as a folder.
+            filepath = os.path.join(filepath, "")
+        return self._storer_cls(filetype, custom_storer, filepath)
+
     def load(  # pylint: disable=too-many-arguments
         self,
         serialized_objects: Dict[str, str],
@@ -83,3 +167,16 @@ class IPFSInteract:
             return deserialized_objects
         except Exception as e:  # pylint: disable=broad-except
             raise IPFSInteractionError(str(e)) from e
+
+    def load_bytes(
+        self,
+        serialized_objects: Dict[str, bytes],
+        filetype: Optional[SupportedFiletype] = None,
+        custom_loader: CustomLoaderType = None,
+    ) -> SupportedObjectType:
+        """Deserialize objects received via IPFS as bytes."""
+        loader = self._loader_cls(filetype, custom_loader)
+        try:
+            return loader.load_bytes(serialized_objects)
+        except Exception as e:  # pylint: disable=broad-except
+            raise IPFSInteractionError(str(e)) from e
@@ -19,6 +19,8 @@
 
 """This module contains all the loading operations of the behaviours."""
 
+import binascii
+import io
 import json
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, Optional
@@ -29,6 +31,8 @@ from packages.valory.skills.abstract_round_abci.io_.store import (
     SupportedFiletype,
     SupportedObjectType,
     SupportedSingleObjectType,
+    decode_binary,
+    import_optional_dependency,
 )
 
 
@@ -45,6 +49,12 @@ class AbstractLoader(ABC):
     ) -> NativelySupportedSingleObjectType:
         """Load a single object."""
 
+    def load_single_object_from_bytes(
+        self, data: bytes
+    ) -> NativelySupportedSingleObjectType:
+        """Load a single object from bytes, by default the UTF-8 encoding of its text serialization."""
+        return self.load_single_object(data.decode("utf-8"))
+
     def load(self, serialized_objects: Dict[str, str]) -> SupportedObjectType:
         """
         Load one or more serialized objects.
@@ -52,13 +62,30 @@ class AbstractLoader(ABC):
         :param serialized_objects: A mapping of filenames to serialized object they contained.
         :return: the loaded file(s).
         """
+        return self._load(self.load_single_object, serialized_objects)
+
+    def load_bytes(self, serialized_objects: Dict[str, bytes]) -> SupportedObjectType:
+        """
+        Load one or more objects serialized as bytes.
+
+        :param serialized_objects: A mapping of filenames to serialized object they contained.
+        :return: the loaded file(s).
+        """
+        return self._load(self.load_single_object_from_bytes, serialized_objects)
+
+    @staticmethod
+    def _load(
+        load_single_object: Callable[[Any], SupportedSingleObjectType],
+        serialized_objects: Dict[str, Any],
+    ) -> SupportedObjectType:
+        """Load one or more serialized objects with the given function."""
         if len(serialized_objects) == 0:
             # no objects are present, raise an error
             raise ValueError('"serialized_objects" does not contain any objects')
 
         objects = {}
         for filename, body in serialized_objects.items():
-            objects[filename] = self.load_single_object(body)
+            objects[filename] = load_single_object(body)
 
         if len(objects) > 1:
             # multiple object are present
@@ -74,6 +101,12 @@ class AbstractLoader(ABC):
 class JSONLoader(AbstractLoader):
     """A JSON file loader."""
 
+    def load_single_object_from_bytes(
+        self, data: bytes
+    ) -> NativelySupportedSingleObjectType:
+        """Read a json file, encoded as UTF-8, without decoding it to a string first."""
+        return self.load_single_object(data)  # type: ignore
+
     def load_single_object(
         self, serialized_object: str
     ) -> NativelySupportedSingleObjectType:
@@ -95,6 +128,72 @@ class JSONLoader(AbstractLoader):
             ) from e
 
 
+class BinaryLoader(AbstractLoader, ABC):
+    """An abstract loader of a binary format, whose files are base64-encoded when serialized as text."""
+
+    @abstractmethod
+    def from_bytes(self, data: bytes) -> NativelySupportedSingleObjectType:
+        """Decode an object from bytes."""
+
+    def load_single_object_from_bytes(
+        self, data: bytes
+    ) -> NativelySupportedSingleObjectType:
+        """Read a binary file.
+
+        :param data: the file's bytes.
+        :return: the deserialized file's content.
+        """
+        try:
+            return self.from_bytes(data)
+        except (ValueError, TypeError) as e:
+            raise IOError(
+                f"The file could not be decoded by `{type(self).__name__}`: {e}"
+            ) from e
+
+    def load_single_object(
+        self, serialized_object: str
+    ) -> NativelySupportedSingleObjectType:
+        """Read a binary file, encoded as text.
+
+        :param serialized_object: the file serialized into a base64 string.
+        :return: the deserialized file's content.
+        """
+        try:
+            return self.from_bytes(decode_binary(serialized_object))
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise IOError(
+                f"The file could not be decoded by `{type(self).__name__}`: {e}"
+            ) from e
+
+
+class MsgpackLoader(BinaryLoader):
+    """A msgpack file loader."""
+
+    def from_bytes(self, data: bytes) -> NativelySupportedSingleObjectType:
+        """Decode an object from msgpack."""
+        msgpack = import_optional_dependency("msgpack", SupportedFiletype.MSGPACK)
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class ZstdJSONLoader(BinaryLoader):
+    """A loader of JSON files compressed with zstd."""
+
+    def from_bytes(self, data: bytes) -> NativelySupportedSingleObjectType:
+        """Decode an object from compressed JSON."""
+        zstd = import_optional_dependency("zstandard", SupportedFiletype.ZSTD_JSON)
+        decompressed = zstd.ZstdDecompressor().decompress(data)
+        return json.loads(decompressed.decode("utf-8"))
+
+
+class ParquetLoader(BinaryLoader):
+    """A loader of parquet files, as lists of records."""
+
+    def from_bytes(self, data: bytes) -> NativelySupportedSingleObjectType:
+        """Decode a list of records from parquet."""
+        pq = import_optional_dependency("pyarrow.parquet", SupportedFiletype.PARQUET)
+        return pq.read_table(io.BytesIO(data)).to_pylist()
+
+
 class Loader(AbstractLoader):
     """Class which loads objects."""
 
@@ -102,8 +201,16 @@ class Loader(AbstractLoader):
         """Initialize a `Loader`."""
         self._filetype = filetype
         self._custom_loader = custom_loader
+        self.__filetype_to_loader_instance: Dict[SupportedFiletype, AbstractLoader] = {
+            SupportedFiletype.JSON: JSONLoader(),
+            SupportedFiletype.COMPACT_JSON: JSONLoader(),
+            SupportedFiletype.MSGPACK: MsgpackLoader(),
+            SupportedFiletype.ZSTD_JSON: ZstdJSONLoader(),
+            SupportedFiletype.PARQUET: ParquetLoader(),
+        }
         self.__filetype_to_loader: Dict[SupportedFiletype, SupportedLoaderType] = {
-            SupportedFiletype.JSON: JSONLoader().load_single_object,
+            filetype: loader.load_single_object
+            for filetype, loader in self.__filetype_to_loader_instance.items()
         }
 
     def load_single_object(self, serialized_object: str) -> SupportedSingleObjectType:
@@ -111,6 +218,13 @@ class Loader(AbstractLoader):
         loader = self._get_single_loader_from_filetype()
         return loader(serialized_object)
 
+    def load_single_object_from_bytes(self, data: bytes) -> SupportedSingleObjectType:
+        """Load a single file from bytes, without encoding the binary filetypes as text."""
+        if self._filetype is not None:
+            loader = self.__filetype_to_loader_instance[self._filetype]
+            return loader.load_single_object_from_bytes(data)
+        return super().load_single_object_from_bytes(data)
+
     def _get_single_loader_from_filetype(self) -> SupportedLoaderType:
         """Get an object loader from a given filetype or keep a custom loader."""
         if self._filetype is not None:
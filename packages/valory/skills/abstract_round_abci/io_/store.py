@@ -20,11 +20,15 @@
 """This module contains all the storing operations of the behaviours."""
 
 
+import base64
+import importlib
+import io
 import json
 import os.path
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Any, Callable, Dict, Optional, TypeVar, Union, cast
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union, cast
 
 from packages.valory.skills.abstract_round_abci.io_.paths import create_pathdirs
 
@@ -47,10 +51,55 @@ NativelySupportedJSONStorerType = Callable[
 ]
 
 
+ZSTD_COMPRESSION_LEVEL = 3
+PARQUET_COMPRESSION = "zstd"
+
+
 class SupportedFiletype(Enum):
-    """Enum for the supported filetypes of the IPFS interacting methods."""
+    """
+    Enum for the supported filetypes of the IPFS interacting methods.
+
+    `JSON` is indented, `COMPACT_JSON` has no whitespace and `ZSTD_JSON` is compact and zstd-compressed.
+    `MSGPACK` is a binary encoding of the same objects, while `PARQUET` is a columnar format
+    for tabular data, i.e., lists of records with the same fields.
+    Apart from the json ones, the filetypes require optional dependencies.
+    The files are transferred to IPFS as bytes, while they are base64-encoded
+    if the binary ones need to be serialized as text.
+    """
 
     JSON = auto()
+    COMPACT_JSON = auto()
+    MSGPACK = auto()
+    ZSTD_JSON = auto()
+    PARQUET = auto()
+
+
+def import_optional_dependency(name: str, filetype: SupportedFiletype) -> ModuleType:
+    """
+    Import an optional dependency, which is only required by some filetypes.
+
+    :param name: the name of the module to import.
+    :param filetype: the filetype which requires the module.
+    :return: the imported module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        package = name.split(".", maxsplit=1)[0]
+        raise ImportError(
+            f"The {filetype.name} filetype requires `{package}`, "
+            f"please install it with `pip install {package}`."
+        ) from e
+
+
+def encode_binary(data: bytes) -> str:
+    """Encode binary data as text, so that it can be transferred as a serialized file."""
+    return base64.b64encode(data).decode("ascii")
+
+
+def decode_binary(serialized_object: str) -> bytes:
+    """Decode binary data which were encoded as text by `encode_binary`."""
+    return base64.b64decode(serialized_object.encode("ascii"), validate=True)
 
 
 class AbstractStorer(ABC):
@@ -68,11 +117,38 @@ class AbstractStorer(ABC):
     ) -> Dict[str, str]:
         """Store a single file."""
 
+    def serialize_object_to_bytes(
+        self, filename: str, obj: SupportedSingleObjectType, **kwargs: Any
+    ) -> Dict[str, bytes]:
+        """Store a single file as bytes, by default the UTF-8 encoding of its text serialization."""
+        return {
+            name: serialized.encode("utf-8")
+            for name, serialized in self.serialize_object(
+                filename, obj, **kwargs
+            ).items()
+        }
+
     def store(
         self, obj: SupportedObjectType, multiple: bool, **kwargs: Any
     ) -> Dict[str, str]:
         """Serialize one or multiple objects."""
-        serialized_files: Dict[str, str] = {}
+        return self._store(self.serialize_object, obj, multiple, **kwargs)
+
+    def store_bytes(
+        self, obj: SupportedObjectType, multiple: bool, **kwargs: Any
+    ) -> Dict[str, bytes]:
+        """Serialize one or multiple objects as bytes."""
+        return self._store(self.serialize_object_to_bytes, obj, multiple, **kwargs)
+
+    def _store(
+        self,
+        serialize: Callable[..., Dict[str, Any]],
+        obj: SupportedObjectType,
+        multiple: bool,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Serialize one or multiple objects with the given function."""
+        serialized_files: Dict[str, Any] = {}
         if multiple:
             if not isinstance(obj, dict):  # pragma: no cover
                 raise ValueError(
@@ -81,10 +157,10 @@ class AbstractStorer(ABC):
                 )
             for filename, single_obj in obj.items():
                 filename = os.path.join(self._path, filename)
-                serialized_file = self.serialize_object(filename, single_obj, **kwargs)
+                serialized_file = serialize(filename, single_obj, **kwargs)
                 serialized_files.update(**serialized_file)
         else:
-            serialized_file = self.serialize_object(self._path, obj, **kwargs)
+            serialized_file = serialize(self._path, obj, **kwargs)
             serialized_files.update(**serialized_file)
         return serialized_files
 
@@ -92,6 +168,9 @@ class AbstractStorer(ABC):
 class JSONStorer(AbstractStorer):
     """A JSON file storer."""
 
+    indent: Optional[int] = 4
+    separators: Optional[Tuple[str, str]] = None
+
     def serialize_object(
         self, filename: str, obj: NativelySupportedSingleObjectType, **kwargs: Any
     ) -> Dict[str, str]:
@@ -102,18 +181,126 @@ class JSONStorer(AbstractStorer):
         :param obj: the object to store.
         :returns: a dict mapping the name to the serialized object.
         """
+        return {filename: self._dumps(obj)}
+
+    def serialize_object_to_bytes(
+        self, filename: str, obj: NativelySupportedSingleObjectType, **kwargs: Any
+    ) -> Dict[str, bytes]:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        :param filename: under which name the provided object should be serialized. Note that it will appear in IPFS with this name.
+        :param obj: the object to store.
+        :returns: a dict mapping the name to the serialized object.
+        """
+        return {filename: self._dumps(obj).encode("utf-8")}
+
+    def _dumps(self, obj: NativelySupportedSingleObjectType) -> str:
+        """Serialize an object to a JSON string."""
         if not any(isinstance(obj, type_) for type_ in (dict, list)):
             raise ValueError(  # pragma: no cover
                 f"`JSONStorer` cannot be used with a {type(obj)}! Only with a {StoredJSONType}"
             )
         try:
-            serialized_object = json.dumps(obj, ensure_ascii=False, indent=4)
-            name_to_obj = {filename: serialized_object}
-            return name_to_obj
+            return json.dumps(
+                obj,
+                ensure_ascii=False,
+                indent=self.indent,
+                separators=self.separators,
+            )
         except (TypeError, OSError) as e:  # pragma: no cover
             raise IOError(str(e)) from e
 
 
+class CompactJSONStorer(JSONStorer):
+    """A JSON file storer which does not add any whitespace."""
+
+    indent = None
+    separators = (",", ":")
+
+
+class BinaryStorer(AbstractStorer, ABC):
+    """An abstract storer of a binary format, whose files are base64-encoded when serialized as text."""
+
+    supported_types: Tuple[type, ...] = (dict, list)
+
+    @abstractmethod
+    def to_bytes(self, obj: NativelySupportedSingleObjectType) -> bytes:
+        """Encode an object to bytes."""
+
+    def serialize_object(
+        self, filename: str, obj: NativelySupportedSingleObjectType, **kwargs: Any
+    ) -> Dict[str, str]:
+        """
+        Serialize an object to the binary format, encoded as text.
+
+        :param filename: under which name the provided object should be serialized. Note that it will appear in IPFS with this name.
+        :param obj: the object to store.
+        :returns: a dict mapping the name to the serialized object.
+        """
+        return {
+            name: encode_binary(data)
+            for name, data in self.serialize_object_to_bytes(filename, obj).items()
+        }
+
+    def serialize_object_to_bytes(
+        self, filename: str, obj: NativelySupportedSingleObjectType, **kwargs: Any
+    ) -> Dict[str, bytes]:
+        """
+        Serialize an object to the binary format.
+
+        :param filename: under which name the provided object should be serialized. Note that it will appear in IPFS with this name.
+        :param obj: the object to store.
+        :returns: a dict mapping the name to the serialized object.
+        """
+        if not isinstance(obj, self.supported_types):
+            raise ValueError(
+                f"`{type(self).__name__}` cannot be used with a {type(obj)}! "
+                f"Only with one of {self.supported_types}"
+            )
+        try:
+            return {filename: self.to_bytes(obj)}
+        except (TypeError, ValueError, OverflowError) as e:
+            raise IOError(str(e)) from e
+
+
+class MsgpackStorer(BinaryStorer):
+    """A msgpack file storer."""
+
+    def to_bytes(self, obj: NativelySupportedSingleObjectType) -> bytes:
+        """Encode an object to msgpack."""
+        msgpack = import_optional_dependency("msgpack", SupportedFiletype.MSGPACK)
+        return msgpack.packb(obj, use_bin_type=True)
+
+
+class ZstdJSONStorer(BinaryStorer):
+    """A storer of compact JSON files, compressed with zstd."""
+
+    def to_bytes(self, obj: NativelySupportedSingleObjectType) -> bytes:
+        """Encode an object to compressed JSON."""
+        zstd = import_optional_dependency("zstandard", SupportedFiletype.ZSTD_JSON)
+        data = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        compressor = zstd.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL)
+        return compressor.compress(data.encode("utf-8"))
+
+
+class ParquetStorer(BinaryStorer):
+    """A storer of tabular data, i.e., lists of records, as parquet files."""
+
+    supported_types = (list,)
+
+    def to_bytes(self, obj: NativelySupportedSingleObjectType) -> bytes:
+        """Encode a list of records to parquet."""
+        pa = import_optional_dependency("pyarrow", SupportedFiletype.PARQUET)
+        pq = import_optional_dependency("pyarrow.parquet", SupportedFiletype.PARQUET)
+        if not all(isinstance(record, dict) for record in obj):
+            raise ValueError("Only lists of records can be stored as parquet files.")
+        table = pa.Table.from_pylist(obj)
+        sink = io.BytesIO()
+        pq.write_table(table, sink, compression=PARQUET_COMPRESSION)
+        return sink.getvalue()
+
+
 class Storer(AbstractStorer):
     """Class which serializes objects."""
 
@@ -127,10 +314,16 @@ class Storer(AbstractStorer):
         super().__init__(path)
         self._filetype = filetype
         self._custom_storer = custom_storer
+        self._filetype_to_storer_instance: Dict[Enum, AbstractStorer] = {
+            SupportedFiletype.JSON: JSONStorer(path),
+            SupportedFiletype.COMPACT_JSON: CompactJSONStorer(path),
+            SupportedFiletype.MSGPACK: MsgpackStorer(path),
+            SupportedFiletype.ZSTD_JSON: ZstdJSONStorer(path),
+            SupportedFiletype.PARQUET: ParquetStorer(path),
+        }
         self._filetype_to_storer: Dict[Enum, SupportedStorerType] = {
-            SupportedFiletype.JSON: cast(
-                NativelySupportedJSONStorerType, JSONStorer(path).serialize_object
-            ),
+            filetype: cast(NativelySupportedJSONStorerType, storer.serialize_object)
+            for filetype, storer in self._filetype_to_storer_instance.items()
         }
 
     def serialize_object(
@@ -140,6 +333,15 @@ class Storer(AbstractStorer):
         storer = self._get_single_storer_from_filetype()
         return storer(filename, obj, **kwargs)  # type: ignore
 
+    def serialize_object_to_bytes(
+        self, filename: str, obj: NativelySupportedObjectType, **kwargs: Any
+    ) -> Dict[str, bytes]:
+        """Store a single object as bytes, without encoding the binary filetypes as text."""
+        if self._filetype is not None:
+            storer = self._filetype_to_storer_instance[self._filetype]
+            return storer.serialize_object_to_bytes(filename, obj, **kwargs)
+        return super().serialize_object_to_bytes(filename, obj, **kwargs)
+
     def _get_single_storer_from_filetype(self) -> SupportedStorerType:
         """Get an object storer from a given filetype or keep a custom storer."""
         if self._filetype is not None:
@@ -34,6 +34,7 @@ from typing import (
     List,
     Optional,
     OrderedDict,
+    Set,
     Tuple,
     Type,
     cast,
@@ -44,6 +45,7 @@ from aea.configurations.data_types import PublicId
 from aea.exceptions import enforce
 from aea.skills.base import Model, SkillContext
 
+from packages.valory.connections.http_client.connection import CACHE_CONTROL_HEADER
 from packages.valory.protocols.http.message import HttpMessage
 from packages.valory.skills.abstract_round_abci.base import (
     AbciApp,
@@ -55,6 +57,15 @@ from packages.valory.skills.abstract_round_abci.base import (
     VALUE_NOT_PROVIDED,
     get_name,
 )
+from packages.valory.skills.abstract_round_abci.io_.delta import SnapshotCache
+from packages.valory.skills.abstract_round_abci.query import StateView
+from packages.valory.skills.abstract_round_abci.snapshots import (
+    DEFAULT_SNAPSHOTS_TO_KEEP,
+    DEFAULT_SNAPSHOT_CHUNK_SIZE,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    SnapshotRestorer,
+    SnapshotStore,
+)
 from packages.valory.skills.abstract_round_abci.utils import (
     check,
     check_type,
@@ -69,6 +80,10 @@ NUMBER_OF_RETRIES: int = 5
 DEFAULT_BACKOFF_FACTOR: float = 2.0
 DEFAULT_TYPE_NAME: str = "str"
 DEFAULT_CHAIN = "ethereum"
+# the blocks of all the periods are retained by default
+DEFAULT_TENDERMINT_RETAIN_PERIODS = 0
+# the interval at which the status of the Tendermint node is polled after a hard reset, until it is ready
+DEFAULT_TENDERMINT_READY_POLL_INTERVAL = 0.2
 
 
 class FrozenMixin:  # pylint: disable=too-few-public-methods
@@ -321,6 +336,21 @@ class BaseParams(
         self.setup_params: Dict[str, Any] = self._ensure("setup", kwargs, dict)
         # TODO add to all configs
         self.default_chain_id: str = kwargs.get("default_chain_id", DEFAULT_CHAIN)
+        self.abci_snapshot_interval: int = kwargs.get(
+            "abci_snapshot_interval", DEFAULT_SNAPSHOT_INTERVAL
+        )
+        self.abci_snapshot_keep_recent: int = kwargs.get(
+            "abci_snapshot_keep_recent", DEFAULT_SNAPSHOTS_TO_KEEP
+        )
+        self.abci_snapshot_chunk_size: int = kwargs.get(
+            "abci_snapshot_chunk_size", DEFAULT_SNAPSHOT_CHUNK_SIZE
+        )
+        self.tendermint_retain_periods: int = kwargs.get(
+            "tendermint_retain_periods", DEFAULT_TENDERMINT_RETAIN_PERIODS
+        )
+        self.tendermint_ready_poll_interval: float = kwargs.get(
+            "tendermint_ready_poll_interval", DEFAULT_TENDERMINT_READY_POLL_INTERVAL
+        )
 
         # we sanitize for null values as these are just kept for schema definitions
         skill_id = kwargs["skill_context"].skill_id
@@ -441,6 +471,13 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
         self.tm_recovery_params: TendermintRecoveryParams = TendermintRecoveryParams(
             self.abci_app_cls.initial_round_cls.auto_round_id()
         )
+        # the snapshots sent to and fetched from IPFS, to reconstruct the next ones from their deltas
+        self.ipfs_snapshots = SnapshotCache()
+        # the state-sync snapshots served to other nodes, and the restoration of the one offered by Tendermint
+        self.abci_snapshots = SnapshotStore()
+        self.snapshot_restorer = SnapshotRestorer()
+        # the view of the state at the latest commit, which is served to the ABCI queries
+        self.state_view: Optional[StateView] = None
         kwargs["skill_context"] = skill_context
         super().__init__(*args, **kwargs)
 
@@ -509,6 +546,12 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
             ),
             self.context.logger,
         )
+        params = cast(BaseParams, self.context.params)
+        self.abci_snapshots = SnapshotStore(
+            params.abci_snapshot_interval,
+            params.abci_snapshot_keep_recent,
+            params.abci_snapshot_chunk_size,
+        )
         if not self.context.is_abstract_component:
             self.initial_tm_configs = dict.fromkeys(
                 self.synchronized_data.all_participants
@@ -552,6 +595,10 @@ class Requests(Model, FrozenMixin):
         """Initialize the state."""
         # mapping from dialogue reference nonce to a callback
         self.request_id_to_callback: Dict[str, Callable] = {}
+        # the hashes of the files sent to IPFS without waiting for the upload to complete
+        self.pending_ipfs_uploads: Set[str] = set()
+        # the hashes of the background uploads which failed, until they are uploaded again
+        self.failed_ipfs_uploads: Set[str] = set()
         super().__init__(*args, **kwargs)
         self._frozen = True
 
@@ -651,18 +698,43 @@ class ApiSpecs(Model, FrozenMixin, TypeCheckMixin):
         )
         self.response_info = ResponseInfo.from_json_dict(kwargs)
         self.retries_info = RetriesInfo.from_json_dict(kwargs)
+        self.cache_ttl: Optional[int] = self._ensure_cache_ttl(kwargs)
         super().__init__(*args, **kwargs)
         self._frozen = True
 
+    @staticmethod
+    def _ensure_cache_ttl(kwargs: Dict[str, Any]) -> Optional[int]:
+        """Get and ensure that the optional `cache_ttl` is a non-negative number of seconds."""
+        skill_id = kwargs["skill_context"].skill_id
+        cache_ttl = kwargs.pop("cache_ttl", None)
+        try:
+            check_type("cache_ttl", cache_ttl, Optional[int])
+        except TypeError:
+            enforce(
+                False,
+                f"'cache_ttl' must be a {Optional[int]}, but type {type(cache_ttl)} was found "
+                f"in `models` of `skill.yaml` of `{skill_id}`",
+            )
+        enforce(
+            cache_ttl is None or cache_ttl >= 0,
+            f"'cache_ttl' must be non-negative, but {cache_ttl} was found "
+            f"in `models` of `skill.yaml` of `{skill_id}`",
+        )
+        return cache_ttl
+
     def get_spec(
         self,
     ) -> Dict:
         """Returns dictionary containing api specifications."""
+        headers = self.headers
+        if self.cache_ttl is not None:
+            # opt in to the http client connection's response cache
+            headers = {**headers, CACHE_CONTROL_HEADER: f"max-age={self.cache_ttl}"}
 
         return {
             "url": self.url,
             "method": self.method,
-            "headers": self.headers,
+            "headers": headers,
             "parameters": self.parameters,
         }
 
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the read-only view of the synchronized state which is served to ABCI queries."""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from packages.valory.skills.abstract_round_abci.base import RoundSequence
+
+
+DEFAULT_QUERY_CACHE_SIZE = 256
+
+FrozenData = Dict[int, Dict[str, Tuple[Any, ...]]]
+
+
+class QueryError(Exception):
+    """Exception raised when a query cannot be answered."""
+
+
+class StateView:
+    """
+    An immutable view of the synchronized state, as committed at a height.
+
+    The supported paths are:
+
+    - `/round`: the height, the period, the round count and the current round of the view.
+    - `/db/keys`: the keys set in the current period.
+    - `/db/latest/<key>`: the latest value of a key in the current period.
+    - `/db/history/<key>`: all the values of a key in the current period, oldest first.
+    - `/db/period/<period>/...`: the same as `/db/...`, for a specific period, if it has not been cleaned up.
+
+    The results are JSON-encoded. Since the view never changes, they are cached by path.
+    """
+
+    def __init__(
+        self,
+        height: int,
+        round_count: int,
+        current_round_id: Optional[str],
+        data: FrozenData,
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the view.
+
+        :param height: the height the state was committed at.
+        :param round_count: the round count.
+        :param current_round_id: the id of the current round.
+        :param data: the data of the db, by period and key.
+        :param cache_size: the maximum number of results to cache.
+        """
+        self.height = height
+        self.round_count = round_count
+        self.current_round_id = current_round_id
+        self._data = data
+        # the periods are created in increasing order, so the current one is the latest, see `AbciAppDB.reset_index`
+        self.period = max(data, default=0)
+        self._cache_size = cache_size
+        self._results: Dict[str, bytes] = {}
+
+    @classmethod
+    def from_round_sequence(cls, round_sequence: RoundSequence) -> "StateView":
+        """Take a view of the state of a round sequence."""
+        db = round_sequence.latest_synchronized_data.db
+        return cls(
+            round_sequence.height,
+            db.round_count,
+            round_sequence.current_round_id,
+            db.frozen_data(),
+        )
+
+    def query(self, path: str) -> bytes:
+        """
+        Query the view.
+
+        :param path: the path of the query.
+        :return: the JSON-encoded result.
+        :raises QueryError: if the path is not supported, or points to data which are not set.
+        """
+        result = self._results.get(path)
+        if result is None:
+            result = json.dumps(self._resolve(path), sort_keys=True).encode("utf-8")
+            if len(self._results) < self._cache_size:
+                self._results[path] = result
+        return result
+
+    def _resolve(self, path: str) -> Any:
+        """Get the result of a query."""
+        parts = [part for part in path.split("/") if part]
+        if parts == ["round"]:
+            return {
+                "height": self.height,
+                "period": self.period,
+                "round_count": self.round_count,
+                "current_round_id": self.current_round_id,
+            }
+        if not parts or parts[0] != "db":
+            raise QueryError(f"Unsupported query path {path!r}.")
+        parts = parts[1:]
+
+        period = self.period
+        if parts[:1] == ["period"]:
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise QueryError(f"Invalid period in the query path {path!r}.")
+            period = int(parts[1])
+            parts = parts[2:]
+        data = self._data.get(period)
+        if data is None:
+            raise QueryError(f"Period {period} is not available.")
+
+        return self._resolve_db(data, parts, path)
+
+    @staticmethod
+    def _resolve_db(
+        data: Dict[str, Tuple[Any, ...]], parts: List[str], path: str
+    ) -> Any:
+        """Get the result of a query to the data of a period."""
+        if parts == ["keys"]:
+            return sorted(data)
+        if len(parts) != 2 or parts[0] not in ("latest", "history"):
+            raise QueryError(f"Unsupported query path {path!r}.")
+        view, key = parts
+        history = data.get(key)
+        if not history:
+            raise QueryError(f"Key {key!r} is not set.")
+        return history[-1] if view == "latest" else list(history)
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the state-sync snapshots of the ABCI app's state."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from packages.valory.protocols.abci.custom_types import ResultType, Snapshot
+
+
+SNAPSHOT_FORMAT = 1
+DEFAULT_SNAPSHOT_INTERVAL = 0
+DEFAULT_SNAPSHOTS_TO_KEEP = 2
+# the chunks need to fit in the messages which the abci connection accepts, i.e., 1 MiB
+DEFAULT_SNAPSHOT_CHUNK_SIZE = 2**19
+
+# the results of applying a chunk are encoded using the values of the offer results' enum:
+# https://github.com/tendermint/tendermint/blob/v0.34.19/proto/tendermint/abci/types.proto
+APPLY_CHUNK_ACCEPT = ResultType.ACCEPT
+APPLY_CHUNK_ABORT = ResultType.ABORT
+APPLY_CHUNK_RETRY = ResultType.REJECT
+APPLY_CHUNK_REJECT_SNAPSHOT = ResultType.REJECT_SENDER
+
+State = Dict[str, Any]
+
+
+class SnapshotError(Exception):
+    """Exception raised when a snapshot is invalid."""
+
+
+def _sha256(data: bytes) -> bytes:
+    """Get the sha256 digest of some data."""
+    return hashlib.sha256(data).digest()
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """
+    A snapshot of the ABCI app's state at a height, split into chunks.
+
+    The hash of the snapshot is the hash of the whole encoded state,
+    and its metadata contain the hashes of the chunks, so that each chunk can be verified as soon as it is received.
+    """
+
+    height: int
+    chunks: Tuple[bytes, ...]
+    hash: bytes
+    metadata: bytes
+
+    @classmethod
+    def build(
+        cls, height: int, state: State, chunk_size: int = DEFAULT_SNAPSHOT_CHUNK_SIZE
+    ) -> "StateSnapshot":
+        """
+        Build the snapshot of a state.
+
+        :param height: the height of the block the state was committed at.
+        :param state: the state.
+        :param chunk_size: the maximum size of a chunk, in bytes.
+        :return: the snapshot.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+        payload = json.dumps(state, sort_keys=True).encode("utf-8")
+        view = memoryview(payload)
+        chunks = tuple(
+            view[i : i + chunk_size].tobytes()
+            for i in range(0, max(len(payload), 1), chunk_size)
+        )
+        metadata = json.dumps([_sha256(chunk).hex() for chunk in chunks]).encode(
+            "utf-8"
+        )
+        return cls(height, chunks, _sha256(payload), metadata)
+
+    @property
+    def header(self) -> Snapshot:
+        """Get the header of the snapshot, as advertised to Tendermint."""
+        return Snapshot(
+            self.height, SNAPSHOT_FORMAT, len(self.chunks), self.hash, self.metadata
+        )
+
+
+class SnapshotStore:
+    """
+    The snapshots of the ABCI app's state which are served to the other nodes.
+
+    A snapshot is due when at least `interval` blocks have been committed since the last one.
+    Only the `keep_recent` most recent snapshots are kept, in memory.
+    """
+
+    def __init__(
+        self,
+        interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        keep_recent: int = DEFAULT_SNAPSHOTS_TO_KEEP,
+        chunk_size: int = DEFAULT_SNAPSHOT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize the store.
+
+        :param interval: the minimum number of blocks between two snapshots. A non-positive value disables them.
+        :param keep_recent: the number of snapshots to keep, at least one.
+        :param chunk_size: the maximum size of the snapshots' chunks, in bytes.
+        """
+        self.interval = interval
+        self.keep_recent = keep_recent
+        self.chunk_size = chunk_size
+        self._snapshots: "OrderedDict[int, StateSnapshot]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether snapshots are taken."""
+        return self.interval > 0
+
+    @property
+    def latest_height(self) -> Optional[int]:
+        """Get the height of the latest snapshot, if any."""
+        return next(reversed(self._snapshots), None)
+
+    def is_due(self, height: int) -> bool:
+        """Check whether a snapshot is due at the given height."""
+        if not self.enabled:
+            return False
+        latest = self.latest_height
+        return latest is None or height - latest >= self.interval
+
+    def take(self, height: int, state: State) -> StateSnapshot:
+        """
+        Take a snapshot of a state, evicting the oldest snapshots if needed.
+
+        :param height: the height of the block the state was committed at.
+        :param state: the state.
+        :return: the snapshot.
+        """
+        snapshot = StateSnapshot.build(height, state, self.chunk_size)
+        self._snapshots[height] = snapshot
+        self._snapshots.move_to_end(height)
+        while len(self._snapshots) > max(self.keep_recent, 1):
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    def list(self) -> List[Snapshot]:
+        """Get the headers of the available snapshots, most recent first."""
+        return [snapshot.header for snapshot in reversed(self._snapshots.values())]
+
+    def load_chunk(self, height: int, format_: int, index: int) -> bytes:
+        """
+        Load a chunk of a snapshot.
+
+        :param height: the height of the snapshot.
+        :param format_: the format of the snapshot.
+        :param index: the index of the chunk.
+        :return: the chunk, or empty bytes if it is not available.
+        """
+        snapshot = self._snapshots.get(height)
+        if (
+            format_ != SNAPSHOT_FORMAT
+            or snapshot is None
+            or not 0 <= index < len(snapshot.chunks)
+        ):
+            return b""
+        return snapshot.chunks[index]
+
+    def __len__(self) -> int:
+        """Get the number of snapshots kept."""
+        return len(self._snapshots)
+
+
+class SnapshotRestorer:
+    """The restoration of the ABCI app's state from a snapshot offered by Tendermint, chunk by chunk."""
+
+    def __init__(self) -> None:
+        """Initialize the restorer."""
+        self._snapshot: Optional[Snapshot] = None
+        self._app_hash = b""
+        self._chunk_hashes: List[str] = []
+        self._chunks: Dict[int, bytes] = {}
+
+    @property
+    def in_progress(self) -> bool:
+        """Check whether a snapshot is being restored."""
+        return self._snapshot is not None
+
+    def reset(self) -> None:
+        """Abandon the snapshot being restored, if any."""
+        self._snapshot = None
+        self._app_hash = b""
+        self._chunk_hashes = []
+        self._chunks = {}
+
+    def offer(self, snapshot: Snapshot, app_hash: bytes) -> ResultType:
+        """
+        Offer a snapshot to restore.
+
+        :param snapshot: the snapshot's header.
+        :param app_hash: the app hash which the restored state is expected to have, as verified by Tendermint.
+        :return: the result of the offer.
+        """
+        self.reset()
+        if snapshot.format_ != SNAPSHOT_FORMAT:
+            return ResultType.REJECT_FORMAT
+        try:
+            chunk_hashes = json.loads(snapshot.metadata.decode("utf-8"))
+        except ValueError:
+            return ResultType.REJECT
+        if (
+            not isinstance(chunk_hashes, list)
+            or len(chunk_hashes) != snapshot.chunks
+            or snapshot.chunks == 0
+        ):
+            return ResultType.REJECT
+        self._snapshot = snapshot
+        self._app_hash = app_hash
+        self._chunk_hashes = chunk_hashes
+        return ResultType.ACCEPT
+
+    def apply_chunk(
+        self, index: int, chunk: bytes
+    ) -> Tuple[ResultType, Tuple[int, ...], Optional[State]]:
+        """
+        Apply a chunk of the snapshot being restored.
+
+        :param index: the index of the chunk.
+        :param chunk: the chunk.
+        :return: the result of applying the chunk, the indexes of the chunks to refetch,
+            and the restored state, once all the chunks have been applied.
+        """
+        if self._snapshot is None:
+            return APPLY_CHUNK_ABORT, (), None
+        if (
+            not 0 <= index < len(self._chunk_hashes)
+            or _sha256(chunk).hex() != self._chunk_hashes[index]
+        ):
+            return APPLY_CHUNK_RETRY, (index,), None
+
+        self._chunks[index] = chunk
+        if len(self._chunks) < len(self._chunk_hashes):
+            return APPLY_CHUNK_ACCEPT, (), None
+
+        try:
+            state = self._assemble()
+        except SnapshotError:
+            self.reset()
+            return APPLY_CHUNK_REJECT_SNAPSHOT, (), None
+        self.reset()
+        return APPLY_CHUNK_ACCEPT, (), state
+
+    def _assemble(self) -> State:
+        """Assemble the chunks into the state, verifying it against the snapshot's hash and the expected app hash."""
+        snapshot = self._snapshot
+        if snapshot is None:  # pragma: nocover
+            raise SnapshotError("No snapshot is being restored.")
+        payload = b"".join(self._chunks[i] for i in range(len(self._chunk_hashes)))
+        if _sha256(payload) != snapshot.hash_:
+            raise SnapshotError("The snapshot's hash does not match its chunks.")
+        try:
+            state = json.loads(payload.decode("utf-8"))
+            serialized_db = state["db"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise SnapshotError(f"The snapshot could not be decoded: {e}") from e
+        # the app hash is the hash of the serialized database, see `AbciAppDB.hash`
+        if _sha256(serialized_db.encode("utf-8")) != self._app_hash:
+            raise SnapshotError("The snapshot's state does not match the app hash.")
+        return state
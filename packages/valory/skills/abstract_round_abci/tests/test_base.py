@@ -649,6 +649,14 @@ class TestAbciAppDB:
             f"by updating the item(s) retrieved via the `{mutable_getters}` method(s)!"
         )
 
+    def test_frozen_data(self) -> None:
+        """Test that the frozen data are not affected by the later updates."""
+        self.db.update(participants=("c",))
+        frozen = self.db.frozen_data()
+        assert frozen == {0: {"participants": (self.participants, ("c",))}}
+        self.db.update(participants=("d",))
+        assert frozen == {0: {"participants": (self.participants, ("c",))}}
+
     def test_increment_round_count(self) -> None:
         """Test increment_round_count."""
         assert self.db.round_count == -1
@@ -2892,6 +2900,26 @@ class TestRoundSequence:
                 == RoundSequence._BlockConstructionState.WAITING_FOR_BEGIN_BLOCK
             )
         assert self.round_sequence._blockchain.height == 0
+        assert self.round_sequence._period_start_heights == {}
+
+    @pytest.mark.parametrize(
+        "retain_periods, expected_height, expected_periods",
+        (
+            (0, 0, [1, 2, 3]),
+            (-1, 0, [1, 2, 3]),
+            (4, 0, [1, 2, 3]),
+            (3, 10, [1, 2, 3]),
+            (2, 20, [2, 3]),
+            (1, 30, [3]),
+        ),
+    )
+    def test_retain_height(
+        self, retain_periods: int, expected_height: int, expected_periods: List[int]
+    ) -> None:
+        """Test `retain_height` method."""
+        self.round_sequence._period_start_heights = {3: 30, 1: 10, 2: 20}
+        assert self.round_sequence.retain_height(retain_periods) == expected_height
+        assert sorted(self.round_sequence._period_start_heights) == expected_periods
 
     def last_round_values_updated(self, any_: bool = True) -> bool:
         """Check if the values for the last round-related attributes have been updated."""
@@ -2965,6 +2993,10 @@ class TestRoundSequence:
         process_event_mock.assert_called_with(
             end_block_res[-1], result=end_block_res[0]
         )
+        period_count = self.round_sequence.latest_synchronized_data.period_count
+        assert self.round_sequence._period_start_heights == {
+            period_count: self.round_sequence.height
+        }
 
         if slashing_enabled:
             store_offence_status_mock.assert_called_once()
@@ -3121,6 +3153,35 @@ class TestRoundSequence:
                         serialized_db_state,
                     )
 
+    def test_snapshot_and_restore_state(self) -> None:
+        """Test that the state of a round sequence can be restored from a state-sync snapshot."""
+        round_sequences = []
+        for _ in range(2):
+            round_sequence = RoundSequence(
+                context=MagicMock(), abci_app_cls=AbciAppTest
+            )
+            round_sequence.setup(
+                BaseSynchronizedData(AbciAppDB(setup_data={"test": [0]})),
+                logging.getLogger(),
+            )
+            round_sequences.append(round_sequence)
+        source, target = round_sequences
+        source.abci_app.synchronized_data.db.update(test=1)
+        source._last_round_transition_timestamp = datetime.datetime(2024, 1, 1)
+        source._last_round_transition_tm_height = 3
+        state = json.loads(json.dumps(source.snapshot_state()))
+
+        target.restore_state(state)
+        assert target.root_hash == source.root_hash
+        assert target.height == source.height
+        assert target.current_round_id == source.current_round_id
+        assert (
+            target.abci_app.synchronized_data.db.round_count
+            == source.abci_app.synchronized_data.db.round_count
+        )
+        assert target.last_round_transition_timestamp == datetime.datetime(2024, 1, 1)
+        assert target.last_round_transition_tm_height == 3
+
     def test_reset_to_default_params(self) -> None:
         """Tests _reset_to_default_params."""
         # we set some values to the parameters, to make sure that they are not "empty"
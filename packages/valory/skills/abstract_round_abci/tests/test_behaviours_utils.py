@@ -95,10 +95,12 @@ from packages.valory.skills.abstract_round_abci.behaviour_utils import (
     _MetaBaseBehaviour,
     make_degenerate_behaviour,
 )
+from packages.valory.skills.abstract_round_abci.io_.delta import SnapshotCache
 from packages.valory.skills.abstract_round_abci.io_.ipfs import (
     IPFSInteract,
     IPFSInteractionError,
 )
+from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
 from packages.valory.skills.abstract_round_abci.models import (
     SharedState,
     TendermintRecoveryParams,
@@ -106,6 +108,8 @@ from packages.valory.skills.abstract_round_abci.models import (
 from packages.valory.skills.abstract_round_abci.tests.conftest import profile_name
 
 
+# the hash of the file which stores `{"dummy": "content"}` as json, computed locally
+DUMMY_FILE_HASH = "QmcYjRTqhyf8P3cXTCy36NuMxEz7vizQHqNfRMafEyXNdK"
 _DEFAULT_REQUEST_TIMEOUT = 10.0
 _DEFAULT_REQUEST_RETRY_DELAY = 1.0
 _DEFAULT_TX_MAX_ATTEMPTS = 10
@@ -530,7 +534,11 @@ class TestBaseBehaviour:
             connection_id=str(IPFS_CONNECTION_ID)
         )
         self.context_mock.outbox = MagicMock(put_message=self.dummy_put_message)
-        self.context_mock.requests = MagicMock(request_id_to_callback={})
+        self.context_mock.requests = MagicMock(
+            request_id_to_callback={},
+            pending_ipfs_uploads=set(),
+            failed_ipfs_uploads=set(),
+        )
         self.context_mock.handlers.__dict__ = {"http": MagicMock()}
         self.behaviour = BehaviourATest(name="", skill_context=self.context_mock)
         self.behaviour.context.logger = logging  # type: ignore
@@ -630,8 +638,8 @@ class TestBaseBehaviour:
         [
             (
                 MagicMock(
-                    files={"dummy_file_name": "test"},
-                    performative=IpfsMessage.Performative.FILES,
+                    binary_files={"dummy_file_name": b"test"},
+                    performative=IpfsMessage.Performative.BINARY_FILES,
                 ),
                 "Retrieved 1 objects from ipfs.",
             ),
@@ -639,7 +647,7 @@ class TestBaseBehaviour:
                 MagicMock(
                     ipfs_hash="test", performative=IpfsMessage.Performative.ERROR
                 ),
-                f"Expected performative {IpfsMessage.Performative.FILES} but got {IpfsMessage.Performative.ERROR}.",
+                f"Expected performative {IpfsMessage.Performative.BINARY_FILES} but got {IpfsMessage.Performative.ERROR}.",
             ),
         ],
     )
@@ -685,6 +693,259 @@ class TestBaseBehaviour:
             try_send(generator)
             assert expected_logs in caplog.text
 
+    @pytest.mark.parametrize(
+        "ipfs_response, expected_log",
+        [
+            (
+                MagicMock(
+                    ipfs_hash=DUMMY_FILE_HASH,
+                    performative=IpfsMessage.Performative.IPFS_HASH,
+                ),
+                f"Confirmed the upload of the files with hash {DUMMY_FILE_HASH} to IPFS.",
+            ),
+            (
+                MagicMock(
+                    ipfs_hash="other", performative=IpfsMessage.Performative.IPFS_HASH
+                ),
+                "which differs from the precomputed hash",
+            ),
+            (
+                MagicMock(performative=IpfsMessage.Performative.ERROR),
+                f"Could not upload the files with hash {DUMMY_FILE_HASH} to IPFS",
+            ),
+        ],
+    )
+    def test_send_to_ipfs_in_background(
+        self,
+        caplog: LogCaptureFixture,
+        ipfs_response: IpfsMessage,
+        expected_log: str,
+    ) -> None:
+        """Test send_to_ipfs without waiting for the upload."""
+        requests = self.context_mock.requests
+        generator = self.behaviour.send_to_ipfs(
+            "dummy_filename",
+            {"dummy": "content"},
+            filetype=SupportedFiletype.JSON,
+            wait_for_upload=False,
+        )
+        with pytest.raises(StopIteration) as stop:
+            next(generator)
+        ipfs_hash = stop.value.value
+        assert ipfs_hash == DUMMY_FILE_HASH
+        assert requests.pending_ipfs_uploads == {ipfs_hash}
+
+        # reading the hash waits for the upload to be confirmed
+        get_response = MagicMock(performative=IpfsMessage.Performative.ERROR)
+        with mock.patch.object(
+            BaseBehaviour,
+            "_do_ipfs_request",
+            side_effect=mock_yield_and_return(get_response),
+        ) as do_req, caplog.at_level(logging.INFO):
+            get_generator = self.behaviour.get_from_ipfs(ipfs_hash)
+            next(get_generator)
+            next(get_generator)
+            do_req.assert_not_called()
+
+            (callback,) = requests.request_id_to_callback.values()
+            callback(ipfs_response, self.behaviour)
+            assert requests.pending_ipfs_uploads == set()
+            assert expected_log in caplog.text
+            with pytest.raises(StopIteration):
+                while True:
+                    next(get_generator)
+            do_req.assert_called_once()
+
+    def test_get_from_ipfs_upload_not_confirmed(
+        self, caplog: LogCaptureFixture
+    ) -> None:
+        """Test get_from_ipfs when the background upload of the hash is not confirmed in time."""
+        requests = self.context_mock.requests
+        requests.pending_ipfs_uploads.add(DUMMY_FILE_HASH)
+        with mock.patch.object(BaseBehaviour, "_do_ipfs_request") as do_req:
+            generator = self.behaviour.get_from_ipfs(DUMMY_FILE_HASH, timeout=0.05)
+            next(generator)
+            time.sleep(0.1)
+            with pytest.raises(StopIteration) as stop:
+                next(generator)
+            do_req.assert_not_called()
+        assert stop.value.value is None
+        assert requests.pending_ipfs_uploads == set()
+        assert (
+            f"The upload of {DUMMY_FILE_HASH} to IPFS was not confirmed within 0.05 seconds."
+            in caplog.text
+        )
+
+    @pytest.mark.parametrize(
+        ("ipfs_response", "expected_uploaded"),
+        [
+            (
+                MagicMock(
+                    ipfs_hash=DUMMY_FILE_HASH,
+                    performative=IpfsMessage.Performative.IPFS_HASH,
+                ),
+                True,
+            ),
+            (
+                MagicMock(
+                    ipfs_hash="other", performative=IpfsMessage.Performative.IPFS_HASH
+                ),
+                False,
+            ),
+            (MagicMock(performative=IpfsMessage.Performative.ERROR), False),
+        ],
+    )
+    def test_wait_for_ipfs_upload(
+        self, ipfs_response: IpfsMessage, expected_uploaded: bool
+    ) -> None:
+        """Test waiting for a background upload, and checking whether it succeeded."""
+        requests = self.context_mock.requests
+        generator = self.behaviour.send_to_ipfs(
+            "dummy_filename",
+            {"dummy": "content"},
+            filetype=SupportedFiletype.JSON,
+            wait_for_upload=False,
+        )
+        with pytest.raises(StopIteration):
+            next(generator)
+
+        wait_generator = self.behaviour.wait_for_ipfs_upload(DUMMY_FILE_HASH)
+        next(wait_generator)
+        (callback,) = requests.request_id_to_callback.values()
+        callback(ipfs_response, self.behaviour)
+        with pytest.raises(StopIteration) as stop:
+            next(wait_generator)
+        assert stop.value.value is expected_uploaded
+        assert (
+            DUMMY_FILE_HASH in requests.failed_ipfs_uploads
+        ) is not expected_uploaded
+
+        # storing the files again clears the failure
+        store_response = MagicMock(
+            ipfs_hash=DUMMY_FILE_HASH, performative=IpfsMessage.Performative.IPFS_HASH
+        )
+        with mock.patch.object(
+            BaseBehaviour,
+            "_do_ipfs_request",
+            side_effect=mock_yield_and_return(store_response),
+        ):
+            generator = self.behaviour.send_to_ipfs(
+                "dummy_filename", {"dummy": "content"}, filetype=SupportedFiletype.JSON
+            )
+            with pytest.raises(StopIteration):
+                while True:
+                    next(generator)
+        wait_generator = self.behaviour.wait_for_ipfs_upload(DUMMY_FILE_HASH)
+        with pytest.raises(StopIteration) as stop:
+            next(wait_generator)
+        assert stop.value.value is True
+
+    def test_wait_for_ipfs_upload_not_confirmed(self) -> None:
+        """Test that a background upload which is not confirmed in time is considered failed."""
+        requests = self.context_mock.requests
+        requests.pending_ipfs_uploads.add(DUMMY_FILE_HASH)
+        generator = self.behaviour.wait_for_ipfs_upload(DUMMY_FILE_HASH, timeout=0.05)
+        next(generator)
+        time.sleep(0.1)
+        with pytest.raises(StopIteration) as stop:
+            next(generator)
+        assert stop.value.value is False
+        assert requests.failed_ipfs_uploads == {DUMMY_FILE_HASH}
+
+    def test_ipfs_snapshots(self, caplog: LogCaptureFixture) -> None:
+        """Test sending snapshots as deltas and reconstructing them."""
+        uploads: Dict[str, Any] = {}
+
+        def dummy_send_to_ipfs(
+            filename: str, obj: Any, **_: Any
+        ) -> Generator[None, None, Optional[str]]:
+            """A dummy method to be used in mocks."""
+            ipfs_hash = f"hash_{len(uploads)}"
+            uploads[ipfs_hash] = json.loads(json.dumps(obj))
+            return ipfs_hash
+            yield
+
+        def dummy_get_from_ipfs(
+            ipfs_hash: str, *_: Any, **__: Any
+        ) -> Generator[None, None, Optional[Any]]:
+            """A dummy method to be used in mocks."""
+            return uploads.get(ipfs_hash)
+            yield
+
+        self.context_mock.state.ipfs_snapshots = SnapshotCache()
+        proposals = [[i, f"0x{i}", 10 * i, False] for i in range(5)]
+        hashes: List[Optional[str]] = [None]
+        with mock.patch.object(
+            BaseBehaviour, "send_to_ipfs", side_effect=dummy_send_to_ipfs
+        ), mock.patch.object(
+            BaseBehaviour, "get_from_ipfs", side_effect=dummy_get_from_ipfs
+        ) as get_from_ipfs:
+            for period in range(4):
+                proposals[period][3] = True
+                generator = self.behaviour.send_snapshot_to_ipfs(
+                    "proposals.json",
+                    {"proposals": proposals},
+                    hashes[-1],
+                    checkpoint_interval=3,
+                )
+                with pytest.raises(StopIteration) as stop:
+                    next(generator)
+                hashes.append(stop.value.value)
+
+            # the snapshots of the previous periods were cached, so nothing is downloaded
+            get_from_ipfs.assert_not_called()
+            assert [uploads[h]["depth"] for h in hashes[1:]] == [0, 1, 2, 0]
+            assert uploads["hash_1"]["delta"] == {
+                "dict": {
+                    "proposals": {
+                        "list": {"1": {"list": {"3": {"set": True}}, "length": 4}},
+                        "length": 5,
+                    }
+                },
+                "removed": [],
+            }
+
+            # a reader without a cache reconstructs the snapshot from the checkpoint and the deltas
+            self.context_mock.state.ipfs_snapshots = SnapshotCache()
+            generator = self.behaviour.get_snapshot_from_ipfs("hash_2")
+            with pytest.raises(StopIteration) as stop, caplog.at_level(logging.INFO):
+                next(generator)
+            expected = {"proposals": [[i, f"0x{i}", 10 * i, i < 3] for i in range(5)]}
+            assert stop.value.value == expected
+            assert get_from_ipfs.call_count == 3
+            assert "by applying 2 deltas" in caplog.text
+
+            # the following snapshots are reconstructed from the cache
+            uploads["hash_4"] = {"depth": 3, "base": "hash_2", "delta": {"set": 0}}
+            generator = self.behaviour.get_snapshot_from_ipfs("hash_4")
+            with pytest.raises(StopIteration) as stop:
+                next(generator)
+            assert stop.value.value == 0
+            assert get_from_ipfs.call_count == 4
+
+            with caplog.at_level(logging.ERROR):
+                generator = self.behaviour.get_snapshot_from_ipfs("unknown")
+                with pytest.raises(StopIteration) as stop:
+                    next(generator)
+                assert stop.value.value is None
+                assert "Could not get the snapshot with hash unknown" in caplog.text
+
+                # a delta without a base is rejected
+                uploads["malformed"] = {"depth": 1, "delta": {"set": 0}}
+                generator = self.behaviour.get_snapshot_from_ipfs("malformed")
+                with pytest.raises(StopIteration) as stop:
+                    next(generator)
+                assert stop.value.value is None
+                assert "Invalid delta snapshot" in caplog.text
+
+                # the snapshot is sent as a checkpoint if the previous one cannot be reconstructed
+                generator = self.behaviour.send_snapshot_to_ipfs(
+                    "proposals.json", {"proposals": proposals}, "unknown"
+                )
+                with pytest.raises(StopIteration) as stop:
+                    next(generator)
+                assert uploads[stop.value.value]["data"] == {"proposals": proposals}
+
     def test_params_property(self) -> None:
         """Test the 'params' property."""
         assert self.behaviour.params == self.context_params_mock
@@ -2117,7 +2378,7 @@ class TestBaseBehaviour:
                 {"result": {"sync_info": {"latest_block_height": 1}}},
                 1,
                 False,
-                3,
+                2,
                 True,
             ),
             (
@@ -2137,7 +2398,7 @@ class TestBaseBehaviour:
                 {"result": {"sync_info": {"latest_block_height": 1}}},
                 1,
                 False,
-                3,
+                2,
                 True,
             ),
             (
@@ -2197,19 +2458,18 @@ class TestBaseBehaviour:
         period_count_mock = MagicMock()
         self.context_state_synchronized_data_mock.period_count = period_count_mock
         self.behaviour.params.reset_pause_duration = 1
+        self.behaviour.params.tendermint_ready_poll_interval = 0.2
         with mock.patch.object(
             BaseBehaviour, "_is_timeout_expired", return_value=False
-        ), mock.patch.object(
-            BaseBehaviour,
-            "wait_from_last_timestamp",
-            new_callable=lambda *_: dummy_generator_wrapper(),
         ), mock.patch.object(
             BaseBehaviour, "_do_request", new_callable=lambda *_: dummy_do_request
         ), mock.patch.object(
             BaseBehaviour, "_get_status", new_callable=lambda *_: dummy_get_status
         ), mock.patch.object(
-            BaseBehaviour, "sleep", new_callable=lambda *_: dummy_generator_wrapper()
-        ):
+            BaseBehaviour, "sleep", side_effect=dummy_generator_wrapper()
+        ) as sleep_mock, mock.patch.object(
+            self.behaviour.context.logger, "info"
+        ) as info_mock:
             self.behaviour.context.state.round_sequence.height = local_height
             reset = self.behaviour.reset_tendermint_with_wait(on_startup=on_startup)
             for _ in range(n_iter):
@@ -2264,6 +2524,17 @@ class TestBaseBehaviour:
                         == self.behaviour.matching_round.auto_round_id()
                     )
                     assert not self.behaviour._is_healthy
+                    # the node is not waited for with a fixed sleep, and the durations of the reset are logged
+                    sleep_mock.assert_not_called()
+                    assert any(
+                        call.args[0].startswith(
+                            "Tendermint reset durations (s): reset="
+                        )
+                        for call in info_mock.call_args_list
+                    )
+                elif should_be_healthy:
+                    # the node is polled until it is ready
+                    sleep_mock.assert_called_once_with(0.2)
             else:
                 pytest.fail("`reset_tendermint_with_wait` did not finish!")
 
@@ -2660,7 +2931,7 @@ class TestIPFSBehaviour:
     def test_build_ipfs_store_file_req(self) -> None:
         """Tests _build_ipfs_store_file_req."""
         with mock.patch.object(
-            IPFSInteract, "store", return_value=MagicMock()
+            IPFSInteract, "store_bytes", return_value=MagicMock()
         ) as mock_store:
             res = self.behaviour._build_ipfs_store_file_req("dummy_filename", {})
             mock_store.assert_called()
@@ -2674,7 +2945,7 @@ class TestIPFSBehaviour:
     def test_deserialize_ipfs_objects(self) -> None:
         """Tests _deserialize_ipfs_objects"""
         with mock.patch.object(
-            IPFSInteract, "load", return_value=MagicMock()
+            IPFSInteract, "load_bytes", return_value=MagicMock()
         ) as mock_load:
             res = self.behaviour._deserialize_ipfs_objects({})
             mock_load.assert_called()
@@ -21,11 +21,12 @@
 
 # pylint: skip-file
 
+import hashlib
 import json
 import logging
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, cast
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -42,6 +43,8 @@ from packages.valory.protocols.abci.custom_types import (
     Evidences,
     Header,
     LastCommitInfo,
+    ResultType,
+    SnapShots,
     Timestamp,
     ValidatorUpdates,
 )
@@ -70,6 +73,12 @@ from packages.valory.skills.abstract_round_abci.handlers import (
     exception_to_info_msg,
 )
 from packages.valory.skills.abstract_round_abci.models import TendermintRecoveryParams
+from packages.valory.skills.abstract_round_abci.query import StateView
+from packages.valory.skills.abstract_round_abci.snapshots import (
+    SNAPSHOT_FORMAT,
+    SnapshotRestorer,
+    SnapshotStore,
+)
 from packages.valory.skills.abstract_round_abci.test_tools.rounds import DummyRound
 
 
@@ -91,6 +100,7 @@ class TestABCIRoundHandler:
         self.handler = ABCIRoundHandler(name="", skill_context=self.context)
         self.context.state.round_sequence.height = 0
         self.context.state.round_sequence.root_hash = b"root_hash"
+        self.context.state.round_sequence.retain_height.return_value = 0
         self.context.state.round_sequence.last_round_transition_timestamp = (
             datetime.now()
         )
@@ -289,6 +299,196 @@ class TestABCIRoundHandler:
                 cast(AbciMessage, message), cast(AbciDialogue, dialogue)
             )
 
+    @pytest.mark.parametrize("transition_height, taken", ((5, True), (4, False)))
+    def test_commit_takes_snapshot(self, transition_height: int, taken: bool) -> None:
+        """Test that the 'commit' handler method takes a snapshot at a round transition, when one is due."""
+        self.context.state.abci_snapshots = SnapshotStore(interval=5)
+        self.context.state.round_sequence.height = 5
+        self.context.state.round_sequence.last_round_transition_height = (
+            transition_height
+        )
+        self.context.state.round_sequence.snapshot_state.return_value = {"db": "{}"}
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_COMMIT,
+        )
+        self.handler.commit(cast(AbciMessage, message), cast(AbciDialogue, dialogue))
+        assert len(self.context.state.abci_snapshots) == int(taken)
+
+    @pytest.mark.parametrize(
+        "snapshot_interval, snapshot_height, expected",
+        ((0, None, 20), (5, None, 0), (5, 15, 15), (5, 25, 20)),
+    )
+    def test_commit_retain_height(
+        self,
+        snapshot_interval: int,
+        snapshot_height: Optional[int],
+        expected: int,
+    ) -> None:
+        """Test that the 'commit' handler method lets Tendermint prune the blocks which are not needed anymore."""
+        self.context.params.tendermint_retain_periods = 2
+        self.context.state.round_sequence.retain_height.return_value = 20
+        self.context.state.abci_snapshots = SnapshotStore(interval=snapshot_interval)
+        if snapshot_height is not None:
+            self.context.state.abci_snapshots.take(snapshot_height, {"db": "{}"})
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_COMMIT,
+        )
+        response = self.handler.commit(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        self.context.state.round_sequence.retain_height.assert_called_once_with(2)
+        assert response.retain_height == expected
+
+    def test_commit_updates_state_view(self) -> None:
+        """Test that the 'commit' handler method takes a view of the committed state."""
+        self.context.state.round_sequence.height = 5
+        self.context.state.round_sequence.latest_synchronized_data.db.frozen_data.return_value = {
+            0: {"key": ("value",)}
+        }
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_COMMIT,
+        )
+        self.handler.commit(cast(AbciMessage, message), cast(AbciDialogue, dialogue))
+        state_view = self.context.state.state_view
+        assert isinstance(state_view, StateView)
+        assert state_view.height == 5
+        assert state_view.query("/db/latest/key") == b'"value"'
+
+    @pytest.mark.parametrize(
+        "has_view, height, path, expected_code, expected_value",
+        (
+            (False, 0, "/db/latest/key", ERROR_CODE, b""),
+            (True, 0, "/db/latest/key", OK_CODE, b'"value"'),
+            (True, 5, "/db/history/key", OK_CODE, b'["value"]'),
+            (True, 4, "/db/latest/key", ERROR_CODE, b""),
+            (True, 0, "/db/latest/other", ERROR_CODE, b""),
+        ),
+    )
+    def test_query(
+        self,
+        has_view: bool,
+        height: int,
+        path: str,
+        expected_code: int,
+        expected_value: bytes,
+    ) -> None:
+        """Test the 'query' handler method."""
+        self.context.state.state_view = (
+            StateView(5, 1, "round", {0: {"key": ("value",)}}) if has_view else None
+        )
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_QUERY,
+            query_data=b"",
+            path=path,
+            height=height,
+            prove=False,
+        )
+        response = self.handler.query(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        assert response.performative == AbciMessage.Performative.RESPONSE_QUERY
+        assert response.code == expected_code
+        assert response.value == expected_value
+        assert response.key == path.encode("utf-8")
+        assert bool(response.log) == (expected_code == ERROR_CODE)
+
+    def test_serve_snapshot(self) -> None:
+        """Test the 'list_snapshots' and 'load_snapshot_chunk' handler methods."""
+        store = SnapshotStore(interval=1, chunk_size=4)
+        snapshot = store.take(5, {"db": "{}"})
+        self.context.state.abci_snapshots = store
+
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_LIST_SNAPSHOTS,
+        )
+        response = self.handler.list_snapshots(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        assert response.performative == AbciMessage.Performative.RESPONSE_LIST_SNAPSHOTS
+        assert response.snapshots == SnapShots([snapshot.header])
+
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_LOAD_SNAPSHOT_CHUNK,
+            height=5,
+            format=SNAPSHOT_FORMAT,
+            chunk_index=1,
+        )
+        response = self.handler.load_snapshot_chunk(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        assert (
+            response.performative
+            == AbciMessage.Performative.RESPONSE_LOAD_SNAPSHOT_CHUNK
+        )
+        assert response.chunk == snapshot.chunks[1]
+
+    @pytest.mark.parametrize("restore_error", (None, ABCIAppInternalError("error")))
+    def test_restore_snapshot(self, restore_error: Any) -> None:
+        """Test the 'offer_snapshot' and 'apply_snapshot_chunk' handler methods."""
+        state = {"height": 5, "db": "{}"}
+        snapshot = SnapshotStore(interval=1, chunk_size=4).take(5, state)
+        self.context.state.snapshot_restorer = SnapshotRestorer()
+        restore_state = self.context.state.round_sequence.restore_state
+        restore_state.side_effect = restore_error
+
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_OFFER_SNAPSHOT,
+            snapshot=snapshot.header,
+            app_hash=hashlib.sha256(b"{}").digest(),
+        )
+        response = self.handler.offer_snapshot(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        assert response.performative == AbciMessage.Performative.RESPONSE_OFFER_SNAPSHOT
+        assert response.result.result_type == ResultType.ACCEPT
+
+        for index, chunk in enumerate(snapshot.chunks):
+            restore_state.assert_not_called()
+            message, dialogue = self.dialogues.create(
+                counterparty="",
+                performative=AbciMessage.Performative.REQUEST_APPLY_SNAPSHOT_CHUNK,
+                index=index,
+                chunk=chunk,
+                chunk_sender="sender",
+            )
+            response = self.handler.apply_snapshot_chunk(
+                cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+            )
+            assert (
+                response.performative
+                == AbciMessage.Performative.RESPONSE_APPLY_SNAPSHOT_CHUNK
+            )
+        restore_state.assert_called_once_with(state)
+        expected = (
+            ResultType.ACCEPT if restore_error is None else ResultType.REJECT_SENDER
+        )
+        assert response.result.result_type == expected
+
+    def test_apply_corrupted_snapshot_chunk(self) -> None:
+        """Test that the 'apply_snapshot_chunk' handler method refetches corrupted chunks and rejects their sender."""
+        snapshot = SnapshotStore(interval=1, chunk_size=4).take(5, {"db": "{}"})
+        self.context.state.snapshot_restorer = SnapshotRestorer()
+        self.context.state.snapshot_restorer.offer(snapshot.header, b"")
+        message, dialogue = self.dialogues.create(
+            counterparty="",
+            performative=AbciMessage.Performative.REQUEST_APPLY_SNAPSHOT_CHUNK,
+            index=0,
+            chunk=b"corrupted",
+            chunk_sender="sender",
+        )
+        response = self.handler.apply_snapshot_chunk(
+            cast(AbciMessage, message), cast(AbciDialogue, dialogue)
+        )
+        assert response.refetch_chunks == (0,)
+        assert response.reject_senders == ("sender",)
+
 
 class ConcreteResponseHandler(AbstractResponseHandler):
     """A concrete response handler for testing purposes."""
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the delta snapshots of abstract round abci."""
+
+# pylint: skip-file
+
+from typing import Any
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.io_.delta import (
+    SnapshotCache,
+    apply_delta,
+    build_snapshot,
+    compute_delta,
+    is_checkpoint,
+)
+
+
+@pytest.mark.parametrize(
+    "base, new",
+    (
+        ({"a": 1, "b": [1, 2]}, {"a": 1, "b": [1, 3, 4], "c": {"d": None}}),
+        ({"a": [[1, False], [2, False]]}, {"a": [[1, True]]}),
+        ({"a": 1, "b": 2}, {"b": 2}),
+        ([1, {"a": 1}], {"a": 1}),
+        ("a", "a"),
+    ),
+)
+def test_compute_and_apply_delta(base: Any, new: Any) -> None:
+    """Test that applying a delta to its base gives the new object."""
+    delta = compute_delta(base, new)
+    assert apply_delta(base, delta) == new
+
+
+def test_compute_delta_only_contains_changes() -> None:
+    """Test that the delta of a list of records only contains the changed fields."""
+    base = [[i, False] for i in range(100)]
+    new = [[i, i == 50] for i in range(101)]
+    delta = compute_delta(base, new)
+    assert delta == {
+        "list": {
+            "50": {"list": {"1": {"set": True}}, "length": 2},
+            "100": {"set": [100, False]},
+        },
+        "length": 101,
+    }
+
+
+@pytest.mark.parametrize(
+    "base, delta, match",
+    (
+        ([], {"dict": {}, "removed": []}, "Cannot apply a dictionary delta"),
+        ({}, {"list": {}, "length": 0}, "Cannot apply a list delta"),
+        ({}, {"unknown": None}, "Invalid delta"),
+    ),
+)
+def test_apply_delta_fails(base: Any, delta: Any, match: str) -> None:
+    """Test that invalid deltas are rejected."""
+    with pytest.raises(ValueError, match=match):
+        apply_delta(base, delta)
+
+
+def test_build_snapshot() -> None:
+    """Test building checkpoints and deltas."""
+    assert build_snapshot([1]) == (0, {"depth": 0, "base": None, "data": [1]})
+    depth, snapshot = build_snapshot([1, 2], "hash", (0, [1]), checkpoint_interval=2)
+    assert depth == 1
+    assert snapshot == {
+        "depth": 1,
+        "base": "hash",
+        "delta": {"list": {"1": {"set": 2}}, "length": 2},
+    }
+    assert not is_checkpoint(snapshot)
+    depth, snapshot = build_snapshot([1, 2], "hash", (1, [1]), checkpoint_interval=2)
+    assert depth == 0
+    assert is_checkpoint(snapshot)
+    with pytest.raises(ValueError, match="Invalid snapshot"):
+        is_checkpoint({"data": []})
+    with pytest.raises(ValueError, match="Invalid delta snapshot"):
+        is_checkpoint({"depth": 1, "delta": {}})
+    with pytest.raises(ValueError, match="Invalid delta snapshot"):
+        is_checkpoint({"depth": 1, "base": "hash"})
+
+
+def test_snapshot_cache() -> None:
+    """Test that the snapshot cache evicts the least recently used snapshots and returns copies."""
+    cache = SnapshotCache(max_size=2)
+    obj = {"a": [1]}
+    cache.put("hash_1", 0, obj)
+    obj["a"].append(2)
+    cache.put("hash_2", 1, obj)
+    assert cache.get("hash_1") == (0, {"a": [1]})
+    cache.put("hash_3", 2, obj)
+    assert "hash_2" not in cache
+    assert len(cache) == 2
+    _, cached = cache.get("hash_3")
+    cached["a"].clear()
+    assert cache.get("hash_3") == (2, {"a": [1, 2]})
+    assert cache.get("hash_2") is None
@@ -27,10 +27,12 @@ from typing import Any, Dict, cast
 from unittest import mock
 
 import pytest
+from aea.helpers.ipfs.base import IPFSHashOnly
 
 from packages.valory.skills.abstract_round_abci.io_.ipfs import (
     IPFSInteract,
     IPFSInteractionError,
+    get_ipfs_hash,
 )
 from packages.valory.skills.abstract_round_abci.io_.load import AbstractLoader
 from packages.valory.skills.abstract_round_abci.io_.store import (
@@ -42,6 +44,12 @@ from packages.valory.skills.abstract_round_abci.io_.store import (
 
 use_ipfs_daemon = pytest.mark.usefixtures("ipfs_daemon")
 
+FILETYPE_DEPENDENCIES = {
+    SupportedFiletype.MSGPACK: "msgpack",
+    SupportedFiletype.ZSTD_JSON: "zstandard",
+    SupportedFiletype.PARQUET: "pyarrow",
+}
+
 
 class TestIPFSInteract:
     """Test `IPFSInteract`."""
@@ -86,6 +94,62 @@ class TestIPFSInteract:
 
         assert actual_objects == expected_objects
 
+    @pytest.mark.parametrize("filetype", tuple(SupportedFiletype))
+    def test_store_and_load_filetypes(
+        self, filetype: SupportedFiletype, tmp_path: PosixPath
+    ) -> None:
+        """Test that the objects are stored and loaded back with every filetype."""
+        if filetype in FILETYPE_DEPENDENCIES:
+            pytest.importorskip(FILETYPE_DEPENDENCIES[filetype])
+        records = [
+            {"proposal_id": i, "amount": 10**17 * i, "executed": i % 2 == 0}
+            for i in range(10)
+        ]
+        filepath = str(tmp_path / "records")
+        serialized_objects = self.ipfs_interact.store(
+            filepath, records, False, filetype
+        )
+        assert self.ipfs_interact.load(serialized_objects, filetype) == records
+
+    @pytest.mark.parametrize("filetype", tuple(SupportedFiletype))
+    @pytest.mark.parametrize("multiple", (True, False))
+    def test_store_and_load_bytes(
+        self, filetype: SupportedFiletype, multiple: bool, tmp_path: PosixPath
+    ) -> None:
+        """Test that the objects are stored and loaded back as bytes, without encoding them as text."""
+        if filetype in FILETYPE_DEPENDENCIES:
+            pytest.importorskip(FILETYPE_DEPENDENCIES[filetype])
+        records = [{"proposal_id": i, "executed": i % 2 == 0} for i in range(10)]
+        obj: Any = {"a.bin": records, "b.bin": records} if multiple else records
+        filepath = str(tmp_path / "records")
+        serialized_objects = self.ipfs_interact.store_bytes(
+            filepath, obj, multiple, filetype
+        )
+        as_text = self.ipfs_interact.store(filepath, obj, multiple, filetype)
+        assert all(isinstance(data, bytes) for data in serialized_objects.values())
+        if filetype in FILETYPE_DEPENDENCIES:
+            # the binary files are not base64-encoded
+            assert sum(map(len, serialized_objects.values())) < sum(
+                map(len, as_text.values())
+            )
+        else:
+            assert get_ipfs_hash(serialized_objects) == get_ipfs_hash(as_text)
+        loaded = self.ipfs_interact.load_bytes(serialized_objects, filetype)
+        if multiple:
+            loaded = {os.path.basename(k): v for k, v in cast(dict, loaded).items()}
+        assert loaded == obj
+
+    def test_store_bytes_fails(self) -> None:
+        """Tests when "store_bytes" and "load_bytes" fail."""
+        with pytest.raises(IPFSInteractionError):
+            self.ipfs_interact.store_bytes(
+                "dummy_file", {1, 2}, False, SupportedFiletype.JSON  # type: ignore
+            )
+        with pytest.raises(IPFSInteractionError):
+            self.ipfs_interact.load_bytes(
+                {"dummy_file": b"\xff"}, SupportedFiletype.JSON
+            )
+
     def test_store_fails(self, dummy_multiple_obj: Dict[str, StoredJSONType]) -> None:
         """Tests when "store" fails."""
         dummy_filepath = "dummy_dir"
@@ -108,3 +172,46 @@ class TestIPFSInteract:
             side_effect=ValueError,
         ), pytest.raises(IPFSInteractionError):
             self.ipfs_interact.load(dummy_object)
+
+
+@pytest.mark.parametrize(
+    "serialized_objects, expected_hash",
+    (
+        (
+            {"dummy_filename": "dummy_content"},
+            "QmYn1qHyFMDdVxYcwseLBdooLAyc3orNBH8vvj4iPTXd4R",
+        ),
+        (
+            {
+                "dummy_dir/dummy_filename1": "dummy_content",
+                "dummy_dir/dummy_filename2": "dummy_content",
+            },
+            "QmRP7wK1NZKwno9CFxQUeFaJip5eaaLBo1v8WFtyECgLCz",
+        ),
+    ),
+)
+def test_get_ipfs_hash(serialized_objects: Dict[str, str], expected_hash: str) -> None:
+    """Test that the locally computed hash matches the one returned by an IPFS node."""
+    assert get_ipfs_hash(serialized_objects) == expected_hash
+
+
+def test_get_ipfs_hash_chunked_file(tmp_path: PosixPath) -> None:
+    """Test the hash of a file which is split in several chunks."""
+    data = "".join(str(i) for i in range(100_000))
+    path = tmp_path / "big_file.json"
+    path.write_text(data)
+    expected_hash = IPFSHashOnly.get(str(path), wrap=True, cid_v1=False)
+    assert get_ipfs_hash({str(path): data}) == expected_hash
+
+
+@pytest.mark.parametrize(
+    "serialized_objects, error",
+    (
+        ({}, "No files were present."),
+        ({"dir_1/file": "", "dir_2/file": ""}, "Received files from different dirs"),
+    ),
+)
+def test_get_ipfs_hash_fails(serialized_objects: Dict[str, str], error: str) -> None:
+    """Test that the hash cannot be computed for invalid files."""
+    with pytest.raises(IPFSInteractionError, match=error):
+        get_ipfs_hash(serialized_objects)
@@ -112,3 +112,11 @@ class TestLoader:
         }
         actual_objects = self.json_loader.load(serialized_objects)
         assert expected_objects == actual_objects
+
+    @pytest.mark.parametrize(
+        "filetype", (SupportedFiletype.MSGPACK, SupportedFiletype.ZSTD_JSON)
+    )
+    def test_load_invalid_binary(self, filetype: SupportedFiletype) -> None:
+        """Test `load` when a binary file is not base64-encoded."""
+        with pytest.raises(IOError, match="The file could not be decoded"):
+            Loader(filetype, None).load({"test": "not base64!"})
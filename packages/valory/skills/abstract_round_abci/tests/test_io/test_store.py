@@ -24,6 +24,7 @@
 import json
 from pathlib import Path, PosixPath
 from typing import Optional, cast
+from unittest import mock
 
 import pytest
 
@@ -33,6 +34,7 @@ from packages.valory.skills.abstract_round_abci.io_.store import (
     Storer,
     SupportedFiletype,
     SupportedStorerType,
+    import_optional_dependency,
 )
 
 
@@ -102,3 +104,28 @@ class TestStorer:
         expected_object = {expected_path: json.dumps(dummy_object, indent=4)}
         actual_object = self.json_storer.store({dummy_filename: dummy_object}, True)
         assert expected_object == actual_object
+
+    def test_store_compact_json(self) -> None:
+        """Test `store` with the compact JSON filetype."""
+        dummy_object = {"test": ["test", 1]}
+        storer = Storer(SupportedFiletype.COMPACT_JSON, None, self.path)
+        actual_object = storer.store(dummy_object, False)
+        assert actual_object == {self.path: '{"test":["test",1]}'}
+
+    def test_store_parquet_not_records(self) -> None:
+        """Test that only lists of records can be stored as parquet files."""
+        pytest.importorskip("pyarrow")
+        storer = Storer(SupportedFiletype.PARQUET, None, self.path)
+        with pytest.raises(ValueError, match="cannot be used with a <class 'dict'>"):
+            storer.store({"test": "test"}, False)
+        with pytest.raises(IOError, match="Only lists of records"):
+            storer.store([1, 2], False)
+
+
+def test_import_optional_dependency() -> None:
+    """Test that a missing optional dependency is reported with its filetype."""
+    with mock.patch("importlib.import_module", side_effect=ImportError), pytest.raises(
+        ImportError,
+        match="The PARQUET filetype requires `pyarrow`, please install it",
+    ):
+        import_optional_dependency("pyarrow.parquet", SupportedFiletype.PARQUET)
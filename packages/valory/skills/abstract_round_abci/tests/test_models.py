@@ -215,6 +215,32 @@ class TestApiSpecsModel:
         assert all([key in specs for key in actual_specs.keys()])
         assert all([specs[key] == actual_specs[key] for key in actual_specs])
 
+    def test_get_spec_with_cache_ttl(
+        self,
+    ) -> None:
+        """Test that `get_spec` opts in to the response cache when `cache_ttl` is set."""
+
+        api_specs = ApiSpecs(**BASE_DUMMY_SPECS_CONFIG, cache_ttl=30)
+        specs = api_specs.get_spec()
+        assert specs["headers"] == {
+            "Dummy-Header": "dummy_value",
+            "Cache-Control": "max-age=30",
+        }
+        assert api_specs.headers == {"Dummy-Header": "dummy_value"}
+
+    @pytest.mark.parametrize(
+        "cache_ttl, expected_error",
+        (
+            ("30", "'cache_ttl' must be a typing.Optional[int]"),
+            (1.5, "'cache_ttl' must be a typing.Optional[int]"),
+            (-1, "'cache_ttl' must be non-negative, but -1 was found"),
+        ),
+    )
+    def test_invalid_cache_ttl(self, cache_ttl: Any, expected_error: str) -> None:
+        """Test that an invalid `cache_ttl` is rejected."""
+        with pytest.raises(AEAEnforceError, match=re.escape(expected_error)):
+            ApiSpecs(**BASE_DUMMY_SPECS_CONFIG, cache_ttl=cache_ttl)
+
     @pytest.mark.parametrize(
         "api_specs_config, message, expected_res, expected_error",
         (
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the ABCI queries of the abstract_round_abci skill."""
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.base import AbciAppDB
+from packages.valory.skills.abstract_round_abci.query import QueryError, StateView
+
+
+class TestStateView:
+    """Test `StateView`."""
+
+    def setup(self) -> None:
+        """Set up the tests."""
+        self.db = AbciAppDB(
+            setup_data={
+                "all_participants": [("a", "b")],
+                "participants": [("a", "b")],
+                "consensus_threshold": [2],
+                "safe_contract_address": ["0x0"],
+            }
+        )
+        self.db.update(most_voted="x")
+        self.db.create(participants=("a", "b", "c"))
+        self.db.update(most_voted="y")
+        self.db.update(most_voted="z")
+        self.db.increment_round_count()
+        round_sequence = MagicMock(height=7, current_round_id="round")
+        round_sequence.latest_synchronized_data.db = self.db
+        self.view = StateView.from_round_sequence(round_sequence)
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        (
+            (
+                "/round",
+                {
+                    "height": 7,
+                    "period": 1,
+                    "round_count": 0,
+                    "current_round_id": "round",
+                },
+            ),
+            (
+                "/db/keys",
+                [
+                    "all_participants",
+                    "consensus_threshold",
+                    "most_voted",
+                    "participants",
+                    "safe_contract_address",
+                ],
+            ),
+            ("/db/latest/most_voted", "z"),
+            ("db/latest/most_voted/", "z"),
+            ("/db/history/most_voted", ["y", "z"]),
+            ("/db/period/0/latest/most_voted", "x"),
+            ("/db/period/0/history/participants", [["a", "b"]]),
+            ("/db/period/1/latest/participants", ["a", "b", "c"]),
+        ),
+    )
+    def test_query(self, path: str, expected: Any) -> None:
+        """Test the supported queries."""
+        assert json.loads(self.view.query(path)) == expected
+
+    @pytest.mark.parametrize(
+        "path, match",
+        (
+            ("", "Unsupported query path"),
+            ("/store/key", "Unsupported query path"),
+            ("/db", "Unsupported query path"),
+            ("/db/latest", "Unsupported query path"),
+            ("/db/oldest/most_voted", "Unsupported query path"),
+            ("/db/latest/unknown", "Key 'unknown' is not set"),
+            ("/db/period/x/keys", "Invalid period"),
+            ("/db/period", "Invalid period"),
+            ("/db/period/5/keys", "Period 5 is not available"),
+        ),
+    )
+    def test_query_errors(self, path: str, match: str) -> None:
+        """Test that the unsupported queries raise."""
+        with pytest.raises(QueryError, match=match):
+            self.view.query(path)
+
+    def test_immutable(self) -> None:
+        """Test that the view is not affected by the later updates of the db."""
+        self.db.update(most_voted="w")
+        self.db.create(participants=("d",))
+        self.db.cleanup(1)
+        assert json.loads(self.view.query("/db/history/most_voted")) == ["y", "z"]
+        assert json.loads(self.view.query("/db/period/0/latest/most_voted")) == "x"
+
+    def test_cache(self) -> None:
+        """Test that the results are cached, up to the cache size."""
+        view = StateView(1, 0, None, {0: {"a": (1,), "b": (2,)}}, cache_size=1)
+        assert view.query("/db/latest/a") == b"1"
+        assert view.query("/db/latest/b") == b"2"
+        assert view._results == {"/db/latest/a": b"1"}
+        assert view.query("/db/latest/a") is view._results["/db/latest/a"]
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the state-sync snapshots of the abstract_round_abci skill."""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+import pytest
+
+from packages.valory.protocols.abci.custom_types import ResultType, Snapshot
+from packages.valory.skills.abstract_round_abci.snapshots import (
+    APPLY_CHUNK_ABORT,
+    APPLY_CHUNK_ACCEPT,
+    APPLY_CHUNK_REJECT_SNAPSHOT,
+    APPLY_CHUNK_RETRY,
+    SNAPSHOT_FORMAT,
+    SnapshotRestorer,
+    SnapshotStore,
+    StateSnapshot,
+)
+
+
+def _state(size: int = 100) -> Dict[str, Any]:
+    """Get a state, whose serialized database has roughly the given size."""
+    db = json.dumps({"db_data": {"0": {"key": ["x" * size]}}, "slashing_config": ""})
+    return {"height": 10, "round_count": 3, "current_round_id": "round", "db": db}
+
+
+def _app_hash(state: Dict[str, Any]) -> bytes:
+    """Get the app hash of a state."""
+    return hashlib.sha256(state["db"].encode("utf-8")).digest()
+
+
+class TestStateSnapshot:
+    """Test `StateSnapshot`."""
+
+    @pytest.mark.parametrize("chunk_size", (1, 7, 64, 2**20))
+    def test_build(self, chunk_size: int) -> None:
+        """Test that a snapshot is split into hashed chunks."""
+        state = _state()
+        snapshot = StateSnapshot.build(10, state, chunk_size)
+        payload = b"".join(snapshot.chunks)
+        assert json.loads(payload) == state
+        assert all(0 < len(chunk) <= chunk_size for chunk in snapshot.chunks)
+        assert snapshot.hash == hashlib.sha256(payload).digest()
+        assert json.loads(snapshot.metadata) == [
+            hashlib.sha256(chunk).hexdigest() for chunk in snapshot.chunks
+        ]
+        assert snapshot.header == Snapshot(
+            10, SNAPSHOT_FORMAT, len(snapshot.chunks), snapshot.hash, snapshot.metadata
+        )
+
+    def test_build_raises_on_invalid_chunk_size(self) -> None:
+        """Test that the chunk size must be positive."""
+        with pytest.raises(ValueError, match="The chunk size must be positive"):
+            StateSnapshot.build(10, _state(), 0)
+
+
+class TestSnapshotStore:
+    """Test `SnapshotStore`."""
+
+    def test_disabled(self) -> None:
+        """Test that no snapshot is due by default."""
+        store = SnapshotStore()
+        assert not store.enabled
+        assert not store.is_due(100)
+
+    def test_take(self) -> None:
+        """Test that snapshots are due every interval, and that only the most recent are kept."""
+        store = SnapshotStore(interval=5, keep_recent=2, chunk_size=16)
+        assert store.is_due(1)
+        for height in (1, 6, 11):
+            store.take(height, _state())
+            assert not store.is_due(height + 4)
+            assert store.is_due(height + 5)
+
+        assert len(store) == 2
+        assert [snapshot.height for snapshot in store.list()] == [11, 6]
+
+    def test_load_chunk(self) -> None:
+        """Test loading the chunks of a snapshot."""
+        store = SnapshotStore(interval=1, chunk_size=16)
+        snapshot = store.take(10, _state())
+        assert store.load_chunk(10, SNAPSHOT_FORMAT, 0) == snapshot.chunks[0]
+        assert store.load_chunk(10, SNAPSHOT_FORMAT, len(snapshot.chunks)) == b""
+        assert store.load_chunk(10, SNAPSHOT_FORMAT + 1, 0) == b""
+        assert store.load_chunk(11, SNAPSHOT_FORMAT, 0) == b""
+
+
+class TestSnapshotRestorer:
+    """Test `SnapshotRestorer`."""
+
+    def setup(self) -> None:
+        """Set up the tests."""
+        self.state = _state(1000)
+        self.snapshot = StateSnapshot.build(10, self.state, 256)
+        self.restorer = SnapshotRestorer()
+
+    def test_restore(self) -> None:
+        """Test restoring a state from its chunks, in any order."""
+        assert (
+            self.restorer.offer(self.snapshot.header, _app_hash(self.state))
+            == ResultType.ACCEPT
+        )
+        assert self.restorer.in_progress
+        indexes = list(reversed(range(len(self.snapshot.chunks))))
+        for index in indexes[:-1]:
+            assert self.restorer.apply_chunk(index, self.snapshot.chunks[index]) == (
+                APPLY_CHUNK_ACCEPT,
+                (),
+                None,
+            )
+        last = indexes[-1]
+        assert self.restorer.apply_chunk(last, self.snapshot.chunks[last]) == (
+            APPLY_CHUNK_ACCEPT,
+            (),
+            self.state,
+        )
+        assert not self.restorer.in_progress
+
+    def test_offer_rejects_invalid_snapshots(self) -> None:
+        """Test that snapshots of other formats or with invalid metadata are rejected."""
+        header = self.snapshot.header
+        other_format = Snapshot(header.height, 2, header.chunks, header.hash_, b"")
+        assert self.restorer.offer(other_format, b"") == ResultType.REJECT_FORMAT
+        for metadata in (b"invalid", b"{}", b"[]"):
+            invalid = Snapshot(
+                header.height, SNAPSHOT_FORMAT, header.chunks, header.hash_, metadata
+            )
+            assert self.restorer.offer(invalid, b"") == ResultType.REJECT
+        assert not self.restorer.in_progress
+
+    def test_apply_chunk_without_offer(self) -> None:
+        """Test that applying a chunk without an accepted snapshot aborts the restoration."""
+        assert self.restorer.apply_chunk(0, self.snapshot.chunks[0]) == (
+            APPLY_CHUNK_ABORT,
+            (),
+            None,
+        )
+
+    def test_apply_corrupted_chunk(self) -> None:
+        """Test that a corrupted chunk is refetched."""
+        self.restorer.offer(self.snapshot.header, _app_hash(self.state))
+        assert self.restorer.apply_chunk(1, b"corrupted") == (
+            APPLY_CHUNK_RETRY,
+            (1,),
+            None,
+        )
+        assert self.restorer.apply_chunk(len(self.snapshot.chunks), b"") == (
+            APPLY_CHUNK_RETRY,
+            (len(self.snapshot.chunks),),
+            None,
+        )
+        assert self.restorer.in_progress
+
+    def test_app_hash_mismatch(self) -> None:
+        """Test that a snapshot whose state does not match the trusted app hash is rejected."""
+        self.restorer.offer(self.snapshot.header, b"other app hash")
+        results = [
+            self.restorer.apply_chunk(index, chunk)
+            for index, chunk in enumerate(self.snapshot.chunks)
+        ]
+        assert results[-1] == (APPLY_CHUNK_REJECT_SNAPSHOT, (), None)
+        assert not self.restorer.in_progress
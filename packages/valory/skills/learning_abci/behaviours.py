@@ -54,7 +54,6 @@ from packages.valory.skills.learning_abci.rounds import (
 from packages.valory.skills.transaction_settlement_abci.payload_tools import (
     hash_payload_to_hex,
 )
-from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
 import json
 
 
@@ -105,20 +104,51 @@ class APICheckBehaviour(LearningBaseBehaviour):  # pylint: disable=too-many-ance
 
             new_proposal = contract_response.state.body["data"]
 
-            ipfs_hash = yield from self.send_to_ipfs(
-                "new_proposal.json",
-                {"new_proposal": new_proposal},
-                filetype=SupportedFiletype.JSON
-                )
+            # the upload proceeds in the background, while the precomputed hash is sent to the other agents
+            ipfs_hash = yield from self.store_proposals(new_proposal, wait_for_upload=False)
             self.context.logger.info(f"The IPFS hash is : {ipfs_hash}")
             payload = APICheckPayload(sender=sender,ipfs_hash=ipfs_hash)
 
         with self.context.benchmark_tool.measure(self.behaviour_id).consensus():
             yield from self.send_a2a_transaction(payload)
+            # the agents agree on the hash, so it must be uploaded before the round ends
+            if ipfs_hash is not None:
+                yield from self.confirm_proposals_upload(ipfs_hash, new_proposal)
             yield from self.wait_until_round_end()
 
         self.set_done()
 
+    def store_proposals(
+        self, proposals: Any, wait_for_upload: bool
+    ) -> Generator[None, None, Optional[str]]:
+        """Store a snapshot of the proposals to IPFS."""
+        ipfs_hash = yield from self.send_snapshot_to_ipfs(
+            "new_proposal.json",
+            {"new_proposal": proposals},
+            previous_hash=self.synchronized_data.ipfs_hash,
+            checkpoint_interval=self.params.snapshot_checkpoint_interval,
+            wait_for_upload=wait_for_upload,
+        )
+        return ipfs_hash
+
+    def confirm_proposals_upload(
+        self, ipfs_hash: str, proposals: Any
+    ) -> Generator[None, None, bool]:
+        """Wait for the background upload of the proposals, and store them again if it failed."""
+        uploaded = yield from self.wait_for_ipfs_upload(ipfs_hash)
+        if uploaded:
+            return True
+        self.context.logger.warning(
+            f"The upload of the proposals with hash {ipfs_hash} failed, storing them again."
+        )
+        stored_hash = yield from self.store_proposals(proposals, wait_for_upload=True)
+        if stored_hash != ipfs_hash:
+            self.context.logger.error(
+                f"Could not store the proposals with the agreed hash {ipfs_hash}: got {stored_hash}."
+            )
+            return False
+        return True
+
 
 
 class DecisionMakingBehaviour(LearningBaseBehaviour):  # pylint: disable=too-many-ancestors
@@ -189,9 +219,7 @@ class DecisionMakingBehaviour(LearningBaseBehaviour):  # pylint: disable=too-man
 
     def fetch_proposals_from_ipfs(self, ipfs_hash: str) -> Generator[None, None, list[dict]]:
         """Fetch proposals from IPFS."""
-        proposals=yield from self.get_from_ipfs(
-            self.synchronized_data.ipfs_hash, filetype=SupportedFiletype.JSON
-        )
+        proposals=yield from self.get_snapshot_from_ipfs(ipfs_hash)
         return proposals
 
     
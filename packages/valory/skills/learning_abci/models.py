@@ -21,6 +21,8 @@
 
 from typing import Any, List
 
+from aea.exceptions import enforce
+
 from packages.valory.skills.abstract_round_abci.models import BaseParams
 from packages.valory.skills.abstract_round_abci.models import (
     BenchmarkTool as BaseBenchmarkTool,
@@ -69,5 +71,18 @@ class Params(BaseParams):
         self.fund_token = self._ensure(
             "fund_token", kwargs, str
         )
+        self.snapshot_checkpoint_interval = self._ensure(
+            "snapshot_checkpoint_interval", kwargs, int
+        )
+        # the `retain_last` of the ipfs connection, which must keep the deltas back to the last checkpoint pinned
+        self.ipfs_retain_last = self._ensure(
+            "ipfs_retain_last", kwargs, int
+        )
+        enforce(
+            self.ipfs_retain_last <= 0
+            or self.ipfs_retain_last >= self.snapshot_checkpoint_interval,
+            "`ipfs_retain_last` must be 0, i.e., retain everything, or at least `snapshot_checkpoint_interval`, "
+            "so that the snapshots can be reconstructed from their deltas.",
+        )
 
         super().__init__(*args, **kwargs)
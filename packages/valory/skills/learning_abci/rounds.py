@@ -106,13 +106,13 @@ class SynchronizedData(BaseSynchronizedData):
 
     @property
     def proposal_amount(self) -> Optional[int]:
-         """Get the proposal amount value."""
-        return self.db.get("proposal_amount", None)  
+        """Get the proposal amount value."""
+        return self.db.get("proposal_amount", None)
 
     @property
     def proposal_id(self) -> Optional[int]:
-         """Get the proposal id value."""
-        return  self.db.get("proposal_id", None)   
+        """Get the proposal id value."""
+        return self.db.get("proposal_id", None)
 
 
 class APICheckRound(CollectSameUntilThresholdRound):
@@ -232,7 +232,10 @@ class LearningAbciApp(AbciApp[Event]):
         FinishedTxPreparationRound,
     }
     event_to_timeout: EventToTimeout = {}
-    cross_period_persisted_keys: FrozenSet[str] = frozenset()
+    # the hash of the proposals' snapshot is kept, so that the next one is sent as a delta against it
+    cross_period_persisted_keys: FrozenSet[str] = frozenset(
+        {get_name(SynchronizedData.ipfs_hash)}
+    )
     db_pre_conditions: Dict[AppState, Set[str]] = {
         APICheckRound: set(),
     }
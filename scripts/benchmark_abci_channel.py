@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a benchmark of the throughput of the ABCI server channels."""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Union, cast
+
+import grpc
+from aea.configurations.base import PublicId
+from aea.mail.base import Envelope
+from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+
+from packages.valory.connections.abci.connection import (
+    GrpcServerChannel,
+    PUBLIC_ID,
+    TcpServerChannel,
+    VarintMessageReader,
+    _TendermintABCISerializer,
+)
+from packages.valory.connections.abci.dialogues import (
+    AbciDialogues as ConnectionAbciDialogues,
+)
+from packages.valory.connections.abci.tendermint.abci import (  # type: ignore
+    types_pb2_grpc,
+)
+from packages.valory.connections.abci.tendermint.abci.types_pb2 import (  # type: ignore
+    Request,
+    RequestCheckTx,
+    RequestDeliverTx,
+    RequestFlush,
+    RequestQuery,
+)
+from packages.valory.connections.abci.tendermint_decoder import (
+    _TendermintProtocolDecoder,
+)
+from packages.valory.protocols.abci import AbciMessage
+from packages.valory.protocols.abci.custom_types import Events, ProofOps
+from packages.valory.protocols.abci.dialogues import AbciDialogue, AbciDialogues
+
+
+SKILL_ID = PublicId.from_str("valory/abstract_round_abci:0.1.0")
+LOCALHOST = "127.0.0.1"
+
+
+def _role_from_first_message(  # pylint: disable=unused-argument
+    message: Message, receiver_address: Address
+) -> BaseDialogue.Role:
+    """The app is always the server of the ABCI dialogues."""
+    return AbciDialogue.Role.SERVER
+
+
+async def run_app(channel: Union[TcpServerChannel, GrpcServerChannel]) -> None:
+    """Reply to the requests of a channel, as cheaply as possible, like a skill would."""
+    dialogues = AbciDialogues(
+        str(SKILL_ID), _role_from_first_message, dialogue_class=AbciDialogue
+    )
+    replies = {
+        AbciMessage.Performative.REQUEST_DELIVER_TX: dict(
+            performative=AbciMessage.Performative.RESPONSE_DELIVER_TX,
+            code=0,
+            data=b"",
+            log="",
+            info="",
+            gas_wanted=0,
+            gas_used=0,
+            events=Events([]),
+            codespace="",
+        ),
+        AbciMessage.Performative.REQUEST_QUERY: dict(
+            performative=AbciMessage.Performative.RESPONSE_QUERY,
+            code=0,
+            log="",
+            info="",
+            index=0,
+            key=b"",
+            value=b"",
+            proof_ops=ProofOps([]),
+            height=0,
+            codespace="",
+        ),
+        AbciMessage.Performative.REQUEST_FLUSH: dict(
+            performative=AbciMessage.Performative.RESPONSE_FLUSH
+        ),
+    }
+    while True:
+        envelope = await channel.get_message()
+        message = cast(AbciMessage, envelope.message)
+        dialogue = cast(AbciDialogue, dialogues.update(message))
+        reply = dialogue.reply(target_message=message, **replies[message.performative])
+        await channel.send(
+            Envelope(to=envelope.sender, sender=envelope.to, message=reply)
+        )
+
+
+def make_payload(n_messages: int, tx_size: int) -> bytes:
+    """Make a stream of framed `deliver_tx` requests, as sent by Tendermint."""
+    request = Request(deliver_tx=RequestDeliverTx(tx=os.urandom(tx_size)))
+    return _TendermintABCISerializer.write_message(request) * n_messages
+
+
+async def benchmark_reader(n_messages: int, tx_size: int) -> float:
+    """Measure the rate at which framed requests are split off a stream, in messages per second."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(make_payload(n_messages, tx_size))
+    reader.feed_eof()
+    varint_message_reader = VarintMessageReader(reader)
+    start = time.perf_counter()
+    for _ in range(n_messages):
+        await varint_message_reader.read_next_message()
+    return n_messages / (time.perf_counter() - start)
+
+
+async def benchmark_channel(n_messages: int, tx_size: int) -> float:
+    """Measure the rate at which framed requests are turned into envelopes by the channel, in messages per second."""
+    channel = TcpServerChannel(
+        SKILL_ID, LOCALHOST, 0, logger=logging.getLogger("benchmark")
+    )
+    await channel.connect(asyncio.get_event_loop())
+    server = cast(asyncio.AbstractServer, channel._server)  # pylint: disable=W0212
+    port = server.sockets[0].getsockname()[1]
+
+    payload = make_payload(n_messages, tx_size)
+
+    queue = cast(asyncio.Queue, channel.queue)
+    _, writer = await asyncio.open_connection(LOCALHOST, port)
+    start = time.perf_counter()
+    writer.write(payload)
+    # the channel stops reading while its request queue is full, so the queue is consumed while the payload is sent
+    drain = asyncio.ensure_future(writer.drain())
+    for _ in range(n_messages):
+        await queue.get()
+    await drain
+    elapsed = time.perf_counter() - start
+
+    writer.close()
+    await channel.disconnect()
+    return n_messages / elapsed
+
+
+async def benchmark_tcp_round_trip(n_messages: int, tx_size: int) -> float:
+    """Measure the rate at which `deliver_tx` requests are answered through the TCP channel, in messages per second."""
+    channel = TcpServerChannel(
+        SKILL_ID, LOCALHOST, 0, logger=logging.getLogger("benchmark")
+    )
+    await channel.connect(asyncio.get_event_loop())
+    server = cast(asyncio.AbstractServer, channel._server)  # pylint: disable=W0212
+    port = server.sockets[0].getsockname()[1]
+    app = asyncio.create_task(run_app(channel))
+
+    # like Tendermint, pipeline the requests of a block and flush at the end of it
+    payload = make_payload(
+        n_messages, tx_size
+    ) + _TendermintABCISerializer.write_message(Request(flush=RequestFlush()))
+    reader, writer = await asyncio.open_connection(LOCALHOST, port)
+    responses = VarintMessageReader(reader)
+    start = time.perf_counter()
+    writer.write(payload)
+    await writer.drain()
+    for _ in range(n_messages + 1):
+        await responses.read_next_message()
+    elapsed = time.perf_counter() - start
+
+    app.cancel()
+    writer.close()
+    await channel.disconnect()
+    return n_messages / elapsed
+
+
+async def benchmark_grpc_round_trip(
+    n_messages: int, tx_size: int, method: str = "deliver_tx"
+) -> float:
+    """Measure the rate at which requests are answered through the gRPC channel, in messages per second."""
+    channel = GrpcServerChannel(
+        SKILL_ID, LOCALHOST, 0, logger=logging.getLogger("benchmark")
+    )
+    await channel.connect(asyncio.get_event_loop())
+    while channel._server is None:  # pylint: disable=W0212
+        await asyncio.sleep(0.01)
+    app = asyncio.create_task(run_app(channel))
+
+    async with grpc.aio.insecure_channel(f"{LOCALHOST}:{channel.port}") as client:
+        stub = types_pb2_grpc.ABCIApplicationStub(client)
+        if method == "query":
+            call, request = stub.Query, RequestQuery(path="/round")
+        else:
+            call, request = stub.DeliverTx, RequestDeliverTx(tx=os.urandom(tx_size))
+        start = time.perf_counter()
+        # like Tendermint's gRPC client, wait for each response before sending the next request
+        for _ in range(n_messages):
+            await call(request)
+        elapsed = time.perf_counter() - start
+
+    app.cancel()
+    await channel.disconnect()
+    return n_messages / elapsed
+
+
+def benchmark_decoder(n_messages: int, tx_size: int, request_type: str) -> float:
+    """Measure the time to decode a request carrying a transaction into an ABCI message, in microseconds."""
+    dialogues = ConnectionAbciDialogues(connection_id=PUBLIC_ID)
+    tx = os.urandom(tx_size)
+    request = (
+        Request(check_tx=RequestCheckTx(tx=tx))
+        if request_type == "check_tx"
+        else Request(deliver_tx=RequestDeliverTx(tx=tx))
+    )
+    start = time.perf_counter()
+    for _ in range(n_messages):
+        _TendermintProtocolDecoder.process(request, dialogues, str(SKILL_ID))
+    return (time.perf_counter() - start) / n_messages * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--tx-sizes", type=int, nargs="+", default=[32, 256, 4096])
+    parser.add_argument(
+        "--decoder",
+        action="store_true",
+        help="measure the time to decode the requests carrying a transaction",
+    )
+    parser.add_argument(
+        "--transports",
+        action="store_true",
+        help="compare the round trips through the TCP and the gRPC channels, as used by Tendermint's socket and gRPC modes",
+    )
+    args = parser.parse_args()
+
+    if args.decoder:
+        print(
+            f"{'tx bytes':>10} {'messages':>10} {'check_tx us':>14} {'deliver_tx us':>14}"
+        )
+        for tx_size in args.tx_sizes:
+            check_tx = benchmark_decoder(args.messages, tx_size, "check_tx")
+            deliver_tx = benchmark_decoder(args.messages, tx_size, "deliver_tx")
+            print(
+                f"{tx_size:>10} {args.messages:>10} {check_tx:>14.1f} {deliver_tx:>14.1f}"
+            )
+        return
+
+    if args.transports:
+        print(f"{'tx bytes':>10} {'messages':>10} {'tcp msg/s':>14} {'grpc msg/s':>14}")
+        for tx_size in args.tx_sizes:
+            tcp_rate = asyncio.run(benchmark_tcp_round_trip(args.messages, tx_size))
+            grpc_rate = asyncio.run(benchmark_grpc_round_trip(args.messages, tx_size))
+            print(
+                f"{tx_size:>10} {args.messages:>10} {tcp_rate:>14.0f} {grpc_rate:>14.0f}"
+            )
+        query_rate = asyncio.run(benchmark_grpc_round_trip(args.messages, 0, "query"))
+        print(f"gRPC queries through the fast path: {query_rate:.0f} msg/s")
+        return
+
+    print(
+        f"{'tx bytes':>10} {'messages':>10} {'reader msg/s':>14} {'channel msg/s':>14}"
+    )
+    for tx_size in args.tx_sizes:
+        reader_rate = asyncio.run(benchmark_reader(args.messages, tx_size))
+        channel_rate = asyncio.run(benchmark_channel(args.messages, tx_size))
+        print(
+            f"{tx_size:>10} {args.messages:>10} {reader_rate:>14.0f} {channel_rate:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a benchmark of the filetypes supported by the io_ storers and loaders."""
+
+import argparse
+import random
+import timeit
+from typing import Dict, List, Union
+
+from packages.valory.skills.abstract_round_abci.io_.ipfs import IPFSInteract
+from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
+
+
+FILEPATH = "proposals.json"
+WEI = 10**18
+
+
+def make_proposals(n_proposals: int, seed: int = 0) -> List[Dict]:
+    """Make a snapshot of proposals, shaped like the ones returned by the fund manager contract."""
+    rng = random.Random(seed)  # nosec
+    n_proposers = max(n_proposals // 10, 1)
+    proposers = [f"0x{rng.getrandbits(160):040x}" for _ in range(n_proposers)]
+    start = 1_700_000_000
+    return [
+        {
+            "proposal_id": i,
+            "proposer": rng.choice(proposers),
+            "amount": rng.randrange(WEI // 100, 9 * WEI),
+            "executed": rng.random() < 0.5,
+            "timestamp": start + i * rng.randrange(1, 600),
+        }
+        for i in range(n_proposals)
+    ]
+
+
+def benchmark(
+    proposals: List[Dict], filetype: SupportedFiletype, repeat: int
+) -> Dict[str, Union[int, float]]:
+    """Measure the size and the encoding/decoding time of a snapshot, as it is transferred to IPFS, for a filetype."""
+    ipfs_interact = IPFSInteract()
+    serialized = ipfs_interact.store_bytes(FILEPATH, proposals, False, filetype)
+    if ipfs_interact.load_bytes(serialized, filetype) != proposals:
+        raise ValueError(f"The {filetype.name} filetype does not round-trip.")
+
+    encode = timeit.timeit(
+        lambda: ipfs_interact.store_bytes(FILEPATH, proposals, False, filetype),
+        number=repeat,
+    )
+    decode = timeit.timeit(
+        lambda: ipfs_interact.load_bytes(serialized, filetype), number=repeat
+    )
+    return {
+        "size": len(serialized[FILEPATH]),
+        "encode_ms": encode / repeat * 1000,
+        "decode_ms": decode / repeat * 1000,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--proposals", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'proposals':>10} {'filetype':>14} {'bytes':>10} {'ratio':>7} "
+        f"{'encode ms':>10} {'decode ms':>10}"
+    )
+    for n_proposals in args.proposals:
+        proposals = make_proposals(n_proposals)
+        baseline = None
+        for filetype in SupportedFiletype:
+            try:
+                result = benchmark(proposals, filetype, args.repeat)
+            except Exception as e:  # pylint: disable=broad-except
+                print(f"{n_proposals:>10} {filetype.name:>14} skipped: {e}")
+                continue
+            baseline = baseline or result["size"]
+            print(
+                f"{n_proposals:>10} {filetype.name:>14} {result['size']:>10} "
+                f"{result['size'] / baseline:>7.2f} "
+                f"{result['encode_ms']:>10.3f} {result['decode_ms']:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
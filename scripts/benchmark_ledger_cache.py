@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a benchmark of the per-request overhead of getting a ledger api and a contract instance."""
+
+import argparse
+import json
+import logging
+import timeit
+from pathlib import Path
+
+from aea.crypto.registries import ledger_apis_registry
+from aea.helpers.async_utils import AsyncState
+from aea_ledger_ethereum.test_tools.constants import ETHEREUM_TESTNET_CONFIG
+
+from packages.valory.connections.ledger.connection import PUBLIC_ID
+from packages.valory.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+
+
+ERC20_BUILD = (
+    Path(__file__).parent.parent
+    / "packages"
+    / "valory"
+    / "contracts"
+    / "erc20"
+    / "build"
+    / "ERC20.json"
+)
+CONTRACT_ADDRESS = "0x21795D753752ccC1AC728002D23Ba33cbF13b8b0"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    interface = {"abi": json.loads(ERC20_BUILD.read_text())["abi"], "bytecode": "0x"}
+    dispatcher = LedgerApiRequestDispatcher(
+        logger=logging.getLogger("benchmark"),
+        connection_id=PUBLIC_ID,
+        connection_state=AsyncState(),
+        api_configs={"ethereum": ETHEREUM_TESTNET_CONFIG},
+    )
+
+    def uncached() -> None:
+        """Make a ledger api and a contract instance, as done before they were cached."""
+        api = ledger_apis_registry.make("ethereum", **ETHEREUM_TESTNET_CONFIG)
+        api.get_contract_instance(interface, CONTRACT_ADDRESS)
+
+    def cached() -> None:
+        """Get the ledger api and the contract instance from the dispatcher's caches."""
+        api = dispatcher.get_ledger_api("ethereum", "ethereum")
+        api.get_contract_instance(interface, CONTRACT_ADDRESS)
+
+    uncached_time = timeit.timeit(uncached, number=args.repeat) / args.repeat
+    cached_time = timeit.timeit(cached, number=args.repeat) / args.repeat
+    print(f"{'uncached us':>14} {'cached us':>14}")
+    print(f"{uncached_time * 1e6:>14.1f} {cached_time * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()